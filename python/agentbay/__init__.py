@@ -67,11 +67,36 @@ from .api.models import ExtraConfigs, MobileExtraConfig, AppManagerRule, MobileS
 # Sync API (Default)
 from ._sync.agentbay import AgentBay
 from ._sync.session import Session, SessionInfo
+from ._sync.session_group import SessionGroup
+from ._sync.session_pool import SessionPool
+from ._sync.session_reaper import SessionReaper
+from ._common.models.session_group import (
+    LatencyStats,
+    SessionCallResult,
+    SessionGroupResult,
+)
+from ._common.models.session_pool import (
+    ReleaseAction,
+    ReleasePolicy,
+    SessionPoolMetrics,
+)
+from ._common.utils.compression import TransferStats
+from ._common.utils.content_cache import FileContentCache
+from ._common.utils.search import GrepMatch
+from ._common.utils.manifest import (
+    FileManifest,
+    ManifestDiff,
+    ManifestEntry,
+    build_local_manifest,
+)
+from ._common.utils.polling import PollMetrics, PollOutcome, PollPolicy, poll_metrics
+from ._common.utils.fingerprint_cache import FingerprintCache
 from ._sync.fingerprint import BrowserFingerprintGenerator
 from ._sync.browser import (
     Browser,
     BrowserAgent,
 )
+from ._sync.browser_connection import BrowserConnection
 from ._common.models import (
     FingerprintFormat,
     BrowserOption,
@@ -95,20 +120,35 @@ from ._sync.computer import (
     InstalledAppListResult,
     ProcessListResult,
     AppOperationResult,
+    ActionBatchResult,
 )
 from ._common.models.computer import ScreenshotMode
-from ._common.models.screenshot import ScreenshotResult
+from ._common.models.screenshot import ScreenshotResult, VisualWaitResult
 from ._sync.mobile import Mobile
-from ._common.models.mobile import KeyCode, UIElementListResult
+from ._common.models.mobile import (
+    KeyCode,
+    UIElementListResult,
+    UISnapshotResult,
+    UITreeResult,
+)
+from ._common.models.ui_tree import UIDiff, UINode, UISnapshot, UITree
 from ._sync.mobile_simulate import MobileSimulateService
 from ._sync.agent import Agent
 from ._common.models.agent import ExecutionResult
-from ._sync.command import Command, CommandResult
+from ._sync.command import Command, CommandJob, CommandResult
+from ._common.models.command import CommandBatchResult, CommandJobChunk
 from ._sync.filesystem import (
     FileSystem,
     FileChangeEvent,
     FileChangeResult,
+    DirectoryEntry,
     DirectoryListResult,
+    DirectoryTreeResult,
+    ManifestResult,
+    PackTransferResult,
+    FileSyncResult,
+    DirectorySyncResult,
+    FileWriteResult,
     FileContentResult,
     BinaryFileContentResult,
     DownloadResult,
@@ -116,11 +156,17 @@ from ._sync.filesystem import (
     UploadResult,
     FileTransfer,
     FileSearchResult,
+    GrepResult,
     MultipleFileContentResult,
 )
 from ._sync.oss import Oss, OSSClientResult, OSSDownloadResult, OSSUploadResult
 from ._sync.context_manager import ContextManager
-from ._common.models.context import ContextInfoResult, ContextSyncResult
+from ._common.models.context import (
+    ContextInfoResult,
+    ContextSyncItemResult,
+    ContextSyncManyResult,
+    ContextSyncResult,
+)
 from ._common.models.context import ContextStatusData
 from ._sync.context import (
     ContextListParams,
@@ -134,8 +180,10 @@ from ._sync.context import (
     ContextService,
 )
 from ._sync.beta_network import SyncBetaNetworkService as BetaNetwork
-from ._sync.code import Code, CodeExecutionResult
+from ._sync.code import Code, CodeContext, CodeExecutionResult
 from ._common.models.code import (
+    CodeArtifact,
+    CodeOutput,
     EnhancedCodeExecutionResult,
     ExecutionResult as CodeExecutionResult,
     ExecutionLogs,
@@ -146,19 +194,23 @@ from ._common.models import MobileSimulateUploadResult
 # Async API (Explicitly marked)
 from ._async.agentbay import AsyncAgentBay
 from ._async.session import AsyncSession
+from ._async.session_group import AsyncSessionGroup
+from ._async.session_pool import AsyncSessionPool
+from ._async.session_reaper import AsyncSessionReaper
 from ._async.browser import AsyncBrowser
 from ._async.browser_agent import AsyncBrowserAgent
+from ._async.browser_connection import AsyncBrowserConnection
 from ._async.fingerprint import AsyncBrowserFingerprintGenerator
 from ._async.computer import AsyncComputer
 from ._async.mobile import AsyncMobile
 from ._async.agent import AsyncAgent
-from ._async.command import AsyncCommand
+from ._async.command import AsyncCommand, AsyncCommandJob
 from ._async.filesystem import AsyncFileSystem, AsyncFileTransfer
 from ._async.oss import AsyncOss
 from ._async.context_manager import AsyncContextManager
 from ._async.context import AsyncContextService
 from ._async.extension import AsyncExtensionsService
-from ._async.code import AsyncCode
+from ._async.code import AsyncCode, AsyncCodeContext
 from ._async.mobile_simulate import AsyncMobileSimulateService
 from ._async.beta_network import AsyncBetaNetworkService as AsyncBetaNetwork
 
@@ -171,6 +223,22 @@ __all__ = [
     "Session",
     "SessionInfo",
     "AsyncSession",
+    "SessionGroup",
+    "AsyncSessionGroup",
+    "SessionCallResult",
+    "SessionGroupResult",
+    "LatencyStats",
+    "SessionPool",
+    "AsyncSessionPool",
+    "ReleaseAction",
+    "ReleasePolicy",
+    "SessionPoolMetrics",
+    "SessionReaper",
+    "AsyncSessionReaper",
+    "PollPolicy",
+    "PollOutcome",
+    "PollMetrics",
+    "poll_metrics",
     # Enums
     "SessionStatus",
     # Functional Modules
@@ -184,6 +252,8 @@ __all__ = [
     "AsyncAgent",
     "Command",
     "AsyncCommand",
+    "CommandJob",
+    "AsyncCommandJob",
     "FileSystem",
     "AsyncFileSystem",
     "Oss",
@@ -195,6 +265,8 @@ __all__ = [
     "AsyncContextManager",
     "Code",
     "AsyncCode",
+    "CodeContext",
+    "AsyncCodeContext",
     "BetaNetwork",
     "AsyncBetaNetwork",
     # Shared Components
@@ -242,12 +314,17 @@ __all__ = [
     "BrowserFingerprintContext",
     "BrowserAgent",
     "AsyncBrowserAgent",
+    "BrowserConnection",
+    "AsyncBrowserConnection",
     "BrowserFingerprintGenerator",
     "FingerprintFormat",
+    "FingerprintCache",
     # Context related
     "ContextListParams",
     "ContextInfoResult",
     "ContextSyncResult",
+    "ContextSyncItemResult",
+    "ContextSyncManyResult",
     "ContextService",
     "AsyncContextService",
     "Context",
@@ -284,10 +361,14 @@ __all__ = [
     "extract_request_id",
     "ExecutionResult",
     "CommandResult",
+    "CommandJobChunk",
+    "CommandBatchResult",
     "CodeExecutionResult",
     "EnhancedCodeExecutionResult",
     "ExecutionLogs",
     "ExecutionError",
+    "CodeArtifact",
+    "CodeOutput",
     "_generate_random_context_name",
     "_colorize_log_message",
     "_BROWSER_DATA_PATH",
@@ -300,11 +381,19 @@ __all__ = [
     "ScrollDirection",
     "ScreenshotMode",
     "ScreenshotResult",
+    "VisualWaitResult",
     "KeyCode",
     "InstalledAppListResult",
     "ProcessListResult",
     "AppOperationResult",
+    "ActionBatchResult",
     "UIElementListResult",
+    "UITree",
+    "UINode",
+    "UITreeResult",
+    "UISnapshot",
+    "UISnapshotResult",
+    "UIDiff",
     "AsyncMobileSimulateService",
     "MobileSimulateService",
     "MobileSimulateUploadResult",
@@ -313,13 +402,28 @@ __all__ = [
     "FileChangeResult",
     "AsyncFileTransfer",
     "FileTransfer",
+    "DirectoryEntry",
     "DirectoryListResult",
+    "DirectoryTreeResult",
+    "ManifestResult",
+    "PackTransferResult",
+    "FileSyncResult",
+    "DirectorySyncResult",
+    "FileWriteResult",
+    "TransferStats",
+    "FileManifest",
+    "ManifestEntry",
+    "ManifestDiff",
+    "build_local_manifest",
+    "FileContentCache",
     "FileContentResult",
     "BinaryFileContentResult",
     "DownloadResult",
     "FileInfoResult",
     "UploadResult",
     "FileSearchResult",
+    "GrepResult",
+    "GrepMatch",
     "MultipleFileContentResult",
     # API Models
     "ExtraConfigs",
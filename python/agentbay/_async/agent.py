@@ -1,7 +1,6 @@
-import asyncio
 import json
 import sys
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Type
 
 from .._common.exceptions import AgentBayError, AgentError
 from .._common.logger import get_logger
@@ -11,7 +10,9 @@ from .._common.models.agent import (
     DefaultSchema,
     Schema,
 )
+from .._common.utils.polling import PollOutcome, PollPolicy
 from .base_service import AsyncBaseService
+from .polling import poll_until
 
 if TYPE_CHECKING:
     from .session import AsyncSession
@@ -75,6 +76,37 @@ class AsyncAgent(AsyncBaseService):
                 return f"{self.tool_prefix}_{base_name}"
             return base_name
 
+        async def _wait_for_task(
+            self,
+            task_id: str,
+            timeout: float,
+            max_interval: float,
+            terminal_statuses: Sequence[str],
+            on_status: Optional[Callable[[Any], None]] = None,
+        ) -> PollOutcome:
+            """
+            Poll the status of a task until it reaches one of `terminal_statuses`
+            or `timeout` seconds pass. The first check happens right away; later
+            checks back off up to `max_interval` seconds.
+            """
+
+            def finished(query: Any) -> bool:
+                if on_status is not None:
+                    on_status(query)
+                if query.task_status in terminal_statuses:
+                    return True
+                _logger.info(f"⏳ Task {task_id} running 🚀: {query.task_action}.")
+                return False
+
+            return await poll_until(
+                lambda: self.get_task_status(task_id),
+                done=finished,
+                timeout=timeout,
+                policy=PollPolicy.up_to(max_interval),
+                raise_errors=True,
+                name=f"agent.{self.tool_prefix or 'task'}",
+            )
+
         def _handle_error(self, e):
             """
             Convert AgentBayError to AgentError for compatibility.
@@ -166,7 +198,7 @@ class AsyncAgent(AsyncBaseService):
             Execute a specific task described in human language synchronously.
 
             This is a synchronous interface that blocks until the task is completed or
-            an error occurs, or timeout happens. The default polling interval is 3 seconds.
+            an error occurs, or timeout happens. Status polling backs off up to 3 seconds.
 
             Args:
                 task: Task description in human language.
@@ -187,7 +219,6 @@ class AsyncAgent(AsyncBaseService):
                 ```
             """
             poll_interval = 3
-            max_poll_attempts = timeout // poll_interval
 
             try:
                 args = {"task": task}
@@ -199,41 +230,40 @@ class AsyncAgent(AsyncBaseService):
                 if result.success:
                     content = json.loads(result.data)
                     task_id = content.get("task_id", "")
-                    tried_time: int = 0
-                    while tried_time < max_poll_attempts:
-                        query = await self.get_task_status(task_id)
-                        if query.task_status == "finished":
-                            return ExecutionResult(
-                                request_id=result.request_id,
-                                success=True,
-                                error_message="",
-                                task_id=task_id,
-                                task_status=query.task_status,
-                                task_result=query.task_product,
-                            )
-                        elif query.task_status == "failed":
-                            error_msg = query.error_message or "Failed to execute task."
-                            return ExecutionResult(
-                                request_id=query.request_id,
-                                success=False,
-                                error_message="Failed to execute task.",
-                                task_id=task_id,
-                                task_status=query.task_status,
-                            )
-                        elif query.task_status == "unsupported":
-                            error_msg = query.error_message or "Unsupported task."
-                            return ExecutionResult(
-                                request_id=query.request_id,
-                                success=False,
-                                error_message=error_msg,
-                                task_id=task_id,
-                                task_status=query.task_status,
-                            )
-                        _logger.info(
-                            f"⏳ Task {task_id} running 🚀: {query.task_action}."
+                    outcome = await self._wait_for_task(
+                        task_id,
+                        timeout,
+                        poll_interval,
+                        ("finished", "failed", "unsupported"),
+                    )
+                    query = outcome.value
+                    if query.task_status == "finished":
+                        return ExecutionResult(
+                            request_id=result.request_id,
+                            success=True,
+                            error_message="",
+                            task_id=task_id,
+                            task_status=query.task_status,
+                            task_result=query.task_product,
+                        )
+                    elif query.task_status == "failed":
+                        error_msg = query.error_message or "Failed to execute task."
+                        return ExecutionResult(
+                            request_id=query.request_id,
+                            success=False,
+                            error_message="Failed to execute task.",
+                            task_id=task_id,
+                            task_status=query.task_status,
+                        )
+                    elif query.task_status == "unsupported":
+                        error_msg = query.error_message or "Unsupported task."
+                        return ExecutionResult(
+                            request_id=query.request_id,
+                            success=False,
+                            error_message=error_msg,
+                            task_id=task_id,
+                            task_status=query.task_status,
                         )
-                        await asyncio.sleep(poll_interval)
-                        tried_time += 1
                     _logger.warning("⚠️ task execution timeout!")
                     # Automatically terminate the task on timeout
                     try:
@@ -244,7 +274,7 @@ class AsyncAgent(AsyncBaseService):
                             _logger.warning(f"⚠️ Failed to terminate task {task_id} after timeout: {terminate_result.error_message}")
                     except Exception as e:
                         _logger.warning(f"⚠️ Exception while terminating task {task_id} after timeout: {e}")
-                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times (max: {max_poll_attempts})."
+                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {outcome.probes} times."
                     return ExecutionResult(
                         request_id=result.request_id,
                         success=False,
@@ -541,7 +571,7 @@ class AsyncAgent(AsyncBaseService):
             Execute a task described in human language on a browser synchronously.
 
             This is a synchronous interface that blocks until the task is completed or
-            an error occurs, or timeout happens. The default polling interval is 3 seconds.
+            an error occurs, or timeout happens. Status polling backs off up to 3 seconds.
 
             Args:
                 task: Task description in human language.
@@ -567,7 +597,6 @@ class AsyncAgent(AsyncBaseService):
                 ```
             """
             poll_interval = 3
-            max_poll_attempts = timeout // poll_interval
 
             try:
                 args = {
@@ -591,41 +620,40 @@ class AsyncAgent(AsyncBaseService):
                 if result.success:
                     content = json.loads(result.data)
                     task_id = content.get("task_id", "")
-                    tried_time: int = 0
-                    while tried_time < max_poll_attempts:
-                        query = await self.get_task_status(task_id)
-                        if query.task_status == "finished":
-                            return ExecutionResult(
-                                request_id=result.request_id,
-                                success=True,
-                                error_message="",
-                                task_id=task_id,
-                                task_status=query.task_status,
-                                task_result=query.task_product,
-                            )
-                        elif query.task_status == "failed":
-                            error_msg = query.error_message or "Failed to execute task."
-                            return ExecutionResult(
-                                request_id=query.request_id,
-                                success=False,
-                                error_message="Failed to execute task.",
-                                task_id=task_id,
-                                task_status=query.task_status,
-                            )
-                        elif query.task_status == "unsupported":
-                            error_msg = query.error_message or "Unsupported task."
-                            return ExecutionResult(
-                                request_id=query.request_id,
-                                success=False,
-                                error_message=error_msg,
-                                task_id=task_id,
-                                task_status=query.task_status,
-                            )
-                        _logger.info(
-                            f"⏳ Task {task_id} running 🚀: {query.task_action}."
+                    outcome = await self._wait_for_task(
+                        task_id,
+                        timeout,
+                        poll_interval,
+                        ("finished", "failed", "unsupported"),
+                    )
+                    query = outcome.value
+                    if query.task_status == "finished":
+                        return ExecutionResult(
+                            request_id=result.request_id,
+                            success=True,
+                            error_message="",
+                            task_id=task_id,
+                            task_status=query.task_status,
+                            task_result=query.task_product,
+                        )
+                    elif query.task_status == "failed":
+                        error_msg = query.error_message or "Failed to execute task."
+                        return ExecutionResult(
+                            request_id=query.request_id,
+                            success=False,
+                            error_message="Failed to execute task.",
+                            task_id=task_id,
+                            task_status=query.task_status,
+                        )
+                    elif query.task_status == "unsupported":
+                        error_msg = query.error_message or "Unsupported task."
+                        return ExecutionResult(
+                            request_id=query.request_id,
+                            success=False,
+                            error_message=error_msg,
+                            task_id=task_id,
+                            task_status=query.task_status,
                         )
-                        await asyncio.sleep(poll_interval)
-                        tried_time += 1
                     _logger.warning("⚠️ task execution timeout!")
                     # Automatically terminate the task on timeout
                     try:
@@ -642,7 +670,7 @@ class AsyncAgent(AsyncBaseService):
                         _logger.warning(
                             f"⚠️ Exception while terminating task {task_id} after timeout: {e}"
                         )
-                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times (max: {max_poll_attempts})."
+                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {outcome.probes} times."
                     return ExecutionResult(
                         request_id=result.request_id,
                         success=False,
@@ -792,8 +820,8 @@ class AsyncAgent(AsyncBaseService):
             Execute a specific task described in human language synchronously.
 
             This is a synchronous interface that blocks until the task is
-            completed or an error occurs, or timeout happens. The default
-            polling interval is 3 seconds.
+            completed or an error occurs, or timeout happens. Status polling
+            backs off up to 3 seconds.
 
             Args:
                 task: Task description in human language.
@@ -826,7 +854,6 @@ class AsyncAgent(AsyncBaseService):
             }
 
             poll_interval = 3
-            max_poll_attempts = timeout // poll_interval
 
             try:
                 tool_name = self._get_tool_name("execute")
@@ -885,11 +912,11 @@ class AsyncAgent(AsyncBaseService):
                 )
 
             last_request_id = result.request_id
-            tried_time: int = 0
             processed_timestamps = set()  # Track processed stream fragments by timestamp_ms
             last_query = None  # Save last query status for timeout result
-            while tried_time < max_poll_attempts:
-                query = await self.get_task_status(task_id)
+
+            def on_status(query: Any) -> None:
+                nonlocal last_query
                 # Only update last_query if stream is not empty
                 if query.stream:
                     last_query = query
@@ -917,47 +944,50 @@ class AsyncAgent(AsyncBaseService):
                 if query.error:
                     _logger.warning(f"⚠️ Task error: {query.error}")
 
-                if query.task_status == "completed":
-                    return ExecutionResult(
-                        request_id=last_request_id,
-                        success=True,
-                        error_message="",
-                        task_id=task_id,
-                        task_status=query.task_status,
-                        task_result=query.task_product,
-                    )
-                elif query.task_status == "failed":
-                    error_msg = query.error or query.error_message or "Failed to execute task."
-                    return ExecutionResult(
-                        request_id=query.request_id,
-                        success=False,
-                        error_message=error_msg,
-                        task_id=task_id,
-                        task_status=query.task_status,
-                    )
-                elif query.task_status == "cancelled":
-                    error_msg = query.error or query.error_message or "Task was cancelled."
-                    return ExecutionResult(
-                        request_id=query.request_id,
-                        success=False,
-                        error_message=error_msg,
-                        task_id=task_id,
-                        task_status=query.task_status,
-                    )
-                elif query.task_status == "unsupported":
-                    error_msg = query.error or query.error_message or "Unsupported task."
-                    return ExecutionResult(
-                        request_id=query.request_id,
-                        success=False,
-                        error_message=error_msg,
-                        task_id=task_id,
-                        task_status=query.task_status,
-                    )
-                _logger.info(
-                    f"⏳ Task {task_id} running 🚀: {query.task_action}."
+            outcome = await self._wait_for_task(
+                task_id,
+                timeout,
+                poll_interval,
+                ("completed", "failed", "cancelled", "unsupported"),
+                on_status=on_status,
+            )
+            query = outcome.value
+            if query.task_status == "completed":
+                return ExecutionResult(
+                    request_id=last_request_id,
+                    success=True,
+                    error_message="",
+                    task_id=task_id,
+                    task_status=query.task_status,
+                    task_result=query.task_product,
+                )
+            elif query.task_status == "failed":
+                error_msg = query.error or query.error_message or "Failed to execute task."
+                return ExecutionResult(
+                    request_id=query.request_id,
+                    success=False,
+                    error_message=error_msg,
+                    task_id=task_id,
+                    task_status=query.task_status,
+                )
+            elif query.task_status == "cancelled":
+                error_msg = query.error or query.error_message or "Task was cancelled."
+                return ExecutionResult(
+                    request_id=query.request_id,
+                    success=False,
+                    error_message=error_msg,
+                    task_id=task_id,
+                    task_status=query.task_status,
+                )
+            elif query.task_status == "unsupported":
+                error_msg = query.error or query.error_message or "Unsupported task."
+                return ExecutionResult(
+                    request_id=query.request_id,
+                    success=False,
+                    error_message=error_msg,
+                    task_id=task_id,
+                    task_status=query.task_status,
                 )
-                await asyncio.sleep(poll_interval)
-                tried_time += 1
 
             _logger.warning("⚠️ task execution timeout!")
             try:
@@ -970,31 +1000,25 @@ class AsyncAgent(AsyncBaseService):
                 _logger.warning(f"⚠️ Exception while terminating task {task_id} after timeout: {e}")
 
             _logger.info(f"⏳ Waiting for task {task_id} to be fully terminated...")
-            terminate_poll_interval = 1
-            max_terminate_poll_attempts = 30
-            terminate_tried_time = 0
-            task_terminated_confirmed = False
-
-            while terminate_tried_time < max_terminate_poll_attempts:
-                try:
-                    status_query = await self.get_task_status(task_id)
-                    if not status_query.success:
-                        error_msg = status_query.error_message or ""
-                        if error_msg.startswith("Task not found or already finished"):
-                            _logger.info(f"✅ Task {task_id} confirmed terminated (not found or finished)")
-                            task_terminated_confirmed = True
-                            break
-                    await asyncio.sleep(terminate_poll_interval)
-                    terminate_tried_time += 1
-                except Exception as e:
-                    _logger.warning(f"⚠️ Exception while polling task status during termination: {e}")
-                    await asyncio.sleep(terminate_poll_interval)
-                    terminate_tried_time += 1
-
-            if not task_terminated_confirmed:
+            def terminated(status_query: Any) -> bool:
+                error_msg = status_query.error_message or ""
+                return not status_query.success and error_msg.startswith(
+                    "Task not found or already finished"
+                )
+
+            terminate_outcome = await poll_until(
+                lambda: self.get_task_status(task_id),
+                done=terminated,
+                timeout=30,
+                policy=PollPolicy.up_to(1.0),
+                name="agent.terminate_task",
+            )
+            if terminate_outcome.done:
+                _logger.info(f"✅ Task {task_id} confirmed terminated (not found or finished)")
+            else:
                 _logger.warning(f"⚠️ Timeout waiting for task {task_id} to be fully terminated")
 
-            timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times (max: {max_poll_attempts})."
+            timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {outcome.probes} times."
 
             # Build task_result with last query status information
             task_result_parts = [f"Task execution timed out after {timeout} seconds."]
@@ -1,13 +1,13 @@
-import asyncio
 import copy
 import json
 import os
 import random
 import string
 import time
+from contextlib import asynccontextmanager
 from enum import Enum
 from threading import Lock
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from alibabacloud_tea_openapi import models as open_api_models
 from alibabacloud_tea_openapi.exceptions._client import ClientException
@@ -40,6 +40,7 @@ from .._common.models import (
 )
 from .._common.version import __is_release__, __version__
 from .._common.enums import SessionStatus
+from .._common.exceptions import SessionError
 from ..api.client import Client as mcp_client
 from ..api.models import (
     CreateMcpSessionRequest,
@@ -48,9 +49,13 @@ from ..api.models import (
     ResumeSessionAsyncRequest,
 )
 from .._common.models.mcp_tool import McpTool
+from .._common.utils.polling import PollPolicy
+from .._common.utils.session_cache import SessionCache
 from .context import AsyncContextService
 from .beta_network import AsyncBetaNetworkService
+from .polling import poll_until
 from .session import AsyncSession
+from .session_reaper import AsyncSessionReaper
 from .._common.params.session_params import CreateSessionParams
 
 # Initialize logger for this module
@@ -68,6 +73,8 @@ class AsyncAgentBay:
         api_key: str = "",
         cfg: Optional[Config] = None,
         env_file: Optional[str] = None,
+        session_cache_size: int = 1024,
+        session_cache_ttl: Optional[float] = 3600.0,
     ):
         """
         Initialize AsyncAgentBay client.
@@ -76,6 +83,11 @@ class AsyncAgentBay:
             api_key: API key for authentication. If not provided, will read from AGENTBAY_API_KEY environment variable.
             cfg: Configuration object. If not provided, will load from environment variables and .env file.
             env_file: Custom path to .env file. If not provided, will search upward from current directory.
+            session_cache_size: Maximum number of sessions the client keeps strongly referenced. Defaults to 1024.
+            session_cache_ttl: Seconds an unused session stays strongly referenced; None disables expiry. Defaults to 3600.
+
+        Raises:
+            ValueError: If no API key is available, or the session cache bounds are not positive.
         """
         if not api_key:
             api_key = os.getenv("AGENTBAY_API_KEY") or ""
@@ -97,8 +109,9 @@ class AsyncAgentBay:
         config.connect_timeout = config_data["timeout_ms"]
 
         self.client = mcp_client(config)
-        self._sessions = {}
+        self._sessions = SessionCache(max_size=session_cache_size, ttl=session_cache_ttl)
         self._lock = Lock()
+        self._reaper: Optional[AsyncSessionReaper] = None
 
         # Initialize context service
         self.context = AsyncContextService(self)
@@ -231,67 +244,51 @@ class AsyncAgentBay:
         """
         Wait for context synchronization to complete asynchronously.
 
-        Uses exponential backoff to balance between quick response and server load:
-        - Starts with short intervals (0.5s) for fast completion detection
-        - Gradually increases intervals (up to 5s max) to reduce server load
-        - Uses exponential backoff factor of 1.1
+        The first status check happens immediately; later checks back off
+        exponentially (with jitter) from 0.5s up to 5s to limit server load.
 
         Args:
             session: The session to wait for context synchronization
         """
         _log_operation_start("Context synchronization", "Waiting for completion")
 
-        # Exponential backoff configuration
-        initial_interval = 0.5  # Start with 0.5 seconds for quick response
-        max_interval = 5.0  # Maximum interval to avoid excessive delays
-        backoff_factor = 1.1  # Multiply interval by this factor each retry
-        max_retries = 50  # Maximum number of retries
-
-        current_interval = initial_interval
-
-        for retry in range(max_retries):
-            # Get context status data
-            try:
-                info_result = await session.context.info()
-            except Exception as e:
-                _logger.error(f"Error getting context info on attempt {retry+1}: {e}")
-                await asyncio.sleep(current_interval)
-                current_interval = min(current_interval * backoff_factor, max_interval)
-                continue
-
-            # Check if all context items have status "Success" or "Failed"
-            all_completed = True
-            has_failure = False
-
+        def all_completed(info_result: Any) -> bool:
+            # Done once every context item has status "Success" or "Failed"
             for item in info_result.context_status_data:
                 _logger.info(
                     f"📁 Context {item.context_id} status: {item.status}, path: {item.path}"
                 )
-
                 if item.status != "Success" and item.status != "Failed":
-                    all_completed = False
-                    break
-
-                if item.status == "Failed":
-                    has_failure = True
-                    _logger.error(
-                        f"❌ Context synchronization failed for {item.context_id}: {item.error_message}"
-                    )
-
-            if all_completed or not info_result.context_status_data:
-                if has_failure:
-                    _log_warning("Context synchronization completed with failures")
-                else:
-                    _log_operation_success("Context synchronization")
-                break
-
-            _logger.debug(
-                f"⏳ Waiting for context synchronization, attempt {retry+1}/{max_retries}, next interval: {current_interval:.2f}s"
+                    return False
+            return True
+
+        outcome = await poll_until(
+            session.context.info,
+            done=all_completed,
+            policy=PollPolicy(initial_interval=0.5, max_interval=5.0),
+            max_probes=50,
+            name="agentbay.context_sync",
+        )
+        if outcome.error is not None:
+            _logger.error(
+                f"Error getting context info on attempt {outcome.probes}: {outcome.error}"
             )
-            await asyncio.sleep(current_interval)
+        if not outcome.done:
+            return
 
-            # Exponential backoff: increase interval for next retry, capped at max_interval
-            current_interval = min(current_interval * backoff_factor, max_interval)
+        failures = [
+            item
+            for item in outcome.value.context_status_data
+            if item.status == "Failed"
+        ]
+        for item in failures:
+            _logger.error(
+                f"❌ Context synchronization failed for {item.context_id}: {item.error_message}"
+            )
+        if failures:
+            _log_warning("Context synchronization completed with failures")
+        else:
+            _log_operation_success("Context synchronization")
 
     async def _wait_for_mobile_simulate(
         self,
@@ -709,6 +706,7 @@ class AsyncAgentBay:
         page: Optional[int] = None,
         limit: Optional[int] = None,
         status: Optional[str] = None,
+        next_token: Optional[str] = None,
     ) -> SessionListResult:
         """
         Returns paginated list of session IDs filtered by labels asynchronously.
@@ -723,6 +721,9 @@ class AsyncAgentBay:
             status (Optional[str], optional): Status to filter sessions. Must be one of:
                 RUNNING, PAUSING, PAUSED, RESUMING, DELETING, DELETED.
                 Defaults to None (returns sessions with any status).
+            next_token (Optional[str], optional): `next_token` of the previous page;
+                fetches the following page directly instead of walking to `page`.
+                Defaults to None.
 
         Returns:
             SessionListResult: Paginated list of session IDs that match the filters.
@@ -760,9 +761,10 @@ class AsyncAgentBay:
                     total_count=0,
                 )
 
-            # Calculate next_token based on page number
-            next_token = ""
-            if page is not None and page > 1:
+            # Calculate next_token based on page number, unless the caller has it
+            resume_token = next_token
+            next_token = resume_token or ""
+            if not resume_token and page is not None and page > 1:
                 # We need to fetch pages 1 through page-1 to get the next_token
                 current_page = 1
                 while current_page < page:
@@ -919,7 +921,7 @@ class AsyncAgentBay:
             )
 
     async def delete(
-        self, session: AsyncSession, sync_context: bool = False
+        self, session: AsyncSession, sync_context: bool = False, wait: bool = True
     ) -> DeleteResult:
         """
         Delete a session by session object asynchronously.
@@ -928,13 +930,19 @@ class AsyncAgentBay:
             session (AsyncSession): The session to delete.
             sync_context (bool): Whether to sync context data (trigger file uploads)
                 before deleting the session. Defaults to False.
+            wait (bool): Wait until the session is gone. With False the call
+                returns once the deletion is accepted and `reaper` confirms it
+                in the background. Defaults to True.
 
         Returns:
             DeleteResult: Result indicating success or failure and request ID.
         """
         try:
             # Delete the session and get the result
-            delete_result = await session.delete(sync_context=sync_context)
+            if wait:
+                delete_result = await session.delete(sync_context=sync_context)
+            else:
+                delete_result = await session.delete(sync_context=sync_context, wait=False)
 
             with self._lock:
                 self._sessions.pop(session.session_id, None)
@@ -950,6 +958,70 @@ class AsyncAgentBay:
                 error_message=f"Failed to delete session {session.session_id}: {e}",
             )
 
+    @property
+    def session_cache(self) -> SessionCache:
+        """
+        Cache of the session objects created or fetched by this client.
+
+        Bounded by size and idle time; sessions still referenced by the
+        application stay reachable. Use `session_cache.add_eviction_hook` to be
+        notified when sessions are evicted.
+        """
+        return self._sessions
+
+    @property
+    def reaper(self) -> AsyncSessionReaper:
+        """
+        Background reaper confirming and retrying session deletions.
+
+        Used by `delete(wait=False)` and `session()`. Check `reaper.leaked` for
+        sessions that could not be deleted, and call `await reaper.drain()`
+        before shutting down to let pending deletions finish.
+        """
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = AsyncSessionReaper()
+            return self._reaper
+
+    @asynccontextmanager
+    async def session(
+        self, params: Optional[CreateSessionParams] = None, sync_context: bool = False
+    ) -> AsyncIterator[AsyncSession]:
+        """
+        Create a session for the duration of an `async with` block.
+
+        On exit the session is handed to `reaper`, which deletes it in the
+        background, so leaving the block does not wait for the deletion.
+
+        Args:
+            params (Optional[CreateSessionParams], optional): Parameters for creating
+                the session. Defaults to None.
+            sync_context (bool, optional): Sync context data before the session is
+                deleted. Defaults to False.
+
+        Yields:
+            AsyncSession: The created session.
+
+        Raises:
+            SessionError: If the session cannot be created.
+
+        Example:
+            ```python
+            async with agent_bay.session(CreateSessionParams(image_id="linux_latest")) as session:
+                await session.command.execute_command("ls")
+            ```
+        """
+        result = await self.create(params)
+        if not result.success or result.session is None:
+            raise SessionError(f"Failed to create session: {result.error_message}")
+        session = result.session
+        try:
+            yield session
+        finally:
+            with self._lock:
+                self._sessions.pop(session.session_id, None)
+            self.reaper.submit(session, sync_context=sync_context)
+
     async def _get_session(self, session_id: str) -> GetSessionResult:
         """
         Get session information by session ID asynchronously.
@@ -1106,8 +1178,12 @@ class AsyncAgentBay:
                 error_message=f"Failed to get session {session_id}: {error_msg}",
             )
 
-        # Create the Session object
-        session = AsyncSession(self, session_id)
+        # Reuse the cached Session object, so every caller shares one instance
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = AsyncSession(self, session_id)
+                self._sessions[session_id] = session
 
         # Set ResourceUrl from GetSession response
         if get_result.data:
@@ -8,13 +8,41 @@ from typing import TYPE_CHECKING, Literal, Optional, Union
 from .._common.config import _BROWSER_DATA_PATH
 from .._common.exceptions import BrowserError
 from .._common.logger import _log_api_response_with_details, get_logger
+from .._common.utils.page_readiness import (
+    MAX_CAPTURE_HEIGHT,
+    POLL_MS,
+    READINESS_SCRIPT,
+    NetworkIdleTracker,
+    ReadinessMonitor,
+    check_wait,
+    parse_sample,
+    plan_tiles,
+)
 from ..api.models import InitBrowserRequest
 from .base_service import AsyncBaseService
 from .browser_agent import AsyncBrowserAgent
+from .browser_connection import AsyncBrowserConnection
 
 # Initialize logger for this module
 _logger = get_logger("browser")
 
+
+def _clip(sample: dict, y: int, height: int) -> dict:
+    """Playwright clip of a horizontal band of the page."""
+    return {"x": 0, "y": y, "width": sample["width"] or 1920, "height": height}
+
+
+def _screenshot_error(e: Exception) -> RuntimeError:
+    # Convert exception to string safely to avoid comparison issues
+    try:
+        error_str = str(e)
+    except:
+        error_str = "Unknown error occurred"
+    error_msg = f"Failed to capture screenshot: {error_str}"
+    _logger.error(error_msg)
+    return RuntimeError(error_msg)
+
+
 if TYPE_CHECKING:
     from .._common.models import FingerprintFormat
     from .._common.models import BrowserOption
@@ -31,6 +59,7 @@ class AsyncBrowser(AsyncBaseService):
         self._initialized = False
         self._option = None
         self.agent = AsyncBrowserAgent(self.session, self)
+        self.connection = AsyncBrowserConnection(self)
         self.endpoint_router_port = None
 
     async def initialize(self, option: Optional["BrowserOption"] = None) -> bool:
@@ -117,13 +146,33 @@ class AsyncBrowser(AsyncBaseService):
         """
         await self._stop_browser()
 
-    async def screenshot(self, page, full_page: bool = False, **options) -> bytes:
+    async def screenshot(
+        self,
+        page,
+        full_page: bool = False,
+        wait: str = "adaptive",
+        max_wait_ms: int = 10000,
+        max_height: int = MAX_CAPTURE_HEIGHT,
+        **options,
+    ) -> bytes:
         """
         Takes a screenshot of the specified page with enhanced options and error handling.
 
+        Before capturing, the page is given time to finish loading. With
+        `wait="adaptive"` it is scrolled one viewport at a time, to trigger lazy
+        content, and captured as soon as its height is stable and no image or
+        network request is pending, so a static page costs a few hundred
+        milliseconds and a busy one at most `max_wait_ms`. `wait="fast"` skips
+        this for pages that are known to be loaded.
+
         Args:
             page (Page): The Playwright Page object to take a screenshot of. This is a required parameter.
             full_page (bool): Whether to capture the full scrollable page. Defaults to False.
+            wait (str): Readiness preset, "adaptive" or "fast". Defaults to "adaptive".
+            max_wait_ms (int): Longest time spent waiting for the page to settle. Defaults to 10000.
+            max_height (int): With full_page, pages taller than this many pixels are
+                clipped to their top `max_height` pixels. Use `screenshot_tiles` to
+                capture them entirely. Defaults to 16384.
             **options: Additional screenshot options that will override defaults.
                       Common options include:
                       - type (str): Image type, either 'png' or 'jpeg' (default: 'png')
@@ -138,13 +187,79 @@ class AsyncBrowser(AsyncBaseService):
 
         Raises:
             BrowserError: If browser is not initialized.
+            ValueError: If page is None or wait is not a known preset.
             RuntimeError: If screenshot capture fails.
         """
+        enhanced_options = self._screenshot_options(page, wait, full_page, options)
+
+        try:
+            sample = await self._wait_until_ready(page, wait, max_wait_ms)
+            if full_page and "clip" not in options and sample["height"] > max_height:
+                # Clip very tall pages rather than rendering them in one piece
+                enhanced_options["clip"] = _clip(sample, 0, max_height)
+
+            # Take the screenshot
+            screenshot_bytes = await page.screenshot(**enhanced_options)
+            _logger.info("Screenshot captured successfully.")
+            return screenshot_bytes
+
+        except Exception as e:
+            raise _screenshot_error(e) from e
+
+    async def screenshot_tiles(
+        self,
+        page,
+        tile_height: int = 4096,
+        wait: str = "adaptive",
+        max_wait_ms: int = 10000,
+        **options,
+    ) -> typing.List[bytes]:
+        """
+        Captures the full page as a sequence of tiles, top to bottom.
+
+        Meant for pages too tall to capture in one piece: every tile is a
+        separate capture of at most `tile_height` pixels, so the browser never
+        renders the whole page at once. The page is waited for as in `screenshot`.
+
+        Args:
+            page (Page): The Playwright Page object to capture.
+            tile_height (int): Height of each tile in CSS pixels. Defaults to 4096.
+            wait (str): Readiness preset, "adaptive" or "fast". Defaults to "adaptive".
+            max_wait_ms (int): Longest time spent waiting for the page to settle. Defaults to 10000.
+            **options: Additional screenshot options, as in `screenshot`.
+
+        Returns:
+            List[bytes]: The tiles, each the image of one horizontal band of the page.
+
+        Raises:
+            BrowserError: If browser is not initialized.
+            ValueError: If page is None, wait is not a known preset or tile_height is not positive.
+            RuntimeError: If a capture fails.
+        """
+        enhanced_options = self._screenshot_options(page, wait, True, options)
+        if tile_height <= 0:
+            raise ValueError("tile_height must be positive")
+
+        try:
+            sample = await self._wait_until_ready(page, wait, max_wait_ms)
+            tiles = []
+            for y, height in plan_tiles(sample["height"], tile_height):
+                enhanced_options["clip"] = _clip(sample, y, height)
+                tiles.append(await page.screenshot(**enhanced_options))
+            _logger.info(f"Captured {len(tiles)} screenshot tiles successfully.")
+            return tiles
+
+        except Exception as e:
+            raise _screenshot_error(e) from e
+
+    def _screenshot_options(self, page, wait: str, full_page: bool, options) -> dict:
+        """Validate a screenshot call and build the options passed to Playwright."""
         # Check if browser is initialized
         if not self.is_initialized():
             raise BrowserError("Browser must be initialized before calling screenshot.")
         if page is None:
             raise ValueError("Page cannot be None")
+        check_wait(wait)
         # Set default enhanced options
         enhanced_options = {
             "animations": "disabled",
@@ -157,70 +272,66 @@ class AsyncBrowser(AsyncBaseService):
 
         # Update with user-provided options (but full_page is already set from function parameter)
         enhanced_options.update(options)
+        return enhanced_options
 
-        try:
-            # Wait for page to load
-            # await page.wait_for_load_state("networkidle")
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_load_state("domcontentloaded", timeout=30000)
-            # Scroll to load all content (especially for lazy-loaded elements)
-            await self._scroll_to_load_all_content_async(page)
-
-            # Ensure images with data-src attributes are loaded
-            await page.evaluate(
-                """
-                () => {
-                    document.querySelectorAll('img[data-src]').forEach(img => {
-                        if (!img.src && img.dataset.src) {
-                            img.src = img.dataset.src;
-                        }
-                    });
-                    // Also handle background-image[data-bg]
-                    document.querySelectorAll('[data-bg]').forEach(el => {
-                        if (!el.style.backgroundImage) {
-                            el.style.backgroundImage = `url(${el.dataset.bg})`;
-                        }
-                    });
-                }
-            """
-            )
+    async def _wait_until_ready(self, page, wait: str, max_wait_ms: int) -> dict:
+        """
+        Wait until the page is ready to capture and return its last readiness sample.
 
-            # Wait a bit for images to load
-            await page.wait_for_timeout(1500)
-            final_height = await page.evaluate("document.body.scrollHeight")
-            await page.set_viewport_size(
-                {"width": 1920, "height": min(final_height, 10000)}
-            )
+        See `agentbay._common.utils.page_readiness` for the criteria.
+        """
+        await page.wait_for_load_state("domcontentloaded", timeout=30000)
+        if wait == "fast":
+            return parse_sample(await page.evaluate(READINESS_SCRIPT, False))
 
-            # Take the screenshot
-            screenshot_bytes = await page.screenshot(**enhanced_options)
-            _logger.info("Screenshot captured successfully.")
-            return screenshot_bytes
+        deadline = time.monotonic() + max_wait_ms / 1000
+        cdp, tracker = await self._track_network(page)
+        try:
+            scroll_y = await page.evaluate("window.scrollY")
+            monitor = ReadinessMonitor()
+            while True:
+                sample = parse_sample(await page.evaluate(READINESS_SCRIPT, True))
+                inflight = tracker.inflight(time.monotonic()) if tracker else 0
+                if monitor.update(sample, inflight):
+                    break
+                if time.monotonic() >= deadline:
+                    _logger.warning(
+                        f"Page not settled after {max_wait_ms}ms, capturing anyway"
+                    )
+                    break
+                await page.wait_for_timeout(POLL_MS)
+            # Capture what the caller was looking at, not the bottom of the page
+            await page.evaluate("(y) => window.scrollTo(0, y)", scroll_y)
+        finally:
+            if cdp is not None:
+                try:
+                    await cdp.detach()
+                except Exception:
+                    pass
+        return sample
+
+    async def _track_network(self, page):
+        """
+        Start counting the requests in flight through a CDP session.
 
-        except Exception as e:
-            # Convert exception to string safely to avoid comparison issues
-            try:
-                error_str = str(e)
-            except:
-                error_str = "Unknown error occurred"
-            error_msg = f"Failed to capture screenshot: {error_str}"
-            _logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-
-    async def _scroll_to_load_all_content_async(
-        self, page, max_scrolls: int = 8, delay_ms: int = 1200
-    ):
-        """Async version of _scroll_to_load_all_content."""
-        last_height = 0
-        for _ in range(max_scrolls):
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(delay_ms)
-            new_height = await page.evaluate(
-                "Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)"
+        Returns:
+            Tuple: The CDP session and its NetworkIdleTracker, or (None, None) when
+                the browser exposes no CDP session.
+        """
+        tracker = NetworkIdleTracker()
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            cdp.on(
+                "Network.requestWillBeSent",
+                lambda event: tracker.request_started(event, time.monotonic()),
             )
-            if new_height == last_height:
-                break
-            last_height = new_height
+            cdp.on("Network.loadingFinished", tracker.request_done)
+            cdp.on("Network.loadingFailed", tracker.request_done)
+            await cdp.send("Network.enable")
+        except Exception as e:
+            _logger.debug(f"Network tracking unavailable, using page signals only: {e}")
+            return None, None
+        return cdp, tracker
 
     async def _stop_browser(self):
         """
@@ -231,6 +342,7 @@ class AsyncBrowser(AsyncBaseService):
                 "stopChrome",
                 {},
             )
+            await self.connection.close()
             self._initialized = False
             self._endpoint_router_port = None
             self._endpoint_url = None
@@ -238,10 +350,18 @@ class AsyncBrowser(AsyncBaseService):
         else:
             raise BrowserError("Browser is not initialized. Cannot stop browser.")
 
-    async def get_endpoint_url(self) -> str:
+    async def get_endpoint_url(self, refresh: bool = False) -> str:
         """
         Returns the endpoint URL if the browser is initialized, otherwise raises an exception.
-        When initialized, always fetches the latest CDP url from session.get_link().
+        The CDP url is fetched from the server and reused for `connection.endpoint_ttl`
+        seconds (five minutes by default); pass refresh=True to fetch a new one.
+
+        To drive the browser with Playwright, prefer `connection.connect()`, which
+        also reuses one CDP connection for the whole session.
+
+        Args:
+            refresh (bool, optional): Fetch a new endpoint even if the cached one
+                has not expired. Defaults to False.
 
         Returns:
             str: The browser CDP endpoint URL.
@@ -260,6 +380,10 @@ class AsyncBrowser(AsyncBaseService):
             await session.delete()
             ```
         """
+        return await self.connection.get_endpoint_url(refresh)
+
+    async def _fetch_endpoint_url(self) -> str:
+        """Fetch the latest CDP url of the browser with GetCdpLink."""
         if not self.is_initialized():
             raise BrowserError(
                 "Browser is not initialized. Cannot access endpoint URL."
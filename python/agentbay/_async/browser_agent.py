@@ -1,12 +1,12 @@
-import asyncio
 import json
 import time
-from typing import List, Dict, Union, Any, Optional, Tuple, TypeVar
+from typing import Callable, List, Dict, Union, Any, Optional, Tuple, TypeVar
 from pydantic import BaseModel
 
 from .._common.exceptions import AgentBayError, BrowserError
 from .._common.logger import get_logger
 from .._common.models import OperationResult
+from .._common.utils.polling import PollOutcome, PollPolicy
 from .._common.models.browser_agent import (
     ActOptions,
     ActResult,
@@ -15,6 +15,7 @@ from .._common.models.browser_agent import (
     ExtractOptions,
 )
 from .base_service import AsyncBaseService as BaseService
+from .polling import poll_until
 from .._common.trace_manager import TraceManager
 
 _logger = get_logger("browser_agent")
@@ -29,6 +30,9 @@ ERROR_EXTRACT_FAIL = 9040
 ERROR_EXTRACT_START_FAIL = 9041
 ERROR_EXTRACT_TIMEOUT = 9042
 
+# Agent tasks take seconds; check soon after starting, then back off
+_TASK_POLL_POLICY = PollPolicy(first_delay=0.5, initial_interval=0.5, max_interval=5.0)
+
 
 class AsyncBrowserAgent(BaseService):
     """
@@ -257,97 +261,90 @@ class AsyncBrowserAgent(BaseService):
             raise BrowserError(error_msg)
 
         task_id = json.loads(response.data)["task_id"]
-        poll_interval_sec = 5.0
-        start_ts = time.monotonic()
-        client_timeout: Optional[int] = None
-        if isinstance(action_input, ActOptions):
-            client_timeout = action_input.timeout
+        timeout_s = 300
+        if isinstance(action_input, ActOptions) and action_input.timeout is not None:
+            timeout_s = action_input.timeout
+        no_action_msg = "No actions have been executed."
 
-        while True:
-            await asyncio.sleep(poll_interval_sec)
-            if hasattr(self, "mcp_client") and self.mcp_client:
-                result = await self._call_mcp_tool_async(
-                    "page_use_get_act_result", {"task_id": task_id}
-                )
-            else:
-                result = await self._call_mcp_tool_timeout(
-                    "page_use_get_act_result", {"task_id": task_id}
-                )
-            if result.success and result.data:
-                data = (
-                    json.loads(result.data)
-                    if isinstance(result.data, str)
-                    else result.data
-                )
-                steps = data.get("steps", [])
-                is_done = data.get("is_done", False)
-                success = bool(data.get("success", False))
-                no_action_msg = "No actions have been executed."
-                if is_done:
-                    if steps:
-                        task_status = (
-                            steps
-                            if isinstance(steps, str)
-                            else json.dumps(steps, ensure_ascii=False)
-                        )
-                    else:
-                        task_status = no_action_msg
-                    _logger.info(
-                        f"Task {task_id}:{task_name} is done. Success: {success}. {task_status}"
-                    )
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    result_request_id = result.request_id if result else ""
-                    trace_manager.send_trace(
-                        owner="browser_agent",
-                        trace_data={
-                            "event": event_name,
-                            "context_id": str(context_id),
-                            "page_id": page_id or "default",
-                            "task_id": task_id,
-                            "task_name": task_name,
-                            "status": "success" if success else "error",
-                            "duration_ms": str(duration_ms),
-                            "steps_count": str(len(steps) if steps else 0),
-                            "request_id": result_request_id,
-                            **({"errorCode": str(ERROR_ACT_TASK_FAILED), "errorMessage": task_status} if not success else {}),
-                        },
-                        span_key=span_key,
-                        biz_index=0,
-                        extra=trace_extra,
-                        is_start=False,
-                    )
-                    return ActResult(success=success, message=task_status)
+        def act_done(result: Any) -> bool:
+            if not (result.success and result.data):
+                return False
+            data = self._parse_task_data(result.data)
+            if data.get("is_done", False):
+                return True
+            steps = data.get("steps", [])
+            task_status = (
+                f"{len(steps)} steps done. Details: {steps}"
+                if steps
+                else no_action_msg
+            )
+            _logger.info(f"Task {task_id}:{task_name} in progress. {task_status}")
+            return False
+
+        outcome = await self._poll_task_result(
+            "page_use_get_act_result", task_id, timeout_s, act_done, "browser_agent.act"
+        )
+        if outcome.done:
+            result = outcome.value
+            data = self._parse_task_data(result.data)
+            steps = data.get("steps", [])
+            success = bool(data.get("success", False))
+            if steps:
                 task_status = (
-                    f"{len(steps)} steps done. Details: {steps}"
-                    if steps
-                    else no_action_msg
+                    steps
+                    if isinstance(steps, str)
+                    else json.dumps(steps, ensure_ascii=False)
                 )
-                _logger.info(f"Task {task_id}:{task_name} in progress. {task_status}")
-            elapsed = time.monotonic() - start_ts
-            timeout_s = client_timeout if client_timeout is not None else 300
-            if elapsed >= timeout_s:
-                error_msg = f"Task {task_id}:{task_name} timeout after {timeout_s}s"
-                duration_ms = int((time.time() - start_time) * 1000)
-                trace_manager.send_trace(
-                    owner="browser_agent",
-                    trace_data={
-                        "event": event_name,
-                        "context_id": str(context_id),
-                        "page_id": page_id or "default",
-                        "task_id": task_id,
-                        "task_name": task_name,
-                        "status": "error",
-                        "duration_ms": str(duration_ms),
-                        "errorCode": str(ERROR_ACT_TIMEOUT),
-                        "errorMessage": error_msg,
-                        "request_id": request_id,
-                    },
-                    span_key=span_key,
-                    biz_index=0,
-                    extra=trace_extra,
-                    is_start=False,
-                )
-                raise BrowserError(error_msg)
+            else:
+                task_status = no_action_msg
+            _logger.info(
+                f"Task {task_id}:{task_name} is done. Success: {success}. {task_status}"
+            )
+            duration_ms = int((time.time() - start_time) * 1000)
+            result_request_id = result.request_id if result else ""
+            trace_manager.send_trace(
+                owner="browser_agent",
+                trace_data={
+                    "event": event_name,
+                    "context_id": str(context_id),
+                    "page_id": page_id or "default",
+                    "task_id": task_id,
+                    "task_name": task_name,
+                    "status": "success" if success else "error",
+                    "duration_ms": str(duration_ms),
+                    "steps_count": str(len(steps) if steps else 0),
+                    "request_id": result_request_id,
+                    **({"errorCode": str(ERROR_ACT_TASK_FAILED), "errorMessage": task_status} if not success else {}),
+                },
+                span_key=span_key,
+                biz_index=0,
+                extra=trace_extra,
+                is_start=False,
+            )
+            return ActResult(success=success, message=task_status)
+
+        error_msg = f"Task {task_id}:{task_name} timeout after {timeout_s}s"
+        duration_ms = int((time.time() - start_time) * 1000)
+        trace_manager.send_trace(
+            owner="browser_agent",
+            trace_data={
+                "event": event_name,
+                "context_id": str(context_id),
+                "page_id": page_id or "default",
+                "task_id": task_id,
+                "task_name": task_name,
+                "status": "error",
+                "duration_ms": str(duration_ms),
+                "errorCode": str(ERROR_ACT_TIMEOUT),
+                "errorMessage": error_msg,
+                "request_id": request_id,
+            },
+            span_key=span_key,
+            biz_index=0,
+            extra=trace_extra,
+            is_start=False,
+        )
+        raise BrowserError(error_msg)
 
     async def observe(
         self,
@@ -450,89 +447,78 @@ class AsyncBrowserAgent(BaseService):
         )
         task_id = task_info["task_id"]
 
-        client_timeout: Optional[int] = options.timeout
-        poll_interval_sec = 5.0
-        start_ts = time.monotonic()
+        timeout_s = options.timeout if options.timeout is not None else 300
 
-        while True:
-            await asyncio.sleep(poll_interval_sec)
-            if hasattr(self, "mcp_client") and self.mcp_client:
-                result = await self._call_mcp_tool_async(
-                    "page_use_get_observe_result", {"task_id": task_id}
-                )
-            else:
-                result = await self._call_mcp_tool_timeout(
-                    "page_use_get_observe_result", {"task_id": task_id}
-                )
+        def has_result(result: Any) -> bool:
             if result.success and result.data:
-                data = (
-                    json.loads(result.data)
-                    if isinstance(result.data, str)
-                    else result.data
-                )
-                _logger.info(f"observe results: {data}")
-                results: List[ObserveResult] = []
-                for item in data:
-                    selector = item.get("selector", "")
-                    description = item.get("description", "")
-                    method = item.get("method", "")
-                    arguments_str = item.get("arguments", "{}")
-                    try:
-                        arguments_dict = json.loads(arguments_str)
-                    except json.JSONDecodeError:
-                        _logger.warning(
-                            f"Warning: Could not parse arguments as JSON: {arguments_str}"
-                        )
-                        arguments_dict = arguments_str
-                    results.append(
-                        ObserveResult(selector, description, method, arguments_dict)
-                    )
+                return True
+            _logger.debug(f"Task {task_id}: No observe result yet")
+            return False
 
-                duration_ms = int((time.time() - start_time) * 1000)
-                result_request_id = result.request_id if result else ""
-                trace_manager.send_trace(
-                    owner="browser_agent",
-                    trace_data={
-                        "event": event_name,
-                        "context_id": str(context_id),
-                        "page_id": page_id or "default",
-                        "status": "success",
-                        "duration_ms": str(duration_ms),
-                        "results_count": str(len(results)),
-                        "request_id": result_request_id,
-                    },
-                    span_key=span_key,
-                    biz_index=0,
-                    extra=trace_extra,
-                    is_start=False,
+        outcome = await self._poll_task_result(
+            "page_use_get_observe_result", task_id, timeout_s, has_result, "browser_agent.observe"
+        )
+        if outcome.done:
+            result = outcome.value
+            data = self._parse_task_data(result.data)
+            _logger.info(f"observe results: {data}")
+            results: List[ObserveResult] = []
+            for item in data:
+                selector = item.get("selector", "")
+                description = item.get("description", "")
+                method = item.get("method", "")
+                arguments_str = item.get("arguments", "{}")
+                try:
+                    arguments_dict = json.loads(arguments_str)
+                except json.JSONDecodeError:
+                    _logger.warning(
+                        f"Warning: Could not parse arguments as JSON: {arguments_str}"
+                    )
+                    arguments_dict = arguments_str
+                results.append(
+                    ObserveResult(selector, description, method, arguments_dict)
                 )
-                return True, results
-            elapsed = time.monotonic() - start_ts
-            _logger.debug(
-                f"Task {task_id}: No observe result yet (elapsed={elapsed:.0f}s)"
+
+            duration_ms = int((time.time() - start_time) * 1000)
+            result_request_id = result.request_id if result else ""
+            trace_manager.send_trace(
+                owner="browser_agent",
+                trace_data={
+                    "event": event_name,
+                    "context_id": str(context_id),
+                    "page_id": page_id or "default",
+                    "status": "success",
+                    "duration_ms": str(duration_ms),
+                    "results_count": str(len(results)),
+                    "request_id": result_request_id,
+                },
+                span_key=span_key,
+                biz_index=0,
+                extra=trace_extra,
+                is_start=False,
             )
-            timeout_s = client_timeout if client_timeout is not None else 300
-            if elapsed >= timeout_s:
-                error_msg = f"Task {task_id}: Observe timeout after {timeout_s}s"
-                duration_ms = int((time.time() - start_time) * 1000)
-                trace_manager.send_trace(
-                    owner="browser_agent",
-                    trace_data={
-                        "event": event_name,
-                        "context_id": str(context_id),
-                        "page_id": page_id or "default",
-                        "status": "error",
-                        "duration_ms": str(duration_ms),
-                        "errorCode": str(ERROR_OBSERVE_FAIL),
-                        "errorMessage": error_msg,
-                        "request_id": request_id,
-                    },
-                    span_key=span_key,
-                    biz_index=0,
-                    extra=trace_extra,
-                    is_start=False,
-                )
-                raise BrowserError(error_msg)
+            return True, results
+
+        error_msg = f"Task {task_id}: Observe timeout after {timeout_s}s"
+        duration_ms = int((time.time() - start_time) * 1000)
+        trace_manager.send_trace(
+            owner="browser_agent",
+            trace_data={
+                "event": event_name,
+                "context_id": str(context_id),
+                "page_id": page_id or "default",
+                "status": "error",
+                "duration_ms": str(duration_ms),
+                "errorCode": str(ERROR_OBSERVE_FAIL),
+                "errorMessage": error_msg,
+                "request_id": request_id,
+            },
+            span_key=span_key,
+            biz_index=0,
+            extra=trace_extra,
+            is_start=False,
+        )
+        raise BrowserError(error_msg)
 
     async def extract(
         self,
@@ -633,78 +619,67 @@ class AsyncBrowserAgent(BaseService):
             raise BrowserError(error_msg)
 
         task_id = json.loads(response.data)["task_id"]
-        client_timeout: Optional[int] = options.timeout
-        poll_interval_sec = 8.0
-        start_ts = time.monotonic()
-
-        while True:
-            await asyncio.sleep(poll_interval_sec)
+        timeout_s = options.timeout if options.timeout is not None else 300
 
-            if hasattr(self, "mcp_client") and self.mcp_client:
-                result = await self._call_mcp_tool_async(
-                    "page_use_get_extract_result", {"task_id": task_id}
-                )
-            else:
-                result = await self._call_mcp_tool_timeout(
-                    "page_use_get_extract_result", {"task_id": task_id}
-                )
+        def has_result(result: Any) -> bool:
             if result.success and result.data:
-                extract_result = (
-                    json.loads(result.data)
-                    if isinstance(result.data, str)
-                    else result.data
-                )
-                duration_ms = int((time.time() - start_time) * 1000)
-                result_request_id = result.request_id if result else ""
-                trace_manager.send_trace(
-                    owner="browser_agent",
-                    trace_data={
-                        "event": event_name,
-                        "context_id": str(context_id),
-                        "page_id": page_id or "default",
-                        "task_id": task_id,
-                        "status": "success",
-                        "duration_ms": str(duration_ms),
-                        "result_length": str(len(str(extract_result))),
-                        "request_id": result_request_id,
-                    },
-                    span_key=span_key,
-                    biz_index=0,
-                    extra=trace_extra,
-                    is_start=False,
-                )
-                return True, options.schema.model_validate(extract_result)
-            elapsed = time.monotonic() - start_ts
-            _logger.debug(
-                f"Task {task_id}: No extract result yet (elapsed={elapsed:.0f}s)"
+                return True
+            _logger.debug(f"Task {task_id}: No extract result yet")
+            return False
+
+        outcome = await self._poll_task_result(
+            "page_use_get_extract_result", task_id, timeout_s, has_result, "browser_agent.extract"
+        )
+        if outcome.done:
+            result = outcome.value
+            extract_result = self._parse_task_data(result.data)
+            duration_ms = int((time.time() - start_time) * 1000)
+            result_request_id = result.request_id if result else ""
+            trace_manager.send_trace(
+                owner="browser_agent",
+                trace_data={
+                    "event": event_name,
+                    "context_id": str(context_id),
+                    "page_id": page_id or "default",
+                    "task_id": task_id,
+                    "status": "success",
+                    "duration_ms": str(duration_ms),
+                    "result_length": str(len(str(extract_result))),
+                    "request_id": result_request_id,
+                },
+                span_key=span_key,
+                biz_index=0,
+                extra=trace_extra,
+                is_start=False,
             )
-            timeout_s = client_timeout if client_timeout is not None else 300
-            if elapsed >= timeout_s:
-                error_msg = f"Task {task_id}: Extract timeout after {timeout_s}s"
-                duration_ms = int((time.time() - start_time) * 1000)
-                trace_manager.send_trace(
-                    owner="browser_agent",
-                    trace_data={
-                        "event": event_name,
-                        "context_id": str(context_id),
-                        "page_id": page_id or "default",
-                        "task_id": task_id,
-                        "status": "error",
-                        "duration_ms": str(duration_ms),
-                        "errorCode": str(ERROR_EXTRACT_TIMEOUT),
-                        "errorMessage": error_msg,
-                        "request_id": request_id,
-                    },
-                    span_key=span_key,
-                    biz_index=0,
-                    extra=trace_extra,
-                    is_start=False,
-                )
-                raise BrowserError(error_msg)
+            return True, options.schema.model_validate(extract_result)
+
+        error_msg = f"Task {task_id}: Extract timeout after {timeout_s}s"
+        duration_ms = int((time.time() - start_time) * 1000)
+        trace_manager.send_trace(
+            owner="browser_agent",
+            trace_data={
+                "event": event_name,
+                "context_id": str(context_id),
+                "page_id": page_id or "default",
+                "task_id": task_id,
+                "status": "error",
+                "duration_ms": str(duration_ms),
+                "errorCode": str(ERROR_EXTRACT_TIMEOUT),
+                "errorMessage": error_msg,
+                "request_id": request_id,
+            },
+            span_key=span_key,
+            biz_index=0,
+            extra=trace_extra,
+            is_start=False,
+        )
+        raise BrowserError(error_msg)
 
     async def _get_page_and_context_index(self, page):
         """
         Async version of _get_page_and_context_index for getting page and context indices asynchronously.
+        The target id is remembered per page by the browser connection.
         Args:
             page: Playwright Page object
         Returns:
@@ -714,18 +689,7 @@ class AsyncBrowserAgent(BaseService):
         """
         if page is None:
             return None, 0
-        try:
-            cdp_session = await page.context.new_cdp_session(page)
-            target_info = await cdp_session.send("Target.getTargetInfo")
-            page_index = target_info["targetInfo"]["targetId"]
-            await cdp_session.detach()
-            if hasattr(page.context.browser, "contexts"):
-                context_index = page.context.browser.contexts.index(page.context)
-            else:
-                context_index = 0
-            return page_index, context_index
-        except Exception as e:
-            raise BrowserError(f"Failed to get page/context index: {e}") from e
+        return await self.browser.connection.page_info(page)
 
     def _handle_error(self, e):
         """
@@ -744,6 +708,38 @@ class AsyncBrowserAgent(BaseService):
             return BrowserError(str(e))
         return e
 
+    async def _poll_task_result(
+        self,
+        tool_name: str,
+        task_id: str,
+        timeout_s: float,
+        done: Callable[[Any], bool],
+        metric_name: str,
+    ) -> PollOutcome:
+        """
+        Poll an agent task until `done` accepts the result of `tool_name` or
+        `timeout_s` passes. The first check happens shortly after the task was
+        started; later checks back off up to 5 seconds.
+        """
+
+        async def fetch() -> OperationResult:
+            if hasattr(self, "mcp_client") and self.mcp_client:
+                return await self._call_mcp_tool_async(tool_name, {"task_id": task_id})
+            return await self._call_mcp_tool_timeout(tool_name, {"task_id": task_id})
+
+        return await poll_until(
+            fetch,
+            done=done,
+            timeout=timeout_s,
+            policy=_TASK_POLL_POLICY,
+            raise_errors=True,
+            name=metric_name,
+        )
+
+    @staticmethod
+    def _parse_task_data(data: Any) -> Any:
+        return json.loads(data) if isinstance(data, str) else data
+
     async def _call_mcp_tool_timeout(
         self, name: str, args: Dict[str, Any]
     ) -> OperationResult:
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, AsyncIterator, Callable, List, Tuple
+
+
+async def _call(fn: Callable[[Any], Any], item: Any) -> Any:
+    try:
+        return await fn(item)
+    except Exception as e:
+        return e
+
+
+async def map_unordered(
+    fn: Callable[[Any], Any], work: List[Any], concurrency: int
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Call `fn(item)` for the items of `work` with at most `concurrency` calls in
+    flight, yielding `(item, result)` as each call finishes.
+
+    Items are taken from `work` by position, so the consumer may append to it
+    while iterating (e.g. subdirectories discovered by a listing). A call that
+    raises yields the exception as its result.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    pending = {}
+    next_index = 0
+    try:
+        while True:
+            while len(pending) < concurrency and next_index < len(work):
+                item = work[next_index]
+                next_index += 1
+                pending[asyncio.ensure_future(_call(fn, item))] = item
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                yield item, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -1,9 +1,8 @@
-import asyncio
 import json
-import time
 from typing import TYPE_CHECKING, Any, List, Optional
 
 from .._common.exceptions import AgentBayError, ClearanceTimeoutError
+from .._common.utils.polling import PollPolicy
 from .._common.models.response import (
     ApiResponse,
     OperationResult,
@@ -28,6 +27,7 @@ from .._common.logger import (
     _log_operation_error,
     get_logger,
 )
+from .polling import poll_until
 
 # Initialize logger for this module
 _logger = get_logger("context")
@@ -1154,7 +1154,7 @@ class AsyncContextService:
         Args:
             context_id: Unique ID of the context to clear.
             timeout: Timeout in seconds to wait for task completion. Defaults to 60.
-            poll_interval: Interval in seconds between status polls. Defaults to 2.0.
+            poll_interval: Maximum interval in seconds between status polls. Defaults to 2.0.
 
         Returns:
             ClearContextResult object containing the final task result.
@@ -1178,52 +1178,44 @@ class AsyncContextService:
         _logger.info(f"Started context clearing task for: {context_id}")
 
         # 2. Poll task status until completion or timeout
-        start_time = time.time()
-        max_attempts = int(timeout / poll_interval)
-        attempt = 0
-
-        while attempt < max_attempts:
-            # Wait before querying
-            await asyncio.sleep(poll_interval)
-            attempt += 1
-
-            # Query task status (using GetContext API with context ID)
-            status_result = await self.get_clear_status(context_id)
-
+        def finished(status_result: ClearContextResult) -> bool:
+            if not status_result.success:
+                return True
+            status = status_result.status
+            _logger.debug(f"Clear task status: {status}")
+            # When clearing is complete, the state changes from "clearing" to "available"
+            if status not in ("available", "clearing", "pre-available"):
+                # Unexpected state; keep polling as it might transition to "available"
+                _logger.warning(f"Context in unexpected state: {status}")
+            return status == "available"
+
+        outcome = await poll_until(
+            lambda: self.get_clear_status(context_id),
+            done=finished,
+            timeout=timeout,
+            policy=PollPolicy.up_to(poll_interval),
+            raise_errors=True,
+            name="context.clear",
+        )
+        status_result = outcome.value
+        if outcome.done:
             if not status_result.success:
                 _logger.error(
                     f"Failed to get clear status: {status_result.error_message}"
                 )
                 return status_result
-
-            status = status_result.status
-            _logger.debug(
-                f"Clear task status: {status} (attempt {attempt}/{max_attempts})"
+            _logger.info(
+                f"Context cleared successfully in {outcome.elapsed:.2f} seconds"
+            )
+            return ClearContextResult(
+                request_id=start_result.request_id,
+                success=True,
+                context_id=status_result.context_id,
+                status=status_result.status,
+                error_message="",
             )
-
-            # Check if completed
-            # When clearing is complete, the state changes from "clearing" to "available"
-            if status == "available":
-                elapsed = time.time() - start_time
-                _logger.info(f"Context cleared successfully in {elapsed:.2f} seconds")
-                return ClearContextResult(
-                    request_id=start_result.request_id,
-                    success=True,
-                    context_id=status_result.context_id,
-                    status=status,
-                    error_message="",
-                )
-            elif status not in ("clearing", "pre-available"):
-                # If status is not "clearing" or "pre-available", and not "available",
-                # treat it as a potential error or unexpected state
-                elapsed = time.time() - start_time
-                _logger.warning(
-                    f"Context in unexpected state after {elapsed:.2f} seconds: {status}"
-                )
-                # Continue polling as the state might transition to "available"
 
         # Timeout
-        elapsed = time.time() - start_time
-        error_msg = f"Context clearing timed out after {elapsed:.2f} seconds"
+        error_msg = f"Context clearing timed out after {outcome.elapsed:.2f} seconds"
         _logger.error(f"{error_msg}")
         raise ClearanceTimeoutError(error_msg)
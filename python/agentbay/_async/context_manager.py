@@ -1,17 +1,105 @@
 import asyncio
 import json
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .._common.logger import _log_api_call, _log_api_response_with_details, get_logger
 from .._common.models.response import ApiResponse, extract_request_id
-from .._common.models.context import ContextStatusData, ContextInfoResult, ContextSyncResult
+from .._common.models.context import (
+    ContextInfoResult,
+    ContextStatusData,
+    ContextSyncItemResult,
+    ContextSyncManyResult,
+    ContextSyncResult,
+)
+from .._common.utils.polling import PollPolicy
 from ..api.models import GetContextInfoRequest, SyncContextRequest
+from .polling import poll_until
 
 # Initialize logger for this module
 _logger = get_logger("context_manager")
 
 
+class _SyncTracker:
+    """
+    Completion bookkeeping for `sync_many`: matches the entries of each status
+    query to the pending items and resolves every item that finished.
+    """
+
+    def __init__(
+        self,
+        items: List[Tuple[str, Optional[str], Optional[str]]],
+        start: float,
+        on_item_complete: Optional[Callable[[ContextSyncItemResult], None]],
+    ):
+        self.items = items
+        self._start = start
+        self._on_item_complete = on_item_complete
+        self.results = [
+            ContextSyncItemResult(context_id=cid, path=path, mode=mode)
+            for cid, path, mode in items
+        ]
+        self._pending = set()
+
+    def requested(self, index: int, request: ContextSyncResult) -> None:
+        result = self.results[index]
+        result.request_id = request.request_id
+        if request.success:
+            self._pending.add(index)
+        else:
+            result.status = "RequestFailed"
+            result.error_message = request.error_message or "SyncContext request failed"
+            self._resolve(index)
+
+    def update(self, info_result: ContextInfoResult) -> bool:
+        """Resolve the items that finished; True once nothing is pending."""
+        if not info_result.success:
+            return not self._pending
+        for index in sorted(self._pending):
+            context_id, path, mode = self.items[index]
+            entries = [
+                item
+                for item in info_result.context_status_data
+                if item.context_id == context_id
+                and (not path or item.path == path)
+                # We only care about sync tasks (upload/download)
+                and item.task_type in ("upload", "download")
+                and (mode not in ("upload", "download") or item.task_type == mode)
+            ]
+            if any(item.status not in ("Success", "Failed") for item in entries):
+                continue
+            result = self.results[index]
+            result.status_data = entries
+            failures = [item for item in entries if item.status == "Failed"]
+            if failures:
+                result.status = "Failed"
+                result.error_message = "; ".join(
+                    item.error_message or "Sync failed" for item in failures
+                )
+            else:
+                result.success = True
+                result.status = "Success" if entries else "NoTask"
+            self._resolve(index)
+        return not self._pending
+
+    def time_out_pending(self) -> None:
+        for index in sorted(self._pending):
+            result = self.results[index]
+            result.status = "Timeout"
+            result.error_message = "Timed out waiting for the sync to finish"
+            self._resolve(index)
+
+    def _resolve(self, index: int) -> None:
+        self._pending.discard(index)
+        result = self.results[index]
+        result.elapsed_ms = int((time.monotonic() - self._start) * 1000)
+        if self._on_item_complete is not None:
+            try:
+                self._on_item_complete(result)
+            except Exception as e:
+                _logger.warning(f"Context sync completion callback failed: {e}")
+
+
 
 class AsyncContextManager:
     """
@@ -159,7 +247,7 @@ class AsyncContextManager:
                   paths are acceptable)
             mode: Optional synchronization mode (e.g., "upload", "download")
             max_retries: Maximum number of retries for polling completion status (default: 150)
-            retry_interval: Milliseconds to wait between retries (default: 1500)
+            retry_interval: Maximum milliseconds between status checks (default: 1500)
 
         Returns:
             ContextSyncResult: Result object containing success status and request ID
@@ -194,6 +282,91 @@ class AsyncContextManager:
                 await on_sync_complete(sync_result)
                 await session.delete()
         """
+        result = await self._request_sync(context_id, path, mode)
+
+        # Wait for completion
+        if result.success:
+            final_success = await self._poll_for_completion(
+                context_id, path, max_retries, retry_interval
+            )
+            return ContextSyncResult(request_id=result.request_id, success=final_success)
+
+        return result
+
+    async def sync_many(
+        self,
+        items: Sequence[Tuple[str, Optional[str], Optional[str]]],
+        max_retries: int = 150,
+        retry_interval: int = 1500,
+        on_item_complete: Optional[Callable[[ContextSyncItemResult], None]] = None,
+    ) -> ContextSyncManyResult:
+        """
+        Synchronize several contexts at once and wait for all of them.
+
+        All SyncContext requests are sent concurrently; completion is then tracked
+        for every item from shared status queries (one GetContextInfo call per
+        poll for all items), and each item is resolved as soon as it finishes.
+
+        Args:
+            items: (context_id, path, mode) tuples; path and mode may be None.
+            max_retries: Bounds the total wait to max_retries * retry_interval
+                (default: 150)
+            retry_interval: Maximum milliseconds between status checks (default: 1500)
+            on_item_complete: Called with each item's result as soon as it finishes.
+
+        Returns:
+            ContextSyncManyResult: Per-item results (in the given order) with timing.
+
+        Example:
+            session_result = await agent_bay.create()
+            if session_result.success:
+                session = session_result.session
+                result = await session.context.sync_many([
+                    ("project-data", "/mnt/project", "upload"),
+                    ("reports", "/mnt/reports", "upload"),
+                ])
+                for path, item in result.by_path().items():
+                    print(f"{path}: {item.status} in {item.elapsed_ms}ms")
+                await session.delete()
+        """
+        start = time.monotonic()
+        tracker = _SyncTracker(list(items), start, on_item_complete)
+        if not tracker.items:
+            return ContextSyncManyResult(success=True)
+
+        tasks = [self._request_sync(cid, path, mode) for cid, path, mode in tracker.items]
+        requests = await asyncio.gather(*tasks)
+        for index, request in enumerate(requests):
+            tracker.requested(index, request)
+
+        outcome = await poll_until(
+            self.info,
+            done=tracker.update,
+            timeout=max_retries * retry_interval / 1000.0,
+            policy=PollPolicy.up_to(retry_interval / 1000.0),
+            name="context.sync_many",
+        )
+        tracker.time_out_pending()
+
+        results = tracker.results
+        failed = [r for r in results if not r.success]
+        return ContextSyncManyResult(
+            request_id=getattr(outcome.value, "request_id", ""),
+            success=not failed,
+            items=results,
+            elapsed_ms=int((time.monotonic() - start) * 1000),
+            error_message="; ".join(
+                f"{r.path or r.context_id}: {r.error_message}" for r in failed
+            ),
+        )
+
+    async def _request_sync(
+        self,
+        context_id: Optional[str] = None,
+        path: Optional[str] = None,
+        mode: Optional[str] = None,
+    ) -> ContextSyncResult:
+        """Send a SyncContext request without waiting for the sync to finish."""
         request = SyncContextRequest(
             authorization=f"Bearer {self.session._get_api_key()}",
             session_id=self.session._get_session_id(),
@@ -252,13 +425,6 @@ class AsyncContextManager:
                 key_fields={"context_id": context_id, "path": path or "default"},
             )
 
-        # Wait for completion
-        if success:
-            final_success = await self._poll_for_completion(
-                context_id, path, max_retries, retry_interval
-            )
-            return ContextSyncResult(request_id=request_id, success=final_success)
-
         return ContextSyncResult(request_id=request_id, success=success)
 
     async def _poll_for_completion(
@@ -275,64 +441,56 @@ class AsyncContextManager:
             context_id: ID of the context to check
             path: Path to check
             max_retries: Maximum number of retries
-            retry_interval: Milliseconds to wait between retries
+            retry_interval: Maximum milliseconds between status checks
 
         Returns:
             bool: True if sync completed successfully, False otherwise
         """
-        for retry in range(max_retries):
-            try:
-                # Get context status data
-                info_result = await self.info(context_id=context_id, path=path)
-
-                # Check if all sync tasks are completed
-                all_completed = True
-                has_failure = False
-                has_sync_tasks = False
-
-                for item in info_result.context_status_data:
-                    # We only care about sync tasks (upload/download)
-                    if item.task_type not in ["upload", "download"]:
-                        continue
-
-                    has_sync_tasks = True
-                    _logger.info(
-                        f"🔄 Sync task {item.context_id} status: {item.status}, path: {item.path}"
-                    )
-
-                    if item.status not in ["Success", "Failed"]:
-                        all_completed = False
-                        break
-
-                    if item.status == "Failed":
-                        has_failure = True
-                        _logger.error(
-                            f"❌ Sync failed for context {item.context_id}: {item.error_message}"
-                        )
-
-                if all_completed or not has_sync_tasks:
-                    # All tasks completed or no sync tasks found
-                    if has_failure:
-                        _logger.warning("Context sync completed with failures")
-                        return False
-                    elif has_sync_tasks:
-                        _logger.info("✅ Context sync completed successfully")
-                        return True
-                    else:
-                        _logger.info("ℹ️  No sync tasks found")
-                        return True
-
+        def sync_tasks(info_result: Any) -> list:
+            # We only care about sync tasks (upload/download)
+            return [
+                item
+                for item in info_result.context_status_data
+                if item.task_type in ["upload", "download"]
+            ]
+
+        def all_completed(info_result: Any) -> bool:
+            for item in sync_tasks(info_result):
                 _logger.info(
-                    f"⏳ Waiting for context sync to complete, attempt {retry+1}/{max_retries}"
+                    f"🔄 Sync task {item.context_id} status: {item.status}, path: {item.path}"
                 )
-                await asyncio.sleep(retry_interval / 1000.0)
-
-            except Exception as e:
-                _logger.error(
-                    f"❌ Error checking context status on attempt {retry+1}: {e}"
-                )
-                await asyncio.sleep(retry_interval / 1000.0)
-
-        # If we've exhausted all retries, return failure
-        _logger.error(f"❌ Context sync polling timed out after {max_retries} attempts")
-        return False
+                if item.status not in ["Success", "Failed"]:
+                    return False
+            return True
+
+        # Check right away, then back off up to retry_interval; the total wait
+        # is bounded by max_retries * retry_interval.
+        outcome = await poll_until(
+            lambda: self.info(context_id=context_id, path=path),
+            done=all_completed,
+            timeout=max_retries * retry_interval / 1000.0,
+            policy=PollPolicy.up_to(retry_interval / 1000.0),
+            name="context.sync",
+        )
+        if not outcome.done:
+            if outcome.error is not None:
+                _logger.error(f"❌ Error checking context status: {outcome.error}")
+            _logger.error(
+                f"❌ Context sync polling timed out after {outcome.probes} attempts"
+            )
+            return False
+
+        tasks = sync_tasks(outcome.value)
+        if not tasks:
+            _logger.info("ℹ️  No sync tasks found")
+            return True
+        failures = [item for item in tasks if item.status == "Failed"]
+        for item in failures:
+            _logger.error(
+                f"❌ Sync failed for context {item.context_id}: {item.error_message}"
+            )
+        if failures:
+            _logger.warning("Context sync completed with failures")
+            return False
+        _logger.info("✅ Context sync completed successfully")
+        return True
@@ -1,25 +1,49 @@
 import asyncio
 import base64
+import hashlib
+import io
 import json
 import os
+import shlex
+import tempfile
 import threading
 import time
+import uuid
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Literal, Optional, overload, Tuple, Union
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    overload,
+    Tuple,
+    Union,
+)
 
 import httpx
 
 from .._common.exceptions import AgentBayError, FileError
 from .._common.models.filesystem import (
     BinaryFileContentResult,
+    DirectoryEntry,
     DirectoryListResult,
+    DirectorySyncResult,
+    DirectoryTreeResult,
     DownloadResult,
     FileChangeEvent,
     FileChangeResult,
     FileContentResult,
     FileInfoResult,
     FileSearchResult,
+    FileSyncResult,
+    FileWriteResult,
+    GrepResult,
+    ManifestResult,
     MultipleFileContentResult,
+    PackTransferResult,
     UploadResult,
 )
 from .._common.models import ApiResponse, BoolResult, extract_request_id
@@ -35,11 +59,55 @@ from .._common.logger import (
     _log_api_response_with_details,
     get_logger,
 )
+from .._common.utils.archive import collect_local_files, create_archive, extract_archive
+from .._common.utils.batch_read import batch_read_command, parse_batch_output, plan_batches
+from .._common.utils.compression import (
+    TransferStats,
+    check_compression,
+    compress_command,
+    decompress,
+    decompress_command,
+    should_compress,
+    timed_compress,
+)
+from .._common.utils.content_cache import DEFAULT_MAX_BYTES, FileContentCache
+from .._common.utils.delta import (
+    choose_block_size,
+    compute_delta,
+    parse_signature,
+    reconstruction_script,
+    signature_command,
+)
+from .._common.utils.manifest import (
+    FileManifest,
+    build_local_manifest,
+    build_manifest_command,
+    parse_manifest_output,
+)
+from .._common.utils.polling import PollPolicy
+from .._common.utils.search import (
+    GrepMatch,
+    grep_command,
+    next_grep_cursor,
+    parse_grep_output,
+    search_command,
+)
+from .concurrency import map_unordered
+from .polling import poll_until
 
 # Initialize logger for this module
 _logger = get_logger("filesystem")
 
 
+# Name prefix of the temporary archives used by pack_upload / pack_download
+_PACK_PREFIX = ".agentbay-pack-"
+_PACK_VIA = ("chunked", "presigned")
+
+
+def _join_remote_path(directory: str, name: str) -> str:
+    return f"{directory.rstrip('/')}/{name}"
+
+
 class AsyncFileTransfer:
     """
     Provides pre-signed URL upload/download functionality between local and OSS,
@@ -534,49 +602,52 @@ class AsyncFileTransfer:
         Poll session.context.info within timeout to check if specified task is completed.
         Returns (True, None) on success, (False, error_msg) on failure.
         """
-        deadline = time.time() + timeout
-        last_err = None
-
-        while time.time() < deadline:
+        async def check() -> Optional[Tuple[bool, Optional[str]]]:
+            info_fn = getattr(self._session.context, "info")
+            # Try calling with filter parameters
             try:
-                info_fn = getattr(self._session.context, "info")
-                # Try calling with filter parameters
-                try:
-                    res = info_fn(
-                        context_id=context_id, path=remote_path, task_type=task_type
-                    )
-                except TypeError:
-                    res = info_fn()
-
-                if asyncio.iscoroutine(res):
-                    res = await res  # Compatibility with async info
-
-                # Parse response
-                status_list = getattr(res, "context_status_data", None) or []
-                for item in status_list:
-                    cid = getattr(item, "context_id", None)
-                    path = getattr(item, "path", None)
-                    ttype = getattr(item, "task_type", None)
-                    status = getattr(item, "status", None)
-                    err = getattr(item, "error_message", None)
-
-                    if (
-                        cid == context_id
-                        and path == remote_path
-                        and (task_type is None or ttype == task_type)
-                    ):
-                        if err:
-                            return False, f"Task error: {err}"
-                        if status and status.lower() in self._finished_states:
-                            return True, None
-                        # Otherwise continue waiting
-                last_err = "task not finished"
-            except Exception as e:
-                last_err = f"info error: {e}"
-
-            await asyncio.sleep(interval)
-
-        return False, last_err or "timeout"
+                res = info_fn(
+                    context_id=context_id, path=remote_path, task_type=task_type
+                )
+            except TypeError:
+                res = info_fn()
+
+            if asyncio.iscoroutine(res):
+                res = await res  # Compatibility with async info
+
+            # Parse response
+            status_list = getattr(res, "context_status_data", None) or []
+            for item in status_list:
+                cid = getattr(item, "context_id", None)
+                path = getattr(item, "path", None)
+                ttype = getattr(item, "task_type", None)
+                status = getattr(item, "status", None)
+                err = getattr(item, "error_message", None)
+
+                if (
+                    cid == context_id
+                    and path == remote_path
+                    and (task_type is None or ttype == task_type)
+                ):
+                    if err:
+                        return False, f"Task error: {err}"
+                    if status and status.lower() in self._finished_states:
+                        return True, None
+                    # Otherwise continue waiting
+            return None
+
+        outcome = await poll_until(
+            check,
+            done=lambda state: state is not None,
+            timeout=timeout,
+            policy=PollPolicy.up_to(interval),
+            name="file_transfer.wait_for_task",
+        )
+        if outcome.done:
+            return outcome.value
+        if outcome.error is not None:
+            return False, f"info error: {outcome.error}"
+        return False, "task not finished" if outcome.probes else "timeout"
 
     @staticmethod
     def _put_file_sync(
@@ -652,6 +723,7 @@ class AsyncFileSystem(BaseService):
         """
         super().__init__(*args, **kwargs)
         self._file_transfer: Optional[AsyncFileTransfer] = None
+        self._content_cache: Optional[FileContentCache] = None
 
     def _ensure_file_transfer(self) -> AsyncFileTransfer:
         """
@@ -715,6 +787,10 @@ class AsyncFileSystem(BaseService):
     # We use 51KB (52224 bytes) for extra safety margin (~6-8KB)
     MQTT_SIZE_LIMIT = 63 * 1024  # 63KB = 64512 bytes
     MAX_CONTENT_BYTES = 51 * 1024  # 51KB = 52224 bytes
+    # Base64 chunks keep the same margin (multiple of 4 to keep chunks decodable)
+    BASE64_CHUNK_CHARS = MAX_CONTENT_BYTES // 4 * 4
+    # Content bytes per batch of read_files; base64 output stays below the limit
+    BATCH_READ_BYTES = BASE64_CHUNK_CHARS // 4 * 3
 
     @staticmethod
     def _split_string_by_bytes(text: str, max_bytes: int) -> str:
@@ -753,6 +829,74 @@ class AsyncFileSystem(BaseService):
 
         return result
 
+    def enable_cache(self, max_bytes: int = DEFAULT_MAX_BYTES) -> FileContentCache:
+        """
+        Cache file contents read through `read_file` and `read_multiple_files`.
+
+        A cached file is served only after a single batched `stat` in the session
+        confirms that its size and modification time are unchanged, which saves
+        the content transfer for files that are read repeatedly. Writes, edits,
+        moves, deletes and uploads made through this service drop the affected
+        paths immediately, as do events seen by `watch_directory`.
+
+        Args:
+            max_bytes (int, optional): Byte budget of the cache; least recently
+                used files are evicted first. Defaults to 32 MiB.
+
+        Returns:
+            FileContentCache: The cache, exposing hit and miss counters via
+                `stats()`. Calling this again replaces the existing cache.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            cache = session.file_system.enable_cache(max_bytes=16 * 1024 * 1024)
+            await session.file_system.read_file("/etc/hosts")
+            await session.file_system.read_file("/etc/hosts")  # served from cache
+            print(cache.stats()["hits"])
+            await session.delete()
+            ```
+        """
+        self._content_cache = FileContentCache(max_bytes)
+        return self._content_cache
+
+    def disable_cache(self) -> None:
+        """
+        Stop caching file contents and release the cached data.
+        """
+        self._content_cache = None
+
+    @property
+    def content_cache(self) -> Optional[FileContentCache]:
+        """The content cache, or None if caching is disabled."""
+        return self._content_cache
+
+    def _invalidate_cache(self, *paths: str) -> None:
+        if self._content_cache is not None:
+            self._content_cache.invalidate(paths)
+
+    async def _stat_files(self, paths: List[str]) -> Dict[str, Tuple[int, str]]:
+        """
+        Size and modification time of the regular files among `paths`, from one
+        `stat` command. Missing files and non-files are left out; an empty dict
+        is returned if the command cannot be run.
+        """
+        command = "stat -c '%F|%s|%y|%n' -- " + " ".join(shlex.quote(p) for p in paths)
+        try:
+            result = await self.session.command.execute_command(command)
+        except Exception as e:
+            _logger.debug(f"Failed to stat files for cache validation: {e}")
+            return {}
+        stats: Dict[str, Tuple[int, str]] = {}
+        for line in (result.stdout or result.output or "").splitlines():
+            parts = line.split("|", 3)
+            if len(parts) != 4 or not parts[0].startswith("regular"):
+                continue
+            kind, size, mtime, path = parts
+            if size.isdigit():
+                stats[path] = (int(size), mtime)
+        return stats
+
     def _handle_error(self, e):
         """
         Convert AgentBayError to FileError for compatibility.
@@ -830,6 +974,7 @@ class AsyncFileSystem(BaseService):
             await session.delete()
             ```
         """
+        self._invalidate_cache(path)
         args = {"path": path}
         try:
             result = await self.session.call_mcp_tool(
@@ -878,6 +1023,8 @@ class AsyncFileSystem(BaseService):
             await session.delete()
             ```
         """
+        if not dry_run:
+            self._invalidate_cache(path)
         args = {"path": path, "edits": edits, "dryRun": dry_run}
         try:
             result = await self.session.call_mcp_tool(
@@ -1114,6 +1261,222 @@ class AsyncFileSystem(BaseService):
                 error_message=f"Failed to list directory: {e}",
             )
 
+    async def walk(
+        self,
+        path: str,
+        max_depth: Optional[int] = None,
+        concurrency: int = 8,
+        use_find: bool = False,
+    ) -> AsyncIterator[DirectoryEntry]:
+        """
+        Recursively list a directory tree, yielding entries as they arrive.
+
+        Directories are listed breadth-first with up to `concurrency` listings in
+        flight. With `use_find=True` the whole tree is enumerated by a single
+        `find` command instead, which is much faster for very large trees.
+
+        Args:
+            path (str): Root directory to walk.
+            max_depth (Optional[int], optional): Deepest level to list; 1 lists the
+                root's direct children only. Defaults to None (unlimited).
+            concurrency (int, optional): Maximum concurrent directory listings.
+                Defaults to 8.
+            use_find (bool, optional): Enumerate with one remote `find` command.
+                Defaults to False.
+
+        Yields:
+            DirectoryEntry: Entries below `path` with `path` and `depth` set.
+                Subdirectories that cannot be listed are skipped.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            async for entry in session.file_system.walk("/tmp", max_depth=2):
+                print(entry.depth, entry.path, entry.is_directory)
+            await session.delete()
+            ```
+        """
+        async for entry in self._walk(path, max_depth, concurrency, use_find, {}):
+            yield entry
+
+    async def scandir_tree(
+        self,
+        path: str,
+        max_depth: Optional[int] = None,
+        concurrency: int = 8,
+        use_find: bool = False,
+    ) -> DirectoryTreeResult:
+        """
+        Recursively list a directory tree and collect all entries.
+
+        Same arguments as `walk`; directories that could not be listed are
+        reported in `errors` instead of being skipped silently.
+
+        Returns:
+            DirectoryTreeResult: All entries (breadth-first) and listing errors.
+                `success` is False only if the root itself could not be listed.
+        """
+        errors: Dict[str, str] = {}
+        try:
+            entries = [
+                entry
+                async for entry in self._walk(
+                    path, max_depth, concurrency, use_find, errors
+                )
+            ]
+        except FileError as e:
+            return DirectoryTreeResult(success=False, error_message=str(e))
+        root_error = errors.pop(path, None)
+        if root_error is not None:
+            return DirectoryTreeResult(success=False, errors=errors, error_message=root_error)
+        return DirectoryTreeResult(success=True, entries=entries, errors=errors)
+
+    async def _walk(
+        self,
+        root: str,
+        max_depth: Optional[int],
+        concurrency: int,
+        use_find: bool,
+        errors: Dict[str, str],
+    ) -> AsyncIterator[DirectoryEntry]:
+        if max_depth is not None and max_depth < 1:
+            return
+        if use_find:
+            for entry in await self._find_tree(root, max_depth, errors):
+                yield entry
+            return
+
+        depths = {root: 0}
+        work = [root]
+        async for directory, result in map_unordered(
+            self.list_directory, work, concurrency
+        ):
+            if isinstance(result, Exception) or not result.success:
+                errors[directory] = (
+                    str(result) if isinstance(result, Exception) else result.error_message
+                )
+                _logger.warning(f"Failed to list {directory}: {errors[directory]}")
+                continue
+            depth = depths.pop(directory) + 1
+            for item in result._entries:
+                is_directory = bool(item.get("isDirectory", False))
+                child = _join_remote_path(directory, item.get("name", ""))
+                yield DirectoryEntry(
+                    {
+                        "name": item.get("name", ""),
+                        "isDirectory": is_directory,
+                        "isFile": not is_directory,
+                    },
+                    path=child,
+                    depth=depth,
+                )
+                if is_directory and (max_depth is None or depth < max_depth):
+                    depths[child] = depth
+                    work.append(child)
+
+    async def _find_tree(
+        self, root: str, max_depth: Optional[int], errors: Dict[str, str]
+    ) -> List[DirectoryEntry]:
+        depth_arg = f" -maxdepth {int(max_depth)}" if max_depth is not None else ""
+        result = await self.session.command.execute_command(
+            f"find {shlex.quote(root)} -mindepth 1{depth_arg} -printf '%y\\t%s\\t%d\\t%p\\n'"
+        )
+        if not result.success:
+            errors[root] = result.error_message or result.stderr or "find failed"
+            return []
+        entries = []
+        for line in (result.stdout or result.output).splitlines():
+            parts = line.split("\t", 3)
+            if len(parts) != 4:
+                continue
+            kind, size, depth, entry_path = parts
+            entries.append(
+                DirectoryEntry(
+                    {
+                        "name": entry_path.rsplit("/", 1)[-1],
+                        "isDirectory": kind == "d",
+                        "isFile": kind == "f",
+                        "size": int(size) if size.isdigit() else 0,
+                    },
+                    path=entry_path,
+                    depth=int(depth) if depth.isdigit() else 0,
+                )
+            )
+        # find emits depth-first; keep the breadth-first order of walk()
+        entries.sort(key=lambda entry: entry.depth)
+        return entries
+
+    async def manifest(
+        self,
+        path: str,
+        hash: Optional[str] = "sha256",
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        timeout_ms: int = 50000,
+    ) -> ManifestResult:
+        """
+        Compute sizes, modification times and checksums of every file in a tree.
+
+        The manifest is built inside the session by a single command, so it costs
+        one round trip regardless of the number of files. Compare it with a
+        local manifest (`build_local_manifest`) or an earlier snapshot via
+        `FileManifest.diff` to find the files that need to be transferred.
+
+        Args:
+            path (str): Remote root directory.
+            hash (Optional[str], optional): Digest algorithm: "sha256", "sha1",
+                "md5", "xxh" (needs `xxh64sum` in the session image) or None to
+                collect only sizes and mtimes. Defaults to "sha256".
+            include (Optional[List[str]], optional): Only list files matching one
+                of these globs (matched against the relative path if the pattern
+                contains "/", otherwise against the name).
+            exclude (Optional[List[str]], optional): Skip files and directories
+                matching one of these globs.
+            timeout_ms (int, optional): Command timeout in milliseconds.
+                Defaults to 50000.
+
+        Returns:
+            ManifestResult: Result with `manifest` indexed by path relative to
+                `path`. Files that could not be read are listed without a digest
+                and reported in `error_message`.
+
+        Raises:
+            ValueError: If `hash` is not supported.
+
+        Example:
+            ```python
+            from agentbay import build_local_manifest
+
+            session = (await agent_bay.create()).session
+            remote = (await session.file_system.manifest("/tmp/project")).manifest
+            local = build_local_manifest("./project")
+            print(local.diff(remote).to_transfer)
+            await session.delete()
+            ```
+        """
+        command = build_manifest_command(path, hash, include, exclude)
+        try:
+            result = await self.session.command.execute_command(
+                command, timeout_ms=timeout_ms
+            )
+        except Exception as e:
+            _logger.error(f"Failed to compute manifest of {path}: {e}")
+            return ManifestResult(success=False, error_message=f"Failed to compute manifest: {e}")
+        output = result.stdout or result.output
+        manifest = parse_manifest_output(output, path, hash)
+        if not result.success and len(manifest) == 0:
+            return ManifestResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or result.stderr or "manifest command failed",
+            )
+        return ManifestResult(
+            request_id=result.request_id,
+            success=True,
+            manifest=manifest,
+            error_message="" if result.success else (result.stderr or result.error_message),
+        )
+
     async def move_file(self, source: str, destination: str) -> BoolResult:
         """
         Move a file or directory from source path to destination path.
@@ -1135,6 +1498,7 @@ class AsyncFileSystem(BaseService):
             await session.delete()
             ```
         """
+        self._invalidate_cache(source, destination)
         args = {"source": source, "destination": destination}
         try:
             result = await self.session.call_mcp_tool(
@@ -1278,8 +1642,36 @@ class AsyncFileSystem(BaseService):
             read_result = await session.file_system.read_multiple_files(paths)
             await session.delete()
             ```
-        """
 
+        See Also:
+            FileSystem.read_files for binary-safe, size-batched reads
+        """
+        cache = self._content_cache
+        if cache is None:
+            return await self._read_multiple_files(paths)
+
+        stats = await self._stat_files(paths)
+        cached: Dict[str, str] = {}
+        misses = []
+        for path in paths:
+            content = cache.get(path, "multiple", stats[path]) if path in stats else None
+            if content is None:
+                misses.append(path)
+            else:
+                cached[path] = content
+        if not misses:
+            return MultipleFileContentResult(success=True, contents=cached)
+
+        result = await self._read_multiple_files(misses)
+        if not result.success:
+            return result
+        for path, content in result.contents.items():
+            if path in stats:
+                cache.put(path, "multiple", stats[path], content)
+        result.contents.update(cached)
+        return result
+
+    async def _read_multiple_files(self, paths: List[str]) -> MultipleFileContentResult:
         def parse_multiple_files_response(text: str) -> Dict[str, str]:
             """
             Parse the response from reading multiple files.
@@ -1373,6 +1765,134 @@ class AsyncFileSystem(BaseService):
                 error_message=f"Failed to read multiple files: {e}",
             )
 
+    async def read_files(
+        self,
+        paths: List[str],
+        format: str = "text",
+        batch_bytes: Optional[int] = None,
+        concurrency: int = 4,
+    ) -> MultipleFileContentResult:
+        """
+        Read many files with few round trips, binary-safe.
+
+        Small files are packed into batches of at most `batch_bytes` bytes, each
+        read by one command with length-checked base64 framing; batches are
+        fetched concurrently. Files too large for a batch go through the
+        chunked `read_file` path. Unlike `read_multiple_files`, contents are
+        never confused by colons or "---" lines and binary files survive intact.
+
+        Args:
+            paths (List[str]): Files to read.
+            format (str, optional): "text" (default) for str contents decoded as
+                UTF-8, or "bytes" for raw bytes.
+            batch_bytes (Optional[int], optional): Content budget of a batch.
+                Defaults to BATCH_READ_BYTES.
+            concurrency (int, optional): Maximum batches and large files in flight.
+                Defaults to 4.
+
+        Returns:
+            MultipleFileContentResult: Contents by path, and `errors` by path for
+                files that could not be read. `success` is False if any failed.
+
+        Raises:
+            ValueError: If `format` is not "text" or "bytes".
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            result = await session.file_system.read_files(
+                ["/etc/hostname", "/usr/bin/true"], format="bytes"
+            )
+            print({path: len(data) for path, data in result.contents.items()})
+            await session.delete()
+            ```
+        """
+        errors: Dict[str, str] = {}
+        contents = {
+            path: content
+            async for path, content in self._iter_files(
+                paths, format, batch_bytes, concurrency, errors
+            )
+        }
+        if errors:
+            return MultipleFileContentResult(
+                success=False,
+                contents=contents,
+                errors=errors,
+                error_message=f"Failed to read {len(errors)} of {len(contents) + len(errors)} files",
+            )
+        return MultipleFileContentResult(success=True, contents=contents)
+
+    async def stream_files(
+        self,
+        paths: List[str],
+        format: str = "text",
+        batch_bytes: Optional[int] = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[Tuple[str, Union[str, bytes]]]:
+        """
+        Read many files like `read_files`, yielding each file as soon as its
+        batch arrives.
+
+        Yields:
+            Tuple[str, Union[str, bytes]]: Path and content, in completion order.
+                Files that cannot be read are skipped.
+        """
+        async for item in self._iter_files(paths, format, batch_bytes, concurrency, {}):
+            yield item
+
+    async def _iter_files(
+        self,
+        paths: List[str],
+        format: str,
+        batch_bytes: Optional[int],
+        concurrency: int,
+        errors: Dict[str, str],
+    ) -> AsyncIterator[Tuple[str, Union[str, bytes]]]:
+        if format not in ("text", "bytes"):
+            raise ValueError(f"format must be 'text' or 'bytes', got {format!r}")
+        budget = batch_bytes or self.BATCH_READ_BYTES
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return
+        stats = await self._stat_files(paths)
+        for path in paths:
+            if path not in stats:
+                errors[path] = "No such file, or not a regular file"
+        sizes = {path: stats[path][0] for path in paths if path in stats}
+        batches, large = plan_batches(sizes, budget)
+        work = [tuple(batch) for batch in batches] + large
+
+        async def fetch(item):
+            if isinstance(item, tuple):
+                return await self.session.command.execute_command(batch_read_command(item))
+            return await self.read_file(item, format=format)
+
+        async for item, result in map_unordered(fetch, work, concurrency):
+            if isinstance(item, str):
+                if isinstance(result, Exception) or not result.success:
+                    errors[item] = (
+                        str(result) if isinstance(result, Exception) else result.error_message
+                    )
+                    continue
+                yield item, result.content
+                continue
+            if isinstance(result, Exception) or not result.success:
+                message = str(result) if isinstance(result, Exception) else (
+                    result.error_message or "Batch read failed"
+                )
+                errors.update((path, message) for path in item)
+                continue
+            contents, failed = parse_batch_output(result.stdout or result.output or "", item)
+            errors.update(failed)
+            for path, data in contents.items():
+                if format == "bytes":
+                    yield path, data
+                else:
+                    yield path, data.decode("utf-8", errors="replace")
+        for path, message in errors.items():
+            _logger.warning(f"Failed to read {path}: {message}")
+
     async def search_files(
         self,
         path: str,
@@ -1401,6 +1921,9 @@ class AsyncFileSystem(BaseService):
             search_result = await session.file_system.search_files("/tmp/test", "test_*")
             await session.delete()
             ```
+
+        See Also:
+            FileSystem.search_files_page, FileSystem.grep
         """
         args = {"path": path, "pattern": pattern}
         if exclude_patterns:
@@ -1443,6 +1966,210 @@ class AsyncFileSystem(BaseService):
                 error_message=f"Failed to search files: {e}",
             )
 
+    async def search_files_page(
+        self,
+        path: str,
+        pattern: str,
+        exclude_patterns: Optional[List[str]] = None,
+        limit: int = 1000,
+        cursor: Optional[str] = None,
+        timeout_ms: int = 50000,
+    ) -> FileSearchResult:
+        """
+        Search for files by name one page at a time.
+
+        Unlike `search_files`, the response size is bounded by `limit`, so
+        searches of very large trees (node_modules, datasets) neither time out
+        nor produce megabyte responses. Matches are returned in byte order of
+        their paths; pass `next_cursor` back to fetch the following page.
+
+        Args:
+            path (str): The base directory path to search in.
+            pattern (str): Wildcard pattern matched against names, e.g. "*.py".
+            exclude_patterns (Optional[List[str]], optional): Wildcard patterns of
+                names to skip, together with everything below them.
+            limit (int, optional): Maximum matches per page. Defaults to 1000.
+            cursor (Optional[str], optional): `next_cursor` of the previous page.
+            timeout_ms (int, optional): Timeout of the search command. Defaults to 50000.
+
+        Returns:
+            FileSearchResult: Matching paths of this page, with `next_cursor` set
+                if more matches follow.
+
+        Raises:
+            ValueError: If `limit` is less than 1.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            page = await session.file_system.search_files_page("/", "*.log", limit=100)
+            while page.success and page.has_more:
+                page = await session.file_system.search_files_page(
+                    "/", "*.log", limit=100, cursor=page.next_cursor
+                )
+            await session.delete()
+            ```
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        command = search_command(path, pattern, exclude_patterns, cursor, limit)
+        try:
+            result = await self.session.command.execute_command(command, timeout_ms=timeout_ms)
+        except Exception as e:
+            return FileSearchResult(success=False, error_message=f"Failed to search files: {e}")
+        if not result.success:
+            return FileSearchResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or result.stderr or "Failed to search files",
+            )
+        matches = [line for line in (result.stdout or result.output or "").split("\n") if line]
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            next_cursor = matches[-1]
+        return FileSearchResult(
+            request_id=result.request_id,
+            success=True,
+            matches=matches,
+            next_cursor=next_cursor,
+        )
+
+    async def stream_search_files(
+        self,
+        path: str,
+        pattern: str,
+        exclude_patterns: Optional[List[str]] = None,
+        page_size: int = 1000,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Search for files by name like `search_files_page`, yielding paths page by
+        page until the search is exhausted or `max_results` paths were yielded.
+
+        Raises:
+            FileError: If a page cannot be fetched.
+        """
+        cursor = None
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = await self.search_files_page(path, pattern, exclude_patterns, limit, cursor)
+            if not page.success:
+                raise FileError(page.error_message)
+            for match in page.matches:
+                yield match
+            if remaining is not None:
+                remaining -= len(page.matches)
+            if not page.has_more:
+                return
+            cursor = page.next_cursor
+
+    async def grep(
+        self,
+        path: str,
+        regex: str,
+        include: Optional[List[str]] = None,
+        max_matches: int = 1000,
+        exclude: Optional[List[str]] = None,
+        ignore_case: bool = False,
+        cursor: Optional[str] = None,
+        timeout_ms: int = 50000,
+    ) -> GrepResult:
+        """
+        Search file contents below `path` for a regular expression.
+
+        The search runs inside the session with `grep` and returns at most
+        `max_matches` matching lines per call; binary files are skipped. Pass
+        `next_cursor` back to continue where the previous call stopped.
+
+        Args:
+            path (str): Directory (or file) to search.
+            regex (str): POSIX extended regular expression.
+            include (Optional[List[str]], optional): Only search files whose name
+                matches one of these wildcard patterns, e.g. ["*.py"].
+            max_matches (int, optional): Maximum matches returned. Defaults to 1000.
+            exclude (Optional[List[str]], optional): Wildcard patterns of names to
+                skip, e.g. ["node_modules", ".git"].
+            ignore_case (bool, optional): Case-insensitive matching. Defaults to False.
+            cursor (Optional[str], optional): `next_cursor` of the previous call.
+            timeout_ms (int, optional): Timeout of the search command. Defaults to 50000.
+
+        Returns:
+            GrepResult: Matches (path, line, column, text) in file order, with
+                `next_cursor` set if more matches follow.
+
+        Raises:
+            ValueError: If `max_matches` is less than 1 or `cursor` is malformed.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            result = await session.file_system.grep(
+                "/app", r"TODO|FIXME", include=["*.py"], exclude=[".venv"]
+            )
+            for match in result.matches:
+                print(f"{match.path}:{match.line}:{match.column}: {match.text}")
+            await session.delete()
+            ```
+        """
+        if max_matches < 1:
+            raise ValueError("max_matches must be at least 1")
+        command = grep_command(path, regex, include, exclude, ignore_case, cursor, max_matches)
+        try:
+            result = await self.session.command.execute_command(command, timeout_ms=timeout_ms)
+        except Exception as e:
+            return GrepResult(success=False, error_message=f"Failed to search file contents: {e}")
+        if not result.success:
+            return GrepResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or result.stderr or "Failed to search file contents",
+            )
+        matches = parse_grep_output(result.stdout or result.output or "", regex, ignore_case)
+        next_cursor = None
+        if len(matches) > max_matches:
+            matches = matches[:max_matches]
+            next_cursor = next_grep_cursor(matches, cursor)
+        return GrepResult(
+            request_id=result.request_id,
+            success=True,
+            matches=matches,
+            next_cursor=next_cursor,
+        )
+
+    async def stream_grep(
+        self,
+        path: str,
+        regex: str,
+        include: Optional[List[str]] = None,
+        max_matches: Optional[int] = None,
+        exclude: Optional[List[str]] = None,
+        ignore_case: bool = False,
+        page_size: int = 500,
+    ) -> AsyncIterator[GrepMatch]:
+        """
+        Search file contents like `grep`, yielding matches page by page until the
+        search is exhausted or `max_matches` matches were yielded.
+
+        Raises:
+            FileError: If a page cannot be fetched.
+        """
+        cursor = None
+        remaining = max_matches
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = await self.grep(path, regex, include, limit, exclude, ignore_case, cursor)
+            if not page.success:
+                raise FileError(page.error_message)
+            for match in page.matches:
+                yield match
+            if remaining is not None:
+                remaining -= len(page.matches)
+            if not page.has_more:
+                return
+            cursor = page.next_cursor
+
     async def _write_file_chunk(
         self, path: str, content: str, mode: str = "overwrite"
     ) -> BoolResult:
@@ -1492,16 +2219,20 @@ class AsyncFileSystem(BaseService):
             )
 
     @overload
-    async def read_file(self, path: str) -> FileContentResult: ...
+    async def read_file(self, path: str, *, compression: str = ...) -> FileContentResult: ...
 
     @overload
-    async def read_file(self, path: str, *, format: Literal["text"]) -> FileContentResult: ...
+    async def read_file(
+        self, path: str, *, format: Literal["text"], compression: str = ...
+    ) -> FileContentResult: ...
 
     @overload
-    async def read_file(self, path: str, *, format: Literal["bytes"]) -> BinaryFileContentResult: ...
+    async def read_file(
+        self, path: str, *, format: Literal["bytes"], compression: str = ...
+    ) -> BinaryFileContentResult: ...
 
     async def read_file(
-        self, path: str, *, format: str = "text"
+        self, path: str, *, format: str = "text", compression: str = "none"
     ) -> Union[FileContentResult, BinaryFileContentResult]:
         """
         Read the contents of a file. Automatically handles large files by chunking.
@@ -1511,13 +2242,22 @@ class AsyncFileSystem(BaseService):
             format (str): Format to read the file in. "text" (default) or "bytes".
                 - "text": Returns FileContentResult with content as string (UTF-8)
                 - "bytes": Returns BinaryFileContentResult with content as bytes
+            compression (str): "none" (default), "auto", "gzip" or "zstd".
+                - "none": Read the content as is
+                - "auto": Text files spanning several chunks are gzipped inside the
+                  session first, if that saves calls (Linux images only: it runs
+                  shell commands in the session)
+                - "gzip"/"zstd": Always compress inside the session ("zstd" needs
+                  the `zstd` tool there and the `zstandard` package locally)
 
         Returns:
             FileContentResult: For text format, contains file content as string.
             BinaryFileContentResult: For bytes format, contains file content as bytes.
+            Both carry `transfer_stats` describing how the content was transferred.
 
         Raises:
             FileError: If the file does not exist or is a directory.
+            ValueError: If `compression` is not a known mode.
 
         Example:
             ```python
@@ -1541,9 +2281,34 @@ class AsyncFileSystem(BaseService):
             - Binary files are returned as bytes (backend uses base64 encoding internally)
 
         See Also:
-            FileSystem.write_file, FileSystem.list_directory, FileSystem.get_file_info
-        """
+            FileSystem.write_file, FileSystem.list_directory, FileSystem.get_file_info,
+            FileSystem.enable_cache
+        """
+        check_compression(compression)
+        cache = self._content_cache
+        if cache is None:
+            return await self._read_file(path, format, compression)
+
+        validator = (await self._stat_files([path])).get(path)
+        if validator is not None:
+            content = cache.get(path, format, validator)
+            if content is not None:
+                if format == "bytes":
+                    return BinaryFileContentResult(
+                        success=True, content=content, size=len(content)
+                    )
+                return FileContentResult(success=True, content=content)
+
+        result = await self._read_file(path, format, compression)
+        if result.success and validator is not None:
+            cache.put(path, format, validator, result.content)
+        return result
+
+    async def _read_file(
+        self, path: str, format: str, compression: str = "none"
+    ) -> Union[FileContentResult, BinaryFileContentResult]:
         chunk_size = self.DEFAULT_CHUNK_SIZE
+        start = time.monotonic()
 
         try:
             # Get file info to check size
@@ -1599,7 +2364,20 @@ class AsyncFileSystem(BaseService):
                         content="",
                     )
 
+            stats = TransferStats(raw_bytes=file_size, transferred_bytes=file_size, calls=1)
+            if compression in ("gzip", "zstd") or (
+                compression == "auto" and format == "text" and file_size > 2 * chunk_size
+            ):
+                compressed = await self._read_compressed(
+                    path, format, file_size, compression, stats
+                )
+                if compressed is not None:
+                    stats.elapsed = time.monotonic() - start
+                    return compressed
+                stats.transferred_bytes = file_size
+
             # Read the file in chunks
+            stats.calls += -(-file_size // chunk_size)
             if format == "bytes":
                 # Binary format
                 content_chunks = []
@@ -1633,11 +2411,13 @@ class AsyncFileSystem(BaseService):
 
                 # Combine all binary chunks
                 final_content = b"".join(content_chunks)
+                stats.elapsed = time.monotonic() - start
                 return BinaryFileContentResult(
                     request_id=file_info_result.request_id,
                     success=True,
                     content=final_content,
                     size=len(final_content),
+                    transfer_stats=stats,
                 )
             else:
                 # Text format (default)
@@ -1659,10 +2439,12 @@ class AsyncFileSystem(BaseService):
                     offset += length
                     chunk_count += 1
 
+                stats.elapsed = time.monotonic() - start
                 return FileContentResult(
                     request_id=file_info_result.request_id,
                     success=True,
                     content="".join(content),
+                    transfer_stats=stats,
                 )
 
         except FileError as e:
@@ -1685,6 +2467,85 @@ class AsyncFileSystem(BaseService):
                     error_message=f"Failed to read file: {e}",
                 )
 
+    async def _read_compressed(
+        self, path: str, format: str, file_size: int, compression: str, stats: TransferStats
+    ) -> Optional[Union[FileContentResult, BinaryFileContentResult]]:
+        """
+        Read `path` compressed inside the session. Returns None (after cleaning
+        up) if "auto" finds that compression does not pay off or is unavailable.
+        """
+        codec = "gzip" if compression == "auto" else compression
+        chunk_size = self.DEFAULT_CHUNK_SIZE
+        remote = f"/tmp/.agentbay-z-{uuid.uuid4().hex}"
+        quoted = shlex.quote(remote)
+        stats.calls += 1
+        try:
+            packed = await self.session.command.execute_command(
+                f"{compress_command(codec)} {shlex.quote(path)} > {quoted} && stat -c %s -- {quoted}"
+            )
+            size_text = (packed.stdout or packed.output or "").strip().rsplit("\n", 1)[-1]
+            error_message = packed.error_message or "Failed to compress file"
+        except Exception as e:
+            packed, size_text, error_message = None, "", f"Failed to compress file: {e}"
+        if packed is None or not packed.success or not size_text.isdigit():
+            await self._remove_remote(remote)
+            if compression == "auto":
+                _logger.debug(f"Compressed read of {path} unavailable: {error_message}")
+                return None
+            return self._read_error(format, getattr(packed, "request_id", ""), error_message)
+        compressed_size = int(size_text)
+        if compression == "auto" and not should_compress(
+            file_size, compressed_size, chunk_size, chunk_size
+        ):
+            await self._remove_remote(remote)
+            stats.calls += 1
+            return None
+
+        chunks = []
+        offset = 0
+        try:
+            while offset < compressed_size:
+                length = min(chunk_size, compressed_size - offset)
+                chunk = await self._read_file_chunk(remote, offset, length, format_type="binary")
+                stats.calls += 1
+                if not chunk.success:
+                    return self._read_error(format, chunk.request_id, chunk.error_message)
+                chunks.append(chunk.content)
+                offset += length
+        finally:
+            await self._remove_remote(remote)
+            stats.calls += 1
+
+        codec_start = time.perf_counter()
+        data = decompress(b"".join(chunks), codec)
+        stats.codec_seconds += time.perf_counter() - codec_start
+        stats.compression = codec
+        stats.transferred_bytes = compressed_size
+        if format == "bytes":
+            return BinaryFileContentResult(
+                request_id=packed.request_id,
+                success=True,
+                content=data,
+                size=len(data),
+                transfer_stats=stats,
+            )
+        return FileContentResult(
+            request_id=packed.request_id,
+            success=True,
+            content=data.decode("utf-8", errors="replace"),
+            transfer_stats=stats,
+        )
+
+    @staticmethod
+    def _read_error(
+        format: str, request_id: str, error_message: str
+    ) -> Union[FileContentResult, BinaryFileContentResult]:
+        if format == "bytes":
+            return BinaryFileContentResult(
+                request_id=request_id, success=False, content=b"", error_message=error_message
+            )
+        return FileContentResult(request_id=request_id, success=False, error_message=error_message)
+
     async def read(self, path: str) -> FileContentResult:
         """
         Alias of read_file().
@@ -1692,8 +2553,8 @@ class AsyncFileSystem(BaseService):
         return await self.read_file(path)
 
     async def write_file(
-        self, path: str, content: str, mode: str = "overwrite"
-    ) -> BoolResult:
+        self, path: str, content: str, mode: str = "overwrite", compression: str = "none"
+    ) -> FileWriteResult:
         """
         Write content to a file. Automatically handles large files by chunking.
 
@@ -1703,16 +2564,25 @@ class AsyncFileSystem(BaseService):
             mode (str, optional): The write mode. Defaults to "overwrite".
                 - "overwrite": Replace file content
                 - "append": Append to existing content
+            compression (str, optional): How to transfer the content. Defaults to "none".
+                - "none": Send the content as is
+                - "auto": Content larger than one chunk is sent gzip-compressed if
+                  that takes fewer calls, falling back to a plain write on failure
+                  (Linux images only: it runs shell commands in the session)
+                - "gzip"/"zstd": Always send compressed ("zstd" needs the
+                  `zstandard` package locally and the `zstd` tool in the session)
 
         Returns:
-            BoolResult: Result object containing success status and error message if any.
+            FileWriteResult: Result object containing success status and error message if any.
                 - success (bool): True if the operation succeeded
                 - data (bool): True if the file was written successfully
                 - request_id (str): Unique identifier for this API request
                 - error_message (str): Error description (if success is False)
+                - transfer_stats (TransferStats): Bytes sent, calls made and codec used
 
         Raises:
             FileError: If the write operation fails.
+            ValueError: If `compression` is not a known mode.
 
         Example:
             ```python
@@ -1726,6 +2596,8 @@ class AsyncFileSystem(BaseService):
         Note:
             - Automatically handles large files by writing in chunks
             - Chunks are split by byte size to ensure MQTT compatibility (63KB limit)
+            - Compressed content is sent as base64 and inflated inside the session,
+              so large logs and source files take a fraction of the calls
             - Creates parent directories if they don't exist
             - In "overwrite" mode, replaces the entire file content
             - In "append" mode, adds content to the end of the file
@@ -1733,10 +2605,93 @@ class AsyncFileSystem(BaseService):
         See Also:
             FileSystem.read_file, FileSystem.create_directory, FileSystem.edit_file
         """
+        check_compression(compression)
+        self._invalidate_cache(path)
+        start = time.monotonic()
+        data = content.encode("utf-8")
+        stats = TransferStats(raw_bytes=len(data), transferred_bytes=len(data))
+
+        if mode in ("overwrite", "append") and (
+            compression in ("gzip", "zstd")
+            or (compression == "auto" and len(data) > self.MAX_CONTENT_BYTES)
+        ):
+            codec = "gzip" if compression == "auto" else compression
+            compressed, seconds = await asyncio.to_thread(timed_compress, data, codec)
+            stats.codec_seconds = seconds
+            encoded_size = -(-len(compressed) // 3) * 4
+            if compression != "auto" or should_compress(
+                len(data), encoded_size, self.MAX_CONTENT_BYTES, self.BASE64_CHUNK_CHARS
+            ):
+                result = await self._write_compressed(path, compressed, codec, mode, stats)
+                if result.success or compression != "auto":
+                    stats.elapsed = time.monotonic() - start
+                    result.transfer_stats = stats
+                    return result
+                _logger.debug(
+                    f"Compressed write to {path} failed, writing uncompressed: {result.error_message}"
+                )
+                stats = TransferStats(raw_bytes=len(data), transferred_bytes=len(data), calls=stats.calls)
+
+        result = await self._write_plain(path, content, mode, stats)
+        stats.elapsed = time.monotonic() - start
+        return FileWriteResult(
+            request_id=result.request_id,
+            success=result.success,
+            data=result.data,
+            error_message=result.error_message,
+            transfer_stats=stats,
+        )
+
+    async def _write_compressed(
+        self, path: str, compressed: bytes, codec: str, mode: str, stats: TransferStats
+    ) -> FileWriteResult:
+        """
+        Upload `compressed` as base64 to a temporary file and inflate it into
+        `path` inside the session.
+        """
+        remote = f"/tmp/.agentbay-z-{uuid.uuid4().hex}.b64"
+        inflated = None
+        try:
+            uploaded = await self._write_base64(remote, io.BytesIO(compressed))
+            stats.calls += max(1, -(-len(compressed) // (self.BASE64_CHUNK_CHARS // 4 * 3)))
+            if not uploaded.success:
+                return FileWriteResult(
+                    request_id=uploaded.request_id,
+                    success=False,
+                    error_message=uploaded.error_message or "Failed to upload compressed content",
+                )
+
+            target, temp = shlex.quote(path), shlex.quote(remote)
+            redirect = ">>" if mode == "append" else ">"
+            stats.calls += 1
+            inflated = await self.session.command.execute_command(
+                f'mkdir -p -- "$(dirname -- {target})" && '
+                f"base64 -d {temp} | {decompress_command(codec)} {redirect} {target}; "
+                f"status=$?; rm -f -- {temp}; [ $status -eq 0 ]"
+            )
+        except Exception as e:
+            return FileWriteResult(success=False, error_message=f"Failed to decompress content: {e}")
+        finally:
+            # A successful inflate removes the temporary file itself
+            if inflated is None or not inflated.success:
+                await self._remove_remote(remote)
+        if not inflated.success:
+            return FileWriteResult(
+                request_id=inflated.request_id,
+                success=False,
+                error_message=inflated.error_message or "Failed to decompress content",
+            )
+        stats.compression = codec
+        stats.transferred_bytes = len(compressed)
+        return FileWriteResult(request_id=inflated.request_id, success=True, data=True)
+
+    async def _write_plain(
+        self, path: str, content: str, mode: str, stats: TransferStats
+    ) -> BoolResult:
         # Use pre-calculated safe chunk size based on first-principles analysis
         max_content_bytes = self.MAX_CONTENT_BYTES
 
-        content_bytes = len(content.encode('utf-8'))
+        content_bytes = stats.raw_bytes
         _log_operation_start(
             f"WriteLargeFile to {path}",
             f"total size: {content_bytes} bytes (UTF-8), max chunk: {max_content_bytes} bytes",
@@ -1744,6 +2699,7 @@ class AsyncFileSystem(BaseService):
 
         # If the content fits in one chunk, write it directly
         if content_bytes <= max_content_bytes:
+            stats.calls += 1
             return await self._write_file_chunk(path, content, mode)
 
         try:
@@ -1766,6 +2722,7 @@ class AsyncFileSystem(BaseService):
 
                 # Write the chunk
                 result = await self._write_file_chunk(path, chunk, current_mode)
+                stats.calls += 1
                 if not result.success:
                     return result
 
@@ -1790,12 +2747,12 @@ class AsyncFileSystem(BaseService):
             )
 
     async def write(
-        self, path: str, content: str, mode: str = "overwrite"
-    ) -> BoolResult:
+        self, path: str, content: str, mode: str = "overwrite", compression: str = "none"
+    ) -> FileWriteResult:
         """
         Alias of write_file().
         """
-        return await self.write_file(path=path, content=content, mode=mode)
+        return await self.write_file(path=path, content=content, mode=mode, compression=compression)
 
     async def list(self, path: str) -> DirectoryListResult:
         """
@@ -1847,7 +2804,7 @@ class AsyncFileSystem(BaseService):
             content_type: Optional content type for the file
             wait: Whether to wait for the sync operation to complete
             wait_timeout: Timeout for waiting for sync completion
-            poll_interval: Interval between polling for sync completion
+            poll_interval: Maximum interval between polls for sync completion
             progress_cb: Callback for upload progress updates
 
         Returns:
@@ -1861,6 +2818,7 @@ class AsyncFileSystem(BaseService):
             await session.delete()
             ```
         """
+        self._invalidate_cache(remote_path)
         try:
             file_transfer = self._ensure_file_transfer()
             result = await file_transfer.upload(
@@ -1906,7 +2864,7 @@ class AsyncFileSystem(BaseService):
             overwrite: Whether to overwrite existing local file
             wait: Whether to wait for the sync operation to complete
             wait_timeout: Timeout for waiting for sync completion
-            poll_interval: Interval between polling for sync completion
+            poll_interval: Maximum interval between polls for sync completion
             progress_cb: Callback for download progress updates
 
         Returns:
@@ -1946,6 +2904,530 @@ class AsyncFileSystem(BaseService):
                 error_message=f"Download exception: {str(e)}",
             )
 
+    async def pack_upload(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        *,
+        paths: Optional[List[str]] = None,
+        via: str = "chunked",
+        large_file_threshold: Optional[int] = None,
+        timeout_ms: int = 50000,
+    ) -> PackTransferResult:
+        """
+        Upload a local directory tree as a single compressed archive.
+
+        The files are packed into a tar.gz on local disk, moved to the session
+        as one blob and extracted into `remote_dir` there. This replaces one
+        call per file with one call per ~51KB of compressed data, which is much
+        faster for trees of many small files.
+
+        Args:
+            local_dir (str): Local directory to upload.
+            remote_dir (str): Remote directory to extract into; created if missing.
+            paths (Optional[List[str]], optional): Only upload these paths,
+                relative to `local_dir`. Defaults to the whole tree.
+            via (str, optional): How the archive is moved: "chunked" (through
+                `write_file`-sized tool calls, works everywhere) or "presigned"
+                (through `upload_file`, needs a file transfer context).
+                Defaults to "chunked".
+            large_file_threshold (Optional[int], optional): Files larger than
+                this many bytes are left out of the archive and uploaded one by
+                one with `upload_file`. Defaults to None (archive everything).
+            timeout_ms (int, optional): Timeout of the remote extraction in
+                milliseconds. Defaults to 50000.
+
+        Returns:
+            PackTransferResult: The archived and individually uploaded files.
+
+        Raises:
+            ValueError: If `via` is not "chunked" or "presigned".
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            result = await session.file_system.pack_upload("./src", "/tmp/project/src")
+            print(len(result.files), result.archive_size)
+            await session.delete()
+            ```
+        """
+        if via not in _PACK_VIA:
+            raise ValueError(f"via must be one of {_PACK_VIA}")
+        if not os.path.isdir(local_dir):
+            return PackTransferResult(
+                success=False, error_message=f"Local directory not found: {local_dir}"
+            )
+        self._invalidate_cache(remote_dir)
+        try:
+            files, large_files = collect_local_files(local_dir, paths, large_file_threshold)
+        except OSError as e:
+            return PackTransferResult(success=False, error_message=str(e))
+
+        result = PackTransferResult(success=True, files=files, large_files=large_files)
+        fd, archive = tempfile.mkstemp(suffix=".tar.gz")
+        os.close(fd)
+        try:
+            if files:
+                result.archive_size = await asyncio.to_thread(create_archive, local_dir, files, archive)
+                result.request_id, error = await self._push_archive(
+                    archive, remote_dir, via, timeout_ms
+                )
+                if error:
+                    result.success = False
+                    result.error_message = error
+                    return result
+        finally:
+            os.remove(archive)
+
+        for rel_path in large_files:
+            upload = await self.upload_file(
+                os.path.join(local_dir, rel_path), _join_remote_path(remote_dir, rel_path)
+            )
+            if not upload.success:
+                result.success = False
+                result.error_message = f"Failed to upload {rel_path}: {upload.error_message}"
+                return result
+        return result
+
+    async def pack_download(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        *,
+        paths: Optional[List[str]] = None,
+        via: str = "chunked",
+        large_file_threshold: Optional[int] = None,
+        timeout_ms: int = 50000,
+    ) -> PackTransferResult:
+        """
+        Download a remote directory tree as a single compressed archive.
+
+        The tree is packed into a tar.gz inside the session, transferred to a
+        local temporary file and extracted into `local_dir`. Links and special
+        files are not extracted, nor are members that would land outside
+        `local_dir`.
+
+        Args:
+            remote_dir (str): Remote directory to download.
+            local_dir (str): Local directory to extract into; created if missing.
+            paths (Optional[List[str]], optional): Only download these paths,
+                relative to `remote_dir`. Defaults to the whole tree.
+            via (str, optional): How the archive is moved: "chunked" (through
+                `read_file`-sized tool calls) or "presigned" (through
+                `download_file`, needs a file transfer context).
+                Defaults to "chunked".
+            large_file_threshold (Optional[int], optional): Files larger than
+                this many bytes are left out of the archive and downloaded one by
+                one with `download_file`. Defaults to None (archive everything).
+            timeout_ms (int, optional): Timeout of the remote commands in
+                milliseconds. Defaults to 50000.
+
+        Returns:
+            PackTransferResult: The extracted and individually downloaded files.
+
+        Raises:
+            ValueError: If `via` is not "chunked" or "presigned".
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            result = await session.file_system.pack_download("/tmp/project", "./project")
+            print(len(result.files), result.archive_size)
+            await session.delete()
+            ```
+        """
+        if via not in _PACK_VIA:
+            raise ValueError(f"via must be one of {_PACK_VIA}")
+        directory = shlex.quote(remote_dir)
+        selected = None if paths is None else [p.lstrip("/") for p in paths]
+
+        large_files: List[str] = []
+        if large_file_threshold is not None:
+            found = await self.session.command.execute_command(
+                f"cd -- {directory} && find . -type f -size +{int(large_file_threshold)}c -printf '%P\\n'",
+                timeout_ms=timeout_ms,
+            )
+            if not found.success:
+                return PackTransferResult(
+                    request_id=found.request_id,
+                    success=False,
+                    error_message=found.error_message or found.stderr or "find failed",
+                )
+            large_files = sorted(line for line in found.stdout.splitlines() if line)
+            if selected is not None:
+                large_files = [p for p in large_files if p in set(selected)]
+
+        result = PackTransferResult(success=True, large_files=large_files)
+        if selected is not None:
+            skipped = set(large_files)
+            selected = [p for p in selected if p not in skipped]
+        if selected is None or selected:
+            error = await self._pull_archive(
+                remote_dir, local_dir, selected, large_files, via, timeout_ms, result
+            )
+            if error:
+                result.success = False
+                result.error_message = error
+                return result
+
+        for rel_path in large_files:
+            download = await self.download_file(
+                _join_remote_path(remote_dir, rel_path), os.path.join(local_dir, rel_path)
+            )
+            if not download.success:
+                result.success = False
+                result.error_message = f"Failed to download {rel_path}: {download.error_message}"
+                return result
+        return result
+
+    async def sync_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        *,
+        block_size: Optional[int] = None,
+        timeout_ms: int = 50000,
+    ) -> FileSyncResult:
+        """
+        Update a remote file to match a local one, sending only what changed.
+
+        Works like rsync: one command computes block checksums of the remote
+        copy, the client finds the blocks it can reuse (at any offset when the
+        session has Python, at block boundaries otherwise) and uploads only the
+        remaining bytes with a script that rebuilds the file in place. The
+        result is checked against the MD5 of the local file before it replaces
+        the remote one. A missing remote file is uploaded in full.
+
+        Args:
+            local_path (str): Local file to upload.
+            remote_path (str): Remote file to update or create.
+            block_size (Optional[int], optional): Block size in bytes. Defaults to
+                about the square root of the file size (1KB to 64KB).
+            timeout_ms (int, optional): Timeout of each remote command in
+                milliseconds. Defaults to 50000.
+
+        Returns:
+            FileSyncResult: Result with the number of bytes actually sent.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            await session.file_system.sync_file("./build/bundle.js", "/app/bundle.js")
+            # ... regenerate the bundle locally ...
+            result = await session.file_system.sync_file("./build/bundle.js", "/app/bundle.js")
+            print(f"sent {result.bytes_sent} of {result.size} bytes")
+            await session.delete()
+            ```
+        """
+        if not os.path.isfile(local_path):
+            return FileSyncResult(
+                success=False, path=remote_path, error_message=f"Local file not found: {local_path}"
+            )
+        self._invalidate_cache(remote_path)
+        with open(local_path, "rb") as f:
+            data = f.read()
+        block_size = block_size or choose_block_size(len(data))
+        digest = hashlib.md5(data).hexdigest()
+
+        signed = await self.session.command.execute_command(
+            signature_command(remote_path, block_size), timeout_ms=timeout_ms
+        )
+        if not signed.success:
+            return FileSyncResult(
+                request_id=signed.request_id,
+                success=False,
+                path=remote_path,
+                size=len(data),
+                error_message=signed.error_message or signed.stderr or "Failed to read remote checksums",
+            )
+        signature = parse_signature(signed.stdout, block_size)
+        if signature.exists and signature.digest == digest:
+            return FileSyncResult(
+                request_id=signed.request_id,
+                success=True,
+                path=remote_path,
+                size=len(data),
+                unchanged=True,
+            )
+
+        ops, literals = await asyncio.to_thread(compute_delta, data, signature)
+        token = uuid.uuid4().hex
+        literal_path = f"/tmp/.agentbay-sync-{token}.b64"
+        script_path = f"/tmp/.agentbay-sync-{token}.sh"
+        written = await self._write_base64(literal_path, io.BytesIO(literals))
+        if written.success:
+            written = await self.write_file(
+                script_path,
+                reconstruction_script(remote_path, literal_path, ops, block_size, digest),
+            )
+        if not written.success:
+            await self._remove_remote(literal_path, script_path)
+            return FileSyncResult(
+                request_id=written.request_id,
+                success=False,
+                path=remote_path,
+                size=len(data),
+                error_message=f"Failed to upload delta: {written.error_message}",
+            )
+
+        script = shlex.quote(script_path)
+        applied = await self.session.command.execute_command(
+            f"sh {script}; status=$?; rm -f -- {script}; [ $status -eq 0 ]",
+            timeout_ms=timeout_ms,
+        )
+        if not applied.success:
+            return FileSyncResult(
+                request_id=applied.request_id,
+                success=False,
+                path=remote_path,
+                size=len(data),
+                error_message=applied.error_message or applied.stderr or "Failed to apply delta",
+            )
+        _logger.debug(
+            f"Synced {remote_path}: sent {len(literals)} of {len(data)} bytes in {len(ops)} operations"
+        )
+        return FileSyncResult(
+            request_id=applied.request_id,
+            success=True,
+            path=remote_path,
+            size=len(data),
+            bytes_sent=len(literals),
+        )
+
+    async def sync_dir(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        *,
+        delete: bool = False,
+        exclude: Optional[List[str]] = None,
+        delta_threshold: int = 64 * 1024,
+        timeout_ms: int = 50000,
+    ) -> DirectorySyncResult:
+        """
+        Make a remote directory match a local one, transferring only changes.
+
+        Local and remote manifests (see `manifest`) are compared by checksum.
+        New files, and changed files smaller than `delta_threshold`, are
+        uploaded together as one archive (`pack_upload`); larger changed files
+        are updated with `sync_file`.
+
+        Args:
+            local_dir (str): Local source directory.
+            remote_dir (str): Remote directory to update; created if missing.
+            delete (bool, optional): Remove remote files that do not exist
+                locally. Defaults to False.
+            exclude (Optional[List[str]], optional): Globs of files and
+                directories to leave alone on both sides (see `manifest`).
+            delta_threshold (int, optional): Minimum size in bytes of a changed
+                file to be updated with a delta. Defaults to 64KB.
+            timeout_ms (int, optional): Timeout of each remote command in
+                milliseconds. Defaults to 50000.
+
+        Returns:
+            DirectorySyncResult: What was uploaded, patched, deleted or skipped.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            result = await session.file_system.sync_dir("./src", "/app/src", delete=True)
+            print(result.uploaded, result.patched, result.deleted)
+            await session.delete()
+            ```
+        """
+        if not os.path.isdir(local_dir):
+            return DirectorySyncResult(
+                success=False, error_message=f"Local directory not found: {local_dir}"
+            )
+        local = await asyncio.to_thread(build_local_manifest, local_dir, "md5", None, exclude)
+        listed = await self.manifest(remote_dir, hash="md5", exclude=exclude, timeout_ms=timeout_ms)
+        # A remote directory that cannot be listed yet is synced from scratch
+        remote = listed.manifest if listed.success else FileManifest(remote_dir, "md5")
+        diff = local.diff(remote)
+
+        result = DirectorySyncResult(success=True, unchanged=diff.unchanged)
+        full = diff.missing + [p for p in diff.changed if local[p].size < delta_threshold]
+        if full:
+            packed = await self.pack_upload(
+                local_dir, remote_dir, paths=sorted(full), timeout_ms=timeout_ms
+            )
+            result.request_id = packed.request_id
+            if not packed.success:
+                result.success = False
+                result.error_message = packed.error_message
+                return result
+            result.uploaded = sorted(full)
+            result.bytes_sent += packed.archive_size
+
+        for rel_path in diff.changed:
+            if local[rel_path].size < delta_threshold:
+                continue
+            synced = await self.sync_file(
+                os.path.join(local_dir, rel_path),
+                _join_remote_path(remote_dir, rel_path),
+                timeout_ms=timeout_ms,
+            )
+            result.request_id = synced.request_id
+            if not synced.success:
+                result.success = False
+                result.error_message = f"Failed to sync {rel_path}: {synced.error_message}"
+                return result
+            result.patched.append(rel_path)
+            result.bytes_sent += synced.bytes_sent
+
+        if delete and diff.extra:
+            targets = [_join_remote_path(remote_dir, p) for p in diff.extra]
+            self._invalidate_cache(*targets)
+            removed = await self.session.command.execute_command(
+                "rm -f -- " + " ".join(shlex.quote(p) for p in targets),
+                timeout_ms=timeout_ms,
+            )
+            result.request_id = removed.request_id
+            if not removed.success:
+                result.success = False
+                result.error_message = removed.error_message or removed.stderr
+                return result
+            result.deleted = diff.extra
+        return result
+
+    async def _pack_location(self, via: str, name: str) -> str:
+        # Presigned transfers must go through the file transfer context path
+        if via == "presigned":
+            context_path = await self.get_file_transfer_context_path()
+            if not context_path:
+                raise FileError("Presigned transfer requires a file transfer context path")
+            return _join_remote_path(context_path, name)
+        return f"/tmp/{name}"
+
+    async def _push_archive(
+        self, archive: str, remote_dir: str, via: str, timeout_ms: int
+    ) -> Tuple[str, Optional[str]]:
+        try:
+            remote_archive = await self._pack_location(
+                via, f"{_PACK_PREFIX}{uuid.uuid4().hex}.tar.gz"
+            )
+        except FileError as e:
+            return "", str(e)
+        source = shlex.quote(remote_archive)
+        target = shlex.quote(remote_dir)
+        if via == "presigned":
+            upload = await self.upload_file(archive, remote_archive)
+            if not upload.success:
+                return "", upload.error_message or "Failed to upload archive"
+            unpack = f"tar -xzf {source} -C {target}"
+        else:
+            with open(archive, "rb") as f:
+                written = await self._write_base64(remote_archive, f)
+            if not written.success:
+                await self._remove_remote(remote_archive)
+                return written.request_id, written.error_message
+            unpack = f"base64 -d {source} | tar -xzf - -C {target}"
+
+        extracted = await self.session.command.execute_command(
+            f"mkdir -p -- {target} && {unpack}; status=$?; rm -f -- {source}; [ $status -eq 0 ]",
+            timeout_ms=timeout_ms,
+        )
+        if not extracted.success:
+            return extracted.request_id, (
+                extracted.error_message or extracted.stderr or "Failed to extract archive"
+            )
+        return extracted.request_id, None
+
+    async def _pull_archive(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        selected: Optional[List[str]],
+        excluded: List[str],
+        via: str,
+        timeout_ms: int,
+        result: PackTransferResult,
+    ) -> Optional[str]:
+        name = f"{_PACK_PREFIX}{uuid.uuid4().hex}"
+        try:
+            remote_archive = await self._pack_location(via, f"{name}.tar.gz")
+        except FileError as e:
+            return str(e)
+        list_file = f"/tmp/{name}.list"
+        archive_arg = shlex.quote(remote_archive)
+        list_arg = shlex.quote(list_file)
+        if selected is not None:
+            members = f"-T {list_arg}"
+            listed = selected
+        elif excluded:
+            members = f"--anchored --no-wildcards -X {list_arg} ."
+            listed = excluded
+        else:
+            members = "."
+            listed = []
+
+        fd, archive = tempfile.mkstemp(suffix=".tar.gz")
+        os.close(fd)
+        try:
+            if listed:
+                written = await self.write_file(
+                    list_file, "".join(f"./{p}\n" for p in listed)
+                )
+                if not written.success:
+                    return f"Failed to write file list: {written.error_message}"
+            packed = await self.session.command.execute_command(
+                f"cd -- {shlex.quote(remote_dir)} && tar -czf {archive_arg} {members}"
+                f" && stat -c %s -- {archive_arg}",
+                timeout_ms=timeout_ms,
+            )
+            result.request_id = packed.request_id
+            size_text = (packed.stdout or "").strip().rsplit("\n", 1)[-1]
+            if not packed.success or not size_text.isdigit():
+                return packed.error_message or packed.stderr or "Failed to create archive"
+            result.archive_size = int(size_text)
+
+            if via == "presigned":
+                download = await self.download_file(remote_archive, archive)
+                if not download.success:
+                    return download.error_message or "Failed to download archive"
+            else:
+                with open(archive, "wb") as f:
+                    offset = 0
+                    while offset < result.archive_size:
+                        length = min(self.DEFAULT_CHUNK_SIZE, result.archive_size - offset)
+                        chunk = await self._read_file_chunk(
+                            remote_archive, offset, length, format_type="binary"
+                        )
+                        if not chunk.success:
+                            return chunk.error_message
+                        f.write(chunk.content)
+                        offset += length
+
+            result.files = await asyncio.to_thread(extract_archive, archive, local_dir)
+            return None
+        finally:
+            os.remove(archive)
+            await self._remove_remote(remote_archive, list_file)
+
+    async def _write_base64(self, remote_path: str, stream: BinaryIO) -> BoolResult:
+        # Base64 keeps binary data intact through the text-only write tool; each
+        # raw chunk is a multiple of 3 bytes so the pieces concatenate cleanly
+        raw_chunk = self.BASE64_CHUNK_CHARS // 4 * 3
+        mode = "overwrite"
+        for chunk in iter(lambda: stream.read(raw_chunk), b""):
+            written = await self._write_file_chunk(
+                remote_path, base64.b64encode(chunk).decode("ascii"), mode
+            )
+            if not written.success:
+                return written
+            mode = "append"
+        if mode == "overwrite":
+            return await self._write_file_chunk(remote_path, "", mode)
+        return written
+
+    async def _remove_remote(self, *paths: str) -> None:
+        try:
+            await self.session.command.execute_command(
+                "rm -f -- " + " ".join(shlex.quote(p) for p in paths)
+            )
+        except Exception as e:
+            _logger.debug(f"Failed to remove temporary files {paths}: {e}")
+
     async def _get_file_change(self, path: str) -> FileChangeResult:
         """
         Get file change information for the specified directory path.
@@ -2032,6 +3514,7 @@ class AsyncFileSystem(BaseService):
         callback: Callable[[List[FileChangeEvent]], None],
         interval: float = 0.5,
         stop_event: Optional[threading.Event] = None,
+        invalidate_cache: bool = True,
     ) -> threading.Thread:
         """
         Watch a directory for file changes and call the callback function when changes occur.
@@ -2043,6 +3526,8 @@ class AsyncFileSystem(BaseService):
             interval: Polling interval in seconds. Defaults to 0.5.
             stop_event: Optional threading.Event to stop the monitoring. If not provided,
                 a new Event will be created and returned via the thread object.
+            invalidate_cache: Drop changed files from the content cache (see
+                `enable_cache`) before calling the callback. Defaults to True.
 
         Returns:
             threading.Thread: The monitoring thread. Call thread.start() to begin monitoring.
@@ -2087,6 +3572,10 @@ class AsyncFileSystem(BaseService):
                         current_events = result.events
 
                         # Only call callback if there are actual events
+                        if current_events and invalidate_cache:
+                            self._invalidate_cache(
+                                *(event.path for event in current_events)
+                            )
                         if current_events:
                             print(f"Detected {len(current_events)} file changes:")
                             for event in current_events:
@@ -1,88 +1,228 @@
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .._common.logger import get_logger
 from .._common.models.fingerprint import FingerprintFormat
+from .._common.utils.fingerprint_cache import (
+    FingerprintCache,
+    cache_key,
+    local_browser_version,
+)
 
 from playwright.async_api import async_playwright
 
 # Global _logger for this module
 _logger = get_logger("fingerprint")
 
+# Common desktop screen sizes emulated by generate_fingerprints
+SCREEN_VARIANTS = (
+    (1920, 1080),
+    (1536, 864),
+    (1366, 768),
+    (1440, 900),
+    (2560, 1440),
+    (1680, 1050),
+    (1600, 900),
+    (1280, 800),
+)
+# Height of the tab strip and toolbar of a maximized browser window
+BROWSER_UI_HEIGHT = 80
+
 
 class AsyncBrowserFingerprintGenerator:
     """
     Browser fingerprint generator class.
 
+    Generating a fingerprint launches a local browser. With a `cache`, the
+    result is stored on disk and reused by later calls (and processes) using
+    the same browser build, launch mode and host.
+
     Args:
         headless: Whether to run browser in headless mode.
         use_chrome_channel: Whether to launch via the Chrome channel.
+        cache: Optional on-disk cache of generated fingerprints.
     """
 
-    def __init__(self, headless: bool = False, use_chrome_channel: bool = True):
+    def __init__(
+        self,
+        headless: bool = False,
+        use_chrome_channel: bool = True,
+        cache: Optional[FingerprintCache] = None,
+    ):
         """
         Initialize the fingerprint generator.
 
         Args:
             headless: Whether to run browser in headless mode
             use_chrome_channel: Whether to use Chrome channel
+            cache: Cache of generated fingerprints, e.g. FingerprintCache(); None disables caching
         """
         self.headless = headless
         self.use_chrome_channel = use_chrome_channel
+        self.cache = cache
+        self._key: Optional[str] = None
 
-    async def generate_fingerprint(self) -> Optional[FingerprintFormat]:
+    async def generate_fingerprint(
+        self, refresh: bool = False
+    ) -> Optional[FingerprintFormat]:
         """
         Extract comprehensive browser fingerprint using Playwright.
 
+        Args:
+            refresh: Generate a new fingerprint even if the cache holds one.
+
         Returns:
             Optional[FingerprintFormat]: FingerprintFormat object containing fingerprint and headers, or None if generation failed
 
         Example:
-            generator = AsyncBrowserFingerprintGenerator(headless=True)
+            generator = AsyncBrowserFingerprintGenerator(headless=True, cache=FingerprintCache())
             fingerprint = await generator.generate_fingerprint()
             if fingerprint:
                 print(fingerprint.headers.get("user-agent"))
         """
         try:
+            key = await self._cache_key()
+            if key is not None and not refresh:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    _logger.info("Using cached fingerprint")
+                    return cached
+
             _logger.info("Starting fingerprint generation")
 
             async with async_playwright() as p:
-                # Launch Chrome browser with specific options
-                launch_options = {
-                    "headless": self.headless,
-                    "args": ["--start-maximized"],
-                }
+                browser = await self._launch(p)
+                try:
+                    fingerprint_format = await self._generate(browser)
+                finally:
+                    await browser.close()
+
+            if key is not None:
+                self.cache.put(key, fingerprint_format)
+            _logger.info("Fingerprint generation completed successfully!")
+            return fingerprint_format
+
+        except Exception as e:
+            _logger.error(f"Error generating fingerprint: {e}")
+            return None
+
+    async def generate_fingerprints(
+        self, count: int, refresh: bool = False
+    ) -> List[FingerprintFormat]:
+        """
+        Generate up to `count` distinct fingerprints with a single browser launch.
+
+        Fingerprints already in the cache are returned first. The missing ones
+        are extracted from fresh contexts of one browser: the first with the
+        host's own screen, the next ones emulating the common desktop screen
+        sizes of SCREEN_VARIANTS (window size, screen and device metrics are
+        reported by the browser itself). Each new fingerprint is added to the
+        cache, which pre-warms the pool, e.g. before creating many profiles.
+        At most 1 + len(SCREEN_VARIANTS) distinct fingerprints exist per browser.
+
+        Args:
+            count: Number of fingerprints wanted.
+            refresh: Ignore the fingerprints already cached.
+
+        Returns:
+            List[FingerprintFormat]: The distinct fingerprints, cached ones first.
+                Generation errors are logged and the fingerprints obtained so far returned.
 
-                if self.use_chrome_channel:
-                    launch_options["channel"] = "chrome"
+        Example:
+            generator = AsyncBrowserFingerprintGenerator(headless=True, cache=FingerprintCache())
+            pool = await generator.generate_fingerprints(5)
+            print(f"{len(pool)} fingerprints ready")
+        """
+        fingerprints: List[FingerprintFormat] = []
+        try:
+            key = await self._cache_key()
+            if key is not None and not refresh:
+                fingerprints = self.cache.pool(key, limit=count)
+            if len(fingerprints) >= count:
+                return fingerprints
+
+            # Screens already covered by the pool are not generated again
+            seen = {(f.fingerprint.screen.width, f.fingerprint.screen.height) for f in fingerprints}
+            screens = [None] + [s for s in SCREEN_VARIANTS if s not in seen]
+            _logger.info(f"Generating up to {count - len(fingerprints)} fingerprints with one browser")
+            async with async_playwright() as p:
+                browser = await self._launch(p)
+                try:
+                    for screen in screens:
+                        if len(fingerprints) >= count:
+                            break
+                        fingerprint_format = await self._generate(browser, screen)
+                        if fingerprint_format in fingerprints:
+                            continue
+                        fingerprints.append(fingerprint_format)
+                        if key is not None:
+                            self.cache.put(key, fingerprint_format)
+                finally:
+                    await browser.close()
+        except Exception as e:
+            _logger.error(f"Error generating fingerprints: {e}")
+        return fingerprints
 
-                browser = await p.chromium.launch(**launch_options)
-                context = await browser.new_context(no_viewport=True)
-                page = await context.new_page()
+    async def _cache_key(self) -> Optional[str]:
+        """Cache key of this generator's browser, None without a cache."""
+        if self.cache is None:
+            return None
+        if self._key is None:
+            channel = "chrome" if self.use_chrome_channel else "chromium"
+            version = await asyncio.to_thread(local_browser_version, channel)
+            self._key = cache_key(channel, version, self.headless)
+        return self._key
+
+    async def _launch(self, p):
+        """Launch the local browser used for generation."""
+        # Launch Chrome browser with specific options
+        launch_options = {
+            "headless": self.headless,
+            "args": ["--start-maximized"],
+        }
 
-                # Navigate to a test page to ensure proper loading
-                await page.goto("about:blank")
+        if self.use_chrome_channel:
+            launch_options["channel"] = "chrome"
 
-                _logger.info("Extracting comprehensive browser fingerprint...")
+        return await p.chromium.launch(**launch_options)
 
-                # Extract comprehensive fingerprint data
-                fingerprint_data = await self._extract_fingerprint_data(page)
+    async def _generate(
+        self, browser, screen: Optional[Tuple[int, int]] = None
+    ) -> FingerprintFormat:
+        """
+        Generate one fingerprint in a fresh context of `browser`, emulating a
+        `screen` of (width, height) pixels instead of the host's if given.
+        """
+        if screen is None:
+            context = await browser.new_context(no_viewport=True)
+        else:
+            width, height = screen
+            # Leave room for the browser UI, as in a maximized window
+            context = await browser.new_context(
+                screen={"width": width, "height": height},
+                viewport={"width": width, "height": height - BROWSER_UI_HEIGHT},
+            )
+        try:
+            page = await context.new_page()
 
-                # Get request headers
-                headers_data = await self._extract_headers_data(page)
+            # Navigate to a test page to ensure proper loading
+            await page.goto("about:blank")
 
-                await browser.close()
+            _logger.info("Extracting comprehensive browser fingerprint...")
 
-                # Combine fingerprint and headers using FingerprintFormat
-                fingerprint_format = FingerprintFormat._from_dict(
-                    {"fingerprint": fingerprint_data, "headers": headers_data}
-                )
+            # Extract comprehensive fingerprint data
+            fingerprint_data = await self._extract_fingerprint_data(page)
 
-                _logger.info("Fingerprint generation completed successfully!")
-                return fingerprint_format
+            # Get request headers
+            headers = await self._extract_headers_data(page)
+        finally:
+            await context.close()
 
-        except Exception as e:
-            _logger.error(f"Error generating fingerprint: {e}")
-            return None
+        # Combine fingerprint and headers using FingerprintFormat
+        fingerprint_format = FingerprintFormat._from_dict(
+            {"fingerprint": fingerprint_data, "headers": headers}
+        )
+        return fingerprint_format
 
     async def generate_fingerprint_to_file(
         self, output_filename: str = "fingerprint_output.json"
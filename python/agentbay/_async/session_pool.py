@@ -0,0 +1,531 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from .._common.exceptions import SessionError
+from .._common.logger import get_logger
+from .._common.models.session_pool import (
+    ReleaseAction,
+    ReleasePolicy,
+    SessionPoolMetrics,
+)
+from .._common.params.session_params import CreateSessionParams
+from .concurrency import map_unordered
+from .session import AsyncSession
+
+# Initialize _logger for this module
+_logger = get_logger("session_pool")
+
+# Interval of the background maintenance loop in seconds
+_MAINTAIN_TICK = 0.5
+
+# Interval between checks for a free session while an acquire is waiting
+_ACQUIRE_POLL = 0.05
+
+# Upper bound of the back-off after failed session creations, in seconds
+_MAX_CREATE_BACKOFF = 30.0
+
+
+class _PoolEntry:
+    """Bookkeeping for one session owned by the pool."""
+
+    __slots__ = ("session", "created_at", "last_used", "uses", "paused")
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.uses = 0
+        self.paused = False
+
+
+class AsyncSessionPool:
+    """
+    Keeps warm sessions of one `CreateSessionParams` profile and leases them out.
+
+    The pool pre-creates `size` sessions and never owns more than `max_size`.
+    A background task health-checks idle sessions with `get_status`, replaces
+    broken or expired ones and, when `pause_idle_after` is set, parks sessions
+    that stay idle with `beta_pause` (they are resumed on demand). What happens
+    to a session when its lease ends is decided by the `ReleasePolicy`.
+
+    Use one pool per profile (image, labels, context syncs).
+
+    Example:
+        ```python
+        async with AsyncSessionPool(agent_bay, CreateSessionParams(image_id="linux_latest"), size=4) as pool:
+            async with pool.acquire() as session:
+                await session.command.execute_command("make test")
+            print(pool.metrics().hit_rate)
+        ```
+    """
+
+    def __init__(
+        self,
+        agent_bay: Any,
+        params: Optional[CreateSessionParams] = None,
+        size: int = 2,
+        max_size: Optional[int] = None,
+        policy: Optional[ReleasePolicy] = None,
+        acquire_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        pause_idle_after: Optional[float] = None,
+    ):
+        """
+        Initialize an AsyncSessionPool.
+
+        Args:
+            agent_bay (AsyncAgentBay): The client used to create sessions.
+            params (Optional[CreateSessionParams], optional): Profile of the pooled
+                sessions. Defaults to None (default session parameters).
+            size (int, optional): Number of warm sessions to keep. Defaults to 2.
+            max_size (Optional[int], optional): Maximum number of sessions owned
+                by the pool, leased or not. Defaults to `size`.
+            policy (Optional[ReleasePolicy], optional): Release policy. Defaults to
+                keeping healthy sessions as-is.
+            acquire_timeout (float, optional): Default number of seconds to wait
+                for a session. Defaults to 300.
+            health_check_interval (float, optional): Seconds between health checks
+                of idle sessions. Defaults to 30.
+            pause_idle_after (Optional[float], optional): Park sessions idle for
+                this many seconds with `beta_pause`. Defaults to None (never).
+
+        Raises:
+            ValueError: If the sizes or intervals are invalid.
+        """
+        if size < 0:
+            raise ValueError("size must not be negative")
+        max_size = size if max_size is None else max_size
+        if max_size < 1 or max_size < size:
+            raise ValueError("max_size must be at least 1 and not smaller than size")
+        if health_check_interval <= 0:
+            raise ValueError("health_check_interval must be positive")
+        if pause_idle_after is not None and pause_idle_after < 0:
+            raise ValueError("pause_idle_after must not be negative")
+
+        self._agent_bay = agent_bay
+        self._params = params
+        self._size = size
+        self._max_size = max_size
+        self._policy = policy or ReleasePolicy()
+        self._acquire_timeout = acquire_timeout
+        self._health_check_interval = health_check_interval
+        self._pause_idle_after = pause_idle_after
+
+        self._lock = threading.Lock()
+        self._idle: List[_PoolEntry] = []
+        self._leased: Dict[str, _PoolEntry] = {}
+        # Slots reserved for sessions being created, and idle sessions being maintained
+        self._creating = 0
+        self._busy = 0
+        self._closed = False
+        self._started = False
+        self._maintainer = None
+        self._last_health_check = time.monotonic()
+        self._create_failures_in_row = 0
+        self._retry_create_at = 0.0
+        self._last_create_error = ""
+        self._metrics = SessionPoolMetrics()
+
+    async def __aenter__(self) -> "AsyncSessionPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def policy(self) -> ReleasePolicy:
+        return self._policy
+
+    def metrics(self) -> SessionPoolMetrics:
+        """
+        Snapshot of the pool metrics.
+
+        Returns:
+            SessionPoolMetrics: Counters plus the current idle and leased gauges.
+        """
+        with self._lock:
+            snapshot = self._metrics.copy()
+            snapshot.idle = len(self._idle) + self._busy
+            snapshot.leased = len(self._leased)
+        return snapshot
+
+    async def start(self) -> None:
+        """
+        Create the warm sessions and start the background maintenance.
+
+        Creation failures are logged and retried by the maintenance loop.
+        """
+        with self._lock:
+            if self._closed:
+                raise SessionError("Session pool is closed")
+            if self._started:
+                return
+            self._started = True
+        await self._refill()
+        self._maintainer = self._spawn(self._maintain)
+
+    async def close(self) -> None:
+        """
+        Stop the maintenance and delete the idle sessions.
+
+        Sessions that are still leased are deleted when they are released.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            entries = self._idle
+            self._idle = []
+        if self._maintainer is not None:
+            await self._join(self._maintainer)
+            self._maintainer = None
+        for entry in entries:
+            await self._delete_entry(entry)
+
+    @asynccontextmanager
+    async def acquire(self, timeout: Optional[float] = None) -> AsyncIterator[AsyncSession]:
+        """
+        Lease a session for the duration of an `async with` block.
+
+        The session is released when the block exits; an exception raised in
+        the block marks the lease as failed for the release policy.
+
+        Args:
+            timeout (Optional[float], optional): Seconds to wait for a session.
+                Defaults to the pool's `acquire_timeout`.
+
+        Yields:
+            AsyncSession: The leased session.
+
+        Raises:
+            SessionError: If the pool is closed, no session becomes available in
+                time, or a new session cannot be created.
+        """
+        session = await self.lease(timeout)
+        failed = False
+        try:
+            yield session
+        except Exception:
+            failed = True
+            raise
+        finally:
+            await self.release(session, failed=failed)
+
+    async def lease(self, timeout: Optional[float] = None) -> AsyncSession:
+        """
+        Lease a session; pair every call with `release`.
+
+        Idle running sessions are preferred, then parked ones (which are
+        resumed), then a new session is created if the pool is below
+        `max_size`. Otherwise the call waits for a release.
+
+        Args:
+            timeout (Optional[float], optional): Seconds to wait for a session.
+                Defaults to the pool's `acquire_timeout`.
+
+        Returns:
+            AsyncSession: The leased session.
+
+        Raises:
+            SessionError: If the pool is closed, no session becomes available in
+                time, or a new session cannot be created.
+        """
+        timeout = self._acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        hit = True
+        while True:
+            create = False
+            with self._lock:
+                if self._closed:
+                    raise SessionError("Session pool is closed")
+                entry = self._pop_idle()
+                if entry is not None and entry.paused:
+                    self._busy += 1
+                elif entry is None and self._total() < self._max_size:
+                    self._creating += 1
+                    create = True
+            if entry is not None and entry.paused:
+                if await self._resume_entry(entry):
+                    return self._checkout(entry, start, hit, from_busy=True)
+            elif entry is not None:
+                return self._checkout(entry, start, hit)
+            elif create:
+                hit = False
+                entry = await self._create_entry()
+                if entry is None:
+                    raise SessionError(
+                        f"Failed to create a pooled session: {self._last_create_error}"
+                    )
+                return self._checkout(entry, start, hit, from_creating=True)
+
+            hit = False
+            if time.monotonic() - start >= timeout:
+                with self._lock:
+                    self._metrics.timeouts += 1
+                raise SessionError(
+                    f"Timed out after {timeout}s waiting for a pooled session"
+                )
+            await asyncio.sleep(_ACQUIRE_POLL)
+
+    async def release(self, session: AsyncSession, failed: bool = False) -> None:
+        """
+        End the lease of a session.
+
+        Args:
+            session (AsyncSession): A session returned by `lease`.
+            failed (bool, optional): Mark the session as failed; the default
+                policy then deletes it. Defaults to False.
+
+        Raises:
+            ValueError: If the session is not leased from this pool.
+        """
+        with self._lock:
+            entry = self._leased.pop(session.session_id, None)
+            if entry is not None:
+                self._busy += 1
+        if entry is None:
+            raise ValueError(f"Session {session.session_id} is not leased from this pool")
+
+        entry.uses += 1
+        try:
+            action = self._policy.decide(
+                entry.uses, time.monotonic() - entry.created_at, failed
+            )
+        except Exception as e:
+            _logger.warning(f"Release policy failed, deleting session: {e}")
+            action = ReleaseAction.DELETE
+        if self._closed:
+            action = ReleaseAction.DELETE
+        if action == ReleaseAction.RESET and not await self._reset_entry(entry):
+            action = ReleaseAction.DELETE
+
+        if action == ReleaseAction.DELETE:
+            with self._lock:
+                self._busy -= 1
+            await self._delete_entry(entry)
+        else:
+            entry.last_used = time.monotonic()
+            await self._return_idle(entry, from_busy=True)
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self._leased) + self._creating + self._busy
+
+    def _pop_idle(self) -> Optional[_PoolEntry]:
+        # Most recently used first; running sessions before parked ones.
+        for i in range(len(self._idle) - 1, -1, -1):
+            if not self._idle[i].paused:
+                return self._idle.pop(i)
+        return self._idle.pop() if self._idle else None
+
+    def _checkout(
+        self,
+        entry: _PoolEntry,
+        start: float,
+        hit: bool,
+        from_creating: bool = False,
+        from_busy: bool = False,
+    ) -> AsyncSession:
+        wait_ms = int((time.monotonic() - start) * 1000)
+        with self._lock:
+            if from_creating:
+                self._creating -= 1
+            if from_busy:
+                self._busy -= 1
+            self._leased[entry.session.session_id] = entry
+            self._metrics.acquires += 1
+            if hit:
+                self._metrics.hits += 1
+            else:
+                self._metrics.misses += 1
+            self._metrics.record_wait(wait_ms)
+        return entry.session
+
+    async def _create_entry(self) -> Optional[_PoolEntry]:
+        """
+        Create a session for a slot reserved in `_creating`.
+
+        On failure the slot is released here; on success the caller releases
+        it when the session is handed out or made idle.
+        """
+        error = ""
+        session = None
+        try:
+            result = await self._agent_bay.create(self._params)
+            if result.success and result.session is not None:
+                session = result.session
+            else:
+                error = result.error_message or "Unknown error"
+        except Exception as e:
+            error = str(e)
+
+        with self._lock:
+            if session is not None:
+                self._metrics.created += 1
+                self._create_failures_in_row = 0
+                return _PoolEntry(session)
+            self._creating -= 1
+            self._metrics.create_failures += 1
+            self._create_failures_in_row += 1
+            self._last_create_error = error
+            backoff = min(_MAX_CREATE_BACKOFF, 2 ** (self._create_failures_in_row - 1))
+            self._retry_create_at = time.monotonic() + backoff
+        _logger.warning(f"Failed to create pooled session: {error}")
+        return None
+
+    async def _return_idle(
+        self, entry: _PoolEntry, from_creating: bool = False, from_busy: bool = False
+    ) -> None:
+        # Release the reserved slot and make the session idle in one step, so
+        # the pool never appears to own fewer sessions than it does.
+        with self._lock:
+            if from_creating:
+                self._creating -= 1
+            if from_busy:
+                self._busy -= 1
+            closed = self._closed
+            if not closed:
+                self._idle.append(entry)
+        if closed:
+            await self._delete_entry(entry)
+
+    async def _delete_entry(self, entry: _PoolEntry) -> None:
+        try:
+            result = await entry.session.delete()
+            if not result.success:
+                _logger.warning(
+                    f"Failed to delete pooled session {entry.session.session_id}: "
+                    f"{result.error_message}"
+                )
+        except Exception as e:
+            _logger.warning(f"Failed to delete pooled session {entry.session.session_id}: {e}")
+        with self._lock:
+            self._metrics.deleted += 1
+
+    async def _reset_entry(self, entry: _PoolEntry) -> bool:
+        try:
+            result = await entry.session.command.execute_command(
+                self._policy.reset_command(), timeout_ms=60000
+            )
+            ok = result.success
+        except Exception as e:
+            _logger.warning(f"Failed to reset pooled session {entry.session.session_id}: {e}")
+            ok = False
+        if ok:
+            with self._lock:
+                self._metrics.resets += 1
+        return ok
+
+    async def _resume_entry(self, entry: _PoolEntry) -> bool:
+        """Resume a parked session reserved in `_busy`; it is deleted if that fails."""
+        try:
+            result = await entry.session.beta_resume()
+            ok = result.success
+        except Exception as e:
+            _logger.warning(f"Failed to resume pooled session {entry.session.session_id}: {e}")
+            ok = False
+        if not ok:
+            with self._lock:
+                self._busy -= 1
+            await self._delete_entry(entry)
+            return False
+        entry.paused = False
+        with self._lock:
+            self._metrics.resumed += 1
+        return True
+
+    async def _refill(self) -> None:
+        """Create sessions until the pool holds `size` warm sessions."""
+        with self._lock:
+            if self._closed or time.monotonic() < self._retry_create_at:
+                return
+            warm = len(self._idle) + self._creating + self._busy
+            count = max(0, min(self._size - warm, self._max_size - self._total()))
+            self._creating += count
+        if count:
+            # Created concurrently (on a thread pool in the sync API)
+            async for _, error in map_unordered(
+                lambda _: self._fill_one(), list(range(count)), count
+            ):
+                if isinstance(error, Exception):
+                    _logger.warning(f"Failed to fill the session pool: {error}")
+
+    async def _fill_one(self) -> None:
+        entry = await self._create_entry()
+        if entry is not None:
+            await self._return_idle(entry, from_creating=True)
+
+    async def _is_healthy(self, entry: _PoolEntry) -> bool:
+        try:
+            result = await entry.session.get_status()
+        except Exception:
+            return False
+        expected = ("PAUSING", "PAUSED") if entry.paused else ("RUNNING",)
+        return result.success and result.status in expected
+
+    async def _check_idle(self) -> None:
+        """Drop idle sessions that are expired or fail their health check."""
+        with self._lock:
+            entries = list(self._idle)
+        now = time.monotonic()
+        for entry in entries:
+            expired = self._policy.is_expired(entry.uses, now - entry.created_at)
+            healthy = not expired and await self._is_healthy(entry)
+            if healthy:
+                continue
+            with self._lock:
+                if entry not in self._idle:
+                    # Leased while it was being checked
+                    continue
+                self._idle.remove(entry)
+                if not expired:
+                    self._metrics.health_failures += 1
+            await self._delete_entry(entry)
+
+    async def _park_idle(self) -> None:
+        """Pause running sessions that have been idle for `pause_idle_after`."""
+        now = time.monotonic()
+        with self._lock:
+            entries = [
+                e
+                for e in self._idle
+                if not e.paused and now - e.last_used >= self._pause_idle_after
+            ]
+            for entry in entries:
+                self._idle.remove(entry)
+            self._busy += len(entries)
+        for entry in entries:
+            try:
+                # Wait for PAUSED: resuming a session still pausing can fail
+                result = await entry.session.beta_pause()
+                entry.paused = result.success
+            except Exception as e:
+                _logger.warning(f"Failed to pause pooled session {entry.session.session_id}: {e}")
+            if entry.paused:
+                with self._lock:
+                    self._metrics.paused += 1
+            await self._return_idle(entry, from_busy=True)
+
+    async def _maintain(self) -> None:
+        while not self._closed:
+            try:
+                if time.monotonic() - self._last_health_check >= self._health_check_interval:
+                    self._last_health_check = time.monotonic()
+                    await self._check_idle()
+                await self._refill()
+                if self._pause_idle_after is not None:
+                    await self._park_idle()
+            except Exception as e:
+                _logger.warning(f"Session pool maintenance failed: {e}")
+            await asyncio.sleep(_MAINTAIN_TICK)
+
+    def _spawn(self, fn: Callable[[], Any]) -> Any:
+        """Run `fn` in the background."""
+        return asyncio.ensure_future(fn())
+
+    async def _join(self, handle: Any) -> None:
+        """Wait for a background run started by `_spawn`."""
+        await handle
@@ -0,0 +1,250 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .._common.exceptions import SessionError
+from .._common.logger import get_logger
+from .session import AsyncSession
+
+# Initialize _logger for this module
+_logger = get_logger("session_reaper")
+
+
+class _PendingDeletion:
+    """Bookkeeping for one session the reaper is deleting."""
+
+    __slots__ = ("session", "sync_context", "requested_at", "attempts", "due_at")
+
+    def __init__(self, session: AsyncSession, sync_context: bool, requested: bool):
+        now = time.monotonic()
+        self.session = session
+        self.sync_context = sync_context
+        # None until DeleteSessionAsync has been accepted
+        self.requested_at: Optional[float] = now if requested else None
+        self.attempts = 0
+        self.due_at = now
+
+
+class AsyncSessionReaper:
+    """
+    Finishes session deletions in the background.
+
+    Sessions handed over with `submit` are deleted by the reaper; sessions
+    passed to `track` already had their deletion accepted (`delete(wait=False)`)
+    and are only confirmed. Deletions that fail or do not complete within
+    `confirm_timeout` are retried; a session that still exists after
+    `max_attempts` is reported in `leaked`.
+
+    Every AgentBay client owns one reaper, available as `agent_bay.reaper`.
+    """
+
+    def __init__(
+        self,
+        check_interval: float = 2.0,
+        confirm_timeout: float = 300.0,
+        max_attempts: int = 3,
+    ):
+        """
+        Initialize an AsyncSessionReaper.
+
+        Args:
+            check_interval (float, optional): Seconds between status checks.
+                Defaults to 2.0.
+            confirm_timeout (float, optional): Seconds to wait for an accepted
+                deletion to complete before retrying it. Defaults to 300.
+            max_attempts (int, optional): Failed attempts after which a session
+                is reported as leaked. Defaults to 3.
+
+        Raises:
+            ValueError: If an argument is not positive.
+        """
+        if check_interval <= 0 or confirm_timeout <= 0 or max_attempts < 1:
+            raise ValueError(
+                "check_interval, confirm_timeout and max_attempts must be positive"
+            )
+        self._check_interval = check_interval
+        self._confirm_timeout = confirm_timeout
+        self._max_attempts = max_attempts
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingDeletion] = {}
+        self._leaked: Dict[str, str] = {}
+        self._confirmed = 0
+        self._retries = 0
+        self._runner = None
+        self._closed = False
+
+    @property
+    def pending(self) -> List[str]:
+        """IDs of the sessions whose deletion is not confirmed yet."""
+        with self._lock:
+            return list(self._pending)
+
+    @property
+    def leaked(self) -> Dict[str, str]:
+        """Sessions the reaper gave up on, mapped to the last error."""
+        with self._lock:
+            return dict(self._leaked)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the reaper.
+
+        Returns:
+            Dict[str, int]: `pending`, `confirmed`, `retries` and `leaked` counts.
+        """
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "confirmed": self._confirmed,
+                "retries": self._retries,
+                "leaked": len(self._leaked),
+            }
+
+    def submit(self, session: AsyncSession, sync_context: bool = False) -> None:
+        """
+        Hand a session over for deletion; returns immediately.
+
+        Args:
+            session (AsyncSession): The session to delete.
+            sync_context (bool, optional): Sync context data before deleting.
+                Defaults to False.
+
+        Raises:
+            SessionError: If the reaper has been closed.
+        """
+        self._add(_PendingDeletion(session, sync_context, requested=False))
+
+    def track(self, session: AsyncSession) -> None:
+        """
+        Confirm the deletion of a session whose DeleteSessionAsync was accepted.
+
+        Args:
+            session (AsyncSession): The session being deleted.
+
+        Raises:
+            SessionError: If the reaper has been closed.
+        """
+        self._add(_PendingDeletion(session, False, requested=True))
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every pending deletion is confirmed or given up on.
+
+        Args:
+            timeout (Optional[float], optional): Maximum seconds to wait.
+                Defaults to None (no limit).
+
+        Returns:
+            bool: True if nothing is pending anymore.
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return True
+            if timeout is not None and time.monotonic() - start >= timeout:
+                return False
+            await asyncio.sleep(0.1)
+
+    async def close(self, timeout: Optional[float] = 60.0) -> Dict[str, str]:
+        """
+        Stop accepting sessions and wait for the pending deletions.
+
+        Args:
+            timeout (Optional[float], optional): Maximum seconds to wait for the
+                pending deletions. Defaults to 60.
+
+        Returns:
+            Dict[str, str]: Sessions that may have leaked, mapped to the reason.
+        """
+        with self._lock:
+            self._closed = True
+        await self.drain(timeout)
+        with self._lock:
+            for session_id in self._pending:
+                self._leaked[session_id] = "Reaper closed before the deletion was confirmed"
+            self._pending.clear()
+            leaked = dict(self._leaked)
+        for session_id, reason in leaked.items():
+            _logger.warning(f"Session {session_id} may have leaked: {reason}")
+        return leaked
+
+    def _add(self, item: _PendingDeletion) -> None:
+        session_id = item.session.session_id
+        with self._lock:
+            if self._closed:
+                raise SessionError("Session reaper is closed")
+            if session_id in self._pending:
+                return
+            self._pending[session_id] = item
+            self._leaked.pop(session_id, None)
+            if not self._is_running(self._runner):
+                self._runner = self._spawn(self._run)
+
+    async def _run(self) -> None:
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                if not self._pending:
+                    self._runner = None
+                    return
+                due = [p for p in self._pending.values() if p.due_at <= now]
+            for item in due:
+                await self._step(item)
+            await asyncio.sleep(self._check_interval)
+
+    async def _step(self, item: _PendingDeletion) -> None:
+        session = item.session
+        try:
+            if item.requested_at is None:
+                if item.sync_context:
+                    await session._sync_context_before_delete()
+                    item.sync_context = False
+                # The Playwright connection lives in this process, not the session
+                await session._close_browser_connection()
+                result = await session._request_delete()
+                if not result.success:
+                    self._attempt_failed(item, result.error_message)
+                    return
+                item.requested_at = time.monotonic()
+                return
+
+            if await session._is_deleted():
+                with self._lock:
+                    self._pending.pop(session.session_id, None)
+                    self._confirmed += 1
+                return
+            if time.monotonic() - item.requested_at >= self._confirm_timeout:
+                self._attempt_failed(
+                    item,
+                    f"Session still exists {self._confirm_timeout}s after its deletion was accepted",
+                )
+        except Exception as e:
+            self._attempt_failed(item, str(e) or type(e).__name__)
+
+    def _attempt_failed(self, item: _PendingDeletion, error: str) -> None:
+        session_id = item.session.session_id
+        item.attempts += 1
+        with self._lock:
+            if item.attempts >= self._max_attempts:
+                self._pending.pop(session_id, None)
+                self._leaked[session_id] = error
+                _logger.warning(
+                    f"Giving up deleting session {session_id} after {item.attempts} attempts: {error}"
+                )
+                return
+            self._retries += 1
+        _logger.debug(f"Retrying deletion of session {session_id}: {error}")
+        # Request the deletion again, with exponential back-off
+        item.requested_at = None
+        item.due_at = time.monotonic() + self._check_interval * (2 ** item.attempts)
+
+    def _spawn(self, fn: Callable[[], Any]) -> Any:
+        """Run `fn` in the background."""
+        return asyncio.ensure_future(fn())
+
+    def _is_running(self, handle: Any) -> bool:
+        """Whether a background run started by `_spawn` is still active."""
+        return handle is not None and not handle.done()
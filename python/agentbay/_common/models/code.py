@@ -7,6 +7,20 @@ from typing import Optional, List, Dict, Any
 from .response import ApiResponse
 
 
+@dataclass
+class CodeArtifact:
+    """Large output of a code context kept in the session until fetched"""
+
+    path: str
+    mime_type: str
+    size: int = 0
+
+    @property
+    def format(self) -> str:
+        """Short format name, e.g. "png" for image/png"""
+        return self.mime_type.split("/")[-1].split("+")[0]
+
+
 @dataclass
 class ExecutionResult:
     """Single execution result supporting multiple formats"""
@@ -21,10 +35,17 @@ class ExecutionResult:
     latex: Optional[str] = None
     chart: Optional[dict] = None  # chart data
     is_main_result: bool = False
+    # Formats too large to send inline, fetched with CodeContext.fetch_artifact
+    artifacts: List[CodeArtifact] = field(default_factory=list)
 
     def formats(self) -> List[str]:
         """Returns all available formats"""
-        return [k for k, v in self.__dict__.items() if v is not None and k != "is_main_result"]
+        formats = [
+            k
+            for k, v in self.__dict__.items()
+            if v is not None and k not in ("is_main_result", "artifacts")
+        ]
+        return formats + [a.format for a in self.artifacts if a.format not in formats]
 
 
 @dataclass
@@ -44,6 +65,25 @@ class ExecutionError:
     traceback: str
 
 
+@dataclass
+class CodeOutput:
+    """
+    One output of a cell run in a code context, delivered while it runs.
+
+    `type` is "stdout" or "stderr" (with `text`), "display" or "result" (with
+    `result`), "error" (with `error`) or "done" (with the execution count and
+    time), which is always the last output of a cell.
+    """
+
+    type: str
+    seq: int = 0
+    text: str = ""
+    result: Optional[ExecutionResult] = None
+    error: Optional[ExecutionError] = None
+    execution_count: Optional[int] = None
+    execution_time: float = 0.0
+
+
 @dataclass
 class EnhancedCodeExecutionResult(ApiResponse):
     """Enhanced code execution result"""
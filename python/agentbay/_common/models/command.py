@@ -2,6 +2,8 @@
 Command module data models.
 """
 
+from typing import List, Optional
+
 from .response import ApiResponse
 
 
@@ -18,6 +20,7 @@ class CommandResult(ApiResponse):
         stdout: str = "",
         stderr: str = "",
         trace_id: str = "",
+        duration_ms: Optional[int] = None,
     ):
         """
         Initialize a CommandResult.
@@ -32,6 +35,8 @@ class CommandResult(ApiResponse):
             stderr (str, optional): Standard error from the command execution.
             trace_id (str, optional): Trace ID for error tracking. Only present when exit_code != 0.
                 Used for quick problem localization.
+            duration_ms (Optional[int], optional): Wall time of the command inside the
+                session in milliseconds, when measured (e.g. by `run_batch`).
         """
         super().__init__(request_id)
         self.success = success
@@ -41,4 +46,74 @@ class CommandResult(ApiResponse):
         self.stdout = stdout
         self.stderr = stderr
         self.trace_id = trace_id
+        self.duration_ms = duration_ms
+
+
+class CommandJobChunk(ApiResponse):
+    """Incremental output of a background command job."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        stdout: str = "",
+        stderr: str = "",
+        stdout_offset: int = 0,
+        stderr_offset: int = 0,
+        exit_code: Optional[int] = None,
+        finished: bool = False,
+        error_message: str = "",
+    ):
+        """
+        Initialize a CommandJobChunk.
 
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+            success (bool, optional): Whether the output could be read.
+            stdout (str, optional): New standard output since the previous read.
+            stderr (str, optional): New standard error since the previous read.
+            stdout_offset (int, optional): Byte offset in stdout after this chunk.
+            stderr_offset (int, optional): Byte offset in stderr after this chunk.
+            exit_code (Optional[int], optional): Exit code once the job has exited.
+            finished (bool, optional): True when the job has exited and all of its
+                output has been read.
+            error_message (str, optional): Error message if the read failed.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.stdout = stdout
+        self.stderr = stderr
+        self.stdout_offset = stdout_offset
+        self.stderr_offset = stderr_offset
+        self.exit_code = exit_code
+        self.finished = finished
+        self.error_message = error_message
+
+
+class CommandBatchResult(ApiResponse):
+    """Result of running several commands in one remote invocation."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        results: Optional[List[CommandResult]] = None,
+        elapsed_ms: int = 0,
+        error_message: str = "",
+    ):
+        """
+        Initialize a CommandBatchResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+            success (bool, optional): Whether every command exited with code 0.
+            results (List[CommandResult], optional): One result per command, in input
+                order. Commands skipped after a failure have ``exit_code`` -1.
+            elapsed_ms (int, optional): Client-side wall time of the whole batch.
+            error_message (str, optional): Error message if the batch failed.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.results = results if results is not None else []
+        self.elapsed_ms = elapsed_ms
+        self.error_message = error_message
@@ -203,3 +203,34 @@ class WindowInfoResult(ApiResponse):
         self.window = window
         self.error_message = error_message
 
+
+class ActionBatchResult(ApiResponse):
+    """Result of executing a batch of input actions."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        results: Optional[List[Any]] = None,
+        failed_index: Optional[int] = None,
+        elapsed_ms: int = 0,
+        error_message: str = "",
+    ):
+        """
+        Initialize an ActionBatchResult.
+
+        Args:
+            request_id (str, optional): Request ID of the last executed step.
+            success (bool, optional): Whether every step succeeded.
+            results (List[Any], optional): Per-step results, in execution order. Steps
+                after a failure are not executed and have no entry.
+            failed_index (Optional[int], optional): Index of the step that failed.
+            elapsed_ms (int, optional): Wall time of the whole batch in milliseconds.
+            error_message (str, optional): Error of the failed step, if any.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.results = results if results is not None else []
+        self.failed_index = failed_index
+        self.elapsed_ms = elapsed_ms
+        self.error_message = error_message
@@ -55,4 +55,83 @@ class ContextStatusData:
             start_time=data.get("startTime", 0),
             finish_time=data.get("finishTime", 0),
             task_type=data.get("taskType", ""),
-        )
\ No newline at end of file
+        )
+
+class ContextSyncItemResult(ApiResponse):
+    """Outcome of one item of `ContextManager.sync_many`."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        context_id: str = "",
+        path: Optional[str] = None,
+        mode: Optional[str] = None,
+        status: str = "",
+        elapsed_ms: int = 0,
+        status_data: Optional[List[ContextStatusData]] = None,
+        error_message: str = "",
+    ):
+        """
+        Initialize a ContextSyncItemResult.
+
+        Args:
+            request_id (str, optional): Request ID of the SyncContext call.
+            success (bool, optional): Whether the sync finished successfully.
+            context_id (str, optional): ID of the synchronized context.
+            path (Optional[str], optional): Synchronized path.
+            mode (Optional[str], optional): Synchronization mode ("upload", "download").
+            status (str, optional): Final status: "Success", "Failed", "NoTask"
+                (no sync task was reported), "RequestFailed" or "Timeout".
+            elapsed_ms (int, optional): Milliseconds from the start of `sync_many`
+                until the item was seen finished.
+            status_data (Optional[List[ContextStatusData]], optional): Last status
+                entries reported for the item.
+            error_message (str, optional): Error message if the sync failed.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.context_id = context_id
+        self.path = path
+        self.mode = mode
+        self.status = status
+        self.elapsed_ms = elapsed_ms
+        self.status_data = status_data or []
+        self.error_message = error_message
+
+
+class ContextSyncManyResult(ApiResponse):
+    """Result of `ContextManager.sync_many`."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        items: Optional[List[ContextSyncItemResult]] = None,
+        elapsed_ms: int = 0,
+        error_message: str = "",
+    ):
+        """
+        Initialize a ContextSyncManyResult.
+
+        Args:
+            request_id (str, optional): Request ID of the last status query.
+            success (bool, optional): Whether every item finished successfully.
+            items (Optional[List[ContextSyncItemResult]], optional): Per-item
+                results, in the order the items were given.
+            elapsed_ms (int, optional): Total milliseconds spent.
+            error_message (str, optional): Summary of the failed items.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.items = items or []
+        self.elapsed_ms = elapsed_ms
+        self.error_message = error_message
+
+    @property
+    def failed(self) -> List[ContextSyncItemResult]:
+        return [item for item in self.items if not item.success]
+
+    def by_path(self) -> Dict[str, ContextSyncItemResult]:
+        """Per-item results keyed by path (items without a path use the context ID)."""
+        return {item.path or item.context_id: item for item in self.items}
@@ -5,7 +5,10 @@ Filesystem module data models.
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
 
-from .response import ApiResponse
+from ..utils.compression import TransferStats
+from ..utils.manifest import FileManifest
+from ..utils.search import GrepMatch
+from .response import ApiResponse, BoolResult
 
 
 @dataclass
@@ -211,8 +214,21 @@ class FileInfoResult(ApiResponse):
 class DirectoryEntry:
     """Wrapper for directory entry with attribute access."""
 
-    def __init__(self, entry_dict: Dict[str, Any]):
+    __slots__ = ("_data", "path", "depth")
+
+    def __init__(self, entry_dict: Dict[str, Any], path: str = "", depth: int = 0):
+        """
+        Initialize a DirectoryEntry.
+
+        Args:
+            entry_dict (Dict[str, Any]): Entry fields (name, isDirectory, ...).
+            path (str, optional): Full path of the entry, set by tree walks.
+            depth (int, optional): Depth below the walked root (1 for its direct
+                children), set by tree walks.
+        """
         self._data = entry_dict
+        self.path = path
+        self.depth = depth
 
     @property
     def name(self) -> str:
@@ -236,6 +252,10 @@ class DirectoryEntry:
         """Get entry size."""
         return self._data.get("size", 0)
 
+    def __repr__(self) -> str:
+        kind = "dir" if self.is_directory else "file"
+        return f"DirectoryEntry({self.path or self.name!r}, {kind})"
+
 
 class DirectoryListResult(ApiResponse):
     """Result of directory listing operations."""
@@ -271,6 +291,228 @@ class DirectoryListResult(ApiResponse):
         return [DirectoryEntry(entry) for entry in self._entries]
 
 
+class DirectoryTreeResult(ApiResponse):
+    """Result of a recursive directory walk."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        entries: Optional[List[DirectoryEntry]] = None,
+        errors: Optional[Dict[str, str]] = None,
+        error_message: str = "",
+    ):
+        """
+        Initialize a DirectoryTreeResult.
+
+        Args:
+            request_id (str, optional): Unique identifier of the last API request.
+                Defaults to "".
+            success (bool, optional): Whether the root could be walked.
+                Defaults to False.
+            entries (List[DirectoryEntry], optional): All entries below the root,
+                breadth-first. Defaults to None.
+            errors (Dict[str, str], optional): Subdirectories that could not be
+                listed, mapped to the error. Defaults to None.
+            error_message (str, optional): Error message if the walk failed.
+                Defaults to "".
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.entries = entries or []
+        self.errors = errors or {}
+        self.error_message = error_message
+
+    @property
+    def files(self) -> List[DirectoryEntry]:
+        return [entry for entry in self.entries if not entry.is_directory]
+
+    @property
+    def directories(self) -> List[DirectoryEntry]:
+        return [entry for entry in self.entries if entry.is_directory]
+
+
+class ManifestResult(ApiResponse):
+    """Result of a remote manifest computation."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        manifest: Optional[FileManifest] = None,
+        error_message: str = "",
+    ):
+        """
+        Initialize a ManifestResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+                Defaults to "".
+            success (bool, optional): Whether the manifest was computed.
+                Defaults to False.
+            manifest (FileManifest, optional): Files of the tree. Defaults to an
+                empty manifest.
+            error_message (str, optional): Error message if the operation failed,
+                or warnings (e.g. unreadable files) of a successful run.
+                Defaults to "".
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.manifest = manifest if manifest is not None else FileManifest()
+        self.error_message = error_message
+
+
+class PackTransferResult(ApiResponse):
+    """Result of an archive-based bulk transfer (pack_upload / pack_download)."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        files: Optional[List[str]] = None,
+        large_files: Optional[List[str]] = None,
+        archive_size: int = 0,
+        error_message: str = "",
+    ):
+        """
+        Initialize a PackTransferResult.
+
+        Args:
+            request_id (str, optional): Unique identifier of the last API request.
+                Defaults to "".
+            success (bool, optional): Whether every file was transferred.
+                Defaults to False.
+            files (List[str], optional): Relative paths transferred in the archive.
+                Defaults to None.
+            large_files (List[str], optional): Relative paths transferred one by
+                one through pre-signed URLs. Defaults to None.
+            archive_size (int, optional): Compressed size of the archive in bytes.
+                Defaults to 0.
+            error_message (str, optional): Error message if the transfer failed.
+                Defaults to "".
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.files = files or []
+        self.large_files = large_files or []
+        self.archive_size = archive_size
+        self.error_message = error_message
+
+
+class FileSyncResult(ApiResponse):
+    """Result of a delta upload of one file (sync_file)."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        path: str = "",
+        size: int = 0,
+        bytes_sent: int = 0,
+        unchanged: bool = False,
+        error_message: str = "",
+    ):
+        """
+        Initialize a FileSyncResult.
+
+        Args:
+            request_id (str, optional): Unique identifier of the last API request.
+                Defaults to "".
+            success (bool, optional): Whether the remote file now matches the
+                local one. Defaults to False.
+            path (str, optional): Remote file path. Defaults to "".
+            size (int, optional): Size of the local file in bytes. Defaults to 0.
+            bytes_sent (int, optional): Literal bytes sent; the rest was copied
+                from the existing remote file. Defaults to 0.
+            unchanged (bool, optional): Whether the remote file was already
+                identical, so nothing was sent. Defaults to False.
+            error_message (str, optional): Error message if the sync failed.
+                Defaults to "".
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.path = path
+        self.size = size
+        self.bytes_sent = bytes_sent
+        self.unchanged = unchanged
+        self.error_message = error_message
+
+
+class DirectorySyncResult(ApiResponse):
+    """Result of synchronizing a local directory into a session (sync_dir)."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        uploaded: Optional[List[str]] = None,
+        patched: Optional[List[str]] = None,
+        deleted: Optional[List[str]] = None,
+        unchanged: Optional[List[str]] = None,
+        bytes_sent: int = 0,
+        error_message: str = "",
+    ):
+        """
+        Initialize a DirectorySyncResult.
+
+        Args:
+            request_id (str, optional): Unique identifier of the last API request.
+                Defaults to "".
+            success (bool, optional): Whether the remote directory now matches the
+                local one. Defaults to False.
+            uploaded (List[str], optional): Relative paths uploaded in full.
+                Defaults to None.
+            patched (List[str], optional): Relative paths updated with a delta.
+                Defaults to None.
+            deleted (List[str], optional): Relative paths removed from the remote
+                directory. Defaults to None.
+            unchanged (List[str], optional): Relative paths that were already up to
+                date. Defaults to None.
+            bytes_sent (int, optional): Bytes sent for patched files, plus the
+                compressed size of the uploaded ones. Defaults to 0.
+            error_message (str, optional): Error message if the sync failed.
+                Defaults to "".
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.uploaded = uploaded or []
+        self.patched = patched or []
+        self.deleted = deleted or []
+        self.unchanged = unchanged or []
+        self.bytes_sent = bytes_sent
+        self.error_message = error_message
+
+
+class FileWriteResult(BoolResult):
+    """Result of write_file, with statistics on how the content was sent."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        data: Optional[bool] = None,
+        error_message: str = "",
+        transfer_stats: Optional[TransferStats] = None,
+    ):
+        """
+        Initialize a FileWriteResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+                Defaults to "".
+            success (bool, optional): Whether the operation was successful.
+                Defaults to False.
+            data (Optional[bool], optional): True if the file was written.
+                Defaults to None.
+            error_message (str, optional): Error message if the operation failed.
+                Defaults to "".
+            transfer_stats (Optional[TransferStats], optional): How the content
+                was transferred (compression, bytes, calls, time). Defaults to None.
+        """
+        super().__init__(request_id, success, data, error_message)
+        self.transfer_stats = transfer_stats
+
+
 class FileContentResult(ApiResponse):
     """Result of file read operations."""
 
@@ -280,6 +522,7 @@ class FileContentResult(ApiResponse):
         success: bool = False,
         content: str = "",
         error_message: str = "",
+        transfer_stats: Optional[TransferStats] = None,
     ):
         """
         Initialize a FileContentResult.
@@ -292,11 +535,14 @@ class FileContentResult(ApiResponse):
             content (str, optional): File content. Defaults to "".
             error_message (str, optional): Error message if the operation failed.
                 Defaults to "".
+            transfer_stats (Optional[TransferStats], optional): How the content
+                was transferred (compression, bytes, calls, time). Defaults to None.
         """
         super().__init__(request_id)
         self.success = success
         self.content = content
         self.error_message = error_message
+        self.transfer_stats = transfer_stats
 
 
 class BinaryFileContentResult(ApiResponse):
@@ -310,6 +556,7 @@ class BinaryFileContentResult(ApiResponse):
         error_message: str = "",
         content_type: Optional[str] = None,
         size: Optional[int] = None,
+        transfer_stats: Optional[TransferStats] = None,
     ):
         """
         Initialize a BinaryFileContentResult.
@@ -324,6 +571,8 @@ class BinaryFileContentResult(ApiResponse):
                 Defaults to "".
             content_type (str, optional): MIME type of the file. Defaults to None.
             size (int, optional): Size of the file in bytes. Defaults to None.
+            transfer_stats (Optional[TransferStats], optional): How the content
+                was transferred (compression, bytes, calls, time). Defaults to None.
         """
         super().__init__(request_id)
         self.success = success
@@ -331,6 +580,7 @@ class BinaryFileContentResult(ApiResponse):
         self.error_message = error_message
         self.content_type = content_type
         self.size = size
+        self.transfer_stats = transfer_stats
 
 
 class MultipleFileContentResult(ApiResponse):
@@ -340,8 +590,9 @@ class MultipleFileContentResult(ApiResponse):
         self,
         request_id: str = "",
         success: bool = False,
-        contents: Optional[Dict[str, str]] = None,
+        contents: Optional[Dict[str, Union[str, bytes]]] = None,
         error_message: str = "",
+        errors: Optional[Dict[str, str]] = None,
     ):
         """
         Initialize a MultipleFileContentResult.
@@ -351,15 +602,18 @@ class MultipleFileContentResult(ApiResponse):
                 Defaults to "".
             success (bool, optional): Whether the operation was successful.
                 Defaults to False.
-            contents (Dict[str, str], optional): Dictionary of file paths to file
-                contents. Defaults to None.
+            contents (Dict[str, Union[str, bytes]], optional): Dictionary of file
+                paths to file contents (bytes for binary reads). Defaults to None.
             error_message (str, optional): Error message if the operation failed.
                 Defaults to "".
+            errors (Dict[str, str], optional): Error message for each path that
+                could not be read. Defaults to None.
         """
         super().__init__(request_id)
         self.success = success
         self.contents = contents or {}
         self.error_message = error_message
+        self.errors = errors or {}
 
 
 class FileSearchResult(ApiResponse):
@@ -371,6 +625,7 @@ class FileSearchResult(ApiResponse):
         success: bool = False,
         matches: Optional[List[str]] = None,
         error_message: str = "",
+        next_cursor: Optional[str] = None,
     ):
         """
         Initialize a FileSearchResult.
@@ -383,9 +638,53 @@ class FileSearchResult(ApiResponse):
             matches (List[str], optional): Matching file paths. Defaults to None.
             error_message (str, optional): Error message if the operation failed.
                 Defaults to "".
+            next_cursor (Optional[str], optional): Cursor of the next page of a
+                paginated search, or None if this was the last page.
+                Defaults to None.
         """
         super().__init__(request_id)
         self.success = success
         self.matches = matches or []
         self.error_message = error_message
+        self.next_cursor = next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+class GrepResult(ApiResponse):
+    """Result of a content search (grep)."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        matches: Optional[List[GrepMatch]] = None,
+        error_message: str = "",
+        next_cursor: Optional[str] = None,
+    ):
+        """
+        Initialize a GrepResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+                Defaults to "".
+            success (bool, optional): Whether the search ran. Defaults to False.
+            matches (List[GrepMatch], optional): Matching lines in file order.
+                Defaults to None.
+            error_message (str, optional): Error message if the operation failed.
+                Defaults to "".
+            next_cursor (Optional[str], optional): Pass to `grep` to fetch the next
+                page, or None if there are no more matches. Defaults to None.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.matches = matches or []
+        self.error_message = error_message
+        self.next_cursor = next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
 
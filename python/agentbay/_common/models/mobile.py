@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Optional
 
 from .response import ApiResponse
+from .ui_tree import UIDiff, UISnapshot, UITree
 
 
 class UIElementListResult(ApiResponse):
@@ -27,6 +28,43 @@ class UIElementListResult(ApiResponse):
         self.error_message = error_message
 
 
+class UITreeResult(ApiResponse):
+    """Result of fetching the UI hierarchy as a compact `UITree`."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        tree: Optional[UITree] = None,
+        raw: str = "",
+        error_message: str = "",
+    ):
+        super().__init__(request_id)
+        self.success = success
+        self.tree = tree if tree is not None else UITree([], [])
+        # Raw tool output, only kept when explicitly requested.
+        self.raw = raw
+        self.error_message = error_message
+
+
+class UISnapshotResult(ApiResponse):
+    """Result of capturing a UI snapshot and diffing it against the previous one."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        snapshot: Optional[UISnapshot] = None,
+        diff: Optional[UIDiff] = None,
+        error_message: str = "",
+    ):
+        super().__init__(request_id)
+        self.success = success
+        self.snapshot = snapshot
+        self.diff = diff if diff is not None else UIDiff()
+        self.error_message = error_message
+
+
 class KeyCode:
     """
     Key codes for mobile device input.
@@ -17,3 +17,22 @@ class ScreenshotResult(BaseResult):
     width: Optional[int] = None
     height: Optional[int] = None
 
+
+@dataclass
+class VisualWaitResult(BaseResult):
+    """
+    Result of waiting for the screen to change or settle.
+
+    Attributes:
+        changed_ratio (float): Fraction of the watched area that differed between
+            the last two compared frames.
+        elapsed_ms (int): Time spent waiting, in milliseconds.
+        frames (int): Number of frames captured while waiting.
+        screenshot (Optional[ScreenshotResult]): The last captured frame, so callers
+            can reuse it instead of taking another screenshot.
+    """
+
+    changed_ratio: float = 0.0
+    elapsed_ms: int = 0
+    frames: int = 0
+    screenshot: Optional[ScreenshotResult] = None
@@ -0,0 +1,131 @@
+"""
+Session group data models.
+"""
+
+from typing import Any, List, Optional
+
+from .response import ApiResponse
+
+
+class SessionCallResult(ApiResponse):
+    """Outcome of one operation on one session of a session group."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        session_id: str = "",
+        index: int = 0,
+        value: Any = None,
+        latency_ms: int = 0,
+        timed_out: bool = False,
+        error_message: str = "",
+    ):
+        """
+        Initialize a SessionCallResult.
+
+        Args:
+            request_id (str, optional): Request ID of the underlying operation, if any.
+            success (bool, optional): Whether the operation succeeded on this session.
+            session_id (str, optional): ID of the session the operation ran on.
+            index (int, optional): Position of the session in the group.
+            value (Any, optional): The value returned by the operation, usually a
+                result object such as `CommandResult`.
+            latency_ms (int, optional): Wall time of the operation in milliseconds.
+            timed_out (bool, optional): True when the per-session timeout expired.
+            error_message (str, optional): Error message if the operation failed.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.session_id = session_id
+        self.index = index
+        self.value = value
+        self.latency_ms = latency_ms
+        self.timed_out = timed_out
+        self.error_message = error_message
+
+
+class LatencyStats:
+    """
+    Latency summary of a fan-out operation.
+
+    Attributes:
+        count (int): Number of samples.
+        min_ms (int): Fastest call.
+        max_ms (int): Slowest call.
+        mean_ms (float): Average latency.
+        p50_ms (int): Median latency.
+        p90_ms (int): 90th percentile latency.
+        p99_ms (int): 99th percentile latency.
+    """
+
+    __slots__ = ("count", "min_ms", "max_ms", "mean_ms", "p50_ms", "p90_ms", "p99_ms")
+
+    def __init__(self, samples: Optional[List[int]] = None):
+        ordered = sorted(samples or [])
+        self.count = len(ordered)
+        if not ordered:
+            self.min_ms = self.max_ms = self.p50_ms = self.p90_ms = self.p99_ms = 0
+            self.mean_ms = 0.0
+            return
+        self.min_ms = ordered[0]
+        self.max_ms = ordered[-1]
+        self.mean_ms = sum(ordered) / len(ordered)
+        self.p50_ms = self._percentile(ordered, 50)
+        self.p90_ms = self._percentile(ordered, 90)
+        self.p99_ms = self._percentile(ordered, 99)
+
+    @staticmethod
+    def _percentile(ordered: List[int], pct: int) -> int:
+        # Nearest-rank percentile
+        rank = -(-pct * len(ordered) // 100)
+        return ordered[max(0, rank - 1)]
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyStats(count={self.count}, p50_ms={self.p50_ms}, "
+            f"p90_ms={self.p90_ms}, p99_ms={self.p99_ms}, max_ms={self.max_ms})"
+        )
+
+
+class SessionGroupResult(ApiResponse):
+    """Aggregated result of running one operation across a session group."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        results: Optional[List[SessionCallResult]] = None,
+        elapsed_ms: int = 0,
+        error_message: str = "",
+    ):
+        """
+        Initialize a SessionGroupResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+            success (bool, optional): True when the operation succeeded on every session.
+            results (Optional[List[SessionCallResult]], optional): Per-session results
+                in group order.
+            elapsed_ms (int, optional): Wall time of the whole fan-out in milliseconds.
+            error_message (str, optional): Summary of the failures, if any.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.results = results if results is not None else []
+        self.elapsed_ms = elapsed_ms
+        self.error_message = error_message
+        self.stats = LatencyStats([r.latency_ms for r in self.results])
+
+    @property
+    def succeeded(self) -> List[SessionCallResult]:
+        """Results of the sessions the operation succeeded on."""
+        return [r for r in self.results if r.success]
+
+    @property
+    def failed(self) -> List[SessionCallResult]:
+        """Results of the sessions the operation failed or timed out on."""
+        return [r for r in self.results if not r.success]
@@ -0,0 +1,163 @@
+"""
+Session pool data models.
+"""
+
+import shlex
+from enum import Enum
+from typing import Optional, Sequence
+
+
+class ReleaseAction(str, Enum):
+    """What a session pool does with a session when its lease ends."""
+
+    KEEP = "keep"  # Return the session to the pool as-is
+    RESET = "reset"  # Clear the reset paths, then return it to the pool
+    DELETE = "delete"  # Delete the session; the pool creates a replacement
+
+
+class ReleasePolicy:
+    """
+    Decides what happens to a pooled session when its lease ends.
+
+    Subclass and override `decide` for custom rules (e.g. based on labels of the
+    session); the built-in rules recycle sessions that failed, that were used
+    `max_uses` times or that are older than `max_age`.
+    """
+
+    def __init__(
+        self,
+        action: ReleaseAction = ReleaseAction.KEEP,
+        reset_paths: Sequence[str] = ("/tmp",),
+        max_uses: Optional[int] = None,
+        max_age: Optional[float] = None,
+        delete_on_error: bool = True,
+    ):
+        """
+        Initialize a ReleasePolicy.
+
+        Args:
+            action (ReleaseAction, optional): Action for healthy sessions.
+                Defaults to ReleaseAction.KEEP.
+            reset_paths (Sequence[str], optional): Directories whose contents are
+                removed by ReleaseAction.RESET. Defaults to ("/tmp",).
+            max_uses (Optional[int], optional): Delete a session after this many
+                leases. Defaults to None (unlimited).
+            max_age (Optional[float], optional): Delete a session once it is older
+                than this many seconds. Defaults to None (unlimited).
+            delete_on_error (bool, optional): Delete a session whose lease ended
+                with an exception. Defaults to True.
+        """
+        self.action = ReleaseAction(action)
+        self.reset_paths = list(reset_paths)
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.delete_on_error = delete_on_error
+
+    def is_expired(self, uses: int, age: float) -> bool:
+        """Whether a session has reached `max_uses` or `max_age`."""
+        if self.max_uses is not None and uses >= self.max_uses:
+            return True
+        return self.max_age is not None and age >= self.max_age
+
+    def decide(self, uses: int, age: float, failed: bool) -> ReleaseAction:
+        """
+        Choose the action for a session whose lease just ended.
+
+        Args:
+            uses (int): Number of leases of the session, including this one.
+            age (float): Seconds since the session was created.
+            failed (bool): Whether the lease ended with an exception or was
+                explicitly marked as failed.
+
+        Returns:
+            ReleaseAction: The action to take.
+        """
+        if failed and self.delete_on_error:
+            return ReleaseAction.DELETE
+        if self.is_expired(uses, age):
+            return ReleaseAction.DELETE
+        return self.action
+
+    def reset_command(self) -> str:
+        """Shell command that clears the reset paths."""
+        return " ; ".join(
+            f"find {shlex.quote(path)} -mindepth 1 -delete 2>/dev/null"
+            for path in self.reset_paths
+        ) + " ; true"
+
+
+class SessionPoolMetrics:
+    """
+    Counters describing how well a session pool serves its callers.
+
+    Attributes:
+        acquires (int): Successful leases.
+        hits (int): Leases served by an idle pooled session without waiting.
+        misses (int): Leases that had to wait for a creation or a release.
+        timeouts (int): Acquire calls that gave up waiting.
+        created (int): Sessions created by the pool.
+        create_failures (int): Failed session creations.
+        deleted (int): Sessions deleted by the pool.
+        resets (int): Sessions reset on release.
+        health_failures (int): Idle sessions dropped by a health check.
+        paused (int): Idle sessions parked with `beta_pause`.
+        resumed (int): Parked sessions resumed for a lease.
+        total_wait_ms (int): Sum of the acquire wait times.
+        max_wait_ms (int): Longest acquire wait time.
+        idle (int): Idle sessions (running or parked) at snapshot time.
+        leased (int): Leased sessions at snapshot time.
+    """
+
+    __slots__ = (
+        "acquires",
+        "hits",
+        "misses",
+        "timeouts",
+        "created",
+        "create_failures",
+        "deleted",
+        "resets",
+        "health_failures",
+        "paused",
+        "resumed",
+        "total_wait_ms",
+        "max_wait_ms",
+        "idle",
+        "leased",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of leases served without waiting."""
+        return self.hits / self.acquires if self.acquires else 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """Average acquire wait time in milliseconds."""
+        return self.total_wait_ms / self.acquires if self.acquires else 0.0
+
+    def record_wait(self, wait_ms: int) -> None:
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def copy(self) -> "SessionPoolMetrics":
+        snapshot = SessionPoolMetrics()
+        for name in self.__slots__:
+            setattr(snapshot, name, getattr(self, name))
+        return snapshot
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["hit_rate"] = self.hit_rate
+        data["mean_wait_ms"] = self.mean_wait_ms
+        return data
+
+    def __repr__(self) -> str:
+        return (
+            f"SessionPoolMetrics(acquires={self.acquires}, hit_rate={self.hit_rate:.2f}, "
+            f"mean_wait_ms={self.mean_wait_ms:.1f}, idle={self.idle}, leased={self.leased})"
+        )
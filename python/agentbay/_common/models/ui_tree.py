@@ -0,0 +1,467 @@
+"""
+Compact, indexed representation of a mobile UI element hierarchy.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+Bounds = Tuple[int, int, int, int]
+
+_BOUNDS_NUMBERS = re.compile(r"-?\d+")
+
+
+def _parse_bounds(bounds: Any) -> Optional[Bounds]:
+    """Parse backend bounds (dict or "l,t,r,b" / "[l,t][r,b]" string) into a tuple."""
+    if isinstance(bounds, dict):
+        values = (
+            bounds.get("left"),
+            bounds.get("top"),
+            bounds.get("right"),
+            bounds.get("bottom"),
+        )
+        if all(isinstance(v, int) for v in values):
+            return values  # type: ignore[return-value]
+        return None
+    if isinstance(bounds, str):
+        nums = _BOUNDS_NUMBERS.findall(bounds)
+        if len(nums) >= 4:
+            return (int(nums[0]), int(nums[1]), int(nums[2]), int(nums[3]))
+    return None
+
+
+class UINode:
+    """
+    A single UI element in a `UITree`.
+
+    Attributes:
+        id (int): Position of the node in the tree in depth-first order.
+        parent (Optional[UINode]): Parent node, or None for roots.
+        children (List[UINode]): Child nodes.
+        depth (int): Nesting depth, 0 for roots.
+        class_name (str): Android class name.
+        text (str): Element text.
+        resource_id (str): Android resource id.
+        type (str): Element type reported by the backend.
+        index (int): Index reported by the backend.
+        is_parent (bool): Whether the backend flagged the element as a parent.
+        bounds (Optional[Tuple[int, int, int, int]]): ``(left, top, right, bottom)``.
+    """
+
+    __slots__ = (
+        "id",
+        "parent",
+        "children",
+        "depth",
+        "class_name",
+        "text",
+        "resource_id",
+        "type",
+        "index",
+        "is_parent",
+        "bounds",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        parent: Optional["UINode"],
+        depth: int,
+        class_name: str = "",
+        text: str = "",
+        resource_id: str = "",
+        type: str = "",
+        index: int = -1,
+        is_parent: bool = False,
+        bounds: Optional[Bounds] = None,
+    ):
+        self.id = id
+        self.parent = parent
+        self.children: List["UINode"] = []
+        self.depth = depth
+        self.class_name = class_name
+        self.text = text
+        self.resource_id = resource_id
+        self.type = type
+        self.index = index
+        self.is_parent = is_parent
+        self.bounds = bounds
+
+    @property
+    def center(self) -> Optional[Tuple[int, int]]:
+        """Center point of the element, suitable for `tap()`."""
+        if self.bounds is None:
+            return None
+        left, top, right, bottom = self.bounds
+        return ((left + right) // 2, (top + bottom) // 2)
+
+    def contains(self, x: int, y: int) -> bool:
+        """Whether the point lies inside the element bounds."""
+        if self.bounds is None:
+            return False
+        left, top, right, bottom = self.bounds
+        return left <= x < right and top <= y < bottom
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the node and its subtree to the dict shape returned by
+        `get_all_ui_elements`.
+        """
+        rect = None
+        if self.bounds is not None:
+            left, top, right, bottom = self.bounds
+            rect = {"left": left, "top": top, "right": right, "bottom": bottom}
+        return {
+            "bounds": ",".join(str(v) for v in self.bounds) if self.bounds else "",
+            "bounds_rect": rect,
+            "className": self.class_name,
+            "text": self.text,
+            "type": self.type,
+            "resourceId": self.resource_id,
+            "index": self.index,
+            "isParent": self.is_parent,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"UINode(id={self.id}, class_name={self.class_name!r}, "
+            f"resource_id={self.resource_id!r}, text={self.text!r}, bounds={self.bounds})"
+        )
+
+
+class UITree:
+    """
+    Flat, indexed UI element hierarchy.
+
+    Nodes are stored once in depth-first order. Lookups by ``resource_id``,
+    ``text`` and ``class_name`` use prebuilt hash indexes, and `element_at`
+    uses a uniform grid over the screen, so queries do not walk the tree.
+
+    Example:
+        ```python
+        result = await session.mobile.get_ui_tree()
+        button = result.tree.find_one(resource_id="com.example:id/login")
+        if button:
+            await session.mobile.tap(*button.center)
+        node = result.tree.element_at(540, 1200)
+        ```
+    """
+
+    __slots__ = (
+        "nodes",
+        "roots",
+        "cell_size",
+        "_by_resource_id",
+        "_by_text",
+        "_by_class_name",
+        "_grid",
+    )
+
+    def __init__(self, nodes: List[UINode], roots: List[UINode], cell_size: int = 128):
+        self.nodes = nodes
+        self.roots = roots
+        self.cell_size = max(1, cell_size)
+        self._by_resource_id: Dict[str, List[UINode]] = {}
+        self._by_text: Dict[str, List[UINode]] = {}
+        self._by_class_name: Dict[str, List[UINode]] = {}
+        self._grid: Dict[Tuple[int, int], List[UINode]] = {}
+        for node in nodes:
+            self._index(node)
+
+    @classmethod
+    def from_elements(
+        cls, elements: List[Dict[str, Any]], cell_size: int = 128
+    ) -> "UITree":
+        """
+        Build a tree from backend element dicts (raw tool JSON or the dicts
+        returned by `get_all_ui_elements`).
+        """
+        nodes: List[UINode] = []
+        roots: List[UINode] = []
+        stack: List[Tuple[Dict[str, Any], Optional[UINode], int]] = [
+            (e, None, 0) for e in reversed(elements or []) if isinstance(e, dict)
+        ]
+        while stack:
+            element, parent, depth = stack.pop()
+            node = UINode(
+                id=len(nodes),
+                parent=parent,
+                depth=depth,
+                class_name=element.get("className", "") or "",
+                text=element.get("text", "") or "",
+                resource_id=element.get("resourceId", "") or "",
+                type=element.get("type", "") or "",
+                index=element.get("index", -1),
+                is_parent=bool(element.get("isParent", False)),
+                bounds=_parse_bounds(element.get("bounds")),
+            )
+            nodes.append(node)
+            if parent is None:
+                roots.append(node)
+            else:
+                parent.children.append(node)
+            children = element.get("children")
+            if isinstance(children, list):
+                for child in reversed(children):
+                    if isinstance(child, dict):
+                        stack.append((child, node, depth + 1))
+        return cls(nodes, roots, cell_size)
+
+    @classmethod
+    def from_json(cls, raw: str, cell_size: int = 128) -> "UITree":
+        """Build a tree from the raw JSON string of the UI elements tool."""
+        data = json.loads(raw)
+        if isinstance(data, dict):
+            data = [data]
+        return cls.from_elements(data, cell_size)
+
+    def _index(self, node: UINode) -> None:
+        if node.resource_id:
+            self._by_resource_id.setdefault(node.resource_id, []).append(node)
+        if node.text:
+            self._by_text.setdefault(node.text, []).append(node)
+        if node.class_name:
+            self._by_class_name.setdefault(node.class_name, []).append(node)
+        if node.bounds is None:
+            return
+        left, top, right, bottom = node.bounds
+        if right <= left or bottom <= top:
+            return
+        size = self.cell_size
+        for cx in range(max(0, left) // size, (max(left, right - 1)) // size + 1):
+            for cy in range(max(0, top) // size, (max(top, bottom - 1)) // size + 1):
+                self._grid.setdefault((cx, cy), []).append(node)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[UINode]:
+        return iter(self.nodes)
+
+    def find(
+        self,
+        resource_id: Optional[str] = None,
+        text: Optional[str] = None,
+        class_name: Optional[str] = None,
+    ) -> List[UINode]:
+        """
+        Find nodes matching all of the given exact attribute values.
+
+        Args:
+            resource_id (Optional[str]): Android resource id.
+            text (Optional[str]): Element text.
+            class_name (Optional[str]): Android class name.
+
+        Returns:
+            List[UINode]: Matching nodes in depth-first order. All nodes when no
+            criteria are given.
+        """
+        candidates: Optional[List[UINode]] = None
+        for index, value in (
+            (self._by_resource_id, resource_id),
+            (self._by_text, text),
+            (self._by_class_name, class_name),
+        ):
+            if value is None:
+                continue
+            matches = index.get(value, [])
+            if candidates is None or len(matches) < len(candidates):
+                candidates = matches
+        if candidates is None:
+            return list(self.nodes)
+        return [
+            n
+            for n in candidates
+            if (resource_id is None or n.resource_id == resource_id)
+            and (text is None or n.text == text)
+            and (class_name is None or n.class_name == class_name)
+        ]
+
+    def find_one(
+        self,
+        resource_id: Optional[str] = None,
+        text: Optional[str] = None,
+        class_name: Optional[str] = None,
+    ) -> Optional[UINode]:
+        """Return the first node matching `find`, or None."""
+        matches = self.find(resource_id=resource_id, text=text, class_name=class_name)
+        return matches[0] if matches else None
+
+    def elements_at(self, x: int, y: int) -> List[UINode]:
+        """Return every node containing the point, outermost first."""
+        if x < 0 or y < 0:
+            return []
+        cell = self._grid.get((x // self.cell_size, y // self.cell_size), [])
+        return [n for n in cell if n.contains(x, y)]
+
+    def element_at(self, x: int, y: int) -> Optional[UINode]:
+        """
+        Hit-test a point.
+
+        Returns:
+            Optional[UINode]: The deepest node containing the point (the last one
+            in document order on ties), or None.
+        """
+        best: Optional[UINode] = None
+        for node in self.elements_at(x, y):
+            if best is None or node.depth >= best.depth:
+                best = node
+        return best
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert the tree back to the `get_all_ui_elements` dict shape."""
+        return [root.to_dict() for root in self.roots]
+
+
+def _node_key(node: UINode) -> Tuple[Any, ...]:
+    """Identity of a node among its siblings: resource id, else class and bounds."""
+    if node.resource_id:
+        return ("id", node.resource_id, node.class_name)
+    return ("at", node.class_name, node.bounds)
+
+
+def _node_content(node: UINode) -> Tuple[Any, ...]:
+    return (
+        node.class_name,
+        node.text,
+        node.resource_id,
+        node.type,
+        node.index,
+        node.is_parent,
+        node.bounds,
+    )
+
+
+def _keyed(nodes: List[UINode]) -> Dict[Tuple[Any, ...], UINode]:
+    keyed: Dict[Tuple[Any, ...], UINode] = {}
+    for node in nodes:
+        key = _node_key(node)
+        n = 0
+        while (key, n) in keyed:
+            n += 1
+        keyed[(key, n)] = node
+    return keyed
+
+
+class UIDiff:
+    """
+    Structural difference between two UI snapshots.
+
+    Attributes:
+        added (List[UINode]): Roots of subtrees that only exist in the new snapshot.
+        removed (List[UINode]): Roots of subtrees that only exist in the old snapshot.
+        changed (List[Tuple[UINode, UINode]]): ``(old, new)`` pairs of matched nodes
+            whose own attributes (text, bounds, ...) differ.
+    """
+
+    __slots__ = ("added", "removed", "changed")
+
+    def __init__(
+        self,
+        added: Optional[List[UINode]] = None,
+        removed: Optional[List[UINode]] = None,
+        changed: Optional[List[Tuple[UINode, UINode]]] = None,
+    ):
+        self.added = added if added is not None else []
+        self.removed = removed if removed is not None else []
+        self.changed = changed if changed is not None else []
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything changed between the snapshots."""
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Compact summary for logging or LLM prompts. Subtrees are reported by their
+        root only.
+        """
+
+        def brief(node: UINode) -> Dict[str, Any]:
+            out: Dict[str, Any] = {"className": node.class_name}
+            if node.resource_id:
+                out["resourceId"] = node.resource_id
+            if node.text:
+                out["text"] = node.text
+            if node.bounds is not None:
+                out["bounds"] = list(node.bounds)
+            return out
+
+        return {
+            "added": [brief(n) for n in self.added],
+            "removed": [brief(n) for n in self.removed],
+            "changed": [
+                {"before": brief(old), "after": brief(new)} for old, new in self.changed
+            ],
+        }
+
+
+class UISnapshot:
+    """
+    A `UITree` with per-subtree content hashes, used to compute cheap diffs
+    between consecutive captures of the same screen.
+
+    Subtrees whose hash matches the previous snapshot are skipped without
+    visiting their descendants.
+
+    Example:
+        ```python
+        previous = UISnapshot(first_tree)
+        current = UISnapshot(second_tree)
+        diff = current.diff(previous)
+        print(diff.to_dict())
+        ```
+    """
+
+    __slots__ = ("tree", "_hashes")
+
+    def __init__(self, tree: UITree):
+        self.tree = tree
+        hashes = [0] * len(tree.nodes)
+        # Nodes are in depth-first order, so children always follow their parent.
+        for node in reversed(tree.nodes):
+            hashes[node.id] = hash(
+                (_node_content(node), tuple(hashes[c.id] for c in node.children))
+            )
+        self._hashes = hashes
+
+    def subtree_hash(self, node: UINode) -> int:
+        """Content hash of the node and all of its descendants."""
+        return self._hashes[node.id]
+
+    def diff(self, previous: Optional["UISnapshot"]) -> UIDiff:
+        """
+        Compute what changed since ``previous``.
+
+        Args:
+            previous (Optional[UISnapshot]): The older snapshot. When None, every
+                root of this snapshot is reported as added.
+
+        Returns:
+            UIDiff: Added, removed and changed nodes.
+        """
+        result = UIDiff()
+        if previous is None:
+            result.added = list(self.tree.roots)
+            return result
+
+        pairs = [(previous.tree.roots, self.tree.roots)]
+        while pairs:
+            old_nodes, new_nodes = pairs.pop()
+            old_keyed = _keyed(old_nodes)
+            new_keyed = _keyed(new_nodes)
+            for key, old in old_keyed.items():
+                new = new_keyed.get(key)
+                if new is None:
+                    result.removed.append(old)
+                    continue
+                if previous._hashes[old.id] == self._hashes[new.id]:
+                    continue
+                if _node_content(old) != _node_content(new):
+                    result.changed.append((old, new))
+                pairs.append((old.children, new.children))
+            for key, new in new_keyed.items():
+                if key not in old_keyed:
+                    result.added.append(new)
+        return result
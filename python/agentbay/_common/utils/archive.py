@@ -0,0 +1,119 @@
+"""
+Local side of archive-based bulk transfers (`pack_upload` / `pack_download`).
+
+Archives are gzip-compressed tarballs written to and read from temporary
+files, so a tree is never held in memory as a whole. Member names are paths
+relative to the transferred directory, using "/" separators.
+"""
+
+import os
+import tarfile
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+def collect_local_files(
+    local_dir: str,
+    paths: Optional[Sequence[str]] = None,
+    large_file_threshold: Optional[int] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Relative paths of the regular files to transfer from `local_dir`.
+
+    Args:
+        local_dir (str): Directory to transfer.
+        paths (Optional[Sequence[str]], optional): Restrict the transfer to these
+            relative paths. Defaults to every file below `local_dir`.
+        large_file_threshold (Optional[int], optional): Files larger than this
+            many bytes are returned separately instead of being archived.
+
+    Returns:
+        Tuple[List[str], List[str]]: Files to archive and large files, sorted.
+
+    Raises:
+        FileNotFoundError: If a path listed in `paths` is not a regular file.
+    """
+    if paths is None:
+        candidates = []
+        for dirpath, _, filenames in os.walk(local_dir):
+            rel_dir = os.path.relpath(dirpath, local_dir).replace(os.sep, "/")
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            for name in filenames:
+                if os.path.isfile(os.path.join(dirpath, name)):
+                    candidates.append(prefix + name)
+    else:
+        candidates = [p.lstrip("/") for p in paths]
+        for rel_path in candidates:
+            if not os.path.isfile(os.path.join(local_dir, rel_path)):
+                raise FileNotFoundError(f"Local file not found: {rel_path}")
+
+    small: List[str] = []
+    large: List[str] = []
+    for rel_path in sorted(candidates):
+        size = os.path.getsize(os.path.join(local_dir, rel_path))
+        if large_file_threshold is not None and size > large_file_threshold:
+            large.append(rel_path)
+        else:
+            small.append(rel_path)
+    return small, large
+
+
+def create_archive(local_dir: str, files: Iterable[str], archive_path: str) -> int:
+    """
+    Write the given files of `local_dir` to a tar.gz archive.
+
+    Returns:
+        int: Size of the archive in bytes.
+    """
+    with tarfile.open(archive_path, "w:gz") as tar:
+        for rel_path in files:
+            tar.add(os.path.join(local_dir, rel_path), arcname=rel_path, recursive=False)
+    return os.path.getsize(archive_path)
+
+
+def _is_within(directory: str, target: str) -> bool:
+    directory = os.path.realpath(directory)
+    return os.path.commonpath([directory, os.path.realpath(target)]) == directory
+
+
+def extract_archive(archive_path: str, dest_dir: str) -> List[str]:
+    """
+    Extract the regular files and directories of a tar.gz archive.
+
+    Members that would land outside `dest_dir` (absolute paths, "..") and
+    special members (links, devices) are skipped.
+
+    Returns:
+        List[str]: Relative paths of the extracted files.
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    extracted = []
+    with tarfile.open(archive_path, "r:gz") as tar:
+        for member in tar:
+            name = member.name
+            while name.startswith("./"):
+                name = name[2:]
+            if name in ("", ".") or os.path.isabs(name):
+                continue
+            target = os.path.join(dest_dir, name)
+            if not _is_within(dest_dir, target):
+                continue
+            if member.isdir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            if not member.isfile():
+                continue
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            source = tar.extractfile(member)
+            if source is None:
+                continue
+            with source, open(target, "wb") as f:
+                while True:
+                    chunk = source.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+            os.chmod(target, member.mode & 0o777 or 0o644)
+            if member.mtime:
+                os.utime(target, (member.mtime, member.mtime))
+            extracted.append(name)
+    return extracted
@@ -0,0 +1,115 @@
+"""
+Batched reads of many small files with one shell command per batch.
+
+Files are packed into batches whose content stays below a byte budget, so the
+output of each command fits in a single response. The command frames every
+file by its position in the batch rather than by its path:
+
+    F <index> <size>
+    <base64 of the content on one line>
+
+or `E <index> <reason>` for a file that cannot be read. Paths never appear in
+the output, so names containing colons, newlines or "---" cannot corrupt the
+framing, and base64 keeps binary content intact. The decoded length is
+checked against the size so truncated output is detected.
+"""
+
+import base64
+import shlex
+from typing import Dict, List, Sequence, Tuple
+
+# Bytes of framing per file on top of its base64 content
+FRAME_OVERHEAD = 32
+
+
+def plan_batches(
+    sizes: Dict[str, int], batch_bytes: int
+) -> Tuple[List[List[str]], List[str]]:
+    """
+    Pack files into batches of at most `batch_bytes` content bytes.
+
+    Files are placed largest first into the first batch with room left
+    (first-fit decreasing), which keeps the number of batches close to minimal.
+
+    Args:
+        sizes (Dict[str, int]): Size in bytes of each file, in request order.
+        batch_bytes (int): Content budget of a batch, framing included.
+
+    Returns:
+        Tuple[List[List[str]], List[str]]: The batches, each in request order,
+            and the files too large for any batch, in request order.
+    """
+    order = {path: index for index, path in enumerate(sizes)}
+    large = [path for path, size in sizes.items() if size + FRAME_OVERHEAD > batch_bytes]
+    small = sorted(
+        (path for path, size in sizes.items() if size + FRAME_OVERHEAD <= batch_bytes),
+        key=lambda path: (-sizes[path], order[path]),
+    )
+    batches: List[List[str]] = []
+    room: List[int] = []
+    for path in small:
+        cost = sizes[path] + FRAME_OVERHEAD
+        for index, left in enumerate(room):
+            if cost <= left:
+                batches[index].append(path)
+                room[index] -= cost
+                break
+        else:
+            batches.append([path])
+            room.append(batch_bytes - cost)
+    return [sorted(batch, key=order.__getitem__) for batch in batches], large
+
+
+def batch_read_command(paths: Sequence[str]) -> str:
+    """Shell command printing the framed contents of `paths` (see module docstring)."""
+    parts = []
+    for index, path in enumerate(paths):
+        f = shlex.quote(path)
+        parts.append(
+            f"if [ -f {f} ] && [ -r {f} ]; then "
+            f"echo F {index} $(stat -c %s -- {f}); base64 -w0 < {f}; echo; "
+            f"else echo E {index} not a readable file; fi"
+        )
+    return "\n".join(parts)
+
+
+def parse_batch_output(
+    output: str, paths: Sequence[str]
+) -> Tuple[Dict[str, bytes], Dict[str, str]]:
+    """
+    Decode the output of `batch_read_command(paths)`.
+
+    Returns:
+        Tuple[Dict[str, bytes], Dict[str, str]]: Contents of the files read and
+            an error message for every other path of the batch.
+    """
+    contents: Dict[str, bytes] = {}
+    errors: Dict[str, str] = {}
+    lines = output.split("\n")
+    i = 0
+    while i < len(lines):
+        parts = lines[i].split(" ", 2)
+        i += 1
+        if len(parts) < 2 or not parts[1].isdigit() or int(parts[1]) >= len(paths):
+            continue
+        path = paths[int(parts[1])]
+        if parts[0] == "E":
+            errors[path] = parts[2] if len(parts) == 3 else "read failed"
+            continue
+        if parts[0] != "F" or i >= len(lines):
+            continue
+        encoded = lines[i]
+        i += 1
+        try:
+            data = base64.b64decode(encoded, validate=True)
+        except ValueError:
+            errors[path] = "corrupt batch output"
+            continue
+        if len(parts) == 3 and parts[2].isdigit() and len(data) != int(parts[2]):
+            errors[path] = "file changed or output truncated while reading"
+            continue
+        contents[path] = data
+    for path in paths:
+        if path not in contents and path not in errors:
+            errors[path] = "missing from batch output"
+    return contents, errors
@@ -0,0 +1,300 @@
+"""
+Kernels behind persistent code execution contexts (`AsyncCode.create_context`).
+
+A context is a long-running interpreter started as a background command in
+the session. It keeps one global namespace for its whole life and runs the
+cells dropped into `<dir>/in/<seq>.code` in order. Everything a cell produces
+is appended to `<dir>/events` as JSON lines, as soon as it is produced:
+
+    {"seq": 3, "type": "stdout", "text": "..."}
+    {"seq": 3, "type": "display", "data": {"image/png": {"artifact": "...", "size": 123456}}}
+    {"seq": 3, "type": "result", "data": {"text/plain": "42"}}
+    {"seq": 3, "type": "error", "name": "...", "value": "...", "traceback": "..."}
+    {"seq": 3, "type": "done", "execution_count": 3, "execution_time": 0.12}
+
+The client reads the file by byte offset, so output streams while the cell
+runs and nothing is sent twice. Images larger than the inline limit are
+written to `<dir>/artifacts/` and only referenced in the event; the client
+downloads them on demand.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from ..models.code import CodeArtifact, CodeOutput, ExecutionError, ExecutionResult
+
+# Images up to this many bytes are sent inline (base64) with their event
+DEFAULT_INLINE_LIMIT = 32 * 1024
+
+PYTHON_KERNEL = r'''
+import ast, base64, io, json, os, signal, sys, time, traceback
+
+root, inline_limit = sys.argv[1], int(sys.argv[2])
+inbox, artifacts = os.path.join(root, "in"), os.path.join(root, "artifacts")
+events = open(os.path.join(root, "events"), "a", encoding="utf-8")
+os.environ.setdefault("MPLBACKEND", "Agg")
+state = {"seq": 0, "count": 0, "artifacts": 0}
+
+
+def emit(**event):
+    event["seq"] = state["seq"]
+    events.write(json.dumps(event) + "\n")
+    events.flush()
+
+
+class Stream(io.TextIOBase):
+    def __init__(self, name):
+        self.name, self.pending = name, ""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.pending += text
+        if "\n" in self.pending or len(self.pending) > 4096:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.pending:
+            text, self.pending = self.pending, ""
+            emit(type=self.name, text=text)
+
+
+REPRS = (
+    ("text/html", "_repr_html_"),
+    ("text/markdown", "_repr_markdown_"),
+    ("text/latex", "_repr_latex_"),
+    ("image/svg+xml", "_repr_svg_"),
+    ("image/png", "_repr_png_"),
+    ("image/jpeg", "_repr_jpeg_"),
+    ("application/json", "_repr_json_"),
+)
+
+
+def image(mime, data):
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    if len(data) <= inline_limit:
+        return base64.b64encode(data).decode("ascii")
+    state["artifacts"] += 1
+    name = "%d-%d.%s" % (state["seq"], state["artifacts"], mime.split("/")[1].split("+")[0])
+    path = os.path.join(artifacts, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return {"artifact": path, "size": len(data)}
+
+
+def bundle(obj):
+    data = {}
+    for mime, method in REPRS:
+        fn = getattr(obj, method, None)
+        if not callable(fn):
+            continue
+        try:
+            value = fn()
+        except Exception:
+            continue
+        if isinstance(value, tuple):
+            value = value[0]
+        if value is None:
+            continue
+        data[mime] = image(mime, value) if mime in ("image/png", "image/jpeg") else value
+    data["text/plain"] = repr(obj)
+    return data
+
+
+def display(*objs):
+    for obj in objs:
+        emit(type="display", data=bundle(obj))
+
+
+def flush_figures():
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is None:
+        return
+    for num in plt.get_fignums():
+        buf = io.BytesIO()
+        plt.figure(num).savefig(buf, format="png", bbox_inches="tight")
+        emit(type="display", data={"image/png": image("image/png", buf.getvalue()), "text/plain": "<Figure>"})
+    plt.close("all")
+
+
+namespace = {"__name__": "__main__", "display": display}
+
+
+def run(code):
+    tree = ast.parse(code, "<cell %d>" % state["count"], "exec")
+    last = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        last = ast.Expression(tree.body.pop().value)
+    exec(compile(tree, "<cell %d>" % state["count"], "exec"), namespace)
+    if last is not None:
+        value = eval(compile(last, "<cell %d>" % state["count"], "eval"), namespace)
+        if value is not None:
+            namespace["_"] = value
+            emit(type="result", data=bundle(value))
+
+
+# Background jobs start with SIGINT ignored; interrupts must raise KeyboardInterrupt
+signal.signal(signal.SIGINT, signal.default_int_handler)
+sys.stdout, sys.stderr = Stream("stdout"), Stream("stderr")
+with open(os.path.join(root, "kernel.pid"), "w") as f:
+    f.write(str(os.getpid()))
+while True:
+    try:
+        cells = sorted(
+            (n for n in os.listdir(inbox) if n.endswith(".code")), key=lambda n: int(n.split(".")[0])
+        )
+        if not cells:
+            time.sleep(0.05)
+            continue
+        path = os.path.join(inbox, cells[0])
+        with open(path, encoding="utf-8") as f:
+            code = f.read()
+        os.remove(path)
+    except KeyboardInterrupt:
+        continue
+    state["seq"] = int(cells[0].split(".")[0])
+    state["count"] += 1
+    started = time.time()
+    try:
+        run(code)
+        flush_figures()
+    except BaseException as e:
+        if isinstance(e, SystemExit):
+            e = RuntimeError("SystemExit is not allowed in a code context")
+        # Hide the kernel's own frames
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename == __file__:
+            tb = tb.tb_next
+        sys.stdout.flush()
+        emit(
+            type="error",
+            name=type(e).__name__,
+            value=str(e),
+            traceback="".join(traceback.format_exception(type(e), e, tb)),
+        )
+    sys.stdout.flush()
+    sys.stderr.flush()
+    emit(type="done", execution_count=state["count"], execution_time=time.time() - started)
+'''
+
+JAVASCRIPT_KERNEL = r'''
+const fs = require("fs"), path = require("path"), util = require("util"), vm = require("vm");
+const root = process.argv[2];
+const inbox = path.join(root, "in"), eventsPath = path.join(root, "events");
+let seq = 0, count = 0;
+const emit = (event) => fs.appendFileSync(eventsPath, JSON.stringify({ ...event, seq }) + "\n");
+const format = (args) => args.map((a) => (typeof a === "string" ? a : util.inspect(a))).join(" ") + "\n";
+const out = (...args) => emit({ type: "stdout", text: format(args) });
+const err = (...args) => emit({ type: "stderr", text: format(args) });
+const display = (...objs) => objs.forEach((o) => emit({ type: "display", data: { "text/plain": util.inspect(o) } }));
+const sandbox = {
+  console: { log: out, info: out, debug: out, error: err, warn: err },
+  display, require, process, Buffer, URL, TextEncoder, TextDecoder,
+  setTimeout, clearTimeout, setInterval, clearInterval, setImmediate,
+};
+sandbox.globalThis = sandbox;
+vm.createContext(sandbox);
+fs.writeFileSync(path.join(root, "kernel.pid"), String(process.pid));
+process.on("SIGINT", () => {});
+
+async function runCell(file) {
+  const code = fs.readFileSync(file, "utf8");
+  fs.unlinkSync(file);
+  count += 1;
+  const started = Date.now();
+  try {
+    let value = vm.runInContext(code, sandbox, { filename: `cell ${count}` });
+    if (value && typeof value.then === "function") value = await value;
+    if (value !== undefined) emit({ type: "result", data: { "text/plain": util.inspect(value) } });
+  } catch (e) {
+    emit({ type: "error", name: (e && e.name) || "Error", value: String(e && e.message !== undefined ? e.message : e), traceback: String((e && e.stack) || "") });
+  }
+  emit({ type: "done", execution_count: count, execution_time: (Date.now() - started) / 1000 });
+}
+
+(async () => {
+  for (;;) {
+    const cells = fs.readdirSync(inbox).filter((n) => n.endsWith(".code")).sort((a, b) => parseInt(a) - parseInt(b));
+    for (const name of cells) {
+      seq = parseInt(name);
+      await runCell(path.join(inbox, name));
+    }
+    await new Promise((resolve) => setTimeout(resolve, 50));
+  }
+})();
+'''
+
+# Interpreter command and kernel source per language
+KERNELS = {
+    "python": ("python3 -u", "kernel.py", PYTHON_KERNEL),
+    "javascript": ("node", "kernel.js", JAVASCRIPT_KERNEL),
+}
+
+_MIME_FIELDS = {
+    "text/plain": "text",
+    "text/html": "html",
+    "text/markdown": "markdown",
+    "image/png": "png",
+    "image/jpeg": "jpeg",
+    "image/svg+xml": "svg",
+    "application/json": "json",
+    "text/latex": "latex",
+    "application/vnd.vegalite.v4+json": "chart",
+    "application/vnd.vegalite.v5+json": "chart",
+}
+
+
+def result_from_bundle(data: Dict[str, Any], is_main_result: bool = False) -> ExecutionResult:
+    """ExecutionResult from a MIME bundle; images stored remotely become artifacts."""
+    fields: Dict[str, Any] = {}
+    artifacts: List[CodeArtifact] = []
+    for mime, value in data.items():
+        name = _MIME_FIELDS.get(mime)
+        if name is None:
+            continue
+        if isinstance(value, dict) and "artifact" in value:
+            artifacts.append(CodeArtifact(value["artifact"], mime, int(value.get("size", 0))))
+        else:
+            fields.setdefault(name, value)
+    return ExecutionResult(is_main_result=is_main_result, artifacts=artifacts, **fields)
+
+
+def parse_events(buffer: str) -> Tuple[List[CodeOutput], str]:
+    """
+    Decode the complete lines of `buffer`.
+
+    Returns:
+        Tuple[List[CodeOutput], str]: The events and the incomplete last line.
+    """
+    *lines, rest = buffer.split("\n")
+    outputs = []
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict):
+            outputs.append(_to_output(event))
+    return outputs, rest
+
+
+def _to_output(event: Dict[str, Any]) -> CodeOutput:
+    kind = event.get("type", "")
+    output = CodeOutput(type=kind, seq=int(event.get("seq", 0)))
+    if kind in ("stdout", "stderr"):
+        output.text = event.get("text", "")
+    elif kind in ("display", "result"):
+        output.result = result_from_bundle(event.get("data") or {}, is_main_result=kind == "result")
+    elif kind == "error":
+        output.error = ExecutionError(
+            name=event.get("name", "Error"),
+            value=event.get("value", ""),
+            traceback=event.get("traceback", ""),
+        )
+    elif kind == "done":
+        output.execution_count = event.get("execution_count")
+        output.execution_time = float(event.get("execution_time", 0.0))
+    return output
@@ -0,0 +1,141 @@
+"""
+Compressed transfer of file contents between the client and a session.
+
+A compressed write uploads the gzip (or zstd) stream as base64, which needs no
+JSON escaping, and inflates it inside the session with the shell; a compressed
+read compresses the file inside the session and inflates it on the client.
+`should_compress` decides whether that saves round trips for a payload.
+"""
+
+import gzip
+import math
+import time
+from typing import Optional
+
+COMPRESSION_MODES = ("auto", "gzip", "zstd", "none")
+
+# Command inflating stdin to stdout / deflating a file to stdout, per codec
+_DECOMPRESS_COMMANDS = {"gzip": "gzip -dc", "zstd": "zstd -dcq"}
+_COMPRESS_COMMANDS = {"gzip": "gzip -c --", "zstd": "zstd -cq --"}
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+class TransferStats:
+    """
+    How the content of one read or write was transferred.
+
+    Attributes:
+        compression (Optional[str]): Codec used ("gzip" or "zstd"), or None.
+        raw_bytes (int): Size of the file content.
+        transferred_bytes (int): Bytes moved over the wire, before base64.
+        calls (int): Tool and command calls made.
+        codec_seconds (float): Time spent compressing or decompressing locally.
+        elapsed (float): Total duration of the operation in seconds.
+    """
+
+    __slots__ = (
+        "compression",
+        "raw_bytes",
+        "transferred_bytes",
+        "calls",
+        "codec_seconds",
+        "elapsed",
+    )
+
+    def __init__(
+        self,
+        compression: Optional[str] = None,
+        raw_bytes: int = 0,
+        transferred_bytes: int = 0,
+        calls: int = 0,
+        codec_seconds: float = 0.0,
+        elapsed: float = 0.0,
+    ):
+        self.compression = compression
+        self.raw_bytes = raw_bytes
+        self.transferred_bytes = transferred_bytes
+        self.calls = calls
+        self.codec_seconds = codec_seconds
+        self.elapsed = elapsed
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.raw_bytes - self.transferred_bytes
+
+    @property
+    def ratio(self) -> float:
+        """Transferred bytes per content byte (1.0 when uncompressed)."""
+        return self.transferred_bytes / self.raw_bytes if self.raw_bytes else 1.0
+
+    def __repr__(self) -> str:
+        return (
+            f"TransferStats(compression={self.compression!r}, raw_bytes={self.raw_bytes}, "
+            f"transferred_bytes={self.transferred_bytes}, calls={self.calls}, "
+            f"codec_seconds={self.codec_seconds:.3f}, elapsed={self.elapsed:.3f})"
+        )
+
+
+def check_compression(compression: str) -> None:
+    """
+    Raises:
+        ValueError: If `compression` is not a known mode.
+        ImportError: If it is "zstd" and the `zstandard` package is missing.
+    """
+    if compression not in COMPRESSION_MODES:
+        raise ValueError(
+            f"compression must be one of {COMPRESSION_MODES}, got {compression!r}"
+        )
+    if compression == "zstd":
+        _zstd()
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "compression='zstd' requires the 'zstandard' package: pip install zstandard"
+        ) from None
+    return zstandard
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return _zstd().ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return _zstd().ZstdDecompressor().decompressobj().decompress(data)
+    return gzip.decompress(data)
+
+
+def timed_compress(data: bytes, codec: str):
+    """`compress` returning (compressed, seconds)."""
+    start = time.perf_counter()
+    compressed = compress(data, codec)
+    return compressed, time.perf_counter() - start
+
+
+def decompress_command(codec: str) -> str:
+    return _DECOMPRESS_COMMANDS[codec]
+
+
+def compress_command(codec: str) -> str:
+    return _COMPRESS_COMMANDS[codec]
+
+
+def should_compress(
+    raw_bytes: int, compressed_bytes: int, raw_chunk: int, compressed_chunk: int
+) -> bool:
+    """
+    Whether sending `compressed_bytes` in chunks of `compressed_chunk` plus
+    one shell command takes fewer calls than `raw_bytes` in chunks of
+    `raw_chunk`.
+    """
+    plain_calls = math.ceil(raw_bytes / raw_chunk)
+    compressed_calls = math.ceil(compressed_bytes / compressed_chunk) + 1
+    return compressed_calls < plain_calls
@@ -0,0 +1,154 @@
+"""
+Read-through cache of remote file contents.
+
+Entries are keyed by path and read format and carry the validator (size and
+modification time) the file had when it was read. A cached entry is only
+served after the caller has re-checked the validator against a fresh stat, so
+changes made behind the SDK's back are picked up; changes made through the
+SDK additionally drop the affected paths right away. Memory is bounded by a
+byte budget, evicting the least recently used entries first.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from ..logger import get_logger
+
+_logger = get_logger("content_cache")
+
+# Default byte budget of a per-session cache
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _content_size(content: Any) -> int:
+    if isinstance(content, str):
+        return len(content.encode("utf-8"))
+    return len(content)
+
+
+class FileContentCache:
+    """
+    LRU cache of file contents with a byte budget and hit/miss counters.
+
+    Thread-safe; shared by the reads and the directory watcher of one
+    file system service.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize a FileContentCache.
+
+        Args:
+            max_bytes (int, optional): Total size of the cached contents in bytes.
+                Files larger than this are never cached. Defaults to 32 MiB.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (path, format) -> (validator, content, size)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Hashable, Any, int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, path: str, format: str, validator: Hashable) -> Optional[Any]:
+        """
+        Cached content of `path`, if it was read with the same validator.
+
+        A stale entry is dropped. Counts a hit or a miss.
+        """
+        key = (path, format)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == validator:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+
+    def put(self, path: str, format: str, validator: Hashable, content: Any) -> None:
+        """Store the content read for `path` together with its validator."""
+        size = _content_size(content)
+        if size > self.max_bytes:
+            return
+        key = (path, format)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (validator, content, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, paths: Iterable[str], recursive: bool = True) -> int:
+        """
+        Drop the entries of `paths`, and with `recursive` everything below them.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        targets = {path.rstrip("/") or "/" for path in paths if path}
+        if not targets:
+            return 0
+        prefixes = tuple(t if t.endswith("/") else t + "/" for t in targets)
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0] in targets or (recursive and key[0].startswith(prefixes))
+            ]
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+        if stale:
+            _logger.debug(f"Invalidated {len(stale)} cached file(s)")
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current usage of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,243 @@
+"""
+rsync-style delta encoding for updating a remote file in place.
+
+The remote copy is described by a signature: the MD5 of every fixed-size block
+and, when the session has Python, its Adler-32 checksum. The client slides a
+window over the new local content, looking up the rolling Adler-32 of each
+position among the remote blocks and confirming candidates with MD5, and emits
+a list of operations: copy a run of remote blocks, or insert literal bytes.
+The remote side rebuilds the file from those operations with `dd`, `tail` and
+`head`, and checks the MD5 of the result before replacing the original.
+
+Without Python in the session only the MD5 of each block is available, so
+blocks are matched at block-aligned positions only. In-place edits and appends
+still transfer little; insertions that shift the rest of the file fall back
+to sending it.
+"""
+
+import hashlib
+import math
+import shlex
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+_ADLER_MOD = 65521
+
+MIN_BLOCK_SIZE = 1024
+MAX_BLOCK_SIZE = 64 * 1024
+
+# Prints "BLOCK <adler32> <md5>" for every block of argv[1]
+_SIGNATURE_PY = (
+    "import hashlib, sys, zlib\n"
+    "n = int(sys.argv[2])\n"
+    "with open(sys.argv[1], 'rb') as f:\n"
+    "    for b in iter(lambda: f.read(n), b''):\n"
+    "        print('BLOCK', zlib.adler32(b), hashlib.md5(b).hexdigest())\n"
+)
+
+# Operations: ("copy", first_block, block_count) or ("data", offset, length),
+# where data offsets point into the concatenated literal bytes.
+DeltaOp = Tuple[str, int, int]
+
+
+class Signature:
+    """
+    Block checksums of a remote file.
+
+    Attributes:
+        exists (bool): Whether the remote file exists.
+        size (int): Size of the remote file in bytes.
+        digest (str): MD5 of the whole remote file.
+        block_size (int): Size of the blocks.
+        blocks (List[Tuple[Optional[int], str]]): Adler-32 (None if unavailable)
+            and MD5 of each block.
+    """
+
+    __slots__ = ("exists", "size", "digest", "block_size", "blocks")
+
+    def __init__(
+        self,
+        exists: bool = False,
+        size: int = 0,
+        digest: str = "",
+        block_size: int = MIN_BLOCK_SIZE,
+        blocks: Optional[List[Tuple[Optional[int], str]]] = None,
+    ):
+        self.exists = exists
+        self.size = size
+        self.digest = digest
+        self.block_size = block_size
+        self.blocks = blocks or []
+
+    @property
+    def rolling(self) -> bool:
+        """Whether the blocks carry weak checksums for unaligned matching."""
+        return bool(self.blocks) and self.blocks[0][0] is not None
+
+
+def choose_block_size(size: int) -> int:
+    """Block size of about the square root of the file size, like rsync."""
+    block = int(math.sqrt(size)) // MIN_BLOCK_SIZE * MIN_BLOCK_SIZE
+    return max(MIN_BLOCK_SIZE, min(MAX_BLOCK_SIZE, block))
+
+
+def signature_command(path: str, block_size: int) -> str:
+    """Shell command printing the signature of `path` (see `parse_signature`)."""
+    f = shlex.quote(path)
+    return (
+        f"if [ ! -f {f} ]; then echo MISSING; exit 0; fi; "
+        f"echo SIZE $(stat -c %s -- {f}); "
+        f"echo FILE $(md5sum < {f} | cut -d' ' -f1); "
+        f"if command -v python3 >/dev/null 2>&1; then "
+        f"python3 -c {shlex.quote(_SIGNATURE_PY)} {f} {int(block_size)}; "
+        f"else split -b {int(block_size)} --filter=md5sum -- {f} "
+        f"| sed 's/^\\([0-9a-f]*\\).*/BLOCK - \\1/'; fi"
+    )
+
+
+def parse_signature(output: str, block_size: int) -> Signature:
+    """Parse the output of `signature_command`."""
+    signature = Signature(block_size=block_size)
+    for line in output.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == "MISSING":
+            return Signature(block_size=block_size)
+        if parts[0] == "SIZE" and len(parts) == 2 and parts[1].isdigit():
+            signature.exists = True
+            signature.size = int(parts[1])
+        elif parts[0] == "FILE" and len(parts) == 2:
+            signature.digest = parts[1]
+        elif parts[0] == "BLOCK" and len(parts) == 3:
+            weak = int(parts[1]) if parts[1].isdigit() else None
+            signature.blocks.append((weak, parts[2]))
+    expected_blocks = -(-signature.size // block_size)
+    if len(signature.blocks) != expected_blocks:
+        # Incomplete listing (e.g. no split --filter): match nothing
+        signature.blocks = []
+    return signature
+
+
+def _md5(data) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+def compute_delta(data: bytes, signature: Signature) -> Tuple[List[DeltaOp], bytes]:
+    """
+    Operations rebuilding `data` from the remote file described by `signature`.
+
+    Returns:
+        Tuple[List[DeltaOp], bytes]: The operations and the literal bytes they
+            reference.
+    """
+    n = signature.block_size
+    blocks = signature.blocks
+    last = len(blocks) - 1
+    # The final block may be short; it can only match at the end of `data`
+    tail_len = signature.size - last * n if blocks else 0
+
+    strong: Dict[str, int] = {}
+    weak: Set[int] = set()
+    for index, (adler, md5) in enumerate(blocks):
+        if index == last and tail_len != n:
+            continue
+        strong.setdefault(md5, index)
+        if adler is not None:
+            weak.add(adler)
+
+    ops: List[DeltaOp] = []
+    literals = bytearray()
+    view = memoryview(data)
+    length = len(data)
+
+    def emit_copy(index: int) -> None:
+        if ops and ops[-1][0] == "copy" and ops[-1][1] + ops[-1][2] == index:
+            ops[-1] = ("copy", ops[-1][1], ops[-1][2] + 1)
+        else:
+            ops.append(("copy", index, 1))
+
+    def emit_data(start: int, end: int) -> None:
+        if start >= end:
+            return
+        if ops and ops[-1][0] == "data":
+            ops[-1] = ("data", ops[-1][1], ops[-1][2] + end - start)
+        else:
+            ops.append(("data", len(literals), end - start))
+        literals.extend(view[start:end])
+
+    def match(pos: int) -> Optional[int]:
+        return strong.get(_md5(view[pos : pos + n]))
+
+    pending = 0  # start of bytes not yet emitted
+    pos = 0
+    rolling = signature.rolling
+    a = b = 0
+    window_valid = False
+    while pos + n <= length:
+        if rolling:
+            if not window_valid:
+                checksum = zlib.adler32(view[pos : pos + n])
+                a, b = checksum & 0xFFFF, checksum >> 16
+                window_valid = True
+            index = match(pos) if (b << 16) | a in weak else None
+        else:
+            index = match(pos)
+        if index is not None:
+            emit_data(pending, pos)
+            emit_copy(index)
+            pos += n
+            pending = pos
+            window_valid = False
+            continue
+        if not rolling:
+            pos += n
+            continue
+        # Roll the window one byte forward
+        if pos + n < length:
+            out_byte, in_byte = data[pos], data[pos + n]
+            a = (a - out_byte + in_byte) % _ADLER_MOD
+            b = (b - n * out_byte + a - 1) % _ADLER_MOD
+        pos += 1
+
+    if blocks and tail_len and tail_len != n and length - pending >= tail_len:
+        start = length - tail_len
+        if start >= pending and _md5(view[start:]) == blocks[last][1]:
+            emit_data(pending, start)
+            emit_copy(last)
+            pending = length
+    emit_data(pending, length)
+    return ops, bytes(literals)
+
+
+def reconstruction_script(
+    target: str, literal_path: str, ops: List[DeltaOp], block_size: int, digest: str
+) -> str:
+    """
+    Shell script rebuilding `target` from its current content and the literal
+    bytes uploaded to `literal_path` (base64), replacing it only if the result
+    has MD5 `digest`. The literal file is removed either way.
+    """
+    lines = [
+        "set -e",
+        f"f={shlex.quote(target)}",
+        f"literal={shlex.quote(literal_path)}",
+        'out="$f.agentbay-sync"',
+        "raw=$(mktemp)",
+        'trap \'rm -f -- "$raw" "$literal" "$out"\' EXIT',
+        'base64 -d "$literal" > "$raw"',
+        'mkdir -p -- "$(dirname -- "$f")"',
+        "{",
+    ]
+    for kind, start, count in ops:
+        if kind == "copy":
+            lines.append(f'dd if="$f" bs={int(block_size)} skip={start} count={count} 2>/dev/null')
+        else:
+            lines.append(f'tail -c +{start + 1} "$raw" | head -c {count}')
+    lines += [
+        ':; } > "$out"',
+        f"[ \"$(md5sum < \"$out\" | cut -d' ' -f1)\" = {shlex.quote(digest)} ]",
+        'chmod --reference="$f" "$out" 2>/dev/null || true',
+        'mv -f -- "$out" "$f"',
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,250 @@
+"""
+On-disk cache of locally generated browser fingerprints.
+
+Generating a fingerprint launches a local browser, which costs seconds of CPU,
+while its result only depends on the browser build, the launch mode and the
+machine. Entries are therefore filed under a key derived from the browser
+channel, version, headless flag and host, and named after the hash of their
+content:
+
+    <dir>/<sha256 of the key>/<sha256 of the fingerprint>.json
+
+so a fingerprint generated twice is stored once, and the distinct
+fingerprints of a key form a pool. Entries expire `ttl` seconds after they
+were written; beyond `max_entries` files the least recently used are removed.
+Files are written atomically, so several processes can share a directory.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..logger import get_logger
+from ..models.fingerprint import FingerprintFormat
+
+_logger = get_logger("fingerprint_cache")
+
+DEFAULT_TTL = 7 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 256
+
+# Executables of the "chrome" channel, by platform
+_CHROME_EXECUTABLES = {
+    "Linux": ["google-chrome", "google-chrome-stable", "/opt/google/chrome/chrome"],
+    "Darwin": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"],
+    "Windows": [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    ],
+}
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "agentbay", "fingerprints")
+
+
+def local_browser_version(channel: str) -> str:
+    """
+    Version of the browser a generator would launch, found without launching it.
+
+    The bundled Chromium is pinned by the Playwright release; Chrome is asked
+    for its version. Returns "unknown" when it cannot be determined, in which
+    case cached entries live until they expire.
+    """
+    if channel != "chrome":
+        try:
+            from importlib.metadata import version
+
+            return "playwright-" + version("playwright")
+        except Exception:
+            return "unknown"
+    for executable in _CHROME_EXECUTABLES.get(platform.system(), []):
+        path = shutil.which(executable) or (executable if os.path.isfile(executable) else None)
+        if path is None:
+            continue
+        try:
+            output = subprocess.run(
+                [path, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        found = re.search(r"\d+(\.\d+)+", output)
+        if found:
+            return found.group(0)
+    return "unknown"
+
+
+def cache_key(channel: str, version: str, headless: bool, host: Optional[str] = None) -> str:
+    """Key of the fingerprints generated by a browser build, launch mode and host."""
+    if host is None:
+        host = f"{platform.node()}/{platform.system()}/{platform.machine()}"
+    canonical = json.dumps(
+        {"channel": channel, "version": version, "headless": headless, "host": host},
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class FingerprintCache:
+    """
+    Directory of fingerprint pools with expiry and a size cap.
+
+    Thread-safe within a process; safe to share between processes.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: Optional[float] = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize a FingerprintCache.
+
+        Args:
+            directory (Optional[str], optional): Where entries are stored.
+                Defaults to $XDG_CACHE_HOME/agentbay/fingerprints (~/.cache/...).
+            ttl (Optional[float], optional): Seconds an entry stays valid.
+                Defaults to 7 days. None disables expiry.
+            max_entries (int, optional): Most entries kept, all keys together.
+                Defaults to 256.
+
+        Raises:
+            ValueError: If ttl or max_entries is not positive.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = directory or default_cache_dir()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[FingerprintFormat]:
+        """Most recently used fingerprint of `key`, or None."""
+        pool = self.pool(key, limit=1)
+        return pool[0] if pool else None
+
+    def pool(self, key: str, limit: Optional[int] = None) -> List[FingerprintFormat]:
+        """
+        Valid fingerprints of `key`, most recently used first. Expired or
+        unreadable entries are removed on the way.
+        """
+        fingerprints, used = [], []
+        with self._lock:
+            for path in self._entries(key):
+                if limit is not None and len(fingerprints) >= limit:
+                    break
+                fingerprint = self._load(path)
+                if fingerprint is None:
+                    continue
+                fingerprints.append(fingerprint)
+                used.append(path)
+            # Touch the first entry last so that the order is kept
+            for path in reversed(used):
+                _touch(path)
+            if fingerprints:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return fingerprints
+
+    def put(self, key: str, fingerprint: FingerprintFormat) -> str:
+        """
+        Store `fingerprint` under `key` and enforce the size cap.
+
+        Returns:
+            str: Path of the entry; the same for identical fingerprints.
+        """
+        data = fingerprint._to_dict()
+        digest = hashlib.sha256(
+            json.dumps(data, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        folder = os.path.join(self.directory, key)
+        path = os.path.join(folder, digest + ".json")
+        entry = {"created": time.time(), "fingerprint": data}
+        with self._lock:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp, path)
+            except BaseException:
+                _remove(tmp)
+                raise
+            self._evict()
+        return path
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Remove the entries of `key`, or of every key."""
+        with self._lock:
+            target = os.path.join(self.directory, key) if key else self.directory
+            shutil.rmtree(target, ignore_errors=True)
+
+    def _entries(self, key: str) -> List[str]:
+        folder = os.path.join(self.directory, key)
+        try:
+            names = [n for n in os.listdir(folder) if n.endswith(".json")]
+        except OSError:
+            return []
+        paths = [os.path.join(folder, n) for n in names]
+        return sorted(paths, key=_mtime, reverse=True)
+
+    def _load(self, path: str) -> Optional[FingerprintFormat]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry: Dict[str, Any] = json.load(f)
+            if self.ttl is not None and time.time() - entry["created"] > self.ttl:
+                _remove(path)
+                return None
+            return FingerprintFormat._from_dict(entry["fingerprint"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _logger.debug(f"Dropping unreadable fingerprint cache entry {path}: {e}")
+            _remove(path)
+            return None
+
+    def _evict(self) -> None:
+        paths = []
+        for root, _, names in os.walk(self.directory):
+            paths += [os.path.join(root, n) for n in names if n.endswith(".json")]
+        if len(paths) <= self.max_entries:
+            return
+        paths.sort(key=_mtime)
+        for path in paths[: len(paths) - self.max_entries]:
+            _remove(path)
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def _touch(path: str) -> None:
+    # The modification time records the last use, for eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,264 @@
+"""
+Lightweight frame signatures for detecting visual changes between screenshots.
+
+A PNG frame is reduced to a coarse grid of CRC32 digests of its pixel rows.
+Comparing two signatures is then a cheap list comparison, so a wait loop can
+tell "did anything in this region change?" without keeping full frames around
+or pulling in an imaging dependency.
+
+The scanlines are unfiltered (Sub/Up/Average/Paeth are undone) before they are
+digested, so every cell reflects exactly the pixels it covers: identical frames
+compare equal, and a cell differs whenever one of its pixels does (short of a
+CRC32 collision), whatever filters the encoder picked.
+"""
+
+import struct
+import zlib
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# Samples per pixel for each PNG color type.
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+Region = Tuple[int, int, int, int]
+
+
+class FrameSignature:
+    """
+    Grid of digests describing one captured frame.
+
+    Attributes:
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        cols (int): Number of grid columns.
+        rows (int): Number of grid rows.
+        digests (List[int]): Row-major CRC32 digest of every grid cell.
+    """
+
+    __slots__ = ("width", "height", "cols", "rows", "cell_w", "cell_h", "digests")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cols: int,
+        rows: int,
+        cell_w: int,
+        cell_h: int,
+        digests: List[int],
+    ):
+        self.width = width
+        self.height = height
+        self.cols = cols
+        self.rows = rows
+        self.cell_w = cell_w
+        self.cell_h = cell_h
+        self.digests = digests
+
+    @classmethod
+    def from_png(cls, data: bytes, grid: int = 32) -> "FrameSignature":
+        """
+        Build a signature from PNG bytes.
+
+        Args:
+            data (bytes): PNG image bytes.
+            grid (int, optional): Number of cells along each axis. Defaults to 32.
+
+        Returns:
+            FrameSignature: The frame signature.
+
+        Raises:
+            ValueError: If the data is not a decodable PNG image.
+        """
+        if not data.startswith(_PNG_MAGIC):
+            raise ValueError("Frame data is not a PNG image")
+
+        width = height = bit_depth = color_type = interlace = 0
+        idat = []
+        pos = len(_PNG_MAGIC)
+        while pos + 8 <= len(data):
+            length, ctype = struct.unpack(">I4s", data[pos : pos + 8])
+            body = data[pos + 8 : pos + 8 + length]
+            if ctype == b"IHDR":
+                width, height, bit_depth, color_type, _, _, interlace = struct.unpack(
+                    ">IIBBBBB", body[:13]
+                )
+            elif ctype == b"IDAT":
+                idat.append(body)
+            elif ctype == b"IEND":
+                break
+            pos += 12 + length
+
+        if width <= 0 or height <= 0 or color_type not in _PNG_CHANNELS:
+            raise ValueError("Invalid PNG header")
+        try:
+            raw = zlib.decompress(b"".join(idat))
+        except zlib.error as e:
+            raise ValueError(f"Invalid PNG image data: {e}") from e
+
+        if interlace:
+            # Adam7 scanlines do not map onto screen rows; fall back to a single
+            # whole-frame digest, which still detects any change.
+            return cls(width, height, 1, 1, width, height, [zlib.crc32(raw)])
+
+        bits_per_pixel = _PNG_CHANNELS[color_type] * bit_depth
+        stride = (width * bits_per_pixel + 7) // 8 + 1
+        if len(raw) < stride * height:
+            raise ValueError("Truncated PNG image data")
+
+        cols = max(1, min(grid, width))
+        rows = max(1, min(grid, height))
+        cell_w = -(-width // cols)
+        cell_h = -(-height // rows)
+        cols = -(-width // cell_w)
+        rows = -(-height // cell_h)
+        cell_bytes = max(1, (cell_w * bits_per_pixel) // 8)
+
+        digests = [0] * (cols * rows)
+        filter_bpp = max(1, bits_per_pixel // 8)
+        for y, row in enumerate(_unfilter(raw, height, stride, filter_bpp)):
+            base = (y // cell_h) * cols
+            for c in range(cols):
+                start = c * cell_bytes
+                digests[base + c] = zlib.crc32(
+                    row[start : start + cell_bytes], digests[base + c]
+                )
+        return cls(width, height, cols, rows, cell_w, cell_h, digests)
+
+    def _cells_in(self, region: Optional[Region]) -> Sequence[int]:
+        if region is None:
+            return range(len(self.digests))
+        x, y, w, h = region
+        c0 = max(0, x // self.cell_w)
+        r0 = max(0, y // self.cell_h)
+        c1 = min(self.cols - 1, (x + max(w, 1) - 1) // self.cell_w)
+        r1 = min(self.rows - 1, (y + max(h, 1) - 1) // self.cell_h)
+        if c1 < c0 or r1 < r0:
+            return []
+        return [r * self.cols + c for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+    def diff(self, other: "FrameSignature", region: Optional[Region] = None) -> float:
+        """
+        Fraction of grid cells that differ between two frames.
+
+        Args:
+            other (FrameSignature): The frame to compare against.
+            region (Optional[Tuple[int, int, int, int]]): Restrict the comparison to
+                the ``(x, y, width, height)`` pixel rectangle. Defaults to the
+                whole frame.
+
+        Returns:
+            float: Changed ratio in ``[0.0, 1.0]``. Frames of different sizes
+            (e.g. after a rotation) are reported as fully changed.
+        """
+        if (
+            self.width != other.width
+            or self.height != other.height
+            or self.cols != other.cols
+            or self.rows != other.rows
+        ):
+            return 1.0
+        cells = self._cells_in(region)
+        if not cells:
+            return 0.0
+        a, b = self.digests, other.digests
+        changed = sum(1 for i in cells if a[i] != b[i])
+        return changed / len(cells)
+
+
+def _unfilter(raw: bytes, height: int, stride: int, bpp: int) -> Iterator[bytes]:
+    """
+    Yield the decoded scanlines of non-interlaced PNG image data.
+
+    None, Sub and Up rows are decoded with whole-row integer arithmetic;
+    Average and Paeth depend on the decoded byte to their left, so they are
+    decoded byte by byte, one channel at a time.
+    """
+    size = stride - 1
+    prior = bytes(size)
+    for y in range(height):
+        pos = y * stride
+        filter_type = raw[pos]
+        line = raw[pos + 1 : pos + stride]
+        if filter_type == 0:
+            row = line
+        elif filter_type == 1:
+            row = _add_left(line, bpp)
+        elif filter_type == 2:
+            row = _add_bytes(line, prior)
+        elif filter_type == 3:
+            row = _unfilter_average(line, prior, bpp)
+        elif filter_type == 4:
+            row = _unfilter_paeth(line, prior, bpp)
+        else:
+            raise ValueError(f"Invalid PNG filter type {filter_type}")
+        yield row
+        prior = row
+
+
+def _masks(size: int) -> Tuple[int, int, int]:
+    high = int.from_bytes(b"\x80" * size, "little")
+    full = (1 << (8 * size)) - 1
+    return high, high ^ full, full
+
+
+def _add_bytes(a: bytes, b: bytes) -> bytes:
+    """Bytewise sum modulo 256, computed on the rows as integers (SWAR)."""
+    high, low, _ = _masks(len(a))
+    x = int.from_bytes(a, "little")
+    y = int.from_bytes(b, "little")
+    return (((x & low) + (y & low)) ^ ((x ^ y) & high)).to_bytes(len(a), "little")
+
+
+def _add_left(line: bytes, bpp: int) -> bytes:
+    """Undo the Sub filter: a running bytewise sum with stride `bpp`, as a prefix scan."""
+    size = len(line)
+    high, low, full = _masks(size)
+    x = int.from_bytes(line, "little")
+    shift = bpp
+    while shift < size:
+        y = (x << (8 * shift)) & full
+        x = ((x & low) + (y & low)) ^ ((x ^ y) & high)
+        shift *= 2
+    return x.to_bytes(size, "little")
+
+
+def _unfilter_average(line: bytes, prior: bytes, bpp: int) -> bytes:
+    out = bytearray(len(line))
+    for k in range(bpp):
+        a = 0
+        i = k
+        for f, b in zip(line[k::bpp], prior[k::bpp]):
+            a = (f + ((a + b) >> 1)) & 255
+            out[i] = a
+            i += bpp
+    return bytes(out)
+
+
+def _unfilter_paeth(line: bytes, prior: bytes, bpp: int) -> bytes:
+    out = bytearray(len(line))
+    for k in range(bpp):
+        a = c = 0
+        i = k
+        for f, b in zip(line[k::bpp], prior[k::bpp]):
+            # Distances of the initial estimate a + b - c to a, b and c
+            pa = b - c
+            pb = a - c
+            pc = pa + pb
+            if pa < 0:
+                pa = -pa
+            if pb < 0:
+                pb = -pb
+            if pc < 0:
+                pc = -pc
+            if pa <= pb and pa <= pc:
+                a = (f + a) & 255
+            elif pb <= pc:
+                a = (f + b) & 255
+            else:
+                a = (f + c) & 255
+            out[i] = a
+            i += bpp
+            c = b
+    return bytes(out)
@@ -0,0 +1,363 @@
+"""
+File manifests: size, mtime and optional content digest of every file in a tree.
+
+A manifest of a remote directory is computed inside the session by a single
+`find` command (see `build_manifest_command` / `parse_manifest_output`); the
+same structure can be built for a local directory with `build_local_manifest`.
+Comparing two manifests with `FileManifest.diff` tells sync tooling which
+files have to be transferred and which can be skipped.
+
+Paths in a manifest are relative to its root and always use "/" separators.
+Include and exclude patterns are shell globs: a pattern containing "/" is
+matched against the relative path, any other pattern against the file or
+directory name. An excluded directory is skipped with everything below it.
+"""
+
+import fnmatch
+import hashlib
+import os
+import shlex
+from typing import Dict, Iterator, List, Optional, Sequence
+
+# Digest algorithms a manifest can carry, with the remote command computing them.
+HASH_COMMANDS = {
+    "sha256": "sha256sum",
+    "sha1": "sha1sum",
+    "md5": "md5sum",
+    "xxh": "xxh64sum",
+}
+
+_READ_CHUNK = 1024 * 1024
+
+
+class ManifestEntry:
+    """
+    One file of a manifest.
+
+    Attributes:
+        path (str): Path relative to the manifest root.
+        size (int): Size in bytes.
+        mtime (float): Modification time (seconds since the epoch).
+        digest (Optional[str]): Hex digest of the content, if hashed.
+    """
+
+    __slots__ = ("path", "size", "mtime", "digest")
+
+    def __init__(self, path: str, size: int, mtime: float, digest: Optional[str] = None):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.digest = digest
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ManifestEntry):
+            return NotImplemented
+        return (self.path, self.size, self.mtime, self.digest) == (
+            other.path,
+            other.size,
+            other.mtime,
+            other.digest,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ManifestEntry({self.path!r}, size={self.size}, mtime={self.mtime}, "
+            f"digest={self.digest!r})"
+        )
+
+
+class ManifestDiff:
+    """
+    Difference between a source and a target manifest.
+
+    Attributes:
+        missing (List[str]): Files only in the source.
+        extra (List[str]): Files only in the target.
+        changed (List[str]): Files in both whose content differs.
+        unchanged (List[str]): Files in both with the same content.
+    """
+
+    __slots__ = ("missing", "extra", "changed", "unchanged")
+
+    def __init__(self):
+        self.missing: List[str] = []
+        self.extra: List[str] = []
+        self.changed: List[str] = []
+        self.unchanged: List[str] = []
+
+    @property
+    def to_transfer(self) -> List[str]:
+        """Files to copy from the source so that the target matches it."""
+        return self.missing + self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.extra or self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"ManifestDiff(missing={len(self.missing)}, extra={len(self.extra)}, "
+            f"changed={len(self.changed)}, unchanged={len(self.unchanged)})"
+        )
+
+
+class FileManifest:
+    """
+    Files of a directory tree indexed by relative path.
+
+    Attributes:
+        root (str): Directory the manifest was built from.
+        hash (Optional[str]): Digest algorithm of the entries, or None.
+    """
+
+    def __init__(
+        self,
+        root: str = "",
+        hash: Optional[str] = None,
+        entries: Optional[Sequence[ManifestEntry]] = None,
+    ):
+        self.root = root
+        self.hash = hash
+        self._entries: Dict[str, ManifestEntry] = {}
+        for entry in entries or ():
+            self._entries[entry.path] = entry
+
+    def add(self, entry: ManifestEntry) -> None:
+        self._entries[entry.path] = entry
+
+    def get(self, path: str) -> Optional[ManifestEntry]:
+        return self._entries.get(path)
+
+    def __getitem__(self, path: str) -> ManifestEntry:
+        return self._entries[path]
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._entries
+
+    def __iter__(self) -> Iterator[ManifestEntry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def paths(self) -> List[str]:
+        return sorted(self._entries)
+
+    @property
+    def total_size(self) -> int:
+        return sum(entry.size for entry in self._entries.values())
+
+    def diff(self, target: "FileManifest", mtime_window: float = 0.0) -> ManifestDiff:
+        """
+        Compare this (source) manifest with `target`.
+
+        Files are compared by digest when both manifests were hashed with the
+        same algorithm, otherwise by size and modification time. Note that
+        mtimes are only comparable between manifests of the same side (e.g. two
+        snapshots of one remote directory); hash both sides to compare a local
+        tree with a remote one.
+
+        Args:
+            target (FileManifest): Manifest to compare against.
+            mtime_window (float, optional): Largest mtime difference (seconds)
+                still treated as equal. Defaults to 0.
+
+        Returns:
+            ManifestDiff: Paths grouped into missing, extra, changed and unchanged,
+                each sorted.
+        """
+        by_digest = self.hash is not None and self.hash == target.hash
+        result = ManifestDiff()
+        for path in self.paths:
+            theirs = target._entries.get(path)
+            if theirs is None:
+                result.missing.append(path)
+            elif _same_content(self._entries[path], theirs, by_digest, mtime_window):
+                result.unchanged.append(path)
+            else:
+                result.changed.append(path)
+        result.extra = [path for path in target.paths if path not in self._entries]
+        return result
+
+    def __repr__(self) -> str:
+        return f"FileManifest({self.root!r}, hash={self.hash!r}, files={len(self)})"
+
+
+def _same_content(
+    ours: ManifestEntry, theirs: ManifestEntry, by_digest: bool, mtime_window: float
+) -> bool:
+    if ours.size != theirs.size:
+        return False
+    if by_digest:
+        # A file that could not be hashed on either side is never assumed equal
+        return ours.digest is not None and ours.digest == theirs.digest
+    return abs(ours.mtime - theirs.mtime) <= mtime_window
+
+
+def _check_hash(hash: Optional[str]) -> None:
+    if hash is not None and hash not in HASH_COMMANDS:
+        raise ValueError(
+            f"Unsupported hash {hash!r}; expected one of {sorted(HASH_COMMANDS)} or None"
+        )
+
+
+def _matches(rel_path: str, patterns: Sequence[str]) -> bool:
+    name = rel_path.rsplit("/", 1)[-1]
+    for pattern in patterns:
+        target = rel_path if "/" in pattern else name
+        if fnmatch.fnmatchcase(target, pattern.lstrip("/")):
+            return True
+    return False
+
+
+def _find_tests(patterns: Sequence[str]) -> str:
+    tests = []
+    for pattern in patterns:
+        if "/" in pattern:
+            tests.append(f"-path {shlex.quote('./' + pattern.lstrip('/'))}")
+        else:
+            tests.append(f"-name {shlex.quote(pattern)}")
+    return "\\( " + " -o ".join(tests) + " \\)"
+
+
+def build_manifest_command(
+    root: str,
+    hash: Optional[str] = "sha256",
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+) -> str:
+    """
+    Shell command printing the manifest of `root` in one pass.
+
+    Every regular file produces a `F<TAB>size<TAB>mtime<TAB>relpath` line and,
+    when hashing, a checksum line in the usual `<digest>  ./relpath` format.
+    """
+    _check_hash(hash)
+    parts = [f"cd -- {shlex.quote(root)} && find . -mindepth 1"]
+    if exclude:
+        parts.append(f"{_find_tests(exclude)} -prune -o")
+    parts.append("-type f")
+    if include:
+        parts.append(_find_tests(include))
+    parts.append("-printf 'F\\t%s\\t%T@\\t%P\\n'")
+    if hash is not None:
+        parts.append(f"-exec {HASH_COMMANDS[hash]} {{}} +")
+    return " ".join(parts)
+
+
+def _unescape_checksum_path(path: str) -> str:
+    # coreutils escapes "\\" and "\n" in names and flags such lines with "\"
+    return path.replace("\\n", "\n").replace("\\\\", "\\")
+
+
+def parse_manifest_output(
+    output: str, root: str = "", hash: Optional[str] = "sha256"
+) -> FileManifest:
+    """
+    Build a FileManifest from the output of `build_manifest_command`.
+
+    Lines that cannot be parsed (e.g. warnings mixed into the output) are skipped.
+    """
+    entries: Dict[str, ManifestEntry] = {}
+    digests: Dict[str, str] = {}
+    for line in output.splitlines():
+        if line.startswith("F\t"):
+            parts = line.split("\t", 3)
+            if len(parts) != 4:
+                continue
+            _, size, mtime, path = parts
+            try:
+                entries[path] = ManifestEntry(path, int(size), float(mtime))
+            except ValueError:
+                continue
+            continue
+        escaped = line.startswith("\\")
+        digest, sep, path = line[int(escaped):].partition("  ")
+        if not sep or not digest or not path.startswith("./"):
+            continue
+        path = path[2:]
+        digests[_unescape_checksum_path(path) if escaped else path] = digest.lower()
+    for path, digest in digests.items():
+        entry = entries.get(path)
+        if entry is not None:
+            entry.digest = digest
+    return FileManifest(root, hash, list(entries.values()))
+
+
+def _new_hasher(hash: str):
+    if hash == "xxh":
+        try:
+            import xxhash
+        except ImportError:
+            raise ImportError(
+                "hash='xxh' requires the 'xxhash' package: pip install xxhash"
+            ) from None
+        return xxhash.xxh64()
+    return hashlib.new(hash)
+
+
+def file_digest(path: str, hash: str = "sha256") -> str:
+    """Hex digest of a local file, in the format of the remote checksum tools."""
+    _check_hash(hash)
+    hasher = _new_hasher(hash)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def build_local_manifest(
+    path: str,
+    hash: Optional[str] = "sha256",
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+) -> FileManifest:
+    """
+    Manifest of a local directory, with the same semantics as `fs.manifest`.
+
+    Args:
+        path (str): Local directory.
+        hash (Optional[str], optional): "sha256", "sha1", "md5", "xxh" (needs the
+            `xxhash` package) or None to skip hashing. Defaults to "sha256".
+        include (Optional[Sequence[str]], optional): Only list files matching one
+            of these globs.
+        exclude (Optional[Sequence[str]], optional): Skip files and directories
+            matching one of these globs.
+
+    Returns:
+        FileManifest: Regular files below `path`. Symbolic links are not followed.
+
+    Raises:
+        ValueError: If `hash` is not supported.
+        ImportError: If `hash` is "xxh" and `xxhash` is not installed.
+    """
+    _check_hash(hash)
+    if hash is not None:
+        _new_hasher(hash)
+    manifest = FileManifest(path, hash)
+    for dirpath, dirnames, filenames in os.walk(path):
+        rel_dir = os.path.relpath(dirpath, path).replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        if exclude:
+            dirnames[:] = [d for d in dirnames if not _matches(prefix + d, exclude)]
+        for name in filenames:
+            rel_path = prefix + name
+            if exclude and _matches(rel_path, exclude):
+                continue
+            if include and not _matches(rel_path, include):
+                continue
+            full_path = os.path.join(dirpath, name)
+            try:
+                st = os.lstat(full_path)
+            except OSError:
+                continue
+            if not os.path.isfile(full_path) or os.path.islink(full_path):
+                continue
+            digest = None
+            if hash is not None:
+                try:
+                    digest = file_digest(full_path, hash)
+                except OSError:
+                    pass
+            manifest.add(ManifestEntry(rel_path, st.st_size, st.st_mtime, digest))
+    return manifest
@@ -0,0 +1,141 @@
+"""
+Page readiness detection used by `Browser.screenshot` before capturing.
+
+Instead of scrolling and sleeping for fixed delays, the page is sampled every
+`POLL_MS` and captured as soon as it is quiet:
+
+- the document height is the same in `STABLE_SAMPLES` successive samples;
+- no `<img>` is still loading;
+- no network request is in flight (tracked through CDP `Network.*` events
+  when the browser exposes a CDP session);
+- lazy content has been reached: each sample scrolls one viewport further
+  down until the bottom of the page.
+
+A static page is therefore captured after a couple of samples, and a page
+that never settles (polling, streaming) after the caller's time budget.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+SCREENSHOT_WAITS = ("adaptive", "fast")
+
+POLL_MS = 100
+STABLE_SAMPLES = 2
+
+# Requests pending longer than this (long polling, event streams) stop blocking
+STALE_REQUEST_MS = 5000
+
+# Tallest capture Chromium renders reliably in one piece
+MAX_CAPTURE_HEIGHT = 16384
+
+# Takes `step`: whether to scroll one viewport further down before sampling.
+# Stepping also starts loading images and backgrounds deferred by data-src /
+# data-bg, so that they are waited for like any other image.
+READINESS_SCRIPT = """
+(step) => {
+    const doc = document.documentElement, body = document.body || doc;
+    if (step) {
+        window.scrollBy(0, window.innerHeight);
+        document.querySelectorAll('img[data-src]').forEach(img => {
+            if (!img.src && img.dataset.src) {
+                img.src = img.dataset.src;
+            }
+        });
+        document.querySelectorAll('[data-bg]').forEach(el => {
+            if (!el.style.backgroundImage) {
+                el.style.backgroundImage = `url(${el.dataset.bg})`;
+            }
+        });
+    }
+    const height = Math.max(body.scrollHeight, doc.scrollHeight);
+    return {
+        height: height,
+        width: doc.clientWidth || window.innerWidth,
+        pending: Array.from(document.images).filter(img => !img.complete).length,
+        bottom: window.scrollY + window.innerHeight >= height - 2,
+    };
+}
+"""
+
+
+def check_wait(wait: str) -> None:
+    """
+    Raises:
+        ValueError: If `wait` is not a known readiness preset.
+    """
+    if wait not in SCREENSHOT_WAITS:
+        raise ValueError(f"wait must be one of {SCREENSHOT_WAITS}, got {wait!r}")
+
+
+def parse_sample(value: Any) -> Dict[str, Any]:
+    """Normalize the result of READINESS_SCRIPT; unknown values mean a settled page."""
+    if not isinstance(value, dict):
+        height = value if isinstance(value, (int, float)) else 0
+        return {"height": int(height), "width": 0, "pending": 0, "bottom": True}
+    return {
+        "height": int(value.get("height") or 0),
+        "width": int(value.get("width") or 0),
+        "pending": int(value.get("pending") or 0),
+        "bottom": bool(value.get("bottom", True)),
+    }
+
+
+class NetworkIdleTracker:
+    """
+    Requests in flight, fed with CDP `Network.*` events.
+
+    Long-lived requests (event streams, or anything pending longer than
+    `stale_ms`) are not counted, so they cannot keep a page busy forever.
+    """
+
+    IGNORED_TYPES = ("EventSource", "WebSocket")
+
+    def __init__(self, stale_ms: int = STALE_REQUEST_MS):
+        self.stale_ms = stale_ms
+        self._started: Dict[str, float] = {}
+
+    def request_started(self, event: Dict[str, Any], now: float) -> None:
+        if event.get("type") in self.IGNORED_TYPES or "requestId" not in event:
+            return
+        # Redirects reuse the request id: keep the original start time
+        self._started.setdefault(event["requestId"], now)
+
+    def request_done(self, event: Dict[str, Any]) -> None:
+        self._started.pop(event.get("requestId"), None)
+
+    def inflight(self, now: float) -> int:
+        limit = self.stale_ms / 1000
+        return sum(1 for started in self._started.values() if now - started < limit)
+
+
+class ReadinessMonitor:
+    """
+    Decides from successive samples when a page is ready to capture.
+
+    `update` returns True once `stable_samples` consecutive samples have the
+    same height, no pending images or requests, and the bottom reached.
+    Any busy sample starts the count again.
+    """
+
+    def __init__(self, stable_samples: int = STABLE_SAMPLES):
+        self.stable_samples = stable_samples
+        self._height: Optional[int] = None
+        self._quiet = 0
+
+    def update(self, sample: Dict[str, Any], inflight: int = 0) -> bool:
+        if sample["pending"] or inflight or not sample["bottom"]:
+            self._quiet = 0
+        elif self._quiet and sample["height"] == self._height:
+            self._quiet += 1
+        else:
+            self._quiet = 1
+        self._height = sample["height"]
+        return self._quiet >= self.stable_samples
+
+
+def plan_tiles(height: int, tile_height: int) -> List[Tuple[int, int]]:
+    """(y, height) of the tiles covering a page of `height` pixels, top to bottom."""
+    if tile_height <= 0:
+        raise ValueError("tile_height must be positive")
+    height = max(height, 1)
+    return [(y, min(tile_height, height - y)) for y in range(0, height, tile_height)]
@@ -0,0 +1,254 @@
+"""
+Polling policy and wait-time metrics shared by the SDK's wait loops.
+
+The loops themselves live in `poll_until` (async and sync variants); this
+module holds the parts that do not depend on the I/O flavour: how long to wait
+between probes and what was observed while waiting.
+"""
+
+import random
+import threading
+from typing import Any, Dict, Optional
+
+
+class PollPolicy:
+    """
+    How a wait loop spaces its probes.
+
+    The first probe happens after `first_delay` (immediately by default), the
+    following ones after `initial_interval`, growing by `multiplier` up to
+    `max_interval`. Each delay is shortened by a random fraction of up to
+    `jitter` so that many clients polling the same backend spread out, and is
+    never longer than the time left until the deadline.
+    """
+
+    __slots__ = ("first_delay", "initial_interval", "max_interval", "multiplier", "jitter")
+
+    def __init__(
+        self,
+        initial_interval: float = 0.25,
+        max_interval: float = 5.0,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+        first_delay: float = 0.0,
+    ):
+        """
+        Initialize a PollPolicy.
+
+        Args:
+            initial_interval (float, optional): Seconds between the first and the
+                second probe. Defaults to 0.25.
+            max_interval (float, optional): Upper bound of the interval in seconds.
+                Defaults to 5.0.
+            multiplier (float, optional): Growth factor of the interval.
+                Defaults to 1.5.
+            jitter (float, optional): Maximum fraction (0-1) removed at random from
+                each interval. Defaults to 0.1.
+            first_delay (float, optional): Seconds before the first probe.
+                Defaults to 0 (probe immediately).
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if initial_interval <= 0 or max_interval <= 0:
+            raise ValueError("initial_interval and max_interval must be positive")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        if first_delay < 0:
+            raise ValueError("first_delay must not be negative")
+        self.initial_interval = min(initial_interval, max_interval)
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.first_delay = first_delay
+
+    @classmethod
+    def up_to(cls, max_interval: float, **kwargs: Any) -> "PollPolicy":
+        """
+        Default policy capped at `max_interval`, e.g. a caller's `poll_interval`.
+        """
+        return cls(max_interval=max_interval, **kwargs)
+
+    def interval(self, probes: int) -> float:
+        """
+        Nominal (jitter-free) delay after the given number of probes.
+
+        Args:
+            probes (int): Probes made so far (0 before the first one).
+
+        Returns:
+            float: Seconds to wait before the next probe.
+        """
+        if probes <= 0:
+            return self.first_delay
+        return min(
+            self.initial_interval * self.multiplier ** (probes - 1), self.max_interval
+        )
+
+    def delay(
+        self,
+        probes: int,
+        remaining: Optional[float] = None,
+        hint: Optional[float] = None,
+    ) -> float:
+        """
+        Delay before the next probe, with jitter and deadline applied.
+
+        Args:
+            probes (int): Probes made so far.
+            remaining (Optional[float], optional): Seconds left until the deadline.
+            hint (Optional[float], optional): Delay suggested by the server (e.g.
+                an estimate of the remaining work); replaces the nominal interval
+                but is still capped by `max_interval`.
+
+        Returns:
+            float: Seconds to wait, never negative.
+        """
+        if hint is not None and probes > 0:
+            delay = min(max(hint, 0.0), self.max_interval)
+        else:
+            delay = self.interval(probes)
+        if self.jitter and delay > 0:
+            delay *= 1 - self.jitter * random.random()
+        if remaining is not None:
+            delay = min(delay, remaining)
+        return max(delay, 0.0)
+
+    def __repr__(self) -> str:
+        return (
+            f"PollPolicy(initial_interval={self.initial_interval}, "
+            f"max_interval={self.max_interval}, multiplier={self.multiplier}, "
+            f"jitter={self.jitter}, first_delay={self.first_delay})"
+        )
+
+
+class PollOutcome:
+    """
+    Result of a wait loop.
+
+    Attributes:
+        value (Any): Last value returned by the probe (None if no probe succeeded).
+        done (bool): Whether the completion predicate accepted `value`.
+        timed_out (bool): Whether the deadline passed first.
+        cancelled (bool): Whether the wait was cancelled.
+        probes (int): Number of probes made.
+        elapsed (float): Seconds spent waiting.
+        error (Optional[BaseException]): Exception raised by the last probe, if any.
+    """
+
+    __slots__ = ("value", "done", "timed_out", "cancelled", "probes", "elapsed", "error")
+
+    def __init__(
+        self,
+        value: Any = None,
+        done: bool = False,
+        timed_out: bool = False,
+        cancelled: bool = False,
+        probes: int = 0,
+        elapsed: float = 0.0,
+        error: Optional[BaseException] = None,
+    ):
+        self.value = value
+        self.done = done
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+        self.probes = probes
+        self.elapsed = elapsed
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return self.done
+
+    def __repr__(self) -> str:
+        return (
+            f"PollOutcome(done={self.done}, timed_out={self.timed_out}, "
+            f"cancelled={self.cancelled}, probes={self.probes}, elapsed={self.elapsed:.3f})"
+        )
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """
+    Delay in seconds a throttled API call asked for, or None.
+
+    The OpenAPI client reports the `x-acs-retry-after` header of a throttling
+    response as the `retry_after` attribute of the exception, in milliseconds.
+    """
+    value = getattr(error, "retry_after", None)
+    if isinstance(value, (int, float)) and value >= 0:
+        return value / 1000.0
+    return None
+
+
+class PollStats:
+    """Wait-time counters of one kind of wait loop."""
+
+    __slots__ = (
+        "waits",
+        "completed",
+        "timed_out",
+        "cancelled",
+        "probes",
+        "probe_errors",
+        "total_wait",
+        "max_wait",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    @property
+    def mean_wait(self) -> float:
+        """Average wait in seconds."""
+        return self.total_wait / self.waits if self.waits else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["mean_wait"] = self.mean_wait
+        return data
+
+
+class PollMetrics:
+    """
+    Registry of wait-time metrics, keyed by the name of the wait loop
+    (e.g. "session.delete", "browser_agent.extract").
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, PollStats] = {}
+
+    def record(self, name: str, outcome: PollOutcome, probe_errors: int = 0) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = PollStats()
+            stats.waits += 1
+            stats.completed += int(outcome.done)
+            stats.timed_out += int(outcome.timed_out)
+            stats.cancelled += int(outcome.cancelled)
+            stats.probes += outcome.probes
+            stats.probe_errors += probe_errors
+            stats.total_wait += outcome.elapsed
+            stats.max_wait = max(stats.max_wait, outcome.elapsed)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Counters of one wait loop, or None if it never ran."""
+        with self._lock:
+            stats = self._stats.get(name)
+            return stats.to_dict() if stats is not None else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Counters of every wait loop that ran."""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide wait-time metrics, fed by every poll_until call
+poll_metrics = PollMetrics()
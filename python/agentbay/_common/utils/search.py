@@ -0,0 +1,184 @@
+"""
+Paginated file name search and content grep run as shell pipelines in a session.
+
+Both list candidates in byte order (`LC_ALL=C sort`) so that a page can be
+resumed from a cursor:
+
+- a name search cursor is the last path returned; the next page starts after it;
+- a grep cursor is `<count>:<path>`: matches are ordered by file, so the next
+  page skips the first `count` matches of `path` and continues with the files
+  after it.
+
+Cursors are opaque to callers. Each page fetches one line more than the limit
+to tell whether another page exists. grep ends the file name with a NUL byte
+(`-Z`), turned into \\x01 so the output stays valid in every transport; paths
+containing colons thus cannot be confused with the line number. The column of
+the match is computed locally.
+"""
+
+import re
+import shlex
+from typing import List, Optional, Sequence, Tuple
+
+# Longest line of grep output kept per match (bytes, path included)
+MAX_LINE_BYTES = 4096
+
+
+class GrepMatch:
+    """
+    One line matching a content search.
+
+    Attributes:
+        path (str): File containing the match.
+        line (int): Line number, starting at 1.
+        column (Optional[int]): Column of the first match in the line, starting
+            at 1, or None if it could not be determined locally.
+        text (str): The matching line (truncated to MAX_LINE_BYTES).
+    """
+
+    __slots__ = ("path", "line", "column", "text")
+
+    def __init__(self, path: str, line: int, column: Optional[int], text: str):
+        self.path = path
+        self.line = line
+        self.column = column
+        self.text = text
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GrepMatch):
+            return NotImplemented
+        return (self.path, self.line, self.column, self.text) == (
+            other.path,
+            other.line,
+            other.column,
+            other.text,
+        )
+
+    def __repr__(self) -> str:
+        return f"GrepMatch({self.path!r}, line={self.line}, column={self.column}, text={self.text!r})"
+
+
+def _name_tests(patterns: Sequence[str]) -> str:
+    return "\\( " + " -o ".join(f"-name {shlex.quote(p)}" for p in patterns) + " \\)"
+
+
+def _find(path: str, exclude: Optional[Sequence[str]]) -> str:
+    command = f"find {shlex.quote(path)} -mindepth 1"
+    if exclude:
+        command += f" {_name_tests(exclude)} -prune -o"
+    return command
+
+
+def _after(cursor: str) -> str:
+    # The cursor travels through the environment so awk does not unescape it
+    return f"C={shlex.quote(cursor)} LC_ALL=C awk '$0 > ENVIRON[\"C\"]'"
+
+
+def search_command(
+    path: str,
+    pattern: str,
+    exclude: Optional[Sequence[str]] = None,
+    cursor: Optional[str] = None,
+    limit: int = 1000,
+) -> str:
+    """Shell command printing up to `limit + 1` paths below `path` matching `pattern`."""
+    parts = [
+        f"[ -e {shlex.quote(path)} ] || {{ echo 'No such file or directory' >&2; exit 2; }};",
+        f"{_find(path, exclude)} -name {shlex.quote(pattern)} -print",
+        "| LC_ALL=C sort",
+    ]
+    if cursor:
+        parts.append(f"| {_after(cursor)}")
+    parts.append(f"| head -n {int(limit) + 1}")
+    return " ".join(parts)
+
+
+def parse_cursor(cursor: Optional[str]) -> Tuple[int, Optional[str]]:
+    """Split a grep cursor into (matches to skip, path)."""
+    if not cursor:
+        return 0, None
+    count, sep, path = cursor.partition(":")
+    if not sep or not count.isdigit() or not path:
+        raise ValueError(f"Invalid grep cursor: {cursor!r}")
+    return int(count), path
+
+
+def grep_command(
+    path: str,
+    regex: str,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    ignore_case: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = 1000,
+) -> str:
+    """
+    Shell command printing up to `limit + 1` matching lines below `path` as
+    `<path>\\x01<line>:<text>`, binary files skipped.
+    """
+    skip, cursor_path = parse_cursor(cursor)
+    flags = "-nHZIE" + ("i" if ignore_case else "")
+    grep = f"grep {flags} -e {shlex.quote(regex)} --"
+    found = f"{_find(path, exclude)} -type f"
+    if include:
+        found += f" {_name_tests(include)}"
+    # A file given as `path` is searched itself (find -mindepth 1 skips it)
+    quoted = shlex.quote(path)
+    files = (
+        f"{{ if [ -f {quoted} ]; then printf '%s\\n' {quoted}; "
+        f"else {found} -print; fi; }} | LC_ALL=C sort"
+    )
+    if cursor_path:
+        files += f" | {_after(cursor_path)}"
+    resumed = f"xargs -r -d '\\n' {grep}"
+    if cursor_path:
+        # Rest of the file the previous page stopped in, then the files after it
+        first = f"{grep} {shlex.quote(cursor_path)} 2>/dev/null | tail -n +{skip + 1}"
+        resumed = f"{{ {first}; {files} | {resumed}; }}"
+    else:
+        resumed = f"{files} | {resumed}"
+    return (
+        f"[ -e {shlex.quote(path)} ] || {{ echo 'No such file or directory' >&2; exit 2; }}; "
+        f"{resumed} 2>/dev/null | tr '\\000' '\\001' | cut -b 1-{MAX_LINE_BYTES} "
+        f"| head -n {int(limit) + 1}"
+    )
+
+
+def _column(pattern: Optional["re.Pattern"], text: str) -> Optional[int]:
+    if pattern is None:
+        return None
+    found = pattern.search(text)
+    return found.start() + 1 if found else None
+
+
+def parse_grep_output(
+    output: str, regex: str, ignore_case: bool = False
+) -> List[GrepMatch]:
+    """Matches from the output of `grep_command`; malformed lines are skipped."""
+    try:
+        pattern = re.compile(regex, re.IGNORECASE if ignore_case else 0)
+    except re.error:
+        # POSIX syntax Python does not understand: leave columns unknown
+        pattern = None
+    matches = []
+    for line in output.split("\n"):
+        path, sep, rest = line.partition("\x01")
+        number, sep2, text = rest.partition(":")
+        if not sep or not sep2 or not number.isdigit():
+            continue
+        matches.append(GrepMatch(path, int(number), _column(pattern, text), text))
+    return matches
+
+
+def next_grep_cursor(
+    matches: Sequence[GrepMatch], cursor: Optional[str]
+) -> Optional[str]:
+    """Cursor resuming after the last of `matches`, the page read with `cursor`."""
+    if not matches:
+        return None
+    last = matches[-1].path
+    count = sum(1 for match in matches if match.path == last)
+    skip, cursor_path = parse_cursor(cursor)
+    if cursor_path == last:
+        count += skip
+    return f"{count}:{last}"
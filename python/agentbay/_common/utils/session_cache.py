@@ -0,0 +1,209 @@
+"""
+Bounded cache of the session objects known to an AgentBay client.
+
+The most recently used sessions are held strongly, up to `max_size` entries
+and for `ttl` seconds since their last use. Sessions pushed out of that window
+stay reachable through a weak reference for as long as the application still
+holds them, so a lookup never hands out a second object for a session that is
+in use, while sessions nobody references anymore are freed.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..logger import get_logger
+
+_logger = get_logger("session_cache")
+
+# Eviction hook signature: hook(session_id, session, reason)
+EvictionHook = Callable[[str, Any, str], None]
+
+# Eviction reasons passed to the hooks
+EVICT_CAPACITY = "capacity"
+EVICT_EXPIRED = "expired"
+EVICT_REMOVED = "removed"
+
+_MISSING = object()
+
+
+class SessionCache:
+    """
+    LRU + TTL bounded mapping of session ID to session object.
+
+    Supports the subset of the dict protocol the client uses (`[]`, `in`,
+    `get`, `pop`, `len`, iteration), so it can stand in for a plain dict.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a SessionCache.
+
+        Args:
+            max_size (int, optional): Maximum number of strongly held sessions.
+                Defaults to 1024.
+            ttl (Optional[float], optional): Seconds a session stays strongly held
+                after its last use. Defaults to 3600. None disables expiry.
+            clock (Callable[[], float], optional): Time source, for tests.
+
+        Raises:
+            ValueError: If max_size or ttl is not positive.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        # session_id -> (session, expires_at), least recently used first
+        self._strong: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._weak: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+        self._hooks: List[EvictionHook] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def add_eviction_hook(self, hook: EvictionHook) -> None:
+        """
+        Register a callable invoked as `hook(session_id, session, reason)` when a
+        session leaves the strongly held set. `reason` is "capacity", "expired"
+        or "removed". Hooks run outside the cache lock; exceptions are logged.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_eviction_hook(self, hook: EvictionHook) -> None:
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def __setitem__(self, session_id: str, session: Any) -> None:
+        self.put(session_id, session)
+
+    def put(self, session_id: str, session: Any) -> None:
+        """Insert or refresh a session as the most recently used entry."""
+        with self._lock:
+            self._strong[session_id] = (session, self._expiry())
+            self._strong.move_to_end(session_id)
+            self._weak[session_id] = session
+            evicted = self._evict_locked()
+        self._notify(evicted)
+
+    def get(self, session_id: str, default: Any = None) -> Any:
+        """Return the cached session (marking it as used), or `default`."""
+        session, evicted = self._lookup(session_id)
+        self._notify(evicted)
+        return default if session is _MISSING else session
+
+    def __getitem__(self, session_id: str) -> Any:
+        session = self.get(session_id, _MISSING)
+        if session is _MISSING:
+            raise KeyError(session_id)
+        return session
+
+    def __contains__(self, session_id: object) -> bool:
+        with self._lock:
+            return self._weak.get(session_id) is not None
+
+    def pop(self, session_id: str, default: Any = _MISSING) -> Any:
+        """Remove a session; eviction hooks are called with reason "removed"."""
+        with self._lock:
+            entry = self._strong.pop(session_id, None)
+            session = self._weak.pop(session_id, None)
+        if entry is not None:
+            session = entry[0]
+            self._notify([(session_id, session, EVICT_REMOVED)])
+        if session is None:
+            if default is _MISSING:
+                raise KeyError(session_id)
+            return default
+        return session
+
+    def clear(self) -> None:
+        with self._lock:
+            evicted = [(sid, entry[0], EVICT_REMOVED) for sid, entry in self._strong.items()]
+            self._strong.clear()
+            self._weak.clear()
+        self._notify(evicted)
+
+    def prune(self) -> int:
+        """Drop the strong references of expired sessions; returns how many."""
+        with self._lock:
+            evicted = self._evict_locked()
+        self._notify(evicted)
+        return len(evicted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._weak)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._weak.keys()))
+
+    def keys(self) -> List[str]:
+        return list(iter(self))
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters: `size`, `strong`, `hits`, `misses`, `evictions`."""
+        with self._lock:
+            return {
+                "size": len(self._weak),
+                "strong": len(self._strong),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _lookup(self, session_id: str) -> Tuple[Any, List[Tuple[str, Any, str]]]:
+        with self._lock:
+            session = self._weak.get(session_id)
+            if session is None:
+                self.misses += 1
+                self._strong.pop(session_id, None)
+                return _MISSING, []
+            self.hits += 1
+            # Still in use elsewhere: promote back into the strongly held set
+            self._strong[session_id] = (session, self._expiry())
+            self._strong.move_to_end(session_id)
+            return session, self._evict_locked()
+
+    def _expiry(self) -> float:
+        return float("inf") if self.ttl is None else self._clock() + self.ttl
+
+    def _evict_locked(self) -> List[Tuple[str, Any, str]]:
+        evicted = []
+        # Entries are ordered by last use, so expired ones are at the front.
+        while self._strong:
+            session_id, (session, expires_at) = next(iter(self._strong.items()))
+            if len(self._strong) > self.max_size:
+                reason = EVICT_CAPACITY
+            elif expires_at <= self._clock():
+                reason = EVICT_EXPIRED
+            else:
+                break
+            del self._strong[session_id]
+            evicted.append((session_id, session, reason))
+        self.evictions += len(evicted)
+        return evicted
+
+    def _notify(self, evicted: List[Tuple[str, Any, str]]) -> None:
+        if not evicted:
+            return
+        with self._lock:
+            hooks = list(self._hooks)
+        for hook in hooks:
+            for session_id, session, reason in evicted:
+                try:
+                    hook(session_id, session, reason)
+                except Exception as e:
+                    _logger.warning(f"Session cache eviction hook failed: {e}")
@@ -1,19 +1,37 @@
-import time
 # DO NOT EDIT THIS FILE MANUALLY.
 # This file is auto-generated by scripts/generate_sync.py
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from .._common.logger import get_logger
 from .._common.models.network import NetworkResult, NetworkStatusResult
 from .._common.models.response import extract_request_id
+from .._common.utils.polling import PollPolicy, retry_after
 from ..api.models import CreateNetworkRequest, DescribeNetworkRequest
+from .polling import poll_until
 
 _logger = get_logger("beta_network")
 
 if TYPE_CHECKING:
     from .agentbay import AgentBay
 
+# DescribeNetwork is retried while the service is unavailable or throttled,
+# waiting as long as a throttling response asks for (0.2 s doubling otherwise)
+_DESCRIBE_ATTEMPTS = 3
+_DESCRIBE_POLICY = PollPolicy(initial_interval=0.2, max_interval=5.0, multiplier=2, jitter=0)
+
+
+def _is_retryable(value: Any) -> bool:
+    if not isinstance(value, Exception):
+        return False
+    error_str = str(value)
+    return (
+        retry_after(value) is not None
+        or "ServiceUnavailable" in error_str
+        or "statusCode': 503" in error_str
+        or "code: 503" in error_str
+    )
+
 
 class SyncBetaNetworkService:
     """
@@ -84,70 +102,77 @@ class SyncBetaNetworkService:
                 error_message="network_id is required",
             )
 
-        max_attempts = 3
-        delay_s = 0.2
-        for attempt in range(1, max_attempts + 1):
-            try:
-                request = DescribeNetworkRequest(
-                    authorization=f"Bearer {self._agent_bay.api_key}",
-                    network_id=network_id,
-                )
-                response = self._agent_bay.client.describe_network(request)
-                request_id = extract_request_id(response) or ""
-
-                if response is None or getattr(response, "body", None) is None:
-                    return NetworkStatusResult(
-                        request_id=request_id,
-                        success=False,
-                        online=False,
-                        error_message="Invalid response from DescribeNetwork API",
-                    )
-
-                body = response.body
-                if getattr(body, "success", None) is None or not body.success:
-                    error_msg = getattr(body, "message", None) or "Unknown error"
-                    code = getattr(body, "code", None)
-                    if code:
-                        error_msg = f"[{code}] {error_msg}"
-                    return NetworkStatusResult(
-                        request_id=request_id,
-                        success=False,
-                        online=False,
-                        error_message=error_msg,
-                    )
-
-                online = False
-                if getattr(body, "data", None) is not None and getattr(body.data, "online", None) is not None:
-                    online = bool(body.data.online)
+        request = DescribeNetworkRequest(
+            authorization=f"Bearer {self._agent_bay.api_key}",
+            network_id=network_id,
+        )
 
-                return NetworkStatusResult(
-                    request_id=request_id,
-                    success=True,
-                    online=online,
-                    error_message="",
-                )
+        def attempt() -> Any:
+            # Errors are returned so that the retry decision sees them
+            try:
+                return self._agent_bay.client.describe_network(request)
             except Exception as e:
-                error_str = str(e)
-                request_id = ""
-                if attempt < max_attempts and (
-                    "ServiceUnavailable" in error_str or "statusCode': 503" in error_str or "code: 503" in error_str
-                ):
-                    time.sleep(delay_s)
-                    delay_s *= 2
-                    continue
-                if "NotFound" in error_str:
-                    return NetworkStatusResult(
-                        request_id=request_id,
-                        success=False,
-                        online=False,
-                        error_message=f"Network {network_id} not found",
-                    )
+                return e
+
+        outcome = poll_until(
+            attempt,
+            done=lambda value: not _is_retryable(value),
+            policy=_DESCRIBE_POLICY,
+            hint=lambda value: retry_after(value) if isinstance(value, Exception) else None,
+            max_probes=_DESCRIBE_ATTEMPTS,
+            raise_errors=True,
+            name="network.describe",
+        )
+        response = outcome.value
+        if isinstance(response, Exception):
+            error_str = str(response)
+            if "NotFound" in error_str:
                 return NetworkStatusResult(
-                    request_id=request_id,
+                    request_id="",
                     success=False,
                     online=False,
-                    error_message=f"Failed to describe network: {e}",
+                    error_message=f"Network {network_id} not found",
                 )
+            return NetworkStatusResult(
+                request_id="",
+                success=False,
+                online=False,
+                error_message=f"Failed to describe network: {response}",
+            )
+
+        request_id = extract_request_id(response) or ""
+
+        if response is None or getattr(response, "body", None) is None:
+            return NetworkStatusResult(
+                request_id=request_id,
+                success=False,
+                online=False,
+                error_message="Invalid response from DescribeNetwork API",
+            )
+
+        body = response.body
+        if getattr(body, "success", None) is None or not body.success:
+            error_msg = getattr(body, "message", None) or "Unknown error"
+            code = getattr(body, "code", None)
+            if code:
+                error_msg = f"[{code}] {error_msg}"
+            return NetworkStatusResult(
+                request_id=request_id,
+                success=False,
+                online=False,
+                error_message=error_msg,
+            )
+
+        online = False
+        if getattr(body, "data", None) is not None and getattr(body.data, "online", None) is not None:
+            online = bool(body.data.online)
+
+        return NetworkStatusResult(
+            request_id=request_id,
+            success=True,
+            online=online,
+            error_message="",
+        )
 
 
 
@@ -0,0 +1,202 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+from playwright.sync_api import sync_playwright
+
+from .._common.exceptions import BrowserError
+from .._common.logger import get_logger
+import threading
+
+if TYPE_CHECKING:
+    from .browser import Browser
+
+_logger = get_logger("browser_connection")
+
+# Seconds a CDP endpoint is reused before GetCdpLink is called again
+ENDPOINT_TTL = 300.0
+
+
+class BrowserConnection:
+    """
+    Reusable CDP connection to the browser of a session.
+
+    Available as `session.browser.connection`. It caches the CDP endpoint for
+    `endpoint_ttl` seconds, keeps one Playwright connection open for the whole
+    session instead of one per caller, and remembers the CDP target id of every
+    page it has seen until the page closes, so that browser agent steps do not
+    open a CDP session each time.
+
+    Example:
+        ```python
+        session.browser.initialize(BrowserOption())
+        browser = session.browser.connection.connect()
+        page = browser.contexts[0].new_page()
+        session.browser.agent.act(ActOptions(action="Click login"), page)
+        session.browser.connection.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        browser: "Browser",
+        endpoint_ttl: float = ENDPOINT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an AsyncBrowserConnection.
+
+        Args:
+            browser (AsyncBrowser): The browser service of the session.
+            endpoint_ttl (float, optional): Seconds the CDP endpoint is reused.
+                Defaults to 300.
+            clock (Callable[[], float], optional): Time source, for tests.
+        """
+        self._browser = browser
+        self.endpoint_ttl = endpoint_ttl
+        self._clock = clock
+        self._endpoint_url: Optional[str] = None
+        self._endpoint_expires = 0.0
+        self._playwright = None
+        self._connected = None
+        self._lock = threading.Lock()
+        # page -> CDP target id, dropped when the page closes or is collected
+        self._targets: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self.endpoint_fetches = 0
+        self.target_lookups = 0
+
+    def get_endpoint_url(self, refresh: bool = False) -> str:
+        """
+        CDP endpoint of the browser, fetched again once older than `endpoint_ttl`.
+
+        Args:
+            refresh (bool, optional): Fetch a new endpoint even if the cached one
+                has not expired. Defaults to False.
+
+        Returns:
+            str: The browser CDP endpoint URL.
+
+        Raises:
+            BrowserError: If the browser is not initialized or the endpoint cannot
+                be retrieved.
+        """
+        if (
+            not refresh
+            and self._endpoint_url is not None
+            and self._clock() < self._endpoint_expires
+        ):
+            return self._endpoint_url
+        url = self._browser._fetch_endpoint_url()
+        self.endpoint_fetches += 1
+        self._endpoint_url = url
+        self._endpoint_expires = self._clock() + self.endpoint_ttl
+        return url
+
+    def invalidate_endpoint(self) -> None:
+        """Forget the cached endpoint; the next use fetches a new one."""
+        self._endpoint_url = None
+        self._endpoint_expires = 0.0
+
+    def connect(self):
+        """
+        Playwright Browser connected over CDP, opened on first use and reused
+        for as long as it stays connected.
+
+        Returns:
+            Browser: The connected Playwright browser.
+
+        Raises:
+            BrowserError: If the connection cannot be established.
+        """
+        with self._lock:
+            if self._connected is not None and self._connected.is_connected():
+                return self._connected
+            try:
+                if self._playwright is None:
+                    self._playwright = sync_playwright().start()
+                try:
+                    connected = self._playwright.chromium.connect_over_cdp(
+                        self.get_endpoint_url()
+                    )
+                except Exception as e:
+                    # The cached link may have expired on the server side
+                    _logger.debug(f"CDP connect failed, retrying with a new endpoint: {e}")
+                    connected = self._playwright.chromium.connect_over_cdp(
+                        self.get_endpoint_url(refresh=True)
+                    )
+            except BrowserError:
+                raise
+            except Exception as e:
+                raise BrowserError(f"Failed to connect to browser over CDP: {e}") from e
+            connected.on("disconnected", self._on_disconnected)
+            self._connected = connected
+            _logger.info("Connected to browser over CDP")
+            return connected
+
+    def page_info(self, page) -> Tuple[str, int]:
+        """
+        CDP target id of `page` and index of its context in the browser.
+
+        The target id is looked up once per page and remembered until the page
+        closes. The context index is read locally each time, since it shifts
+        when an earlier context closes.
+
+        Args:
+            page (Page): A Playwright page of this browser.
+
+        Returns:
+            Tuple[str, int]: (target id, context index).
+
+        Raises:
+            BrowserError: If the target id cannot be determined.
+        """
+        try:
+            target_id = self._targets.get(page)
+            if target_id is None:
+                cdp_session = page.context.new_cdp_session(page)
+                try:
+                    target_info = cdp_session.send("Target.getTargetInfo")
+                finally:
+                    cdp_session.detach()
+                target_id = target_info["targetInfo"]["targetId"]
+                self.target_lookups += 1
+                self._targets[page] = target_id
+                page.once("close", self._forget_page)
+            if hasattr(page.context.browser, "contexts"):
+                context_index = page.context.browser.contexts.index(page.context)
+            else:
+                context_index = 0
+            return target_id, context_index
+        except Exception as e:
+            raise BrowserError(f"Failed to get page/context index: {e}") from e
+
+    def close(self) -> None:
+        """
+        Disconnect from the browser and forget the cached endpoint and pages.
+        The remote browser keeps running; `connect` opens a new connection.
+        """
+        with self._lock:
+            connected, self._connected = self._connected, None
+            playwright, self._playwright = self._playwright, None
+            self._targets = weakref.WeakKeyDictionary()
+            self.invalidate_endpoint()
+            try:
+                if connected is not None:
+                    connected.close()
+                if playwright is not None:
+                    playwright.stop()
+            except Exception as e:
+                _logger.warning(f"Error while closing browser connection: {e}")
+
+    def _forget_page(self, page) -> None:
+        self._targets.pop(page, None)
+
+    def _on_disconnected(self, connected) -> None:
+        if self._connected is connected:
+            self._connected = None
+            self._targets = weakref.WeakKeyDictionary()
+            self.invalidate_endpoint()
+            _logger.info("Browser CDP connection lost; reconnecting on next use")
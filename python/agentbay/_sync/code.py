@@ -1,23 +1,57 @@
 # DO NOT EDIT THIS FILE MANUALLY.
 # This file is auto-generated by scripts/generate_sync.py
 
+import base64
+import binascii
+import codecs
 import json
-from typing import Any, Dict, List, Optional
+import shlex
+import uuid
+from typing import Any, Iterator, Dict, List, Optional, Tuple
 from .._common.exceptions import AgentBayError, CommandError
 from .._common.logger import get_logger
 from .._common.models.code import (
     CodeExecutionResult,
+    CodeOutput,
     EnhancedCodeExecutionResult,
     ExecutionLogs,
     ExecutionResult,
     ExecutionError,
 )
-from .._common.models.response import ApiResponse
+from .._common.models.filesystem import BinaryFileContentResult
+from .._common.models.response import ApiResponse, BoolResult
+from .._common.utils.code_kernel import DEFAULT_INLINE_LIMIT, KERNELS, parse_events
+from .._common.utils.polling import PollPolicy
 from .base_service import BaseService
+from .command import CommandJob
+from .polling import poll_each
+import threading
 
 # Initialize _logger for this module
 _logger = get_logger("code")
 
+_LANGUAGE_ALIASES = {
+    "py": "python",
+    "python3": "python",
+    "js": "javascript",
+    "node": "javascript",
+    "nodejs": "javascript",
+}
+
+# Remote directory holding the kernels and outputs of `create_context()` contexts
+_CONTEXT_ROOT = "/tmp/.agentbay_code"
+
+# Default number of event bytes fetched per poll of a context
+_CONTEXT_CHUNK_BYTES = 256 * 1024
+
+# Extra time a cell gets to stop after the interrupt sent on timeout
+_INTERRUPT_GRACE_S = 5.0
+
+# Largest cell in bytes sent inline with the submit command; larger cells (e.g.
+# data loading scripts) are uploaded through the file system first, so the
+# command line stays well below ARG_MAX and the MQTT message limit
+_INLINE_CELL_BYTES = 8 * 1024
+
 
 class Code(BaseService):
     """
@@ -299,14 +333,7 @@ class Code(BaseService):
             raw_language = "" if language is None else str(language)
             normalized_language = raw_language.strip().lower()
 
-            aliases = {
-                "py": "python",
-                "python3": "python",
-                "js": "javascript",
-                "node": "javascript",
-                "nodejs": "javascript",
-            }
-            canonical_language = aliases.get(normalized_language, normalized_language)
+            canonical_language = _LANGUAGE_ALIASES.get(normalized_language, normalized_language)
 
             supported_languages = {"python", "javascript", "r", "java"}
             if canonical_language not in supported_languages:
@@ -391,3 +418,343 @@ class Code(BaseService):
         Alias of run_code() for better ergonomics and LLM friendliness.
         """
         return self.run_code(code=code, language=language, timeout_s=timeout_s)
+
+    def create_context(
+        self,
+        language: str = "python",
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+        inline_limit: int = DEFAULT_INLINE_LIMIT,
+    ) -> "CodeContext":
+        """
+        Start a persistent execution context that keeps interpreter state
+        (variables, imports, loaded data) between runs.
+
+        The context runs as a background process in the session, so cells are
+        not bound by the 60s limit of `run_code`. Outputs are streamed while a
+        cell runs, and images larger than `inline_limit` stay in the session
+        until fetched with `AsyncCodeContext.fetch_artifact`.
+
+        Args:
+            language: "python" (default) or "javascript". Case-insensitive.
+            cwd: Working directory of the interpreter.
+            envs: Environment variables of the interpreter.
+            inline_limit: Largest image in bytes returned inline with its result.
+                Defaults to 32 KiB.
+
+        Returns:
+            AsyncCodeContext: Handle used to run code and to close the context.
+
+        Raises:
+            CommandError: If the language is not supported or the context could
+                not be started.
+
+        Example:
+            ctx = session.code.create_context("python")
+            ctx.run("import pandas as pd; df = pd.read_csv('/data/big.csv')")
+            result = ctx.run("df.describe()")
+            print(result.result)
+            ctx.close()
+        """
+        raw_language = "" if language is None else str(language)
+        canonical_language = _LANGUAGE_ALIASES.get(
+            raw_language.strip().lower(), raw_language.strip().lower()
+        )
+        if canonical_language not in KERNELS:
+            raise CommandError(
+                f"Unsupported language for code contexts: {raw_language}. "
+                f"Supported languages are {', '.join(repr(k) for k in KERNELS)}"
+            )
+        interpreter, kernel_file, source = KERNELS[canonical_language]
+
+        context_id = uuid.uuid4().hex[:16]
+        context_dir = f"{_CONTEXT_ROOT}/{context_id}"
+        d = shlex.quote(context_dir)
+        encoded = base64.b64encode(source.encode("utf-8")).decode("ascii")
+        setup = self.session.command.execute_command(
+            f"mkdir -p {d}/in {d}/artifacts && : >{d}/events && "
+            f"printf %s {encoded} | base64 -d >{d}/{kernel_file}",
+            timeout_ms=10000,
+        )
+        if not setup.success:
+            raise CommandError(f"Failed to create code context: {setup.error_message}")
+        job = self.session.command.start(
+            f"exec {interpreter} {d}/{kernel_file} {d} {int(inline_limit)}",
+            cwd=cwd,
+            envs=envs,
+        )
+        _logger.debug(f"Started {canonical_language} code context {context_id}")
+        return CodeContext(self, context_id, canonical_language, context_dir, job)
+
+
+class CodeContext:
+    """
+    Persistent code execution context created with `AsyncCode.create_context`.
+
+    Cells run one at a time in the order they are submitted and share one
+    global namespace. Outputs are read from the session by byte offset, so
+    every poll only transfers output not seen before.
+
+    Attributes:
+        context_id (str): Identifier of the context.
+        language (str): Language of the interpreter.
+        context_dir (str): Remote directory holding the kernel, its outputs and
+            its artifacts.
+        job (AsyncCommandJob): Background job running the interpreter.
+    """
+
+    def __init__(
+        self,
+        code: Code,
+        context_id: str,
+        language: str,
+        context_dir: str,
+        job: CommandJob,
+    ):
+        self._service = code
+        self.context_id = context_id
+        self.language = language
+        self.context_dir = context_dir
+        self.job = job
+        self.closed = False
+        self._seq = 0
+        self._offset = 0
+        self._buffer = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._lock = threading.Lock()
+
+    def run(
+        self, code: str, timeout_s: Optional[float] = None
+    ) -> EnhancedCodeExecutionResult:
+        """
+        Run a cell and collect its outputs.
+
+        Args:
+            code: The code to execute. The value of a trailing expression is
+                returned as the main result.
+            timeout_s: Interrupt the cell after this many seconds. Waits
+                indefinitely when None.
+
+        Returns:
+            EnhancedCodeExecutionResult: Logs, rich results and error of the cell.
+                ``success`` is False if the cell raised.
+        """
+        logs = ExecutionLogs()
+        results: List[ExecutionResult] = []
+        error: Optional[ExecutionError] = None
+        execution_count = None
+        execution_time = 0.0
+        try:
+            for output in self.stream(code, timeout_s=timeout_s):
+                if output.type == "stdout":
+                    logs.stdout.append(output.text)
+                elif output.type == "stderr":
+                    logs.stderr.append(output.text)
+                elif output.result is not None:
+                    results.append(output.result)
+                elif output.error is not None:
+                    error = output.error
+                elif output.type == "done":
+                    execution_count = output.execution_count
+                    execution_time = output.execution_time
+        except CommandError as e:
+            return EnhancedCodeExecutionResult(success=False, error_message=str(e))
+        return EnhancedCodeExecutionResult(
+            success=error is None,
+            execution_count=execution_count,
+            execution_time=execution_time,
+            logs=logs,
+            results=results,
+            error=error,
+            error_message="" if error is None else f"{error.name}: {error.value}",
+        )
+
+    def stream(
+        self,
+        code: str,
+        timeout_s: Optional[float] = None,
+        min_interval_ms: int = 50,
+        max_interval_ms: int = 1000,
+    ) -> Iterator[CodeOutput]:
+        """
+        Run a cell and yield its outputs as they are produced.
+
+        Polling is adaptive like `AsyncCommandJob.stream`: the interval starts at
+        ``min_interval_ms``, doubles while the cell is quiet up to
+        ``max_interval_ms``, and drops back as soon as new output arrives.
+
+        Args:
+            code: The code to execute.
+            timeout_s: Interrupt the cell after this many seconds. Waits
+                indefinitely when None.
+            min_interval_ms: Shortest pause between polls in milliseconds.
+            max_interval_ms: Longest pause between polls in milliseconds.
+
+        Yields:
+            CodeOutput: stdout/stderr text, display and result outputs, an error
+                if the cell raised, and finally a "done" output.
+
+        Raises:
+            CommandError: If the context is closed or its output cannot be read.
+        """
+        with self._lock:
+            seq = self._submit(code)
+
+            def probe() -> Tuple[List[CodeOutput], Optional[int]]:
+                outputs, kernel_exit = self._poll()
+                return [output for output in outputs if output.seq == seq], kernel_exit
+
+            def finished(polled: Tuple[List[CodeOutput], Optional[int]]) -> bool:
+                outputs, kernel_exit = polled
+                return kernel_exit is not None or any(o.type == "done" for o in outputs)
+
+            min_interval = min_interval_ms / 1000.0
+            policy = PollPolicy(
+                initial_interval=min_interval,
+                max_interval=max_interval_ms / 1000.0,
+                multiplier=2,
+                jitter=0,
+            )
+            timeout = timeout_s
+            # On timeout the cell is interrupted and gets a grace period to stop
+            for interrupted in (False, True):
+                done = False
+                for outputs, kernel_exit in poll_each(
+                    probe,
+                    done=finished,
+                    timeout=timeout,
+                    policy=policy,
+                    # New output restarts the backoff from the shortest interval
+                    hint=lambda polled: min_interval if polled[0] else None,
+                    raise_errors=True,
+                    name="code.context_stream",
+                ):
+                    for output in outputs:
+                        yield output
+                        if output.type == "done":
+                            done = True
+                            break
+                    if not done and kernel_exit is not None:
+                        for output in self._failure(
+                            seq, "KernelExited", f"The interpreter exited with code {kernel_exit}"
+                        ):
+                            yield output
+                        done = True
+                if done:
+                    return
+                if interrupted:
+                    for output in self._failure(
+                        seq, "TimeoutError", f"Cell did not finish within {timeout_s}s"
+                    ):
+                        yield output
+                    return
+                self.interrupt()
+                timeout = _INTERRUPT_GRACE_S
+
+    def fetch_artifact(self, artifact) -> BinaryFileContentResult:
+        """
+        Download an artifact (a large image) referenced by a result.
+
+        Args:
+            artifact: A CodeArtifact from `ExecutionResult.artifacts`, or its path.
+
+        Returns:
+            BinaryFileContentResult: The artifact's bytes.
+        """
+        path = artifact if isinstance(artifact, str) else artifact.path
+        return self._service.session.file_system.read_file(path, format="bytes")
+
+    def interrupt(self) -> BoolResult:
+        """
+        Interrupt the running cell (KeyboardInterrupt in Python). The context and
+        its state stay available. JavaScript cells cannot be interrupted.
+        """
+        d = shlex.quote(self.context_dir)
+        result = self._service.session.command.execute_command(
+            f"kill -INT $(cat {d}/kernel.pid)", timeout_ms=10000
+        )
+        return BoolResult(
+            request_id=result.request_id,
+            success=result.success,
+            data=result.success,
+            error_message=result.error_message,
+        )
+
+    def close(self) -> BoolResult:
+        """Stop the interpreter and remove the context's files, artifacts included."""
+        self.closed = True
+        self.job.kill("KILL")
+        result = self._service.session.command.execute_command(
+            f"rm -rf {shlex.quote(self.context_dir)} {shlex.quote(self.job.job_dir)}",
+            timeout_ms=10000,
+        )
+        return BoolResult(
+            request_id=result.request_id,
+            success=result.success,
+            data=result.success,
+            error_message=result.error_message,
+        )
+
+    def _submit(self, code: str) -> int:
+        if self.closed:
+            raise CommandError(f"Code context {self.context_id} is closed")
+        self._seq += 1
+        d = shlex.quote(self.context_dir)
+        pending = f"{d}/in/{self._seq}.tmp"
+        data = code.encode("utf-8")
+        if len(data) > _INLINE_CELL_BYTES:
+            uploaded = self._service.session.file_system.write_file(
+                f"{self.context_dir}/in/{self._seq}.tmp", code
+            )
+            if not uploaded.success:
+                raise CommandError(f"Failed to submit code: {uploaded.error_message}")
+            write = ""
+        else:
+            encoded = base64.b64encode(data).decode("ascii")
+            write = f"printf %s {encoded} | base64 -d >{pending} && "
+        # Written under a temporary name so the kernel never sees a partial cell
+        result = self._service.session.command.execute_command(
+            f"{write}mv {pending} {d}/in/{self._seq}.code",
+            timeout_ms=10000,
+        )
+        if not result.success:
+            raise CommandError(f"Failed to submit code: {result.error_message}")
+        return self._seq
+
+    def _poll(self) -> Tuple[List[CodeOutput], Optional[int]]:
+        d = shlex.quote(self.context_dir)
+        # The exit file is read first: once it exists the kernel has stopped
+        # writing, so the events read afterwards are complete.
+        script = (
+            f"test -d {d} || exit 44; "
+            f"printf '%s\\n' \"$(cat {shlex.quote(self.job.job_dir)}/exit 2>/dev/null)\"; "
+            f"tail -c +{self._offset + 1} {d}/events | head -c {_CONTEXT_CHUNK_BYTES} "
+            f"| base64 | tr -d '\\n'; echo"
+        )
+        result = self._service.session.command.execute_command(script, timeout_ms=10000)
+        if not result.success:
+            raise CommandError(
+                f"Code context {self.context_id} not found"
+                if result.exit_code == 44
+                else result.error_message or "Failed to read code context output"
+            )
+        lines = (result.stdout or "").split("\n")
+        lines += [""] * (2 - len(lines))
+        try:
+            data = base64.b64decode(lines[1].strip())
+        except (ValueError, binascii.Error) as e:
+            raise CommandError(f"Failed to decode code context output: {e}")
+        self._offset += len(data)
+        outputs, self._buffer = parse_events(self._buffer + self._decoder.decode(data))
+        exit_text = lines[0].strip()
+        drained = len(data) < _CONTEXT_CHUNK_BYTES
+        if exit_text.lstrip("-").isdigit() and drained:
+            return outputs, int(exit_text)
+        return outputs, None
+
+    @staticmethod
+    def _failure(seq: int, name: str, message: str) -> List[CodeOutput]:
+        return [
+            CodeOutput(type="error", seq=seq, error=ExecutionError(name, message, "")),
+            CodeOutput(type="done", seq=seq),
+        ]
@@ -1,18 +1,59 @@
 # DO NOT EDIT THIS FILE MANUALLY.
 # This file is auto-generated by scripts/generate_sync.py
 
+import base64
+import binascii
+import codecs
 import json
-from typing import Any, Dict, Optional
+import shlex
+import time
+import uuid
+from typing import Any, Iterator, Dict, List, Optional
 
 from .._common.exceptions import AgentBayError, CommandError
 from .._common.logger import get_logger
-from .._common.models.command import CommandResult
-from .._common.models.response import ApiResponse
+from .._common.models.command import (
+    CommandBatchResult,
+    CommandJobChunk,
+    CommandResult,
+)
+from .._common.models.response import ApiResponse, BoolResult
+from .._common.utils.polling import PollPolicy
 from .base_service import BaseService
+from .polling import poll_each
 
 # Initialize _logger for this module
 _logger = get_logger("command")
 
+# Remote directory holding the output files of background jobs started by `start()`
+_JOB_ROOT = "/tmp/.agentbay_jobs"
+
+# Default number of bytes fetched per stream and poll for background jobs
+_JOB_CHUNK_BYTES = 256 * 1024
+
+_SIGNALS = {"HUP": 1, "INT": 2, "KILL": 9, "TERM": 15}
+
+# Header line prefix separating per-command output in `run_batch`
+_BATCH_MARKER = "@@agentbay-batch"
+
+
+def _validate_envs(envs: Optional[Dict[str, str]]) -> None:
+    """Raise ValueError unless every environment variable key and value is a string."""
+    if envs is None:
+        return
+    invalid_vars = []
+    for key, value in envs.items():
+        if not isinstance(key, str):
+            invalid_vars.append(f"key '{key}' (type: {type(key).__name__})")
+        if not isinstance(value, str):
+            invalid_vars.append(f"value for key '{key}' (type: {type(value).__name__})")
+
+    if invalid_vars:
+        raise ValueError(
+            f"Invalid environment variables: all keys and values must be strings. "
+            f"Found invalid entries: {', '.join(invalid_vars)}"
+        )
+
 
 class Command(BaseService):
     """
@@ -78,19 +119,7 @@ class Command(BaseService):
             session.delete()
         """
         # Validate environment variables - strict type checking (before try block to allow ValueError to propagate)
-        if envs is not None:
-            invalid_vars = []
-            for key, value in envs.items():
-                if not isinstance(key, str):
-                    invalid_vars.append(f"key '{key}' (type: {type(key).__name__})")
-                if not isinstance(value, str):
-                    invalid_vars.append(f"value for key '{key}' (type: {type(value).__name__})")
-
-            if invalid_vars:
-                raise ValueError(
-                    f"Invalid environment variables: all keys and values must be strings. "
-                    f"Found invalid entries: {', '.join(invalid_vars)}"
-                )
+        _validate_envs(envs)
 
         try:
             # Limit timeout to maximum 50s (50000ms) as per SDK constraints
@@ -230,3 +259,453 @@ class Command(BaseService):
             cwd=cwd,
             envs=envs,
         )
+
+    def run_batch(
+        self,
+        commands: List[str],
+        stop_on_error: bool = True,
+        parallel: bool = False,
+        timeout_ms: int = 50000,
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+    ) -> CommandBatchResult:
+        """
+        Run several shell commands in a single remote invocation.
+
+        The commands are wrapped in one script that captures each command's stdout,
+        stderr, exit code and wall time separately and prints them back with
+        per-command framing, so N commands cost one round trip instead of N.
+
+        Args:
+            commands: The shell commands to run
+            stop_on_error: Skip the remaining commands after the first non-zero exit
+                code. Ignored when ``parallel`` is True. Defaults to True
+            parallel: Run all commands concurrently inside the session. Only use
+                this for independent commands. Defaults to False
+            timeout_ms: Timeout for the whole batch in milliseconds. Capped at
+                50000ms like `execute_command`
+            cwd: The working directory for all commands
+            envs: Environment variables applied to all commands
+
+        Returns:
+            CommandBatchResult: One `CommandResult` per command, in input order,
+                with ``duration_ms`` set when the session can measure it. Skipped
+                commands have ``success`` False and ``exit_code`` -1.
+
+        Raises:
+            ValueError: If envs contains non-string keys or values
+
+        Example:
+            result = session.command.run_batch(
+                ["pip install -q requests", "mkdir -p /workspace/data", "git --version"],
+            )
+            for r in result.results:
+                print(r.exit_code, r.duration_ms, r.stdout)
+        """
+        _validate_envs(envs)
+        if not commands:
+            return CommandBatchResult(success=True)
+
+        start = time.monotonic()
+        prefix = ""
+        if envs:
+            prefix = "env " + " ".join(shlex.quote(f"{k}={v}") for k, v in envs.items()) + " "
+        lines = ['d=$(mktemp -d) || exit 1', "ok=1"]
+        if cwd is not None:
+            lines.append(f"cd {shlex.quote(cwd)} || exit 1")
+        for i, cmd in enumerate(commands):
+            step = (
+                f'{{ s=$(date +%s%N); {prefix}sh -c {shlex.quote(cmd)} >"$d/{i}.out" '
+                f'2>"$d/{i}.err" </dev/null; echo $? >"$d/{i}.rc"; '
+                f'echo "$s $(date +%s%N)" >"$d/{i}.t"; }}'
+            )
+            if parallel:
+                lines.append(step + " &")
+            elif stop_on_error:
+                lines.append(
+                    f'if [ $ok = 1 ]; then {step}; [ "$(cat "$d/{i}.rc")" = 0 ] || ok=0; fi'
+                )
+            else:
+                lines.append(step)
+        if parallel:
+            lines.append("wait")
+        lines.append(
+            f"i=0; while [ $i -lt {len(commands)} ]; do "
+            f'if [ -f "$d/$i.rc" ]; then '
+            f'echo "{_BATCH_MARKER} $i $(cat "$d/$i.rc") $(cat "$d/$i.t" 2>/dev/null)"; '
+            f"base64 <\"$d/$i.out\" | tr -d '\\n'; echo; "
+            f"base64 <\"$d/$i.err\" | tr -d '\\n'; echo; "
+            f"fi; i=$((i+1)); done"
+        )
+        lines.append('rm -rf "$d"')
+
+        result = self.execute_command("\n".join(lines), timeout_ms=timeout_ms)
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        if not result.success:
+            return CommandBatchResult(
+                request_id=result.request_id,
+                success=False,
+                elapsed_ms=elapsed_ms,
+                error_message=result.error_message or "Failed to execute command batch",
+            )
+
+        results: List[Optional[CommandResult]] = [None] * len(commands)
+        out_lines = (result.stdout or "").split("\n")
+        try:
+            for pos, line in enumerate(out_lines):
+                if not line.startswith(_BATCH_MARKER + " "):
+                    continue
+                fields = line.split()
+                index, exit_code = int(fields[1]), int(fields[2])
+                duration_ms = None
+                if len(fields) >= 5 and fields[3].isdigit() and fields[4].isdigit():
+                    duration_ms = (int(fields[4]) - int(fields[3])) // 1_000_000
+                stdout = base64.b64decode(out_lines[pos + 1]).decode("utf-8", "replace")
+                stderr = base64.b64decode(out_lines[pos + 2]).decode("utf-8", "replace")
+                results[index] = CommandResult(
+                    request_id=result.request_id,
+                    success=exit_code == 0,
+                    output=stdout + stderr,
+                    exit_code=exit_code,
+                    stdout=stdout,
+                    stderr=stderr,
+                    error_message="" if exit_code == 0 else stderr,
+                    duration_ms=duration_ms,
+                )
+        except (IndexError, ValueError, binascii.Error) as e:
+            return CommandBatchResult(
+                request_id=result.request_id,
+                success=False,
+                elapsed_ms=elapsed_ms,
+                error_message=f"Failed to parse command batch output: {e}",
+            )
+
+        final = [
+            r
+            if r is not None
+            else CommandResult(
+                request_id=result.request_id,
+                success=False,
+                exit_code=-1,
+                error_message="Skipped after an earlier command failed",
+            )
+            for r in results
+        ]
+        return CommandBatchResult(
+            request_id=result.request_id,
+            success=all(r.success for r in final),
+            results=final,
+            elapsed_ms=elapsed_ms,
+        )
+
+    def start(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+    ) -> "CommandJob":
+        """
+        Start a shell command in the background and return a job handle.
+
+        Unlike `execute_command`, the command is not bound by the 50s tool timeout.
+        Its stdout and stderr are written to files inside the session, and the
+        returned job reads them incrementally by byte offset.
+
+        Args:
+            command: The shell command to run
+            cwd: The working directory for the command. If not specified, the
+                command runs in the default session directory
+            envs: Environment variables as a dictionary of key-value pairs
+
+        Returns:
+            AsyncCommandJob: Handle used to stream output, wait for completion and
+                kill the job.
+
+        Raises:
+            ValueError: If envs contains non-string keys or values
+            CommandError: If the job could not be started
+
+        Example:
+            job = session.command.start("make -j8 all", cwd="/workspace")
+            async for chunk in job.stream():
+                print(chunk.stdout, end="")
+            print(job.exit_code)
+        """
+        _validate_envs(envs)
+
+        job_id = uuid.uuid4().hex[:16]
+        job_dir = f"{_JOB_ROOT}/{job_id}"
+        d = shlex.quote(job_dir)
+        run = "sh -c " + shlex.quote(command)
+        if envs:
+            run = (
+                "env "
+                + " ".join(shlex.quote(f"{k}={v}") for k, v in envs.items())
+                + " "
+                + run
+            )
+        wrapper = (
+            f"{run} >{d}/stdout 2>{d}/stderr </dev/null; "
+            f"echo $? >{d}/exit.tmp; mv {d}/exit.tmp {d}/exit"
+        )
+        if cwd is not None:
+            wrapper = (
+                f"cd {shlex.quote(cwd)} 2>{d}/stderr || "
+                f"{{ echo 1 >{d}/exit; exit 1; }}; " + wrapper
+            )
+        launcher = (
+            f"mkdir -p {d} || exit 1; : >{d}/stdout; : >{d}/stderr; "
+            f"$(command -v setsid) nohup sh -c {shlex.quote(wrapper)} "
+            f">/dev/null 2>&1 </dev/null & echo $! >{d}/pid; echo $!"
+        )
+
+        result = self.execute_command(launcher, timeout_ms=10000)
+        pid_text = (result.stdout or result.output or "").strip()
+        if not result.success or not pid_text.isdigit():
+            raise CommandError(
+                f"Failed to start background job: {result.error_message or pid_text}"
+            )
+        _logger.debug(f"Started background job {job_id} (pid {pid_text})")
+        return CommandJob(self, job_id, job_dir, int(pid_text), command)
+
+
+class CommandJob:
+    """
+    Handle for a background command started with `AsyncCommand.start`.
+
+    Output is read by byte offset, so every poll only transfers bytes that were
+    not seen before. Jobs are plain objects without threads or tasks of their
+    own, so many of them can be polled concurrently from one event loop.
+
+    Attributes:
+        job_id (str): Identifier of the job.
+        job_dir (str): Remote directory holding the job's pid, output and exit files.
+        pid (int): Remote process id of the job.
+        command (str): The command being run.
+        exit_code (Optional[int]): Exit code once the job has exited.
+    """
+
+    def __init__(
+        self, command: Command, job_id: str, job_dir: str, pid: int, cmd: str
+    ):
+        self._service = command
+        self.job_id = job_id
+        self.job_dir = job_dir
+        self.pid = pid
+        self.command = cmd
+        self.exit_code: Optional[int] = None
+        self.stdout_offset = 0
+        self.stderr_offset = 0
+        self._finished = False
+        self._stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._stderr_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    @property
+    def finished(self) -> bool:
+        """True when the job has exited and all of its output has been read."""
+        return self._finished
+
+    def poll(self, max_bytes: int = _JOB_CHUNK_BYTES) -> CommandJobChunk:
+        """
+        Read new output and the exit status in a single round trip.
+
+        Args:
+            max_bytes: Maximum number of bytes read from each stream.
+
+        Returns:
+            CommandJobChunk: Output produced since the previous read.
+        """
+        d = shlex.quote(self.job_dir)
+        # The exit file is read first: once it exists the job has stopped writing,
+        # so the output read afterwards is complete.
+        script = (
+            f"test -d {d} || exit 44; "
+            f"printf '%s\\n' \"$(cat {d}/exit 2>/dev/null)\"; "
+            f"tail -c +{self.stdout_offset + 1} {d}/stdout 2>/dev/null "
+            f"| head -c {max_bytes} | base64 | tr -d '\\n'; echo; "
+            f"tail -c +{self.stderr_offset + 1} {d}/stderr 2>/dev/null "
+            f"| head -c {max_bytes} | base64 | tr -d '\\n'; echo"
+        )
+        result = self._service.execute_command(script, timeout_ms=10000)
+        if not result.success:
+            message = (
+                f"Background job {self.job_id} not found"
+                if result.exit_code == 44
+                else result.error_message or "Failed to read job output"
+            )
+            return CommandJobChunk(
+                request_id=result.request_id,
+                success=False,
+                stdout_offset=self.stdout_offset,
+                stderr_offset=self.stderr_offset,
+                exit_code=self.exit_code,
+                error_message=message,
+            )
+
+        lines = (result.stdout or "").split("\n")
+        lines += [""] * (3 - len(lines))
+        try:
+            out = base64.b64decode(lines[1].strip())
+            err = base64.b64decode(lines[2].strip())
+        except (ValueError, binascii.Error) as e:
+            return CommandJobChunk(
+                request_id=result.request_id,
+                success=False,
+                stdout_offset=self.stdout_offset,
+                stderr_offset=self.stderr_offset,
+                exit_code=self.exit_code,
+                error_message=f"Failed to decode job output: {e}",
+            )
+
+        exit_text = lines[0].strip()
+        if exit_text.lstrip("-").isdigit():
+            self.exit_code = int(exit_text)
+        self.stdout_offset += len(out)
+        self.stderr_offset += len(err)
+        drained = len(out) < max_bytes and len(err) < max_bytes
+        self._finished = self.exit_code is not None and drained
+        return CommandJobChunk(
+            request_id=result.request_id,
+            success=True,
+            stdout=self._stdout_decoder.decode(out, final=self._finished),
+            stderr=self._stderr_decoder.decode(err, final=self._finished),
+            stdout_offset=self.stdout_offset,
+            stderr_offset=self.stderr_offset,
+            exit_code=self.exit_code,
+            finished=self._finished,
+        )
+
+    def stream(
+        self,
+        min_interval_ms: int = 100,
+        max_interval_ms: int = 2000,
+        timeout_ms: Optional[int] = None,
+    ) -> Iterator[CommandJobChunk]:
+        """
+        Yield output chunks until the job finishes.
+
+        Polling is adaptive: the interval starts at ``min_interval_ms``, doubles
+        while the job is quiet up to ``max_interval_ms``, and drops back as soon as
+        new output arrives.
+
+        Args:
+            min_interval_ms: Shortest pause between polls in milliseconds.
+            max_interval_ms: Longest pause between polls in milliseconds.
+            timeout_ms: Stop streaming after this many milliseconds. The job keeps
+                running; check `finished` to tell the cases apart.
+
+        Yields:
+            CommandJobChunk: Chunks with new output, the final chunk with
+                ``finished=True``, or a chunk with ``success=False`` if reading
+                failed, after which the stream stops.
+        """
+        if self._finished:
+            return
+        min_interval = min_interval_ms / 1000.0
+        policy = PollPolicy(
+            initial_interval=min_interval,
+            max_interval=max_interval_ms / 1000.0,
+            multiplier=2,
+            jitter=0,
+        )
+        for chunk in poll_each(
+            self.poll,
+            done=lambda chunk: not chunk.success or chunk.finished,
+            timeout=None if timeout_ms is None else timeout_ms / 1000.0,
+            policy=policy,
+            # New output restarts the backoff from the shortest interval
+            hint=lambda chunk: min_interval if chunk.stdout or chunk.stderr else None,
+            raise_errors=True,
+            name="command.job_stream",
+        ):
+            if not chunk.success or chunk.finished or chunk.stdout or chunk.stderr:
+                yield chunk
+
+    def wait(self, timeout_ms: Optional[int] = None) -> CommandResult:
+        """
+        Wait for the job to exit.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds. Waits indefinitely
+                when None.
+
+        Returns:
+            CommandResult: Exit code plus the stdout/stderr not already consumed
+                through `stream()` or `poll()`. ``success`` is False on timeout,
+                read errors, or a non-zero exit code.
+        """
+        stdout_parts = []
+        stderr_parts = []
+        for chunk in self.stream(timeout_ms=timeout_ms):
+            if not chunk.success:
+                return CommandResult(
+                    request_id=chunk.request_id,
+                    success=False,
+                    error_message=chunk.error_message,
+                )
+            stdout_parts.append(chunk.stdout)
+            stderr_parts.append(chunk.stderr)
+
+        stdout = "".join(stdout_parts)
+        stderr = "".join(stderr_parts)
+        if not self._finished:
+            return CommandResult(
+                success=False,
+                output=stdout + stderr,
+                stdout=stdout,
+                stderr=stderr,
+                error_message=f"Timed out waiting for background job {self.job_id}",
+            )
+        return CommandResult(
+            success=self.exit_code == 0,
+            output=stdout + stderr,
+            exit_code=self.exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            error_message="" if self.exit_code == 0 else stderr,
+        )
+
+    def kill(self, signal: str = "TERM") -> BoolResult:
+        """
+        Send a signal to the job's process group.
+
+        Args:
+            signal: One of "TERM", "KILL", "INT" or "HUP". Defaults to "TERM".
+
+        Returns:
+            BoolResult: Whether the signal was delivered. If the process is gone,
+                the exit code is recorded as ``128 + signal number``.
+        """
+        name = signal.upper().replace("SIG", "", 1)
+        if name not in _SIGNALS:
+            raise ValueError(f"Invalid signal '{signal}'. Must be one of {list(_SIGNALS)}")
+        d = shlex.quote(self.job_dir)
+        # A killed job never writes its own exit file, so record one once the
+        # process is gone (or only a zombie is left).
+        script = (
+            f"kill -s {name} -- -{self.pid} 2>/dev/null || kill -s {name} {self.pid}; "
+            f"rc=$?; for i in 1 2 3 4 5 6 7 8 9 10; do "
+            f"test -d /proc/{self.pid} && ! grep -q '^State:[[:space:]]*Z' "
+            f"/proc/{self.pid}/status 2>/dev/null || break; sleep 0.1; done; "
+            f"if test $i -lt 10 || ! test -d /proc/{self.pid}; then "
+            f"test -f {d}/exit || echo {128 + _SIGNALS[name]} >{d}/exit; fi; exit $rc"
+        )
+        result = self._service.execute_command(script, timeout_ms=10000)
+        return BoolResult(
+            request_id=result.request_id,
+            success=result.success,
+            data=result.success,
+            error_message=result.error_message,
+        )
+
+    def cleanup(self) -> BoolResult:
+        """Remove the job's remote output files. Call after the job has finished."""
+        result = self._service.execute_command(
+            f"rm -rf {shlex.quote(self.job_dir)}", timeout_ms=10000
+        )
+        return BoolResult(
+            request_id=result.request_id,
+            success=result.success,
+            data=result.success,
+            error_message=result.error_message,
+        )
@@ -9,12 +9,14 @@ application management, and screen operations.
 
 import json
 import base64
+import time
 import warnings
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .._common.exceptions import AgentBayError
 from .._common.models.computer import (
+    ActionBatchResult,
     AppOperationResult,
     InstalledApp,
     InstalledAppListResult,
@@ -29,9 +31,167 @@ from .._common.models.computer import (
     WindowListResult,
 )
 from .._common.models.response import ApiResponse, BoolResult, OperationResult
+from .._common.models.screenshot import VisualWaitResult
+from .._common.utils.frame_diff import FrameSignature
 from .base_service import BaseService
 
 
+def _watch_screen(
+    capture: Callable[[], Any],
+    region: Optional[Tuple[int, int, int, int]],
+    timeout_ms: int,
+    interval_ms: int,
+    threshold: float,
+    stable_ms: Optional[int] = None,
+) -> VisualWaitResult:
+    """
+    Capture frames until the watched area changes (``stable_ms`` is None) or
+    stays unchanged for ``stable_ms`` milliseconds.
+
+    Frames are captured back to back with at most ``interval_ms`` between them,
+    and each new frame is compared against a grid signature of the reference
+    frame instead of full pixel data.
+    """
+    start = time.monotonic()
+    deadline = start + timeout_ms / 1000.0
+    reference = None
+    stable_since = start
+    last_shot = None
+    ratio = 0.0
+    frames = 0
+
+    while True:
+        try:
+            last_shot = capture()
+            signature = FrameSignature.from_png(last_shot.data)
+        except (AgentBayError, ValueError) as e:
+            return VisualWaitResult(
+                request_id=getattr(last_shot, "request_id", ""),
+                success=False,
+                error_message=f"Failed to capture frame: {e}",
+                changed_ratio=ratio,
+                elapsed_ms=int((time.monotonic() - start) * 1000),
+                frames=frames,
+                screenshot=last_shot,
+            )
+        frames += 1
+        now = time.monotonic()
+
+        if reference is None:
+            reference = signature
+            stable_since = now
+        else:
+            ratio = signature.diff(reference, region)
+            if stable_ms is None:
+                if ratio > threshold:
+                    return VisualWaitResult(
+                        request_id=last_shot.request_id,
+                        success=True,
+                        changed_ratio=ratio,
+                        elapsed_ms=int((now - start) * 1000),
+                        frames=frames,
+                        screenshot=last_shot,
+                    )
+            elif ratio > threshold:
+                reference = signature
+                stable_since = now
+            elif (now - stable_since) * 1000 >= stable_ms:
+                return VisualWaitResult(
+                    request_id=last_shot.request_id,
+                    success=True,
+                    changed_ratio=ratio,
+                    elapsed_ms=int((now - start) * 1000),
+                    frames=frames,
+                    screenshot=last_shot,
+                )
+
+        if now >= deadline:
+            what = "change" if stable_ms is None else "become stable"
+            return VisualWaitResult(
+                request_id=last_shot.request_id,
+                success=False,
+                error_message=f"Timed out after {timeout_ms}ms waiting for screen to {what}",
+                changed_ratio=ratio,
+                elapsed_ms=int((now - start) * 1000),
+                frames=frames,
+                screenshot=last_shot,
+            )
+        time.sleep(min(interval_ms / 1000.0, max(0.0, deadline - now)))
+
+
+def _run_action_batch(
+    service: Any,
+    allowed: Tuple[str, ...],
+    actions: List[Dict[str, Any]],
+    delay_ms: int,
+    stop_on_error: bool,
+) -> ActionBatchResult:
+    """
+    Validate and execute a list of input actions in order on ``service``.
+
+    Every action is a dict with an ``action`` key naming one of ``allowed`` (or
+    ``"wait"`` with an ``ms`` value); the remaining keys are passed to the method
+    as keyword arguments. An optional per-action ``delay_ms`` overrides the batch
+    delay applied after that step.
+
+    Steps are not pipelined: each one is a separate MCP call awaited before the
+    next is sent, because input actions depend on the UI state left by the
+    previous ones and the backend has no batched input tool. A batch therefore
+    takes as long as the same calls made one by one.
+    """
+    steps = []
+    for index, action in enumerate(actions):
+        if not isinstance(action, dict) or "action" not in action:
+            raise ValueError(
+                f"Invalid action at index {index}: expected a dict with an 'action' key"
+            )
+        name = action["action"]
+        if name != "wait" and name not in allowed:
+            raise ValueError(
+                f"Invalid action '{name}' at index {index}. Must be one of "
+                f"{list(allowed) + ['wait']}"
+            )
+        kwargs = {k: v for k, v in action.items() if k not in ("action", "delay_ms")}
+        steps.append((name, kwargs, action.get("delay_ms", delay_ms)))
+
+    start = time.monotonic()
+    results: List[Any] = []
+    request_id = ""
+    failed_index = None
+    error_message = ""
+    for index, (name, kwargs, pause_ms) in enumerate(steps):
+        if name == "wait":
+            time.sleep(max(0, kwargs.get("ms", 0)) / 1000.0)
+            result = BoolResult(success=True, data=True)
+        else:
+            try:
+                result = getattr(service, name)(**kwargs)
+            except Exception as e:
+                result = BoolResult(
+                    success=False, data=None, error_message=f"Failed to {name}: {e}"
+                )
+        results.append(result)
+        request_id = getattr(result, "request_id", "") or request_id
+
+        if not result.success:
+            if failed_index is None:
+                failed_index = index
+                error_message = result.error_message
+            if stop_on_error:
+                break
+        if pause_ms and index < len(steps) - 1:
+            time.sleep(pause_ms / 1000.0)
+
+    return ActionBatchResult(
+        request_id=request_id,
+        success=failed_index is None,
+        results=results,
+        failed_index=failed_index,
+        elapsed_ms=int((time.monotonic() - start) * 1000),
+        error_message=error_message,
+    )
+
+
 class Computer(BaseService):
     """
     Handles computer UI automation operations in the AgentBay cloud environment.
@@ -355,6 +515,69 @@ class Computer(BaseService):
                 error_message=f"Failed to scroll: {str(e)}",
             )
 
+    def batch(
+        self,
+        actions: List[Dict[str, Any]],
+        delay_ms: int = 0,
+        stop_on_error: bool = True,
+    ) -> ActionBatchResult:
+        """
+        Executes a sequence of mouse and keyboard actions in order.
+
+        Each action is a dict whose ``action`` key names a Computer input method and
+        whose other keys are that method's arguments. Supported actions:
+        ``click_mouse``, ``move_mouse``, ``drag_mouse``, ``scroll``, ``input_text``,
+        ``press_keys``, ``release_keys`` and ``wait`` (pause for ``ms`` milliseconds).
+
+        Args:
+            actions (List[Dict[str, Any]]): The actions to execute.
+            delay_ms (int, optional): Pause after every step in milliseconds. A step
+                can override it with its own ``delay_ms`` key. Defaults to 0.
+            stop_on_error (bool, optional): Stop at the first failed step.
+                Defaults to True.
+
+        Returns:
+            ActionBatchResult: Per-step results in ``results``; ``failed_index`` and
+                ``error_message`` describe the first failed step, if any.
+
+        Raises:
+            ValueError: If an action is malformed or not supported. Validation happens
+                before any step is executed.
+
+        Note:
+            Every step is still one MCP call, made after the previous step returned;
+            a batch does not reduce the number of round trips.
+
+        Example:
+            ```python
+            session = (agent_bay.create()).session
+            result = session.computer.batch([
+                {"action": "click_mouse", "x": 200, "y": 300},
+                {"action": "input_text", "text": "alice"},
+                {"action": "press_keys", "keys": ["Tab"]},
+                {"action": "input_text", "text": "secret", "delay_ms": 200},
+                {"action": "press_keys", "keys": ["Enter"]},
+            ], delay_ms=50)
+            print(result.success, len(result.results))
+            session.delete()
+            ```
+        """
+        return _run_action_batch(
+            self,
+            (
+                "click_mouse",
+                "move_mouse",
+                "drag_mouse",
+                "scroll",
+                "input_text",
+                "press_keys",
+                "release_keys",
+            ),
+            actions,
+            delay_ms,
+            stop_on_error,
+        )
+
     def get_cursor_position(self) -> OperationResult:
         """
         Gets the current cursor position.
@@ -794,6 +1017,104 @@ class Computer(BaseService):
             height=height,
         )
 
+    def wait_for_visual_change(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        timeout_ms: int = 10000,
+        interval_ms: int = 100,
+        threshold: float = 0.0,
+    ) -> VisualWaitResult:
+        """
+        Waits until the screen (or a region of it) changes.
+
+        The first captured frame is the reference; later frames are compared with
+        it using a coarse grid of per-cell digests, so the call returns as soon as
+        the UI reacts instead of after a fixed sleep.
+
+        Args:
+            region (Optional[Tuple[int, int, int, int]], optional): ``(x, y, width, height)``
+                rectangle in screenshot pixels to watch. Defaults to the whole screen.
+            timeout_ms (int, optional): Maximum time to wait in milliseconds.
+                Defaults to 10000.
+            interval_ms (int, optional): Maximum pause between two captures in
+                milliseconds. Defaults to 100.
+            threshold (float, optional): Fraction of the watched area that must
+                differ to count as a change. Defaults to 0.0 (any change).
+
+        Returns:
+            VisualWaitResult: ``success`` is True when a change was detected. On
+                timeout ``success`` is False and ``error_message`` is set. The last
+                captured frame is available as ``screenshot``.
+
+        Example:
+            ```python
+            session = (agent_bay.create()).session
+            session.computer.click_mouse(100, 200)
+            result = session.computer.wait_for_visual_change(timeout_ms=5000)
+            print(result.success, result.elapsed_ms)
+            session.delete()
+            ```
+
+        See Also:
+            wait_until_stable, beta_take_screenshot
+        """
+        return _watch_screen(
+            lambda: self.beta_take_screenshot(format="png"),
+            region,
+            timeout_ms,
+            interval_ms,
+            threshold,
+        )
+
+    def wait_until_stable(
+        self,
+        stable_ms: int = 500,
+        timeout_ms: int = 10000,
+        interval_ms: int = 100,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        threshold: float = 0.0,
+    ) -> VisualWaitResult:
+        """
+        Waits until the screen stops changing for ``stable_ms`` milliseconds.
+
+        Args:
+            stable_ms (int, optional): How long the screen must stay unchanged, in
+                milliseconds. Defaults to 500.
+            timeout_ms (int, optional): Maximum time to wait in milliseconds.
+                Defaults to 10000.
+            interval_ms (int, optional): Maximum pause between two captures in
+                milliseconds. Defaults to 100.
+            region (Optional[Tuple[int, int, int, int]], optional): ``(x, y, width, height)``
+                rectangle in screenshot pixels to watch. Defaults to the whole screen.
+            threshold (float, optional): Fraction of the watched area allowed to
+                differ while still counting as stable, e.g. to ignore a blinking
+                cursor. Defaults to 0.0.
+
+        Returns:
+            VisualWaitResult: ``success`` is True once the screen has settled. On
+                timeout ``success`` is False and ``error_message`` is set.
+
+        Example:
+            ```python
+            session = (agent_bay.create()).session
+            session.computer.input_text("hello")
+            session.computer.wait_until_stable(stable_ms=300)
+            screenshot = session.computer.beta_take_screenshot()
+            session.delete()
+            ```
+
+        See Also:
+            wait_for_visual_change, beta_take_screenshot
+        """
+        return _watch_screen(
+            lambda: self.beta_take_screenshot(format="png"),
+            region,
+            timeout_ms,
+            interval_ms,
+            threshold,
+            stable_ms=stable_ms,
+        )
+
     # Window Management Operations
     def list_root_windows(self, timeout_ms: int = 3000) -> WindowListResult:
         """
@@ -0,0 +1,50 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import concurrent.futures
+from typing import Any, Iterator, Callable, List, Tuple
+
+
+def _call(fn: Callable[[Any], Any], item: Any) -> Any:
+    try:
+        return fn(item)
+    except Exception as e:
+        return e
+
+
+def map_unordered(
+    fn: Callable[[Any], Any], work: List[Any], concurrency: int
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Call `fn(item)` for the items of `work` with at most `concurrency` calls in
+    flight, yielding `(item, result)` as each call finishes.
+
+    Items are taken from `work` by position, so the consumer may append to it
+    while iterating (e.g. subdirectories discovered by a listing). A call that
+    raises yields the exception as its result.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="agentbay-map"
+    )
+    pending = {}
+    next_index = 0
+    try:
+        while True:
+            while len(pending) < concurrency and next_index < len(work):
+                item = work[next_index]
+                next_index += 1
+                pending[executor.submit(_call, fn, item)] = item
+            if not pending:
+                return
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                yield item, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -9,7 +9,7 @@ and mobile environment configuration operations.
 
 import base64
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .._common.exceptions import AgentBayError, SessionError
 from .._common.logger import get_logger
@@ -22,19 +22,28 @@ from .._common.models.response import (
 from .._common.utils.command_templates import MOBILE_COMMAND_TEMPLATES
 from .base_service import BaseService
 from .computer import (
+    ActionBatchResult,
     AppOperationResult,
     InstalledApp,
     InstalledAppListResult,
     Process,
     ProcessListResult,
+    _run_action_batch,
+    _watch_screen,
 )
 
 # Initialize logger for this module
 _logger = get_logger("mobile")
 
 
-from .._common.models.mobile import UIElementListResult, KeyCode
-from .._common.models.screenshot import ScreenshotResult
+from .._common.models.mobile import (
+    KeyCode,
+    UIElementListResult,
+    UISnapshotResult,
+    UITreeResult,
+)
+from .._common.models.ui_tree import UISnapshot, UITree
+from .._common.models.screenshot import ScreenshotResult, VisualWaitResult
 
 
 def _parse_bounds_rect(bounds: Any) -> Optional[Dict[str, int]]:
@@ -108,6 +117,7 @@ class Mobile(BaseService):
             session: The session object that provides access to the AgentBay API.
         """
         super().__init__(session)
+        self._last_ui_snapshot: Optional[UISnapshot] = None
 
     # Touch Operations
     def tap(self, x: int, y: int) -> BoolResult:
@@ -323,6 +333,61 @@ class Mobile(BaseService):
             )
 
     # UI Element Operations
+    def batch(
+        self,
+        actions: List[Dict[str, Any]],
+        delay_ms: int = 0,
+        stop_on_error: bool = True,
+    ) -> ActionBatchResult:
+        """
+        Executes a sequence of touch and key actions in order.
+
+        Each action is a dict whose ``action`` key names a Mobile input method and
+        whose other keys are that method's arguments. Supported actions:
+        ``tap``, ``swipe``, ``input_text``, ``send_key`` and ``wait`` (pause for
+        ``ms`` milliseconds).
+
+        Args:
+            actions (List[Dict[str, Any]]): The actions to execute.
+            delay_ms (int, optional): Pause after every step in milliseconds. A step
+                can override it with its own ``delay_ms`` key. Defaults to 0.
+            stop_on_error (bool, optional): Stop at the first failed step.
+                Defaults to True.
+
+        Returns:
+            ActionBatchResult: Per-step results in ``results``; ``failed_index`` and
+                ``error_message`` describe the first failed step, if any.
+
+        Raises:
+            ValueError: If an action is malformed or not supported. Validation happens
+                before any step is executed.
+
+        Note:
+            Every step is still one MCP call, made after the previous step returned;
+            a batch does not reduce the number of round trips.
+
+        Example:
+            ```python
+            session = (agent_bay.create(image="mobile_latest")).session
+            result = session.mobile.batch([
+                {"action": "tap", "x": 500, "y": 800},
+                {"action": "input_text", "text": "alice"},
+                {"action": "swipe", "start_x": 500, "start_y": 1500,
+                 "end_x": 500, "end_y": 500, "delay_ms": 300},
+                {"action": "send_key", "key": KeyCode.BACK},
+            ], delay_ms=50)
+            print(result.success, len(result.results))
+            session.delete()
+            ```
+        """
+        return _run_action_batch(
+            self,
+            ("tap", "swipe", "input_text", "send_key"),
+            actions,
+            delay_ms,
+            stop_on_error,
+        )
+
     def get_clickable_ui_elements(
         self, timeout_ms: int = 2000
     ) -> UIElementListResult:
@@ -400,7 +465,7 @@ class Mobile(BaseService):
             )
 
     def get_all_ui_elements(
-        self, timeout_ms: int = 2000, format: str = "json"
+        self, timeout_ms: int = 2000, format: str = "json", keep_raw: bool = True
     ) -> UIElementListResult:
         """
         Retrieves all UI elements within the specified timeout.
@@ -409,6 +474,9 @@ class Mobile(BaseService):
             timeout_ms (int, optional): Timeout in milliseconds. Defaults to 2000.
             format (str, optional): Output format of the underlying MCP tool.
                 Supported values: "json", "xml". Defaults to "json".
+            keep_raw (bool, optional): Keep the raw tool output on ``result.raw``
+                for JSON results. Set to False to avoid holding large hierarchies
+                twice in memory. Defaults to True. XML results always keep ``raw``.
 
         Returns:
             UIElementListResult: Result object containing UI elements and error
@@ -504,7 +572,7 @@ class Mobile(BaseService):
                     request_id=request_id,
                     success=True,
                     elements=parsed_elements,
-                    raw=result.data,
+                    raw=result.data if keep_raw else "",
                     format="json",
                     error_message="",
                 )
@@ -527,6 +595,147 @@ class Mobile(BaseService):
                 error_message=f"Failed to get all UI elements: {str(e)}",
             )
 
+    def get_ui_tree(
+        self, timeout_ms: int = 2000, keep_raw: bool = False
+    ) -> UITreeResult:
+        """
+        Retrieves all UI elements as a compact, indexed `UITree`.
+
+        Unlike `get_all_ui_elements`, nodes are stored once as slotted objects with
+        prebuilt indexes by resource id, text and class name plus a spatial grid,
+        so `tree.find(...)` and `tree.element_at(x, y)` do not walk the hierarchy.
+
+        Args:
+            timeout_ms (int, optional): Timeout in milliseconds. Defaults to 2000.
+            keep_raw (bool, optional): Keep the raw tool JSON on ``result.raw``.
+                Defaults to False.
+
+        Returns:
+            UITreeResult: Result object containing the tree and error message if any.
+
+        Example:
+            ```python
+            session = (agent_bay.create(image="mobile_latest")).session
+            result = session.mobile.get_ui_tree()
+            node = result.tree.find_one(text="Settings")
+            if node:
+                session.mobile.tap(*node.center)
+            session.delete()
+            ```
+
+        See Also:
+            get_all_ui_elements
+        """
+        args = {"timeout_ms": timeout_ms, "format": "json"}
+        try:
+            result = self.session.call_mcp_tool(
+                "get_all_ui_elements",
+                args,
+            )
+            if not result.success:
+                return UITreeResult(
+                    request_id=result.request_id,
+                    success=False,
+                    error_message=result.error_message,
+                )
+            try:
+                tree = UITree.from_json(result.data)
+            except Exception as e:
+                return UITreeResult(
+                    request_id=result.request_id,
+                    success=False,
+                    raw=result.data if keep_raw else "",
+                    error_message=f"Failed to parse UI elements data: {e}",
+                )
+            return UITreeResult(
+                request_id=result.request_id,
+                success=True,
+                tree=tree,
+                raw=result.data if keep_raw else "",
+            )
+        except Exception as e:
+            return UITreeResult(
+                request_id="",
+                success=False,
+                error_message=f"Failed to get UI tree: {str(e)}",
+            )
+
+    def snapshot_ui(
+        self, timeout_ms: int = 2000, clickable_only: bool = False
+    ) -> UISnapshotResult:
+        """
+        Captures the UI hierarchy and reports what changed since the previous call.
+
+        The previous snapshot is kept on this Mobile object. Subtrees whose content
+        hash is unchanged are skipped during the diff, so steady screens cost almost
+        nothing to compare, and ``result.diff.to_dict()`` is a compact change list
+        that can be sent to an LLM instead of the whole hierarchy.
+
+        Args:
+            timeout_ms (int, optional): Timeout in milliseconds. Defaults to 2000.
+            clickable_only (bool, optional): Snapshot only clickable elements via
+                the `get_clickable_ui_elements` tool. Defaults to False.
+
+        Returns:
+            UISnapshotResult: Result object with the new ``snapshot`` and the
+                ``diff`` against the previous one. On the first call every root is
+                reported as added. The stored snapshot is left untouched on failure.
+
+        Example:
+            ```python
+            session = (agent_bay.create(image="mobile_latest")).session
+            session.mobile.snapshot_ui()
+            session.mobile.tap(500, 800)
+            result = session.mobile.snapshot_ui()
+            print(result.diff.to_dict())
+            session.delete()
+            ```
+
+        See Also:
+            get_ui_tree, reset_ui_snapshot
+        """
+        tool = "get_clickable_ui_elements" if clickable_only else "get_all_ui_elements"
+        args: Dict[str, Any] = {"timeout_ms": timeout_ms}
+        if not clickable_only:
+            args["format"] = "json"
+        try:
+            result = self.session.call_mcp_tool(
+                tool,
+                args,
+            )
+            if not result.success:
+                return UISnapshotResult(
+                    request_id=result.request_id,
+                    success=False,
+                    error_message=result.error_message,
+                )
+            try:
+                snapshot = UISnapshot(UITree.from_json(result.data))
+            except Exception as e:
+                return UISnapshotResult(
+                    request_id=result.request_id,
+                    success=False,
+                    error_message=f"Failed to parse UI elements data: {e}",
+                )
+            diff = snapshot.diff(self._last_ui_snapshot)
+            self._last_ui_snapshot = snapshot
+            return UISnapshotResult(
+                request_id=result.request_id,
+                success=True,
+                snapshot=snapshot,
+                diff=diff,
+            )
+        except Exception as e:
+            return UISnapshotResult(
+                request_id="",
+                success=False,
+                error_message=f"Failed to snapshot UI: {str(e)}",
+            )
+
+    def reset_ui_snapshot(self) -> None:
+        """Forget the stored snapshot so the next `snapshot_ui` starts fresh."""
+        self._last_ui_snapshot = None
+
     # Application Management Operations
     def get_installed_apps(
         self, start_menu: bool, desktop: bool, ignore_system_apps: bool
@@ -829,6 +1038,104 @@ class Mobile(BaseService):
             height=height,
         )
 
+    def wait_for_visual_change(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        timeout_ms: int = 10000,
+        interval_ms: int = 100,
+        threshold: float = 0.0,
+    ) -> VisualWaitResult:
+        """
+        Waits until the screen (or a region of it) changes.
+
+        The first captured frame is the reference; later frames are compared with
+        it using a coarse grid of per-cell digests, so the call returns as soon as
+        the UI reacts instead of after a fixed sleep.
+
+        Args:
+            region (Optional[Tuple[int, int, int, int]], optional): ``(x, y, width, height)``
+                rectangle in screenshot pixels to watch. Defaults to the whole screen.
+            timeout_ms (int, optional): Maximum time to wait in milliseconds.
+                Defaults to 10000.
+            interval_ms (int, optional): Maximum pause between two captures in
+                milliseconds. Defaults to 100.
+            threshold (float, optional): Fraction of the watched area that must
+                differ to count as a change. Defaults to 0.0 (any change).
+
+        Returns:
+            VisualWaitResult: ``success`` is True when a change was detected. On
+                timeout ``success`` is False and ``error_message`` is set. The last
+                captured frame is available as ``screenshot``.
+
+        Example:
+            ```python
+            session = (agent_bay.create(image="mobile_latest")).session
+            session.mobile.tap(500, 800)
+            result = session.mobile.wait_for_visual_change(timeout_ms=5000)
+            print(result.success, result.elapsed_ms)
+            session.delete()
+            ```
+
+        See Also:
+            wait_until_stable, beta_take_screenshot
+        """
+        return _watch_screen(
+            lambda: self.beta_take_screenshot(),
+            region,
+            timeout_ms,
+            interval_ms,
+            threshold,
+        )
+
+    def wait_until_stable(
+        self,
+        stable_ms: int = 500,
+        timeout_ms: int = 10000,
+        interval_ms: int = 100,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        threshold: float = 0.0,
+    ) -> VisualWaitResult:
+        """
+        Waits until the screen stops changing for ``stable_ms`` milliseconds.
+
+        Args:
+            stable_ms (int, optional): How long the screen must stay unchanged, in
+                milliseconds. Defaults to 500.
+            timeout_ms (int, optional): Maximum time to wait in milliseconds.
+                Defaults to 10000.
+            interval_ms (int, optional): Maximum pause between two captures in
+                milliseconds. Defaults to 100.
+            region (Optional[Tuple[int, int, int, int]], optional): ``(x, y, width, height)``
+                rectangle in screenshot pixels to watch. Defaults to the whole screen.
+            threshold (float, optional): Fraction of the watched area allowed to
+                differ while still counting as stable, e.g. to ignore a blinking
+                cursor. Defaults to 0.0.
+
+        Returns:
+            VisualWaitResult: ``success`` is True once the screen has settled. On
+                timeout ``success`` is False and ``error_message`` is set.
+
+        Example:
+            ```python
+            session = (agent_bay.create(image="mobile_latest")).session
+            session.mobile.input_text("hello")
+            session.mobile.wait_until_stable(stable_ms=300)
+            screenshot = session.mobile.beta_take_screenshot()
+            session.delete()
+            ```
+
+        See Also:
+            wait_for_visual_change, beta_take_screenshot
+        """
+        return _watch_screen(
+            lambda: self.beta_take_screenshot(),
+            region,
+            timeout_ms,
+            interval_ms,
+            threshold,
+            stable_ms=stable_ms,
+        )
+
     @staticmethod
     def _decode_image_from_mcp_text(
         text: Any, expected_format: str
@@ -0,0 +1,167 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import time
+from typing import Any, Iterator, Callable, Optional
+
+from .._common.logger import get_logger
+from .._common.utils.polling import PollOutcome, PollPolicy, poll_metrics
+
+# Initialize _logger for this module
+_logger = get_logger("polling")
+
+DEFAULT_POLICY = PollPolicy()
+
+
+def poll_until(
+    probe: Callable[[], Any],
+    done: Callable[[Any], bool] = bool,
+    timeout: Optional[float] = None,
+    policy: Optional[PollPolicy] = None,
+    hint: Optional[Callable[[Any], Optional[float]]] = None,
+    cancel: Any = None,
+    max_probes: Optional[int] = None,
+    raise_errors: bool = False,
+    name: str = "poll",
+) -> PollOutcome:
+    """
+    Call `probe` until `done` accepts its result, the deadline passes or the
+    wait is cancelled.
+
+    Probes are spaced by `policy` (immediate first probe, then exponential
+    backoff with jitter); the last sleep is shortened so that a final probe
+    happens right at the deadline. Every call is recorded in `poll_metrics`
+    under `name`.
+
+    Args:
+        probe (Callable[[], Any]): Coroutine function returning the current state.
+        done (Callable[[Any], bool], optional): Completion predicate; should also
+            accept terminal failure states so the caller can inspect them.
+            Defaults to truthiness.
+        timeout (Optional[float], optional): Seconds to wait. Defaults to None
+            (no deadline).
+        policy (Optional[PollPolicy], optional): Probe spacing. Defaults to
+            `PollPolicy()`.
+        hint (Optional[Callable[[Any], Optional[float]]], optional): Extracts a
+            server-suggested delay (seconds) from a probe result, or None. A
+            hinted delay replaces the next interval and restarts the backoff.
+        cancel (Any, optional): Event-like object; the wait stops once its
+            `is_set()` returns True.
+        max_probes (Optional[int], optional): Give up (as timed out) after this
+            many probes.
+        raise_errors (bool, optional): Propagate exceptions raised by `probe`
+            instead of logging them and probing again. Defaults to False.
+        name (str, optional): Metrics key of this wait loop. Defaults to "poll".
+
+    Returns:
+        PollOutcome: The last probe result and how the wait ended.
+    """
+    outcome = PollOutcome()
+    for _ in _poll(
+        outcome, probe, done, timeout, policy, hint, cancel, max_probes, raise_errors, name
+    ):
+        pass
+    return outcome
+
+
+def poll_each(
+    probe: Callable[[], Any],
+    done: Callable[[Any], bool] = bool,
+    timeout: Optional[float] = None,
+    policy: Optional[PollPolicy] = None,
+    hint: Optional[Callable[[Any], Optional[float]]] = None,
+    cancel: Any = None,
+    max_probes: Optional[int] = None,
+    raise_errors: bool = False,
+    name: str = "poll",
+) -> Iterator[Any]:
+    """
+    Like `poll_until`, but yield the result of every successful probe as soon as
+    it arrives, the one accepted by `done` included, e.g. to stream progress.
+
+    The arguments are those of `poll_until`. Iteration ends when `done` accepts
+    a result, the deadline passes or the wait is cancelled; a consumer that
+    stops early is recorded as a cancelled wait.
+
+    Yields:
+        Any: The probe results, in order.
+    """
+    for value in _poll(
+        PollOutcome(), probe, done, timeout, policy, hint, cancel, max_probes, raise_errors, name
+    ):
+        yield value
+
+
+def _poll(
+    outcome: PollOutcome,
+    probe: Callable[[], Any],
+    done: Callable[[Any], bool],
+    timeout: Optional[float],
+    policy: Optional[PollPolicy],
+    hint: Optional[Callable[[Any], Optional[float]]],
+    cancel: Any,
+    max_probes: Optional[int],
+    raise_errors: bool,
+    name: str,
+) -> Iterator[Any]:
+    """Wait loop shared by poll_until and poll_each; fills in `outcome`."""
+    policy = policy or DEFAULT_POLICY
+    start = time.monotonic()
+    probe_errors = 0
+    suggested: Optional[float] = None
+    # Probe count at the last server hint: the unhinted delays that follow grow
+    # again from the initial interval.
+    backoff_start = 0
+    # Time spent sleeping; the deadline is checked against the larger of this
+    # and the wall clock, so the loop stays bounded even if sleep returns early.
+    slept = 0.0
+
+    def elapsed() -> float:
+        return max(time.monotonic() - start, slept)
+
+    try:
+        while True:
+            remaining = None if timeout is None else timeout - elapsed()
+            delay = policy.delay(outcome.probes - backoff_start, remaining, suggested)
+            if suggested is not None:
+                backoff_start = outcome.probes
+            if delay > 0:
+                time.sleep(delay)
+                slept += delay
+            if cancel is not None and cancel.is_set():
+                outcome.cancelled = True
+                return
+
+            outcome.probes += 1
+            try:
+                outcome.value = probe()
+                outcome.error = None
+            except Exception as e:
+                if raise_errors:
+                    raise
+                probe_errors += 1
+                outcome.error = e
+                _logger.debug(f"{name}: probe {outcome.probes} failed: {e}")
+            else:
+                if done(outcome.value):
+                    outcome.done = True
+                    yield outcome.value
+                    return
+                yield outcome.value
+                suggested = hint(outcome.value) if hint is not None else None
+
+            if max_probes is not None and outcome.probes >= max_probes:
+                outcome.timed_out = True
+                return
+            if timeout is not None and elapsed() >= timeout:
+                outcome.timed_out = True
+                return
+    except BaseException as e:
+        # Task cancellation, interrupt or a consumer that stopped iterating
+        # (probe errors are Exceptions)
+        if not isinstance(e, Exception):
+            outcome.cancelled = True
+        raise
+    finally:
+        outcome.elapsed = elapsed()
+        poll_metrics.record(name, outcome, probe_errors)
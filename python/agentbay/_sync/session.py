@@ -32,6 +32,7 @@ from .._common.models import (
     extract_request_id,
 )
 from .._common.models.mcp_tool import McpTool
+from .._common.utils.polling import PollPolicy
 from ..api.models import (
     CallMcpToolRequest,
     DeleteSessionAsyncRequest,
@@ -55,6 +56,7 @@ from .context_manager import ContextManager
 from .filesystem import FileSystem
 from .mobile import Mobile
 from .oss import Oss
+from .polling import poll_until
 
 if TYPE_CHECKING:
     from .agentbay import AgentBay
@@ -109,11 +111,75 @@ class SessionInfo:
         self.ticket = ticket
 
 
+class _LazyService:
+    """
+    Per-session service created on first access and cached in a slot.
+
+    Bulk flows (list, get, delete) materialize many sessions without ever
+    touching their services, so nothing is allocated for them up front.
+    Assigning the attribute replaces the cached service.
+    """
+
+    __slots__ = ("factory", "slot")
+
+    def __init__(self, factory: Any, slot: str):
+        self.factory = factory
+        self.slot = slot
+
+    def __get__(self, session: Any, owner: Any = None) -> Any:
+        if session is None:
+            return self
+        try:
+            return getattr(session, self.slot)
+        except AttributeError:
+            service = self.factory(session)
+            setattr(session, self.slot, service)
+            return service
+
+    def __set__(self, session: Any, value: Any) -> None:
+        setattr(session, self.slot, value)
+
+
 class Session:
     """
     AsyncSession represents a session in the AgentBay cloud environment.
     """
 
+    __slots__ = (
+        "agent_bay",
+        "session_id",
+        "resource_url",
+        "token",
+        "link_url",
+        "enableBrowserReplay",
+        "mcpTools",
+        "image_id",
+        "_file_system",
+        "_command",
+        "_code",
+        "_oss",
+        "_computer",
+        "_mobile",
+        "_context",
+        "_browser",
+        "_agent",
+        # Keep ad-hoc attributes (and patching in tests) working; the dict is
+        # only allocated when such an attribute is actually set.
+        "__dict__",
+        "__weakref__",
+    )
+
+    # Services are created lazily, on first access
+    file_system = _LazyService(FileSystem, "_file_system")
+    command = _LazyService(Command, "_command")
+    code = _LazyService(Code, "_code")
+    oss = _LazyService(Oss, "_oss")
+    computer = _LazyService(Computer, "_computer")
+    mobile = _LazyService(Mobile, "_mobile")
+    context = _LazyService(ContextManager, "_context")
+    browser = _LazyService(Browser, "_browser")
+    agent = _LazyService(Agent, "_agent")
+
     def __init__(self, agent_bay: "AgentBay", session_id: str):
         self.agent_bay = agent_bay
         self.session_id = session_id
@@ -133,21 +199,6 @@ class Session:
         # MCP tool list returned by backend for this session
         self.mcpTools: list[McpTool] = []
 
-        # Initialize file system, command and code handlers
-        self.file_system = FileSystem(self)
-        self.command = Command(self)
-        self.code = Code(self)
-        self.oss = Oss(self)
-
-        # Initialize Computer and Mobile modules
-        self.computer = Computer(self)
-        self.mobile = Mobile(self)
-
-        self.context = ContextManager(self)
-        self.browser = Browser(self)
-
-        self.agent = Agent(self)
-
     @property
     def fs(self) -> FileSystem:
         """
@@ -298,17 +349,21 @@ class Session:
                 error_message=f"Failed to get session status {self.session_id}: {e}",
             )
 
-    def delete(self, sync_context: bool = False) -> DeleteResult:
+    def delete(self, sync_context: bool = False, wait: bool = True) -> DeleteResult:
         """
         Delete this session and release all associated resources.
 
         Args:
             sync_context (bool, optional): Whether to sync context data (trigger file uploads)
                 before deleting the session. Defaults to False.
+            wait (bool, optional): Wait until the session is gone (up to five minutes).
+                With False the call returns as soon as the deletion is accepted and
+                the AgentBay client's reaper confirms it in the background.
+                Defaults to True.
 
         Returns:
             DeleteResult: Result indicating success or failure with request ID.
-                - success (bool): True if deletion succeeded
+                - success (bool): True if deletion succeeded (or was accepted, with wait=False)
                 - error_message (str): Error details if deletion failed
                 - request_id (str): Unique identifier for this API request
 
@@ -318,126 +373,41 @@ class Session:
         try:
             # Perform context synchronization if needed
             if sync_context:
-                _log_operation_start(
-                    "Context synchronization", "Before session deletion"
-                )
-
-                sync_start_time = time.time()
-
-                try:
-                    # Sync all contexts
-                    sync_result = self.context.sync()
-                    _logger.info("🔄 Synced all contexts")
-
-                    sync_duration = time.time() - sync_start_time
-
-                    if sync_result.success:
-                        _log_operation_success("Context sync")
-                        _logger.info(
-                            f"⏱️  Context sync completed in {sync_duration:.2f} seconds"
-                        )
-                    else:
-                        _log_warning("Context sync completed with failures")
-                        _logger.warning(
-                            f"⏱️  Context sync failed after {sync_duration:.2f} seconds"
-                        )
-
-                except Exception as e:
-                    sync_duration = time.time() - sync_start_time
-                    _log_warning(f"Failed to trigger context sync: {e}")
-                    _logger.warning(
-                        f"⏱️  Context sync failed after {sync_duration:.2f} seconds"
-                    )
-                    # Continue with deletion even if sync fails
+                self._sync_context_before_delete()
 
             # Proceed with session deletion
-            request = DeleteSessionAsyncRequest(
-                authorization=f"Bearer {self._get_api_key()}",
-                session_id=self.session_id,
-            )
-            client = self._get_client()
-            response = client.delete_session_async(request)
+            request_result = self._request_delete()
+            if not request_result.success:
+                return request_result
+            self._forget()
+            self._close_browser_connection()
+            if not wait:
+                # Completion is confirmed (and the delete retried) by the client's reaper
+                reaper = getattr(self.agent_bay, "reaper", None)
+                if reaper is not None:
+                    reaper.track(self)
+                return request_result
+            request_id = request_result.request_id
 
-            # Extract request ID
-            request_id = extract_request_id(response)
-
-            # Check if the response is success
-            response_map = response.to_map()
-            body = response_map.get("body", {})
-            success = body.get("Success", True)
-
-            if not success:
-                error_message = f"[{body.get('Code', 'Unknown')}] {body.get('Message', 'Failed to delete session')}"
-                _log_api_response_with_details(
-                    api_name="DeleteSessionAsync",
-                    request_id=request_id,
-                    success=False,
-                    full_response=json.dumps(body, ensure_ascii=False, indent=2),
-                )
+            # Poll for session deletion status
+            _logger.info(f"🔄 Waiting for session {self.session_id} to be deleted...")
+            poll_timeout = 300.0  # 5 minutes timeout
+            outcome = poll_until(
+                self._is_deleted,
+                timeout=poll_timeout,
+                policy=PollPolicy.up_to(2.0),
+                raise_errors=True,
+                name="session.delete",
+            )
+            if not outcome.done:
+                error_message = f"Timeout waiting for session deletion after {poll_timeout}s"
+                _logger.warning(f"⏱️  {error_message}")
                 return DeleteResult(
                     request_id=request_id,
                     success=False,
                     error_message=error_message,
                 )
 
-            # Poll for session deletion status
-            _logger.info(f"🔄 Waiting for session {self.session_id} to be deleted...")
-            poll_timeout = 300.0  # 5 minutes timeout
-            poll_interval = 1.0  # Poll every 1 second
-            poll_start_time = time.time()
-
-            while True:
-                # Check timeout
-                elapsed_time = time.time() - poll_start_time
-                if elapsed_time >= poll_timeout:
-                    error_message = f"Timeout waiting for session deletion after {poll_timeout}s"
-                    _logger.warning(f"⏱️  {error_message}")
-                    return DeleteResult(
-                        request_id=request_id,
-                        success=False,
-                        error_message=error_message,
-                    )
-
-                # Get session status
-                session_result = self.get_status()
-
-                # Check if session is deleted (NotFound error)
-                if not session_result.success:
-                    error_code = getattr(session_result, "code", "") or ""
-                    error_message = session_result.error_message or ""
-                    http_status_code = getattr(session_result, "http_status_code", 0) or 0
-
-                    # Check for InvalidMcpSession.NotFound, 400 with "not found", or error_message containing "not found"
-                    is_not_found = (
-                        error_code == "InvalidMcpSession.NotFound" or
-                        (http_status_code == 400 and (
-                            "not found" in error_message.lower() or
-                            "NotFound" in error_message or
-                            "not found" in error_code.lower()
-                        )) or
-                        "not found" in error_message.lower()
-                    )
-
-                    if is_not_found:
-                        # Session is deleted
-                        _logger.info(f"✅ Session {self.session_id} successfully deleted (NotFound)")
-                        break
-                    else:
-                        # Other error, continue polling
-                        _logger.debug(f"⚠️  Get session error (will retry): {error_message}")
-                        # Continue to next poll iteration
-
-                # Check session status if we got valid data
-                elif session_result.status:
-                    status = session_result.status
-                    _logger.debug(f"📊 Session status: {status}")
-                    if status == "FINISH":
-                        _logger.info(f"✅ Session {self.session_id} successfully deleted")
-                        break
-
-                # Wait before next poll
-                time.sleep(poll_interval)
-
             # Log successful deletion
             _log_api_response_with_details(
                 api_name="DeleteSessionAsync",
@@ -457,6 +427,140 @@ class Session:
                 error_message=f"Failed to delete session {self.session_id}: {e}",
             )
 
+    def _close_browser_connection(self) -> None:
+        """Disconnect Playwright from the session's browser, if it was ever used."""
+        browser = getattr(self, "_browser", None)
+        if isinstance(browser, Browser):
+            browser.connection.close()
+
+    def _forget(self) -> None:
+        """Drop this session from the client's session cache."""
+        sessions = getattr(self.agent_bay, "_sessions", None)
+        if sessions is not None:
+            sessions.pop(self.session_id, None)
+
+    def _sync_context_before_delete(self) -> None:
+        """Sync all contexts before deletion; failures are logged, never raised."""
+        _log_operation_start(
+            "Context synchronization", "Before session deletion"
+        )
+
+        sync_start_time = time.time()
+
+        try:
+            # Sync all contexts
+            sync_result = self.context.sync()
+            _logger.info("🔄 Synced all contexts")
+
+            sync_duration = time.time() - sync_start_time
+
+            if sync_result.success:
+                _log_operation_success("Context sync")
+                _logger.info(
+                    f"⏱️  Context sync completed in {sync_duration:.2f} seconds"
+                )
+            else:
+                _log_warning("Context sync completed with failures")
+                _logger.warning(
+                    f"⏱️  Context sync failed after {sync_duration:.2f} seconds"
+                )
+
+        except Exception as e:
+            sync_duration = time.time() - sync_start_time
+            _log_warning(f"Failed to trigger context sync: {e}")
+            _logger.warning(
+                f"⏱️  Context sync failed after {sync_duration:.2f} seconds"
+            )
+            # Continue with deletion even if sync fails
+
+    def _request_delete(self) -> DeleteResult:
+        """
+        Send DeleteSessionAsync without waiting for the session to go away.
+
+        Returns:
+            DeleteResult: Whether the deletion request was accepted.
+        """
+        request = DeleteSessionAsyncRequest(
+            authorization=f"Bearer {self._get_api_key()}",
+            session_id=self.session_id,
+        )
+        client = self._get_client()
+        response = client.delete_session_async(request)
+
+        # Extract request ID
+        request_id = extract_request_id(response)
+
+        # Check if the response is success
+        response_map = response.to_map()
+        body = response_map.get("body", {})
+        success = body.get("Success", True)
+
+        if not success:
+            error_message = f"[{body.get('Code', 'Unknown')}] {body.get('Message', 'Failed to delete session')}"
+            _log_api_response_with_details(
+                api_name="DeleteSessionAsync",
+                request_id=request_id,
+                success=False,
+                full_response=json.dumps(body, ensure_ascii=False, indent=2),
+            )
+            return DeleteResult(
+                request_id=request_id,
+                success=False,
+                error_message=error_message,
+            )
+        return DeleteResult(request_id=request_id, success=True)
+
+    def _get_status_value(self) -> Optional[str]:
+        """Current status of this session, or None if it could not be fetched."""
+        session_result = self.agent_bay._get_session(self.session_id)
+        if session_result.success and session_result.data:
+            return session_result.data.status
+        return None
+
+    def _is_deleted(self) -> bool:
+        """
+        Check once whether a deleted session is gone.
+
+        Returns:
+            bool: True if the session is not found or has status FINISH.
+        """
+        # Get session status
+        session_result = self.get_status()
+
+        # Check if session is deleted (NotFound error)
+        if not session_result.success:
+            error_code = getattr(session_result, "code", "") or ""
+            error_message = session_result.error_message or ""
+            http_status_code = getattr(session_result, "http_status_code", 0) or 0
+
+            # Check for InvalidMcpSession.NotFound, 400 with "not found", or error_message containing "not found"
+            is_not_found = (
+                error_code == "InvalidMcpSession.NotFound" or
+                (http_status_code == 400 and (
+                    "not found" in error_message.lower() or
+                    "NotFound" in error_message or
+                    "not found" in error_code.lower()
+                )) or
+                "not found" in error_message.lower()
+            )
+
+            if is_not_found:
+                # Session is deleted
+                _logger.info(f"✅ Session {self.session_id} successfully deleted (NotFound)")
+                return True
+            # Other error, continue polling
+            _logger.debug(f"⚠️  Get session error (will retry): {error_message}")
+            return False
+
+        # Check session status if we got valid data
+        if session_result.status:
+            status = session_result.status
+            _logger.debug(f"📊 Session status: {status}")
+            if status == "FINISH":
+                _logger.info(f"✅ Session {self.session_id} successfully deleted")
+                return True
+        return False
+
     def _validate_labels(self, labels: Dict[str, str]) -> Optional[OperationResult]:
         """
         Validates labels parameter for label operations.
@@ -1277,51 +1381,36 @@ class Session:
                 f"Session {self.session_id} pause initiated successfully",
             )
 
-            # Poll for session status until PAUSED or timeout
-            start_time = time.time()
-            max_attempts = int(timeout / poll_interval)
-            attempt = 0
-
-            while attempt < max_attempts:
-                attempt += 1
-
-                try:
-                    # Check session status using _get_session (internal)
-                    session_result = self.agent_bay._get_session(self.session_id)
-                    if session_result.success and session_result.data:
-                        status = session_result.data.status
-                        if status == "PAUSED":
-                            _log_operation_success(
-                                "PauseSessionAsync",
-                                f"Session {self.session_id} is now PAUSED",
-                            )
-                            return SessionPauseResult(
-                                request_id=request_id,
-                                success=True,
-                                status="PAUSED",
-                            )
-                        elif (
-                            status == "ERROR" or status == "FAILED"
-                        ):  # Add other failure states if known
-                            _log_operation_error(
-                                "PauseSessionAsync",
-                                f"Session entered error state: {status}",
-                            )
-                            return SessionPauseResult(
-                                request_id=request_id,
-                                success=False,
-                                error_message=f"Session entered error state: {status}",
-                                status=status,
-                            )
-                except Exception:
-                    pass
-
-                # Check timeout
-                if time.time() - start_time > timeout:
-                    break
-
-                # Wait before next poll
-                time.sleep(poll_interval)
+            # Poll for session status until PAUSED, a failure state or timeout
+            outcome = poll_until(
+                self._get_status_value,
+                done=lambda status: status in ("PAUSED", "ERROR", "FAILED"),
+                timeout=timeout,
+                policy=PollPolicy.up_to(poll_interval),
+                name="session.pause",
+            )
+            status = outcome.value
+            if status == "PAUSED":
+                _log_operation_success(
+                    "PauseSessionAsync",
+                    f"Session {self.session_id} is now PAUSED",
+                )
+                return SessionPauseResult(
+                    request_id=request_id,
+                    success=True,
+                    status="PAUSED",
+                )
+            if outcome.done:
+                _log_operation_error(
+                    "PauseSessionAsync",
+                    f"Session entered error state: {status}",
+                )
+                return SessionPauseResult(
+                    request_id=request_id,
+                    success=False,
+                    error_message=f"Session entered error state: {status}",
+                    status=status,
+                )
 
             _log_operation_error(
                 "PauseSessionAsync",
@@ -1436,49 +1525,36 @@ class Session:
                 f"Session {self.session_id} resume initiated successfully",
             )
 
-            # Poll for session status until RUNNING or timeout
-            start_time = time.time()
-            max_attempts = int(timeout / poll_interval)
-            attempt = 0
-
-            while attempt < max_attempts:
-                attempt += 1
-
-                try:
-                    # Check session status using _get_session (internal)
-                    session_result = self.agent_bay._get_session(self.session_id)
-                    if session_result.success and session_result.data:
-                        status = session_result.data.status
-                        if status == "RUNNING":
-                            _log_operation_success(
-                                "ResumeSessionAsync",
-                                f"Session {self.session_id} is now RUNNING",
-                            )
-                            return SessionResumeResult(
-                                request_id=request_id,
-                                success=True,
-                                status="RUNNING",
-                            )
-                        elif status == "ERROR" or status == "FAILED":
-                            _log_operation_error(
-                                "ResumeSessionAsync",
-                                f"Session entered error state: {status}",
-                            )
-                            return SessionResumeResult(
-                                request_id=request_id,
-                                success=False,
-                                error_message=f"Session entered error state: {status}",
-                                status=status,
-                            )
-                except Exception:
-                    pass
-
-                # Check timeout
-                if time.time() - start_time > timeout:
-                    break
-
-                # Wait before next poll
-                time.sleep(poll_interval)
+            # Poll for session status until RUNNING, a failure state or timeout
+            outcome = poll_until(
+                self._get_status_value,
+                done=lambda status: status in ("RUNNING", "ERROR", "FAILED"),
+                timeout=timeout,
+                policy=PollPolicy.up_to(poll_interval),
+                name="session.resume",
+            )
+            status = outcome.value
+            if status == "RUNNING":
+                _log_operation_success(
+                    "ResumeSessionAsync",
+                    f"Session {self.session_id} is now RUNNING",
+                )
+                return SessionResumeResult(
+                    request_id=request_id,
+                    success=True,
+                    status="RUNNING",
+                )
+            if outcome.done:
+                _log_operation_error(
+                    "ResumeSessionAsync",
+                    f"Session entered error state: {status}",
+                )
+                return SessionResumeResult(
+                    request_id=request_id,
+                    success=False,
+                    error_message=f"Session entered error state: {status}",
+                    status=status,
+                )
 
             _log_operation_error(
                 "ResumeSessionAsync",
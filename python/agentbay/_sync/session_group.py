@@ -0,0 +1,422 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import concurrent.futures
+import time
+from typing import (
+    Any,
+    Iterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .._common.exceptions import SessionError
+from .._common.logger import get_logger
+from .._common.models.session_group import SessionCallResult, SessionGroupResult
+from .session import Session
+
+# Initialize _logger for this module
+_logger = get_logger("session_group")
+
+# Page size used when collecting sessions with `AgentBay.list`
+_LIST_PAGE_SIZE = 100
+
+SessionOperation = Callable[[Session], Any]
+
+
+def _session_id_of(item: Union[str, Dict[str, Any]]) -> str:
+    if isinstance(item, dict):
+        return item.get("sessionId") or item.get("session_id") or ""
+    return item
+
+
+def _call(index: int, session: Session, fn: SessionOperation) -> SessionCallResult:
+    """Run one operation and convert its outcome into a SessionCallResult."""
+    start = time.monotonic()
+    try:
+        value = fn(session)
+    except Exception as e:
+        return SessionCallResult(
+            success=False,
+            session_id=session.session_id,
+            index=index,
+            latency_ms=int((time.monotonic() - start) * 1000),
+            error_message=str(e) or type(e).__name__,
+        )
+    latency_ms = int((time.monotonic() - start) * 1000)
+    # Result objects report failures through `success`; plain values count as success.
+    success = getattr(value, "success", True) is not False
+    return SessionCallResult(
+        request_id=getattr(value, "request_id", "") or "",
+        success=success,
+        session_id=session.session_id,
+        index=index,
+        value=value,
+        latency_ms=latency_ms,
+        error_message="" if success else (getattr(value, "error_message", "") or "Operation failed"),
+    )
+
+
+def _timed_out(index: int, session: Session, start: float, timeout: float) -> SessionCallResult:
+    return SessionCallResult(
+        success=False,
+        session_id=session.session_id,
+        index=index,
+        latency_ms=int((time.monotonic() - start) * 1000),
+        timed_out=True,
+        error_message=f"Operation timed out after {timeout}s",
+    )
+
+
+def _fan_out(
+    sessions: Sequence[Session],
+    fn: SessionOperation,
+    concurrency: int,
+    timeout: Optional[float],
+) -> Iterator[SessionCallResult]:
+    """Run `fn` on every session with at most `concurrency` in flight, yielding as each finishes."""
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="agentbay-group"
+    )
+    started: Dict[int, float] = {}
+
+    def _one(index: int, session: Session) -> SessionCallResult:
+        started[index] = time.monotonic()
+        return _call(index, session, fn)
+
+    pending = {executor.submit(_one, i, s): i for i, s in enumerate(sessions)}
+    try:
+        while pending:
+            wait_s = None
+            if timeout is not None:
+                now = time.monotonic()
+                for future, index in list(pending.items()):
+                    if index in started and now - started[index] >= timeout:
+                        del pending[future]
+                        future.cancel()
+                        yield _timed_out(index, sessions[index], started[index], timeout)
+                if not pending:
+                    break
+                deadlines = [started[i] + timeout for i in pending.values() if i in started]
+                wait_s = max(0.0, min(deadlines) - now) if deadlines else None
+                if len(deadlines) < len(pending):
+                    # Queued calls get their deadline once a worker picks them up
+                    wait_s = 0.05 if wait_s is None else min(wait_s, 0.05)
+            done, _ = concurrent.futures.wait(
+                pending, timeout=wait_s, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                del pending[future]
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+class SessionGroup:
+    """
+    Runs one operation across many sessions concurrently.
+
+    At most `concurrency` operations are in flight at any time, and each of them
+    is bounded by the per-session `timeout`. Results can be streamed as they
+    complete with `as_completed`, or collected with `map` and the operation
+    helpers, which also report latency statistics.
+
+    Example:
+        ```python
+        group = AsyncSessionGroup.from_list(agent_bay, labels={"team": "qa"})
+        result = group.run_command("uname -a")
+        print(result.stats.p90_ms, len(result.failed))
+        ```
+    """
+
+    def __init__(
+        self,
+        sessions: Sequence[Session],
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize an AsyncSessionGroup.
+
+        Args:
+            sessions (Sequence[AsyncSession]): Sessions the operations run on.
+            concurrency (int, optional): Maximum number of sessions operated on at
+                the same time. Defaults to 16.
+            timeout (Optional[float], optional): Per-session timeout in seconds.
+                Defaults to None (no timeout).
+
+        Raises:
+            ValueError: If concurrency is not positive or timeout is not positive.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        self.sessions = list(sessions)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        # Session IDs that could not be resolved by `from_ids`/`from_list`, with the reason
+        self.unresolved: Dict[str, str] = {}
+
+    @classmethod
+    def from_ids(
+        cls,
+        agent_bay: Any,
+        session_ids: Sequence[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+    ) -> "SessionGroup":
+        """
+        Build a group by fetching sessions with `AgentBay.get`.
+
+        Args:
+            agent_bay (AgentBay): The client used to fetch the sessions.
+            session_ids (Sequence[Union[str, Dict[str, Any]]]): Session IDs, or the
+                entries of `SessionListResult.session_ids`.
+            concurrency (int, optional): Concurrency limit of the group, also used
+                while fetching. Defaults to 16.
+            timeout (Optional[float], optional): Per-session timeout in seconds.
+
+        Returns:
+            AsyncSessionGroup: The group. Sessions that could not be fetched are
+            left out and listed in `unresolved`.
+        """
+        ids = [_session_id_of(item) for item in session_ids]
+        ids = [sid for sid in ids if sid]
+        stubs = [_SessionRef(sid) for sid in ids]
+
+        def _get(ref: "_SessionRef") -> Any:
+            return agent_bay.get(ref.session_id)
+
+        resolved: List[Optional[Session]] = [None] * len(stubs)
+        unresolved = {}
+        for item in _fan_out(stubs, _get, concurrency, timeout):
+            if item.success and getattr(item.value, "session", None) is not None:
+                resolved[item.index] = item.value.session
+            else:
+                unresolved[item.session_id] = item.error_message
+
+        group = cls(
+            [s for s in resolved if s is not None],
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+        group.unresolved = unresolved
+        if unresolved:
+            _logger.warning(f"Could not resolve {len(unresolved)} of {len(ids)} sessions")
+        return group
+
+    @classmethod
+    def from_list(
+        cls,
+        agent_bay: Any,
+        labels: Optional[Dict[str, str]] = None,
+        status: Optional[str] = "RUNNING",
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+    ) -> "SessionGroup":
+        """
+        Build a group from every session returned by `AgentBay.list`.
+
+        Args:
+            agent_bay (AgentBay): The client used to list and fetch sessions.
+            labels (Optional[Dict[str, str]], optional): Labels to filter sessions.
+            status (Optional[str], optional): Status to filter sessions.
+                Defaults to "RUNNING".
+            concurrency (int, optional): Concurrency limit of the group. Defaults to 16.
+            timeout (Optional[float], optional): Per-session timeout in seconds.
+
+        Returns:
+            AsyncSessionGroup: The group.
+
+        Raises:
+            SessionError: If a page of the session list cannot be fetched.
+        """
+        session_ids: List[Dict[str, Any]] = []
+        next_token = None
+        while True:
+            # Continue from the token so that every page is fetched once
+            result = agent_bay.list(
+                labels=labels, limit=_LIST_PAGE_SIZE, status=status, next_token=next_token
+            )
+            if not result.success:
+                raise SessionError(f"Failed to list sessions: {result.error_message}")
+            session_ids.extend(result.session_ids)
+            if not result.next_token or not result.session_ids:
+                break
+            next_token = result.next_token
+        return cls.from_ids(
+            agent_bay, session_ids, concurrency=concurrency, timeout=timeout
+        )
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    @property
+    def session_ids(self) -> List[str]:
+        """IDs of the sessions in the group, in group order."""
+        return [s.session_id for s in self.sessions]
+
+    def as_completed(
+        self, fn: SessionOperation, timeout: Optional[float] = None
+    ) -> Iterator[SessionCallResult]:
+        """
+        Run an operation on every session, yielding results as they complete.
+
+        Args:
+            fn (SessionOperation): The operation to run; it receives the session.
+            timeout (Optional[float], optional): Per-session timeout in seconds.
+                Defaults to the group timeout.
+
+        Yields:
+            SessionCallResult: One result per session, in completion order.
+        """
+        for item in _fan_out(
+            self.sessions, fn, self.concurrency, timeout or self.timeout
+        ):
+            yield item
+
+    def map(
+        self, fn: SessionOperation, timeout: Optional[float] = None
+    ) -> SessionGroupResult:
+        """
+        Run an operation on every session and collect the results.
+
+        Args:
+            fn (SessionOperation): The operation to run; it receives the session.
+            timeout (Optional[float], optional): Per-session timeout in seconds.
+                Defaults to the group timeout.
+
+        Returns:
+            SessionGroupResult: Per-session results in group order with latency stats.
+        """
+        start = time.monotonic()
+        results: List[Optional[SessionCallResult]] = [None] * len(self.sessions)
+        for item in self.as_completed(fn, timeout=timeout):
+            results[item.index] = item
+        failed = [r for r in results if not r.success]
+        return SessionGroupResult(
+            success=not failed,
+            results=results,
+            elapsed_ms=int((time.monotonic() - start) * 1000),
+            error_message=(
+                f"Operation failed on {len(failed)} of {len(results)} sessions"
+                if failed
+                else ""
+            ),
+        )
+
+    def run_command(
+        self,
+        command: str,
+        timeout_ms: int = 50000,
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+    ) -> SessionGroupResult:
+        """
+        Execute a shell command on every session.
+
+        Args:
+            command (str): The command to execute.
+            timeout_ms (int, optional): Command timeout inside each session.
+                Defaults to 50000.
+            cwd (Optional[str], optional): Working directory for the command.
+            envs (Optional[Dict[str, str]], optional): Environment variables.
+
+        Returns:
+            SessionGroupResult: `CommandResult` values per session.
+        """
+
+        def _op(session: Session) -> Any:
+            return session.command.execute_command(
+                command, timeout_ms=timeout_ms, cwd=cwd, envs=envs
+            )
+
+        return self.map(_op)
+
+    def read_file(self, path: str, format: str = "text") -> SessionGroupResult:
+        """
+        Read the same file on every session.
+
+        Args:
+            path (str): Path of the file to read.
+            format (str, optional): "text" or "bytes". Defaults to "text".
+
+        Returns:
+            SessionGroupResult: `FileContentResult` (or `BinaryFileContentResult`)
+            values per session.
+        """
+
+        def _op(session: Session) -> Any:
+            return session.file_system.read_file(path, format=format)
+
+        return self.map(_op)
+
+    def write_file(
+        self, path: str, content: str, mode: str = "overwrite"
+    ) -> SessionGroupResult:
+        """
+        Write the same file on every session.
+
+        Args:
+            path (str): Path of the file to write.
+            content (str): Content to write.
+            mode (str, optional): "overwrite" or "append". Defaults to "overwrite".
+
+        Returns:
+            SessionGroupResult: `BoolResult` values per session.
+        """
+
+        def _op(session: Session) -> Any:
+            return session.file_system.write_file(path, content, mode=mode)
+
+        return self.map(_op)
+
+    def screenshot(self) -> SessionGroupResult:
+        """
+        Take a screenshot of every session with `Computer.screenshot`.
+
+        Returns:
+            SessionGroupResult: `OperationResult` values per session, holding the
+            screenshot URLs.
+        """
+
+        def _op(session: Session) -> Any:
+            return session.computer.screenshot()
+
+        return self.map(_op)
+
+    def call_mcp_tool(
+        self, tool_name: str, args: Dict[str, Any], **kwargs: Any
+    ) -> SessionGroupResult:
+        """
+        Call an MCP tool on every session.
+
+        Args:
+            tool_name (str): Name of the tool.
+            args (Dict[str, Any]): Arguments of the tool.
+            **kwargs: Extra keyword arguments for `Session.call_mcp_tool`.
+
+        Returns:
+            SessionGroupResult: `McpToolResult` values per session.
+        """
+
+        def _op(session: Session) -> Any:
+            return session.call_mcp_tool(tool_name, args, **kwargs)
+
+        return self.map(_op)
+
+
+class _SessionRef:
+    """Placeholder carrying only a session ID, used while resolving sessions."""
+
+    __slots__ = ("session_id",)
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
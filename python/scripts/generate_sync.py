@@ -56,6 +56,97 @@ def _build_client_api_method_replacements() -> dict:
     return replacements
 
 
+# Thread-pool implementation of concurrency.map_unordered for the sync API.
+SYNC_MAP_UNORDERED = '''
+def map_unordered(
+    fn: Callable[[Any], Any], work: List[Any], concurrency: int
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Call `fn(item)` for the items of `work` with at most `concurrency` calls in
+    flight, yielding `(item, result)` as each call finishes.
+
+    Items are taken from `work` by position, so the consumer may append to it
+    while iterating (e.g. subdirectories discovered by a listing). A call that
+    raises yields the exception as its result.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="agentbay-map"
+    )
+    pending = {}
+    next_index = 0
+    try:
+        while True:
+            while len(pending) < concurrency and next_index < len(work):
+                item = work[next_index]
+                next_index += 1
+                pending[executor.submit(_call, fn, item)] = item
+            if not pending:
+                return
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                yield item, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+'''
+
+# Thread-pool implementation of session_group._fan_out for the sync API.
+# Worker threads cannot be interrupted, so a call that exceeds the per-session
+# timeout is reported as timed out and abandoned; it keeps its worker until it returns.
+SYNC_SESSION_GROUP_FAN_OUT = '''
+def _fan_out(
+    sessions: Sequence[Session],
+    fn: SessionOperation,
+    concurrency: int,
+    timeout: Optional[float],
+) -> Iterator[SessionCallResult]:
+    """Run `fn` on every session with at most `concurrency` in flight, yielding as each finishes."""
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="agentbay-group"
+    )
+    started: Dict[int, float] = {}
+
+    def _one(index: int, session: Session) -> SessionCallResult:
+        started[index] = time.monotonic()
+        return _call(index, session, fn)
+
+    pending = {executor.submit(_one, i, s): i for i, s in enumerate(sessions)}
+    try:
+        while pending:
+            wait_s = None
+            if timeout is not None:
+                now = time.monotonic()
+                for future, index in list(pending.items()):
+                    if index in started and now - started[index] >= timeout:
+                        del pending[future]
+                        future.cancel()
+                        yield _timed_out(index, sessions[index], started[index], timeout)
+                if not pending:
+                    break
+                deadlines = [started[i] + timeout for i in pending.values() if i in started]
+                wait_s = max(0.0, min(deadlines) - now) if deadlines else None
+                if len(deadlines) < len(pending):
+                    # Queued calls get their deadline once a worker picks them up
+                    wait_s = 0.05 if wait_s is None else min(wait_s, 0.05)
+            done, _ = concurrent.futures.wait(
+                pending, timeout=wait_s, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                del pending[future]
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+'''
+
+
 def _apply_custom_replacements(content: str, file_path: str) -> str:
     """Apply custom replacements that unasync doesn't handle."""
     # Fix asyncio.wait_for with stop_event.wait() - this is a common pattern in filesystem.py
@@ -93,6 +184,11 @@ def generate_sync():
         "AsyncSession": "Session",
         "AsyncBrowser": "Browser",
         "AsyncCommand": "Command",
+        "AsyncCommandJob": "CommandJob",
+        "AsyncCodeContext": "CodeContext",
+        "AsyncSessionGroup": "SessionGroup",
+        "AsyncSessionPool": "SessionPool",
+        "AsyncSessionReaper": "SessionReaper",
         "AsyncCode": "Code",
         "AsyncFileSystem": "FileSystem",
         "AsyncContextManager": "ContextManager",
@@ -104,6 +200,7 @@ def generate_sync():
         "AsyncOss": "Oss",
         "AsyncAgent": "Agent",
         "AsyncBrowserAgent": "BrowserAgent",
+        "AsyncBrowserConnection": "BrowserConnection",
         "AsyncBrowserFingerprintGenerator": "BrowserFingerprintGenerator",
         "AsyncBaseService": "BaseService",
         "AsyncMobileSimulateService": "MobileSimulateService",
@@ -140,7 +237,6 @@ def generate_sync():
         "_execute_observe_async": "_execute_observe",
         "_execute_screenshot_async": "_execute_screenshot",
         "_get_page_and_context_index_async": "_get_page_and_context_index",
-        "_scroll_to_load_all_content_async": "_scroll_to_load_all_content",
         # "page_use_act_async": "page_use_act",  # Keep async API for compatibility
         # "page_use_extract_async": "page_use_extract",
         # "page_use_observe_async": "page_use_observe",
@@ -383,8 +479,9 @@ def generate_sync():
                                 insert_pos = last_import_match.end()
                                 content = content[:insert_pos] + 'import threading\n' + content[insert_pos:]
 
-                    # Add time import if time.sleep or time.time is used
-                    if ('time.sleep' in content or 'time.time' in content) and 'import time' not in content:
+                    # Add time import if time.sleep or time.time is called (not just named
+                    # in a string, e.g. a patch("time.sleep") target)
+                    if re.search(r'(?<![\w."\'])time\.(sleep|time)\(', content) and 'import time' not in content:
                         content = "import time\n" + content
 
                     # Add concurrent.futures import if ThreadPoolExecutor is used
@@ -498,6 +595,50 @@ def generate_sync():
                         content = content.replace("asyncio.get_event_loop().run_until_complete(", "")
                         pass
 
+                    if path == os.path.join(SYNC_DIR, "session_group.py"):
+                        # The semaphore/task based fan-out has no sync equivalent after unasync;
+                        # swap in a thread-pool implementation with the same contract.
+                        content = re.sub(
+                            r"def _fan_out\(.*?(?=\n\n\nclass )",
+                            lambda _: SYNC_SESSION_GROUP_FAN_OUT.strip("\n"),
+                            content,
+                            flags=re.DOTALL,
+                        )
+                        content = content.replace("Callable[[Session], Awaitable[Any]]", "Callable[[Session], Any]")
+                        content = content.replace("    Awaitable,\n", "")
+                        if "import concurrent.futures" not in content:
+                            content = content.replace("import time\n", "import concurrent.futures\nimport time\n", 1)
+
+                    if path == os.path.join(SYNC_DIR, "concurrency.py"):
+                        # Bounded concurrent map on a thread pool
+                        content = re.sub(
+                            r"def map_unordered\(.*",
+                            lambda _: SYNC_MAP_UNORDERED.strip("\n") + "\n",
+                            content,
+                            flags=re.DOTALL,
+                        )
+                        if "import concurrent.futures" not in content:
+                            content = content.replace(
+                                "from typing", "import concurrent.futures\nfrom typing", 1
+                            )
+
+                    if root == SYNC_DIR and file in ("session_pool.py", "session_reaper.py"):
+                        # Background work runs in a daemon thread instead of a task
+                        content = content.replace(
+                            "        return asyncio.ensure_future(fn())\n",
+                            "        thread = threading.Thread(target=fn, daemon=True)\n"
+                            "        thread.start()\n"
+                            "        return thread\n",
+                        )
+                        content = content.replace(
+                            '        """Wait for a background run started by `_spawn`."""\n        handle\n',
+                            '        """Wait for a background run started by `_spawn`."""\n        handle.join()\n',
+                        )
+                        content = content.replace(
+                            "return handle is not None and not handle.done()",
+                            "return handle is not None and handle.is_alive()",
+                        )
+
                     # Test specific cleanup
                     content = content.replace("@pytest.mark.asyncio", "@pytest.mark.sync")
                     content = content.replace("@pytest_asyncio.fixture", "@pytest.fixture")
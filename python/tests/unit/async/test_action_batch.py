@@ -0,0 +1,132 @@
+"""
+Unit tests for Computer.batch / Mobile.batch.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from agentbay import ActionBatchResult, AsyncComputer, AsyncMobile
+
+
+def _ok(request_id="req"):
+    result = Mock()
+    result.success = True
+    result.request_id = request_id
+    result.error_message = ""
+    return result
+
+
+def _fail(message="tool failed"):
+    result = Mock()
+    result.success = False
+    result.request_id = "req-fail"
+    result.error_message = message
+    return result
+
+
+class TestComputerBatch:
+    def setup_method(self):
+        self.session = Mock()
+        self.session.call_mcp_tool = AsyncMock(return_value=_ok())
+        self.computer = AsyncComputer(self.session)
+
+    @pytest.mark.asyncio
+    async def test_batch_executes_actions_in_order(self):
+        result = await self.computer.batch(
+            [
+                {"action": "click_mouse", "x": 10, "y": 20},
+                {"action": "input_text", "text": "hello"},
+                {"action": "wait", "ms": 0},
+                {"action": "press_keys", "keys": ["Enter"]},
+            ]
+        )
+
+        assert isinstance(result, ActionBatchResult)
+        assert result.success is True
+        assert result.failed_index is None
+        assert len(result.results) == 4
+        calls = [c.args[0] for c in self.session.call_mcp_tool.call_args_list]
+        assert calls == ["click_mouse", "input_text", "press_keys"]
+
+    @pytest.mark.asyncio
+    async def test_batch_stops_on_first_error(self):
+        self.session.call_mcp_tool = AsyncMock(side_effect=[_ok(), _fail(), _ok()])
+
+        result = await self.computer.batch(
+            [
+                {"action": "move_mouse", "x": 1, "y": 1},
+                {"action": "click_mouse", "x": 2, "y": 2},
+                {"action": "input_text", "text": "never sent"},
+            ]
+        )
+
+        assert result.success is False
+        assert result.failed_index == 1
+        assert result.error_message == "tool failed"
+        assert len(result.results) == 2
+        assert self.session.call_mcp_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_continues_when_requested(self):
+        self.session.call_mcp_tool = AsyncMock(side_effect=[_fail(), _ok()])
+
+        result = await self.computer.batch(
+            [
+                {"action": "click_mouse", "x": 2, "y": 2},
+                {"action": "input_text", "text": "still sent"},
+            ],
+            stop_on_error=False,
+        )
+
+        assert result.success is False
+        assert result.failed_index == 0
+        assert len(result.results) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_step_argument_error_is_a_failed_step(self):
+        result = await self.computer.batch(
+            [{"action": "click_mouse", "x": 1, "y": 1, "button": "bogus"}]
+        )
+
+        assert result.success is False
+        assert result.failed_index == 0
+        assert "Invalid button" in result.error_message
+        self.session.call_mcp_tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_unknown_action_before_running(self):
+        with pytest.raises(ValueError):
+            await self.computer.batch(
+                [
+                    {"action": "click_mouse", "x": 1, "y": 1},
+                    {"action": "screenshot"},
+                ]
+            )
+        self.session.call_mcp_tool.assert_not_called()
+
+
+class TestMobileBatch:
+    def setup_method(self):
+        self.session = Mock()
+        self.session.call_mcp_tool = AsyncMock(return_value=_ok())
+        self.mobile = AsyncMobile(self.session)
+
+    @pytest.mark.asyncio
+    async def test_batch_dispatches_mobile_actions(self):
+        result = await self.mobile.batch(
+            [
+                {"action": "tap", "x": 5, "y": 6},
+                {"action": "swipe", "start_x": 0, "start_y": 0, "end_x": 1, "end_y": 1},
+                {"action": "send_key", "key": 4},
+            ]
+        )
+
+        assert result.success is True
+        calls = [c.args[0] for c in self.session.call_mcp_tool.call_args_list]
+        assert calls == ["tap", "swipe", "send_key"]
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_computer_actions(self):
+        with pytest.raises(ValueError):
+            await self.mobile.batch([{"action": "click_mouse", "x": 1, "y": 1}])
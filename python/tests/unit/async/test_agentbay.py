@@ -40,7 +40,7 @@ class TestAsyncAgentBay(unittest.IsolatedAsyncioTestCase):
         # Verify results
         self.assertEqual(agent_bay.api_key, "test-api-key")
         self.assertEqual(agent_bay.client, mock_client)
-        self.assertDictEqual(agent_bay._sessions, {})
+        self.assertEqual(len(agent_bay._sessions), 0)
         self.assertIsNotNone(agent_bay._lock)
         self.assertIsNotNone(agent_bay.context)
 
@@ -345,6 +345,14 @@ class TestAsyncAgentBay(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.session_ids[0]["sessionId"], "session-3")
         self.assertEqual(result.session_ids[1]["sessionId"], "session-4")
 
+        # With the token of page 1, page 2 is fetched in a single call
+        mock_client.list_session_async = AsyncMock(return_value=mock_response_page2)
+        result = await agent_bay.list(labels={"env": "prod"}, limit=2, next_token="token-page2")
+        self.assertEqual(result.session_ids[0]["sessionId"], "session-3")
+        mock_client.list_session_async.assert_called_once()
+        request = mock_client.list_session_async.call_args.args[0]
+        self.assertEqual(request.next_token, "token-page2")
+
     @patch("agentbay._async.agentbay.extract_request_id")
     @patch("agentbay._async.agentbay._load_config")
     @patch("agentbay._async.agentbay.mcp_client")
@@ -57,6 +57,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.set_viewport_size = AsyncMock()
+        mock_page.context.new_cdp_session = AsyncMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = AsyncMock(return_value=b"fake_screenshot_data")
 
         # Call the screenshot method
@@ -84,6 +85,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.set_viewport_size = AsyncMock()
+        mock_page.context.new_cdp_session = AsyncMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = AsyncMock(return_value=b"fake_full_page_screenshot_data")
 
         # Call the screenshot method with full_page=True
@@ -118,6 +120,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.set_viewport_size = AsyncMock()
+        mock_page.context.new_cdp_session = AsyncMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = AsyncMock(return_value=b"fake_custom_screenshot_data")
 
         # Call the screenshot method with custom options
@@ -149,6 +152,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.set_viewport_size = AsyncMock()
+        mock_page.context.new_cdp_session = AsyncMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = AsyncMock(side_effect=Exception("Screenshot failed"))
 
         # Call the screenshot method and expect it to raise RuntimeError
@@ -172,6 +176,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.set_viewport_size = AsyncMock()
+        mock_page.context.new_cdp_session = AsyncMock(side_effect=Exception("no CDP"))
 
         # Create a mock exception that raises an error when converted to string
         class UnconvertibleException(Exception):
@@ -0,0 +1,133 @@
+"""
+Unit tests for background command jobs (AsyncCommand.start).
+
+The fake session runs the generated shell scripts with the local /bin/sh, so
+these tests exercise the real launcher, offset reads and kill scripts.
+"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from agentbay import AsyncCommand, AsyncCommandJob, CommandError, McpToolResult
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="requires sh")
+
+
+class LocalShellSession:
+    def __init__(self):
+        self.calls = []
+
+    async def call_mcp_tool(self, name, args):
+        self.calls.append(args["command"])
+        proc = subprocess.run(
+            ["sh", "-c", args["command"]],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd="/tmp",
+        )
+        data = json.dumps(
+            {"stdout": proc.stdout, "stderr": proc.stderr, "exit_code": proc.returncode}
+        )
+        if proc.returncode == 0:
+            return McpToolResult(request_id="req", success=True, data=data)
+        return McpToolResult(request_id="req", success=False, error_message=data)
+
+
+@pytest.fixture
+def command():
+    return AsyncCommand(LocalShellSession())
+
+
+class TestCommandJob:
+    @pytest.mark.asyncio
+    async def test_start_and_wait_collects_output(self, command):
+        job = await command.start(
+            "echo out; echo err >&2; echo $GREETING; exit 3",
+            envs={"GREETING": "hi there"},
+        )
+        try:
+            assert isinstance(job, AsyncCommandJob)
+            result = await job.wait(timeout_ms=10000)
+
+            assert result.success is False
+            assert result.exit_code == 3
+            assert result.stdout == "out\nhi there\n"
+            assert result.stderr == "err\n"
+            assert job.finished is True
+        finally:
+            await job.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_stream_reads_incrementally_by_offset(self, command):
+        job = await command.start("for i in 1 2 3; do echo line$i; sleep 0.2; done")
+        try:
+            chunks = [c async for c in job.stream(min_interval_ms=50, max_interval_ms=100)]
+
+            assert "".join(c.stdout for c in chunks) == "line1\nline2\nline3\n"
+            assert chunks[-1].finished is True
+            assert chunks[-1].exit_code == 0
+            assert job.stdout_offset == len("line1\nline2\nline3\n")
+            assert len(chunks) >= 2
+        finally:
+            await job.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_poll_honours_max_bytes(self, command):
+        job = await command.start("printf 'abcdefghij'", cwd="/tmp")
+        try:
+            chunks = []
+            while not job.finished:
+                chunk = await job.poll(max_bytes=4)
+                assert chunk.success is True
+                chunks.append(chunk)
+
+            assert all(len(c.stdout) <= 4 for c in chunks)
+            assert "".join(c.stdout for c in chunks) == "abcdefghij"
+            assert chunks[-1].exit_code == 0
+            assert job.stdout_offset == 10
+        finally:
+            await job.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_kill_stops_job(self, command):
+        job = await command.start("sleep 30")
+        try:
+            killed = await job.kill()
+            result = await job.wait(timeout_ms=10000)
+
+            assert killed.success is True
+            assert result.exit_code == 143
+        finally:
+            await job.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_poll_after_cleanup_reports_missing_job(self, command):
+        job = await command.start("true")
+        await job.wait(timeout_ms=10000)
+        await job.cleanup()
+        job._finished = False
+
+        chunk = await job.poll()
+
+        assert chunk.success is False
+        assert "not found" in chunk.error_message
+
+    @pytest.mark.asyncio
+    async def test_start_rejects_invalid_envs(self, command):
+        with pytest.raises(ValueError):
+            await command.start("true", envs={"A": 1})
+
+    @pytest.mark.asyncio
+    async def test_start_failure_raises(self):
+        session = LocalShellSession()
+
+        async def failing(name, args):
+            return McpToolResult(request_id="req", success=False, error_message="denied")
+
+        session.call_mcp_tool = failing
+        with pytest.raises(CommandError):
+            await AsyncCommand(session).start("true")
@@ -0,0 +1,124 @@
+import base64
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncFileSystem, CommandResult, McpToolResult
+
+
+class FakeSession:
+    """Serves files from a dict and counts the tool calls."""
+
+    def __init__(self, files):
+        self.files = files
+        self.mtimes = {path: "2024-01-01 00:00:00.000000000 +0000" for path in files}
+        self.tool_calls = []
+        self.command = MagicMock()
+        self.command.execute_command = AsyncMock(side_effect=self._stat)
+
+    async def _stat(self, command, **kwargs):
+        lines = [
+            f"regular file|{len(content.encode())}|{self.mtimes[path]}|{path}"
+            for path, content in self.files.items()
+            if f"'{path}'" in command or f" {path}" in command
+        ]
+        return CommandResult(success=True, stdout="\n".join(lines))
+
+    async def call_mcp_tool(self, name, args):
+        self.tool_calls.append(name)
+        if name == "get_file_info":
+            content = self.files[args["path"]]
+            return McpToolResult(
+                request_id="r", success=True, data=f"size: {len(content.encode())}\nisDirectory: false"
+            )
+        if name == "read_file":
+            chunk = self.files[args["path"]][args["offset"]:args["offset"] + args["length"]]
+            if args.get("format") == "binary":
+                chunk = base64.b64encode(chunk.encode()).decode()
+            return McpToolResult(request_id="r", success=True, data=chunk)
+        if name == "read_multiple_files":
+            data = "\n---\n".join(f"{path}: {self.files[path]}" for path in args["paths"])
+            return McpToolResult(request_id="r", success=True, data=data)
+        return McpToolResult(request_id="r", success=True, data="ok")
+
+
+@pytest.mark.asyncio
+async def test_read_file_without_cache_does_not_stat():
+    session = FakeSession({"/a.txt": "hello"})
+    fs = AsyncFileSystem(session)
+
+    assert (await fs.read_file("/a.txt")).content == "hello"
+    assert fs.content_cache is None
+    session.command.execute_command.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_repeated_read_is_served_from_cache():
+    session = FakeSession({"/a.txt": "hello"})
+    fs = AsyncFileSystem(session)
+    cache = fs.enable_cache()
+
+    first = await fs.read_file("/a.txt")
+    second = await fs.read_file("/a.txt")
+
+    assert first.content == second.content == "hello"
+    assert session.tool_calls == ["get_file_info", "read_file"]
+    assert session.command.execute_command.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_changed_mtime_forces_a_reread():
+    session = FakeSession({"/a.txt": "hello"})
+    fs = AsyncFileSystem(session)
+    cache = fs.enable_cache()
+    await fs.read_file("/a.txt")
+
+    session.files["/a.txt"] = "world"
+    session.mtimes["/a.txt"] = "2024-01-01 00:00:01.000000000 +0000"
+
+    assert (await fs.read_file("/a.txt")).content == "world"
+    assert cache.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_sdk_writes_invalidate_the_cache():
+    session = FakeSession({"/d/a.txt": "hello", "/d/b.txt": "bye"})
+    fs = AsyncFileSystem(session)
+    cache = fs.enable_cache()
+    await fs.read_file("/d/a.txt")
+    await fs.read_file("/d/b.txt", format="bytes")
+    assert len(cache) == 2
+
+    await fs.write_file("/d/a.txt", "new")
+    assert len(cache) == 1
+    await fs.move_file("/d", "/e")
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_read_multiple_files_only_fetches_misses():
+    session = FakeSession({"/a": "A", "/b": "B"})
+    fs = AsyncFileSystem(session)
+    cache = fs.enable_cache()
+
+    await fs.read_multiple_files(["/a"])
+    result = await fs.read_multiple_files(["/a", "/b"])
+
+    assert result.success
+    assert result.contents == {"/a": "A", "/b": "B"}
+    assert session.tool_calls == ["read_multiple_files", "read_multiple_files"]
+    assert cache.hits == 1
+
+    result = await fs.read_multiple_files(["/a", "/b"])
+    assert result.contents == {"/a": "A", "/b": "B"}
+    assert len(session.tool_calls) == 2
+    assert session.command.execute_command.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_disable_cache():
+    fs = AsyncFileSystem(FakeSession({}))
+    fs.enable_cache(max_bytes=1024)
+    fs.disable_cache()
+    assert fs.content_cache is None
@@ -0,0 +1,128 @@
+import base64
+import os
+import random
+
+import pytest
+
+from agentbay import AsyncFileSystem, CommandResult
+
+
+def build_log(lines):
+    rng = random.Random(7)
+    levels = ["INFO", "DEBUG", "WARN"]
+    return "".join(
+        f"2024-05-01T12:{i % 60:02d}:00Z {rng.choice(levels)} worker-{i % 8} handled request {i}\n"
+        for i in range(lines)
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_text_write_is_compressed(tmp_path, sandbox):
+    target = tmp_path / "logs" / "app.log"
+    content = build_log(20_000)
+
+    result = await AsyncFileSystem(sandbox).write_file(str(target), content, compression="auto")
+
+    assert result.success, result.error_message
+    assert target.read_text() == content
+    stats = result.transfer_stats
+    assert stats.compression == "gzip"
+    assert stats.raw_bytes == len(content)
+    assert stats.ratio < 0.3
+    assert sandbox.written < len(content) // 2
+    assert stats.calls < -(-len(content) // AsyncFileSystem.MAX_CONTENT_BYTES)
+
+
+@pytest.mark.asyncio
+async def test_compressed_append_and_small_writes(tmp_path, sandbox):
+    target = tmp_path / "out.txt"
+    fs = AsyncFileSystem(sandbox)
+
+    small = await fs.write_file(str(target), "header\n")
+    assert small.transfer_stats.compression is None
+    assert small.transfer_stats.calls == 1
+
+    body = build_log(5000)
+    appended = await fs.write_file(str(target), body, mode="append", compression="gzip")
+
+    assert appended.success, appended.error_message
+    assert appended.transfer_stats.compression == "gzip"
+    assert target.read_text() == "header\n" + body
+
+
+@pytest.mark.asyncio
+async def test_incompressible_content_is_written_plain(tmp_path, sandbox):
+    target = tmp_path / "random.txt"
+    content = base64.b64encode(random.Random(3).randbytes(120 * 1024)).decode()
+
+    result = await AsyncFileSystem(sandbox).write_file(str(target), content, compression="auto")
+
+    assert result.success
+    assert result.transfer_stats.compression is None
+    assert target.read_text() == content
+
+
+@pytest.mark.asyncio
+async def test_large_text_read_is_compressed(tmp_path, sandbox):
+    source = tmp_path / "big.log"
+    content = build_log(20_000)
+    source.write_text(content)
+
+    result = await AsyncFileSystem(sandbox).read_file(str(source), compression="auto")
+
+    assert result.success, result.error_message
+    assert result.content == content
+    assert result.transfer_stats.compression == "gzip"
+    assert result.transfer_stats.transferred_bytes < len(content) // 3
+    assert sandbox.tool_calls.count("read_file") < -(-len(content) // AsyncFileSystem.DEFAULT_CHUNK_SIZE)
+    assert os.listdir(tmp_path) == ["big.log"]
+    assert not os.listdir(sandbox.tmp)
+
+
+@pytest.mark.asyncio
+async def test_transfers_are_uncompressed_by_default(tmp_path, sandbox):
+    source = tmp_path / "big.log"
+    content = build_log(20_000)
+    fs = AsyncFileSystem(sandbox)
+
+    written = await fs.write_file(str(source), content)
+    assert written.success, written.error_message
+    assert written.transfer_stats.compression is None
+
+    result = await fs.read_file(str(source))
+
+    assert result.content == content
+    assert result.transfer_stats.compression is None
+    assert not sandbox.commands
+
+
+@pytest.mark.asyncio
+async def test_failed_inflate_removes_the_temporary_file(tmp_path, sandbox):
+    target = tmp_path / "out.log"
+    content = build_log(20_000)
+    run = sandbox.execute_command
+
+    async def execute_command(command, **kwargs):
+        if "base64 -d" in command:
+            return CommandResult(request_id="cmd", success=False, error_message="no shell")
+        return await run(command, **kwargs)
+
+    sandbox.execute_command = execute_command
+    result = await AsyncFileSystem(sandbox).write_file(str(target), content, compression="auto")
+
+    # The plain write takes over, and the uploaded archive is removed
+    assert result.success, result.error_message
+    assert result.transfer_stats.compression is None
+    assert target.read_text() == content
+    temp = [c for c in sandbox.commands if c.startswith("rm -f -- ") and ".agentbay-z-" in c]
+    assert len(temp) == 1
+    assert not os.listdir(sandbox.tmp)
+
+
+@pytest.mark.asyncio
+async def test_unknown_compression_mode(sandbox):
+    fs = AsyncFileSystem(sandbox)
+    with pytest.raises(ValueError):
+        await fs.write_file("/tmp/x", "data", compression="lz4")
+    with pytest.raises(ValueError):
+        await fs.read_file("/tmp/x", compression="lz4")
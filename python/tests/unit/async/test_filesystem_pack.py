@@ -0,0 +1,106 @@
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncFileSystem
+
+
+def make_tree(root, count=50):
+    for i in range(count):
+        sub = root / f"pkg{i % 5}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"mod{i}.py").write_text(f"value = {i}\n" * (i + 1))
+    (root / "data.bin").write_bytes(os.urandom(4096))
+
+
+def read_tree(root):
+    return {
+        os.path.relpath(os.path.join(dirpath, name), root): open(os.path.join(dirpath, name), "rb").read()
+        for dirpath, _, names in os.walk(root)
+        for name in names
+    }
+
+
+@pytest.mark.asyncio
+async def test_pack_upload_moves_a_tree_in_few_calls(tmp_path, sandbox):
+    local, remote = tmp_path / "local", tmp_path / "remote" / "dst"
+    make_tree(local)
+    fs = AsyncFileSystem(sandbox)
+
+    result = await fs.pack_upload(str(local), str(remote))
+
+    assert result.success, result.error_message
+    assert len(result.files) == 51
+    assert result.archive_size > 0
+    assert read_tree(remote) == read_tree(local)
+    assert sandbox.tool_calls == ["write_file"]
+    # The remote archive is removed after extraction
+    assert not any(name.startswith(".agentbay-pack-") for name in os.listdir(sandbox.tmp))
+
+
+@pytest.mark.asyncio
+async def test_pack_upload_selected_paths_in_several_chunks(tmp_path, sandbox):
+    local, remote = tmp_path / "local", tmp_path / "remote"
+    local.mkdir()
+    (local / "big.bin").write_bytes(os.urandom(200_000))
+    (local / "skip.txt").write_text("not uploaded")
+    fs = AsyncFileSystem(sandbox)
+
+    result = await fs.pack_upload(str(local), str(remote), paths=["big.bin"])
+
+    assert result.success, result.error_message
+    assert result.files == ["big.bin"]
+    assert fs.session.tool_calls.count("write_file") > 1
+    assert read_tree(remote) == {"big.bin": (local / "big.bin").read_bytes()}
+
+
+@pytest.mark.asyncio
+async def test_pack_download_round_trip(tmp_path, sandbox):
+    remote, local = tmp_path / "remote", tmp_path / "local"
+    make_tree(remote)
+    fs = AsyncFileSystem(sandbox)
+
+    result = await fs.pack_download(str(remote), str(local))
+
+    assert result.success, result.error_message
+    assert len(result.files) == 51
+    assert read_tree(local) == read_tree(remote)
+    assert set(sandbox.tool_calls) == {"read_file"}
+
+
+@pytest.mark.asyncio
+async def test_pack_download_sends_large_files_individually(tmp_path, sandbox):
+    remote, local = tmp_path / "remote", tmp_path / "local"
+    make_tree(remote, count=5)
+    fs = AsyncFileSystem(sandbox)
+    fs.download_file = AsyncMock(return_value=MagicMock(success=True))
+
+    result = await fs.pack_download(str(remote), str(local), large_file_threshold=1024)
+
+    assert result.success, result.error_message
+    assert result.large_files == ["data.bin"]
+    assert "data.bin" not in result.files and len(result.files) == 5
+    fs.download_file.assert_called_once_with(str(remote / "data.bin"), str(local / "data.bin"))
+
+    subset = await fs.pack_download(str(remote), str(tmp_path / "subset"), paths=["pkg1/mod1.py"])
+    assert subset.files == ["pkg1/mod1.py"]
+
+
+@pytest.mark.asyncio
+async def test_pack_upload_large_files_and_errors(tmp_path, sandbox):
+    local = tmp_path / "local"
+    make_tree(local, count=2)
+    fs = AsyncFileSystem(sandbox)
+    fs.upload_file = AsyncMock(return_value=MagicMock(success=False, error_message="no context"))
+
+    result = await fs.pack_upload(str(local), str(tmp_path / "remote"), large_file_threshold=1024)
+
+    assert not result.success
+    assert result.large_files == ["data.bin"]
+    assert "no context" in result.error_message
+
+    missing = await fs.pack_upload(str(tmp_path / "missing"), "/tmp/x")
+    assert not missing.success
+    with pytest.raises(ValueError):
+        await fs.pack_upload(str(local), "/tmp/x", via="ftp")
@@ -228,7 +228,9 @@ class TestAsyncFileSystemRefactor(unittest.IsolatedAsyncioTestCase):
 
         # Create content larger than default chunk size (50KB)
         large_content = "x" * (150 * 1024)  # 150KB content
-        result = await self.fs.write_file("/path/to/large_file.txt", large_content)
+        result = await self.fs.write_file(
+            "/path/to/large_file.txt", large_content, compression="none"
+        )
 
         self.assertIsInstance(result, BoolResult)
         self.assertTrue(result.success)
@@ -0,0 +1,112 @@
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentbay import AsyncBrowserFingerprintGenerator, FingerprintCache
+from agentbay._common.models.fingerprint import FingerprintFormat
+from agentbay._async import fingerprint as fingerprint_module
+
+EXAMPLE = os.path.join(
+    os.path.dirname(__file__), "../../../../resource/fingerprint.example.json"
+)
+
+
+def example(width=2560, height=1440):
+    with open(EXAMPLE) as f:
+        data = json.load(f)
+    data["fingerprint"]["screen"].update(width=width, height=height)
+    return data
+
+
+def fake_playwright():
+    """
+    Playwright stand-in launching browsers whose contexts are MagicMocks.
+    Their pages remember the screen emulated by the context, if any.
+    """
+    browser = MagicMock()
+    browser.close = AsyncMock()
+
+    async def new_context(**options):
+        page = MagicMock(goto=AsyncMock(), emulated_screen=options.get("screen"))
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        context.close = AsyncMock()
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    p = MagicMock()
+    p.chromium.launch = AsyncMock(return_value=browser)
+    return p, browser
+
+
+def make_generator(tmp_path):
+    generator = AsyncBrowserFingerprintGenerator(
+        headless=True, cache=FingerprintCache(str(tmp_path))
+    )
+    generator._key = "test-key"
+
+    # The browser reports the host's 2560x1440 screen unless one is emulated
+    async def extract(page):
+        screen = page.emulated_screen
+        if screen is None:
+            return example()["fingerprint"]
+        return example(screen["width"], screen["height"])["fingerprint"]
+
+    generator._extract_fingerprint_data = AsyncMock(side_effect=extract)
+    generator._extract_headers_data = AsyncMock(return_value=example()["headers"])
+    return generator
+
+
+@pytest.mark.asyncio
+async def test_generate_fingerprint_is_served_from_cache(tmp_path):
+    p, browser = fake_playwright()
+    generator = make_generator(tmp_path)
+    with patch.object(fingerprint_module, "async_playwright") as playwright:
+        playwright.return_value.__aenter__.return_value = p
+        first = await generator.generate_fingerprint()
+        again = await generator.generate_fingerprint()
+        refreshed = await generator.generate_fingerprint(refresh=True)
+
+    assert again == first
+    assert refreshed == first
+    assert p.chromium.launch.call_count == 2
+    assert browser.close.call_count == 2
+    assert len(generator.cache.pool("test-key")) == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_fingerprints_emulates_screens_in_one_browser(tmp_path):
+    p, browser = fake_playwright()
+    generator = make_generator(tmp_path)
+    with patch.object(fingerprint_module, "async_playwright") as playwright:
+        playwright.return_value.__aenter__.return_value = p
+        pool = await generator.generate_fingerprints(4)
+        cached = await generator.generate_fingerprints(4)
+
+    screens = [(f.fingerprint.screen.width, f.fingerprint.screen.height) for f in pool]
+    assert screens == [(2560, 1440), (1920, 1080), (1536, 864), (1366, 768)]
+    assert len(set(f._to_json() for f in pool)) == 4
+    p.chromium.launch.assert_called_once()
+    assert browser.new_context.call_count == 4
+    emulated = browser.new_context.call_args_list[1].kwargs
+    assert emulated["screen"] == {"width": 1920, "height": 1080}
+    assert emulated["viewport"]["width"] == 1920
+    assert sorted(f._to_json() for f in cached) == sorted(f._to_json() for f in pool)
+
+
+@pytest.mark.asyncio
+async def test_generate_fingerprints_skips_cached_and_duplicate_screens(tmp_path):
+    p, browser = fake_playwright()
+    generator = make_generator(tmp_path)
+    generator.cache.put("test-key", FingerprintFormat._from_dict(example(1920, 1080)))
+    with patch.object(fingerprint_module, "async_playwright") as playwright:
+        playwright.return_value.__aenter__.return_value = p
+        pool = await generator.generate_fingerprints(20)
+
+    screens = [(f.fingerprint.screen.width, f.fingerprint.screen.height) for f in pool]
+    assert screens[:2] == [(1920, 1080), (2560, 1440)]
+    # Every variant once; the host screen equals the 2560x1440 variant
+    assert len(set(screens)) == len(screens) == len(fingerprint_module.SCREEN_VARIANTS)
+    assert browser.new_context.call_count == len(fingerprint_module.SCREEN_VARIANTS)
@@ -0,0 +1,67 @@
+"""
+Memory-growth test for the AsyncAgentBay session cache.
+
+Creates and drops 100k sessions through the client's session builder (no
+network involved) and checks that neither the cache nor the traced memory
+keeps growing once the cache is full.
+"""
+
+import gc
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from agentbay import AsyncAgentBay, AsyncSession, CreateSessionParams
+
+TOTAL_SESSIONS = 100_000
+CACHE_SIZE = 256
+TRACED_SESSIONS = 10_000
+
+
+def test_session_cache_bounds_are_configurable():
+    agent_bay = AsyncAgentBay(
+        api_key="test_api_key", session_cache_size=8, session_cache_ttl=60.0
+    )
+    assert agent_bay._sessions.max_size == 8
+    assert agent_bay._sessions.ttl == 60.0
+    assert AsyncAgentBay(api_key="test_api_key", session_cache_ttl=None)._sessions.ttl is None
+    with pytest.raises(ValueError):
+        AsyncAgentBay(api_key="test_api_key", session_cache_size=0)
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+# A Mock logger would itself retain every call, so silence logging with plain no-ops.
+_SILENT_LOGGER = SimpleNamespace(debug=_noop, info=_noop, warning=_noop, error=_noop)
+
+
+@pytest.mark.asyncio
+async def test_dropped_sessions_do_not_accumulate():
+    agent_bay = AsyncAgentBay(api_key="test_api_key", session_cache_size=CACHE_SIZE)
+    params = CreateSessionParams()
+    # Tracing every allocation is slow; trace the last part of the run, when
+    # the cache has long reached its steady state.
+    traced_from = TOTAL_SESSIONS - TRACED_SESSIONS
+
+    with patch("agentbay._async.agentbay._logger", _SILENT_LOGGER):
+        try:
+            for i in range(TOTAL_SESSIONS):
+                if i == traced_from:
+                    gc.collect()
+                    tracemalloc.start()
+                    baseline, _ = tracemalloc.get_traced_memory()
+                await agent_bay._build_session_from_response({"SessionId": f"s-{i}"}, params)
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    live = sum(1 for obj in gc.get_objects() if isinstance(obj, AsyncSession))
+    assert len(agent_bay._sessions) <= CACHE_SIZE
+    assert live <= CACHE_SIZE
+    # Unbounded, the traced sessions alone would retain tens of megabytes.
+    assert current - baseline < 2 * 1024 * 1024
@@ -0,0 +1,182 @@
+"""
+Unit tests for AsyncSessionReaper, non-blocking deletion and AsyncAgentBay.session().
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentbay import (
+    AsyncAgentBay,
+    AsyncSession,
+    AsyncSessionReaper,
+    DeleteResult,
+    SessionError,
+    SessionResult,
+)
+
+
+def _make_session(session_id="s1", deleted=True, request_ok=True):
+    session = MagicMock()
+    session.session_id = session_id
+    session._request_delete = AsyncMock(
+        return_value=DeleteResult(
+            request_id="req", success=request_ok, error_message="" if request_ok else "throttled"
+        )
+    )
+    session._is_deleted = AsyncMock(return_value=deleted)
+    session._sync_context_before_delete = AsyncMock()
+    session._close_browser_connection = AsyncMock()
+    return session
+
+
+class TestAsyncSessionReaper:
+    def test_rejects_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            AsyncSessionReaper(max_attempts=0)
+
+    @pytest.mark.asyncio
+    async def test_submit_deletes_and_confirms(self):
+        reaper = AsyncSessionReaper(check_interval=0.01)
+        session = _make_session()
+
+        reaper.submit(session, sync_context=True)
+
+        assert reaper.pending == ["s1"]
+        assert await reaper.drain(timeout=5) is True
+        session._sync_context_before_delete.assert_called_once()
+        session._close_browser_connection.assert_called_once()
+        session._request_delete.assert_called_once()
+        session._is_deleted.assert_called()
+        assert reaper.stats() == {"pending": 0, "confirmed": 1, "retries": 0, "leaked": 0}
+
+    @pytest.mark.asyncio
+    async def test_track_only_confirms(self):
+        reaper = AsyncSessionReaper(check_interval=0.01)
+        session = _make_session()
+
+        reaper.track(session)
+
+        assert await reaper.drain(timeout=5) is True
+        session._request_delete.assert_not_called()
+        assert reaper.stats()["confirmed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_are_retried_then_reported_as_leaked(self):
+        reaper = AsyncSessionReaper(check_interval=0.01, max_attempts=3)
+        session = _make_session(request_ok=False)
+
+        reaper.submit(session)
+
+        assert await reaper.drain(timeout=5) is True
+        assert session._request_delete.call_count == 3
+        assert reaper.leaked == {"s1": "throttled"}
+        assert reaper.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_deletion_is_requested_again(self):
+        reaper = AsyncSessionReaper(check_interval=0.01, confirm_timeout=0.01, max_attempts=2)
+        session = _make_session(deleted=False)
+
+        reaper.track(session)
+
+        assert await reaper.drain(timeout=5) is True
+        session._request_delete.assert_called_once()
+        assert "still exists" in reaper.leaked["s1"]
+
+    @pytest.mark.asyncio
+    async def test_close_rejects_new_sessions(self):
+        reaper = AsyncSessionReaper(check_interval=0.01)
+        reaper.submit(_make_session())
+
+        leaked = await reaper.close(timeout=5)
+
+        assert leaked == {}
+        with pytest.raises(SessionError):
+            reaper.submit(_make_session("s2"))
+
+
+class TestNonBlockingDelete:
+    @pytest.mark.asyncio
+    async def test_delete_without_wait_hands_over_to_reaper(self):
+        agent_bay = MagicMock()
+        agent_bay.api_key = "test_api_key"
+        response = MagicMock()
+        response.to_map.return_value = {"body": {"Success": True, "RequestId": "request-123"}}
+        agent_bay.client.delete_session_async_async = AsyncMock(return_value=response)
+        session = AsyncSession(agent_bay, "s1")
+        session.get_status = AsyncMock()
+
+        with patch("agentbay._async.session.DeleteSessionAsyncRequest"):
+            result = await session.delete(wait=False)
+
+        assert result.success is True
+        assert result.request_id == "request-123"
+        session.get_status.assert_not_called()
+        agent_bay.reaper.track.assert_called_once_with(session)
+
+    @pytest.mark.asyncio
+    async def test_rejected_delete_is_not_tracked(self):
+        agent_bay = MagicMock()
+        agent_bay.api_key = "test_api_key"
+        response = MagicMock()
+        response.to_map.return_value = {
+            "body": {"Success": False, "Code": "Throttling", "Message": "slow down"}
+        }
+        agent_bay.client.delete_session_async_async = AsyncMock(return_value=response)
+        session = AsyncSession(agent_bay, "s1")
+
+        with patch("agentbay._async.session.DeleteSessionAsyncRequest"):
+            result = await session.delete(wait=False)
+
+        assert result.success is False
+        assert "Throttling" in result.error_message
+        agent_bay.reaper.track.assert_not_called()
+
+
+class TestAgentBaySessionContext:
+    @pytest.mark.asyncio
+    async def test_session_context_hands_cleanup_to_reaper(self):
+        agent_bay = AsyncAgentBay(api_key="test_api_key")
+        session = MagicMock(session_id="s1")
+        agent_bay.create = AsyncMock(return_value=SessionResult(success=True, session=session))
+        agent_bay._reaper = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            async with agent_bay.session(sync_context=True) as leased:
+                assert leased is session
+                raise RuntimeError("task failed")
+
+        agent_bay._reaper.submit.assert_called_once_with(session, sync_context=True)
+
+    @pytest.mark.asyncio
+    async def test_session_context_closes_browser_connection(self):
+        agent_bay = AsyncAgentBay(api_key="test_api_key")
+        agent_bay._reaper = AsyncSessionReaper(check_interval=0.01)
+        session = AsyncSession(agent_bay, "s1")
+        session._request_delete = AsyncMock(return_value=DeleteResult(request_id="req", success=True))
+        session._is_deleted = AsyncMock(return_value=True)
+        session.browser.connection.close = AsyncMock()
+        agent_bay.create = AsyncMock(return_value=SessionResult(success=True, session=session))
+
+        async with agent_bay.session():
+            pass
+
+        assert await agent_bay.reaper.drain(timeout=5) is True
+        session.browser.connection.close.assert_called_once()
+        session._request_delete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_session_context_raises_when_creation_fails(self):
+        agent_bay = AsyncAgentBay(api_key="test_api_key")
+        agent_bay.create = AsyncMock(
+            return_value=SessionResult(success=False, error_message="quota exceeded")
+        )
+
+        with pytest.raises(SessionError, match="quota exceeded"):
+            async with agent_bay.session():
+                pass
+
+    def test_reaper_is_created_once(self):
+        agent_bay = AsyncAgentBay(api_key="test_api_key")
+        assert agent_bay.reaper is agent_bay.reaper
@@ -0,0 +1,48 @@
+import base64
+import subprocess
+
+from agentbay._common.utils.batch_read import (
+    FRAME_OVERHEAD,
+    batch_read_command,
+    parse_batch_output,
+    plan_batches,
+)
+
+
+def test_plan_batches_respects_budget_and_order():
+    sizes = {"/a": 600, "/b": 300, "/c": 500, "/d": 100, "/big": 5000}
+    batches, large = plan_batches(sizes, 1000)
+
+    assert large == ["/big"]
+    assert sorted(p for batch in batches for p in batch) == ["/a", "/b", "/c", "/d"]
+    for batch in batches:
+        assert sum(sizes[p] + FRAME_OVERHEAD for p in batch) <= 1000
+        assert batch == sorted(batch, key=list(sizes).index)
+    assert len(batches) == 2
+
+
+def test_framing_survives_awkward_names_and_binary(tmp_path):
+    tricky = tmp_path / "a: b\n---"
+    tricky.write_text("x: 1\n---\ny: 2\n")
+    blob = tmp_path / "blob.bin"
+    blob.write_bytes(bytes(range(256)) * 4)
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    paths = [str(tricky), str(blob), str(empty), str(tmp_path / "missing")]
+
+    output = subprocess.run(
+        ["bash", "-c", batch_read_command(paths)], capture_output=True, text=True
+    ).stdout
+    contents, errors = parse_batch_output(output, paths)
+
+    assert contents[str(tricky)] == b"x: 1\n---\ny: 2\n"
+    assert contents[str(blob)] == bytes(range(256)) * 4
+    assert contents[str(empty)] == b""
+    assert list(errors) == [str(tmp_path / "missing")]
+
+
+def test_truncated_output_is_reported():
+    data = base64.b64encode(b"hello world").decode()
+    contents, errors = parse_batch_output(f"F 0 11\n{data[:8]}\n", ["/a", "/b"])
+    assert contents == {}
+    assert set(errors) == {"/a", "/b"}
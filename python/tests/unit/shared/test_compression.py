@@ -0,0 +1,40 @@
+import pytest
+
+from agentbay._common.utils.compression import (
+    TransferStats,
+    check_compression,
+    compress,
+    decompress,
+    should_compress,
+)
+
+
+def test_gzip_round_trip_is_deterministic():
+    data = b"2024-01-01 INFO request handled\n" * 1000
+    packed = compress(data, "gzip")
+    assert packed == compress(data, "gzip")
+    assert len(packed) < len(data) // 10
+    assert decompress(packed, "gzip") == data
+
+
+def test_check_compression_rejects_unknown_modes():
+    for mode in ("auto", "gzip", "none"):
+        check_compression(mode)
+    with pytest.raises(ValueError):
+        check_compression("brotli")
+
+
+def test_should_compress_counts_calls():
+    # 150 KB in 50 KB chunks is 3 calls; 20 KB compressed is 1 chunk + 1 command
+    assert should_compress(150 * 1024, 20 * 1024, 50 * 1024, 60 * 1024)
+    # Incompressible data gains nothing
+    assert not should_compress(150 * 1024, 150 * 1024, 50 * 1024, 60 * 1024)
+    # A single plain chunk can never be beaten
+    assert not should_compress(10 * 1024, 100, 50 * 1024, 60 * 1024)
+
+
+def test_transfer_stats_ratio():
+    stats = TransferStats("gzip", raw_bytes=1000, transferred_bytes=250, calls=2)
+    assert stats.ratio == 0.25
+    assert stats.bytes_saved == 750
+    assert TransferStats().ratio == 1.0
@@ -0,0 +1,64 @@
+import pytest
+
+from agentbay import FileContentCache
+
+
+def test_hit_requires_same_validator():
+    cache = FileContentCache()
+    cache.put("/a", "text", (3, "t1"), "abc")
+
+    assert cache.get("/a", "text", (3, "t1")) == "abc"
+    assert cache.get("/a", "bytes", (3, "t1")) is None
+    assert cache.get("/a", "text", (3, "t2")) is None
+    # The stale entry was dropped
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = FileContentCache(max_bytes=10)
+    cache.put("/a", "bytes", 1, b"aaaa")
+    cache.put("/b", "bytes", 1, b"bbbb")
+    cache.get("/a", "bytes", 1)
+    cache.put("/c", "bytes", 1, b"cccc")
+
+    assert cache.get("/b", "bytes", 1) is None
+    assert cache.get("/a", "bytes", 1) == b"aaaa"
+    assert cache.size_bytes == 8
+    assert cache.evictions == 1
+
+    cache.put("/huge", "bytes", 1, b"x" * 11)
+    assert cache.get("/huge", "bytes", 1) is None
+
+
+def test_size_counts_encoded_text():
+    cache = FileContentCache()
+    cache.put("/u", "text", 1, "éé")
+    assert cache.size_bytes == 4
+
+
+def test_invalidate_paths_and_subtrees():
+    cache = FileContentCache()
+    for path in ("/d/a", "/d/sub/b", "/dx", "/e"):
+        cache.put(path, "text", 1, "x")
+
+    assert cache.invalidate(["/d/"]) == 2
+    assert cache.invalidate(["/e"], recursive=False) == 1
+    assert sorted(key[0] for key in cache._entries) == ["/dx"]
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_stats_and_validation():
+    cache = FileContentCache(max_bytes=100)
+    cache.put("/a", "text", 1, "a")
+    cache.get("/a", "text", 1)
+    cache.get("/b", "text", 1)
+
+    stats = cache.stats()
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1 and stats["bytes"] == 1 and stats["max_bytes"] == 100
+    cache.clear()
+    assert len(cache) == 0 and cache.size_bytes == 0
+
+    with pytest.raises(ValueError):
+        FileContentCache(max_bytes=0)
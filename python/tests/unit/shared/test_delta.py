@@ -0,0 +1,125 @@
+import base64
+import hashlib
+import os
+import random
+import subprocess
+import zlib
+
+import pytest
+
+from agentbay._common.utils.delta import (
+    Signature,
+    choose_block_size,
+    compute_delta,
+    parse_signature,
+    reconstruction_script,
+    signature_command,
+)
+
+
+def signature_of(data, block_size, rolling=True):
+    blocks = [
+        (zlib.adler32(data[i:i + block_size]) if rolling else None, hashlib.md5(data[i:i + block_size]).hexdigest())
+        for i in range(0, len(data), block_size)
+    ]
+    return Signature(True, len(data), hashlib.md5(data).hexdigest(), block_size, blocks)
+
+
+def apply(old, ops, literals, block_size):
+    out = bytearray()
+    for kind, start, count in ops:
+        if kind == "copy":
+            out += old[start * block_size:(start + count) * block_size]
+        else:
+            out += literals[start:start + count]
+    return bytes(out)
+
+
+@pytest.fixture
+def old():
+    rng = random.Random(7)
+    return bytes(rng.getrandbits(8) for _ in range(50_000))
+
+
+def test_insertion_is_matched_at_shifted_offsets(old):
+    new = old[:10_000] + b"inserted line\n" + old[10_000:]
+    ops, literals = compute_delta(new, signature_of(old, 1024))
+
+    assert apply(old, ops, literals, 1024) == new
+    assert len(literals) < 2 * 1024
+    assert [kind for kind, _, _ in ops] == ["copy", "data", "copy"]
+
+
+def test_unchanged_tail_block_is_reused(old):
+    new = b"X" + old[1:]
+    ops, literals = compute_delta(new, signature_of(old, 1024))
+
+    assert apply(old, ops, literals, 1024) == new
+    assert ops[-1][0] == "copy"
+    assert len(literals) == 1024
+
+
+def test_aligned_matching_without_weak_checksums(old):
+    edited = bytearray(old)
+    edited[5000:5010] = b"0123456789"
+    new = bytes(edited) + b"appended"
+    ops, literals = compute_delta(new, signature_of(old, 1024, rolling=False))
+
+    assert apply(old, ops, literals, 1024) == new
+    assert len(literals) == 1024 + (len(old) % 1024) + len(b"appended")
+
+
+def test_missing_remote_sends_everything():
+    ops, literals = compute_delta(b"hello", Signature())
+    assert ops == [("data", 0, 5)] and literals == b"hello"
+
+
+def test_parse_signature_rejects_incomplete_block_lists():
+    output = "SIZE 2048\nFILE abc\nBLOCK 1 aa\n"
+    signature = parse_signature(output, 1024)
+    assert signature.exists and signature.digest == "abc"
+    assert signature.blocks == []
+    assert not parse_signature("MISSING\n", 1024).exists
+
+
+def test_choose_block_size():
+    assert choose_block_size(0) == 1024
+    assert choose_block_size(10 * 1024 * 1024) == 3072
+    assert choose_block_size(10 ** 12) == 64 * 1024
+
+
+@pytest.mark.parametrize("use_python", [True, False])
+def test_shell_round_trip(tmp_path, old, use_python):
+    target = tmp_path / "remote file.bin"
+    target.write_bytes(old)
+    command = signature_command(str(target), 1024)
+    if not use_python:
+        command = command.replace("command -v python3", "false")
+    output = subprocess.run(["bash", "-c", command], capture_output=True, text=True, check=True).stdout
+    signature = parse_signature(output, 1024)
+    assert signature.rolling == use_python
+    assert signature.digest == hashlib.md5(old).hexdigest()
+    assert len(signature.blocks) == 49
+
+    new = old[:3000] + b"edit" + old[3100:] + b"tail"
+    ops, literals = compute_delta(new, signature)
+    literal_path = tmp_path / "literals.b64"
+    literal_path.write_bytes(base64.b64encode(literals))
+    script = reconstruction_script(str(target), str(literal_path), ops, 1024, hashlib.md5(new).hexdigest())
+    subprocess.run(["sh", "-c", script], check=True)
+
+    assert target.read_bytes() == new
+    assert not literal_path.exists()
+    assert sorted(os.listdir(tmp_path)) == ["remote file.bin"]
+
+
+def test_shell_reconstruction_keeps_file_on_digest_mismatch(tmp_path):
+    target = tmp_path / "f"
+    target.write_bytes(b"original")
+    literal_path = tmp_path / "lit"
+    literal_path.write_bytes(base64.b64encode(b"new"))
+    script = reconstruction_script(str(target), str(literal_path), [("data", 0, 3)], 1024, "0" * 32)
+
+    assert subprocess.run(["sh", "-c", script]).returncode != 0
+    assert target.read_bytes() == b"original"
+    assert sorted(os.listdir(tmp_path)) == ["f"]
@@ -0,0 +1,73 @@
+import json
+import os
+import time
+
+import pytest
+
+from agentbay import FingerprintCache, FingerprintFormat
+from agentbay._common.utils.fingerprint_cache import cache_key
+
+EXAMPLE = os.path.join(
+    os.path.dirname(__file__), "../../../../resource/fingerprint.example.json"
+)
+
+
+def fingerprint(width=2560):
+    with open(EXAMPLE) as f:
+        data = json.load(f)
+    data["fingerprint"]["screen"]["width"] = width
+    return FingerprintFormat.load(data)
+
+
+def test_round_trip_and_content_addressing(tmp_path):
+    cache = FingerprintCache(str(tmp_path))
+    assert cache.get("k") is None
+
+    first = cache.put("k", fingerprint())
+    assert cache.put("k", fingerprint()) == first
+    cache.put("k", fingerprint(1920))
+
+    assert cache.get("k") == fingerprint(1920)
+    assert len(cache.pool("k")) == 2
+    assert cache.pool("other") == []
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_expired_and_corrupt_entries_are_dropped(tmp_path):
+    cache = FingerprintCache(str(tmp_path), ttl=60)
+    path = cache.put("k", fingerprint())
+    with open(path) as f:
+        entry = json.load(f)
+    entry["created"] = time.time() - 120
+    with open(path, "w") as f:
+        json.dump(entry, f)
+    with open(os.path.join(tmp_path, "k", "bad.json"), "w") as f:
+        f.write("{not json")
+
+    assert cache.get("k") is None
+    assert os.listdir(os.path.join(tmp_path, "k")) == []
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    cache = FingerprintCache(str(tmp_path), max_entries=2)
+    old = cache.put("a", fingerprint(1))
+    os.utime(old, (1, 1))
+    cache.put("b", fingerprint(2))
+    cache.put("b", fingerprint(3))
+
+    assert not os.path.exists(old)
+    assert len(cache.pool("b")) == 2
+
+
+def test_cache_key_covers_channel_version_mode_and_host():
+    base = cache_key("chrome", "120.0.1", False, "host-a")
+    assert base == cache_key("chrome", "120.0.1", False, "host-a")
+    assert len({
+        base,
+        cache_key("chromium", "120.0.1", False, "host-a"),
+        cache_key("chrome", "121.0.0", False, "host-a"),
+        cache_key("chrome", "120.0.1", True, "host-a"),
+        cache_key("chrome", "120.0.1", False, "host-b"),
+    }) == 5
+    with pytest.raises(ValueError):
+        FingerprintCache(ttl=0)
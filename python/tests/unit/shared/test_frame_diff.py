@@ -0,0 +1,129 @@
+"""
+Unit tests for screenshot frame signatures.
+"""
+
+import struct
+import zlib
+
+import pytest
+
+from agentbay._common.utils.frame_diff import FrameSignature
+
+
+def _png(width, height, pixel=lambda x, y: (0, 0, 0)):
+    """Encode an RGB PNG with unfiltered scanlines."""
+    rows = b"".join(
+        b"\x00" + b"".join(bytes(pixel(x, y)) for x in range(width))
+        for y in range(height)
+    )
+    return _encode(width, height, rows)
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _filtered_png(width, height, pixel, filter_for_row):
+    """Encode an RGB PNG, filtering row y with filter type filter_for_row(y)."""
+    bpp = 3
+    prior = bytes(width * bpp)
+    rows = b""
+    for y in range(height):
+        line = b"".join(bytes(pixel(x, y)) for x in range(width))
+        filter_type = filter_for_row(y)
+        out = bytearray()
+        for i, v in enumerate(line):
+            a = line[i - bpp] if i >= bpp else 0
+            b = prior[i]
+            c = prior[i - bpp] if i >= bpp else 0
+            predictor = [0, a, b, (a + b) // 2, _paeth(a, b, c)][filter_type]
+            out.append((v - predictor) & 255)
+        rows += bytes([filter_type]) + bytes(out)
+        prior = line
+    return _encode(width, height, rows)
+
+
+def _encode(width, height, rows, color_type=2):
+    """Wrap already filtered 8-bit scanlines into a PNG."""
+
+    def chunk(ctype, body):
+        return (
+            struct.pack(">I", len(body))
+            + ctype
+            + body
+            + struct.pack(">I", zlib.crc32(ctype + body))
+        )
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+class TestFrameSignature:
+    def test_identical_frames_do_not_differ(self):
+        a = FrameSignature.from_png(_png(64, 48))
+        b = FrameSignature.from_png(_png(64, 48))
+        assert a.diff(b) == 0.0
+
+    def test_single_pixel_change_is_detected(self):
+        a = FrameSignature.from_png(_png(64, 64), grid=8)
+        b = FrameSignature.from_png(
+            _png(64, 64, lambda x, y: (255, 0, 0) if (x, y) == (5, 5) else (0, 0, 0)),
+            grid=8,
+        )
+        assert a.diff(b) == pytest.approx(1 / 64)
+
+    def test_region_limits_comparison(self):
+        a = FrameSignature.from_png(_png(64, 64), grid=8)
+        b = FrameSignature.from_png(
+            _png(64, 64, lambda x, y: (255, 255, 255) if x < 8 and y < 8 else (0, 0, 0)),
+            grid=8,
+        )
+        assert a.diff(b, region=(32, 32, 16, 16)) == 0.0
+        assert a.diff(b, region=(0, 0, 8, 8)) == 1.0
+
+    def test_same_filtered_bytes_with_other_filter_differ(self):
+        # Same filtered bytes: pixels [1, 2, 3] unfiltered vs [1, 3, 6] with Sub
+        a = FrameSignature.from_png(_encode(3, 1, b"\x00\x01\x02\x03", color_type=0))
+        b = FrameSignature.from_png(_encode(3, 1, b"\x01\x01\x02\x03", color_type=0))
+        assert a.diff(b) == pytest.approx(2 / 3)
+
+    def test_all_filters_decode_to_the_same_pixels(self):
+        def pixel(x, y):
+            return ((x * 7 + y) % 256, (x * y) % 256, (255 - x - y) % 256)
+
+        plain = FrameSignature.from_png(_png(40, 40, pixel), grid=8)
+        for filter_for_row in (lambda y: 1, lambda y: 2, lambda y: 3, lambda y: 4, lambda y: y % 5):
+            filtered = FrameSignature.from_png(_filtered_png(40, 40, pixel, filter_for_row), grid=8)
+            assert filtered.diff(plain) == 0.0
+
+    def test_uniform_region_change_under_sub_and_up(self):
+        def frame(inner):
+            return lambda x, y: inner if 16 <= x < 48 and 16 <= y < 48 else (0, 0, 0)
+
+        for filter_type in (1, 2):
+            a = FrameSignature.from_png(
+                _filtered_png(64, 64, frame((200, 30, 30)), lambda y: filter_type), grid=8
+            )
+            b = FrameSignature.from_png(
+                _filtered_png(64, 64, frame((30, 200, 30)), lambda y: filter_type), grid=8
+            )
+            assert a.diff(b, region=(24, 24, 16, 16)) == 1.0
+            assert a.diff(b) == pytest.approx(16 / 64)
+
+    def test_size_change_counts_as_full_change(self):
+        a = FrameSignature.from_png(_png(32, 64))
+        b = FrameSignature.from_png(_png(64, 32))
+        assert a.diff(b) == 1.0
+
+    def test_rejects_non_png(self):
+        with pytest.raises(ValueError):
+            FrameSignature.from_png(b"\xff\xd8\xff not a png")
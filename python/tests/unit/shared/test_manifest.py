@@ -0,0 +1,103 @@
+import pytest
+
+from agentbay import FileManifest, ManifestEntry, build_local_manifest
+from agentbay._common.utils.manifest import (
+    build_manifest_command,
+    file_digest,
+    parse_manifest_output,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+    (tmp_path / "src" / "util.py").write_text("x = 1\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("module.exports = 1\n")
+    (tmp_path / "README.md").write_text("# readme\n")
+    return tmp_path
+
+
+def test_local_manifest_lists_files_with_digests(tree):
+    manifest = build_local_manifest(str(tree))
+
+    assert manifest.paths == ["README.md", "node_modules/dep.js", "src/app.py", "src/util.py"]
+    entry = manifest["src/app.py"]
+    assert entry.size == len("print('hi')\n")
+    assert entry.digest == file_digest(str(tree / "src" / "app.py"))
+    assert len(entry.digest) == 64
+
+
+def test_local_manifest_include_and_exclude(tree):
+    manifest = build_local_manifest(str(tree), hash=None, include=["*.py", "*.js"], exclude=["node_modules"])
+
+    assert manifest.paths == ["src/app.py", "src/util.py"]
+    assert manifest["src/app.py"].digest is None
+    assert build_local_manifest(str(tree), exclude=["src/*.py"]).paths == ["README.md", "node_modules/dep.js"]
+
+
+def test_unsupported_hash_is_rejected(tree):
+    with pytest.raises(ValueError):
+        build_local_manifest(str(tree), hash="crc")
+    with pytest.raises(ValueError):
+        build_manifest_command("/tmp", hash="crc")
+
+
+def test_manifest_command_filters_in_find():
+    command = build_manifest_command("/data dir", include=["*.py"], exclude=["node_modules", "build/*"])
+
+    assert command.startswith("cd -- '/data dir' && find . -mindepth 1 ")
+    assert "\\( -name node_modules -o -path './build/*' \\) -prune -o -type f \\( -name '*.py' \\)" in command
+    assert command.endswith("-exec sha256sum {} +")
+    assert "-exec" not in build_manifest_command("/data", hash=None)
+
+
+def test_parse_manifest_output_joins_stat_and_checksum_lines():
+    output = (
+        "F\t6\t1700000000.5000000000\tsrc/a.py\n"
+        "F\t0\t1700000001.0000000000\tempty\n"
+        "ABCDEF  ./src/a.py\n"
+        "\\1234  ./back\\\\slash\n"
+        "F\t3\t1700000002.0000000000\tback\\slash\n"
+        "find: './secret': Permission denied\n"
+    )
+    manifest = parse_manifest_output(output, "/data")
+
+    assert manifest.root == "/data"
+    assert manifest["src/a.py"].digest == "abcdef"
+    assert manifest["src/a.py"].mtime == 1700000000.5
+    assert manifest["empty"].digest is None
+    assert manifest["back\\slash"].digest == "1234"
+    assert "secret" not in manifest
+
+
+def test_diff_by_digest_and_by_mtime():
+    source = FileManifest("", "sha256", [
+        ManifestEntry("same", 1, 10.0, "aa"),
+        ManifestEntry("edited", 1, 10.0, "bb"),
+        ManifestEntry("new", 1, 10.0, "cc"),
+        ManifestEntry("unhashed", 1, 10.0, None),
+    ])
+    target = FileManifest("", "sha256", [
+        ManifestEntry("same", 1, 99.0, "aa"),
+        ManifestEntry("edited", 1, 10.0, "bx"),
+        ManifestEntry("gone", 1, 10.0, "dd"),
+        ManifestEntry("unhashed", 1, 10.0, None),
+    ])
+    diff = source.diff(target)
+
+    assert diff.missing == ["new"]
+    assert diff.extra == ["gone"]
+    assert diff.changed == ["edited", "unhashed"]
+    assert diff.unchanged == ["same"]
+    assert diff.to_transfer == ["new", "edited", "unhashed"]
+
+    # Without comparable digests, size and mtime decide
+    stat_only = FileManifest("", None, [ManifestEntry("same", 1, 99.5)])
+    assert stat_only.diff(target).changed == ["same"]
+    assert stat_only.diff(target, mtime_window=1).unchanged == ["same"]
+
+
+def test_identical_trees_have_empty_diff(tree):
+    assert not build_local_manifest(str(tree)).diff(build_local_manifest(str(tree)))
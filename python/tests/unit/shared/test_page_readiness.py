@@ -0,0 +1,55 @@
+import pytest
+
+from agentbay._common.utils.page_readiness import (
+    NetworkIdleTracker,
+    ReadinessMonitor,
+    check_wait,
+    parse_sample,
+    plan_tiles,
+)
+
+
+def sample(height=1000, pending=0, bottom=True):
+    return {"height": height, "width": 1280, "pending": pending, "bottom": bottom}
+
+
+def test_static_page_is_ready_after_two_samples():
+    monitor = ReadinessMonitor()
+    assert not monitor.update(sample())
+    assert monitor.update(sample())
+
+
+def test_growth_pending_images_and_requests_restart_the_count():
+    monitor = ReadinessMonitor()
+    states = [
+        (sample(1000, bottom=False), 0),
+        (sample(2000), 0),
+        (sample(2000, pending=1), 0),
+        (sample(2000), 2),
+        (sample(2000), 0),
+        (sample(2000), 0),
+    ]
+    assert [monitor.update(s, inflight) for s, inflight in states] == [
+        False, False, False, False, False, True,
+    ]
+
+
+def test_network_tracker_ignores_streams_and_stale_requests():
+    tracker = NetworkIdleTracker(stale_ms=1000)
+    tracker.request_started({"requestId": "1"}, now=0.0)
+    tracker.request_started({"requestId": "2", "type": "EventSource"}, now=0.0)
+    tracker.request_started({"requestId": "3"}, now=0.5)
+    tracker.request_started({"requestId": "3"}, now=0.9)  # redirect
+    assert tracker.inflight(now=0.9) == 2
+    assert tracker.inflight(now=1.2) == 1
+    tracker.request_done({"requestId": "3"})
+    assert tracker.inflight(now=1.2) == 0
+
+
+def test_parse_sample_and_tiles():
+    assert parse_sample(1500) == {"height": 1500, "width": 0, "pending": 0, "bottom": True}
+    assert parse_sample({"height": 10, "pending": 2, "bottom": False})["pending"] == 2
+    assert plan_tiles(10000, 4096) == [(0, 4096), (4096, 4096), (8192, 1808)]
+    assert plan_tiles(0, 4096) == [(0, 1)]
+    with pytest.raises(ValueError):
+        check_wait("slow")
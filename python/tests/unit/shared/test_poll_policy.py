@@ -0,0 +1,76 @@
+import pytest
+
+from agentbay._common.utils.polling import PollMetrics, PollOutcome, PollPolicy
+
+
+def test_intervals_back_off_up_to_the_cap():
+    policy = PollPolicy(initial_interval=0.5, max_interval=2.0, multiplier=2.0, jitter=0)
+    assert [policy.interval(n) for n in range(5)] == [0.0, 0.5, 1.0, 2.0, 2.0]
+
+
+def test_first_delay_applies_before_the_first_probe():
+    policy = PollPolicy(first_delay=0.3, jitter=0)
+    assert policy.delay(0) == 0.3
+
+
+def test_jitter_only_shortens_delays():
+    policy = PollPolicy(initial_interval=1.0, max_interval=1.0, jitter=0.5)
+    delays = [policy.delay(3) for _ in range(200)]
+    assert all(0.5 <= d <= 1.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_delay_never_exceeds_remaining_time():
+    policy = PollPolicy(initial_interval=5.0, max_interval=5.0, jitter=0)
+    assert policy.delay(1, remaining=0.2) == 0.2
+    assert policy.delay(1, remaining=-1.0) == 0.0
+
+
+def test_server_hint_replaces_interval_but_respects_cap():
+    policy = PollPolicy(initial_interval=0.25, max_interval=3.0, jitter=0)
+    assert policy.delay(1, hint=1.5) == 1.5
+    assert policy.delay(1, hint=30.0) == 3.0
+
+
+def test_up_to_caps_the_default_policy():
+    policy = PollPolicy.up_to(1.0)
+    assert policy.max_interval == 1.0
+    assert policy.interval(100) == 1.0
+    # A cap below the default initial interval lowers it too
+    assert PollPolicy.up_to(0.1).initial_interval == 0.1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial_interval": 0},
+        {"max_interval": -1},
+        {"multiplier": 0.5},
+        {"jitter": 1.0},
+        {"first_delay": -0.1},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        PollPolicy(**kwargs)
+
+
+def test_metrics_aggregate_per_wait_loop():
+    metrics = PollMetrics()
+    metrics.record("a", PollOutcome(done=True, probes=2, elapsed=1.0))
+    metrics.record("a", PollOutcome(timed_out=True, probes=5, elapsed=3.0), probe_errors=1)
+    metrics.record("b", PollOutcome(cancelled=True, probes=1, elapsed=0.5))
+
+    a = metrics.get("a")
+    assert a["waits"] == 2
+    assert a["completed"] == 1
+    assert a["timed_out"] == 1
+    assert a["probes"] == 7
+    assert a["probe_errors"] == 1
+    assert a["max_wait"] == 3.0
+    assert a["mean_wait"] == 2.0
+    assert metrics.snapshot()["b"]["cancelled"] == 1
+    assert metrics.get("missing") is None
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
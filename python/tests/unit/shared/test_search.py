@@ -0,0 +1,62 @@
+import subprocess
+
+import pytest
+
+from agentbay._common.utils.search import (
+    GrepMatch,
+    grep_command,
+    next_grep_cursor,
+    parse_cursor,
+    parse_grep_output,
+)
+
+
+def run(command):
+    return subprocess.run(["bash", "-c", command], capture_output=True, text=True).stdout
+
+
+def test_parse_grep_output_handles_colons_in_paths():
+    output = "/a:b.txt\x013:x = foo()\n/c.txt\x0110:no match here\nnoise\n"
+    matches = parse_grep_output(output, r"foo")
+    assert matches == [
+        GrepMatch("/a:b.txt", 3, 5, "x = foo()"),
+        GrepMatch("/c.txt", 10, None, "no match here"),
+    ]
+
+
+def test_grep_pages_resume_inside_a_file(tmp_path):
+    (tmp_path / "a.py").write_text("hit 1\nmiss\nhit 2\nhit 3\n")
+    (tmp_path / "b.py").write_text("hit 4\n")
+    (tmp_path / "c.txt").write_text("hit ignored\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "d.py").write_text("hit excluded\n")
+
+    seen, cursor = [], None
+    while True:
+        command = grep_command(
+            str(tmp_path), "hit [0-9]", ["*.py"], ["node_modules"], cursor=cursor, limit=2
+        )
+        matches = parse_grep_output(run(command), "hit [0-9]")
+        page, more = matches[:2], len(matches) > 2
+        seen += [(m.path.rsplit("/", 1)[-1], m.line) for m in page]
+        if not more:
+            break
+        cursor = next_grep_cursor(page, cursor)
+
+    assert seen == [("a.py", 1), ("a.py", 3), ("a.py", 4), ("b.py", 1)]
+
+
+def test_parse_cursor_rejects_garbage():
+    assert parse_cursor(None) == (0, None)
+    assert parse_cursor("2:/x:y") == (2, "/x:y")
+    with pytest.raises(ValueError):
+        parse_cursor("/x")
+
+
+def test_grep_single_file(tmp_path):
+    target = tmp_path / "a.txt"
+    target.write_text("hello\nworld\nhello again\n")
+    (tmp_path / "b.txt").write_text("hello elsewhere\n")
+
+    matches = parse_grep_output(run(grep_command(str(target), "hello")), "hello")
+    assert [(m.path, m.line) for m in matches] == [(str(target), 1), (str(target), 3)]
@@ -0,0 +1,102 @@
+import gc
+
+import pytest
+
+from agentbay._common.utils.session_cache import SessionCache
+
+
+class Obj:
+    pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_capacity_evicts_least_recently_used():
+    evicted = []
+    cache = SessionCache(max_size=2, ttl=None)
+    cache.add_eviction_hook(lambda sid, obj, reason: evicted.append((sid, reason)))
+    a, b, c = Obj(), Obj(), Obj()
+
+    cache["a"] = a
+    cache["b"] = b
+    assert cache.get("a") is a
+    cache["c"] = c
+
+    assert evicted == [("b", "capacity")]
+    assert cache.stats()["strong"] == 2
+
+
+def test_evicted_sessions_stay_reachable_while_referenced():
+    cache = SessionCache(max_size=1, ttl=None)
+    a = Obj()
+    cache["a"] = a
+    cache["b"] = Obj()
+
+    assert "a" in cache
+    assert cache["a"] is a
+
+    del a
+    cache["c"] = Obj()
+    gc.collect()
+    assert "a" not in cache
+    assert cache.get("a") is None
+
+
+def test_unreferenced_sessions_are_freed_after_ttl():
+    clock = FakeClock()
+    evicted = []
+    cache = SessionCache(max_size=10, ttl=60, clock=clock)
+    cache.add_eviction_hook(lambda sid, obj, reason: evicted.append((sid, reason)))
+    cache["a"] = Obj()
+
+    clock.now = 30
+    assert cache.get("a") is not None
+    clock.now = 80
+    assert cache.prune() == 0
+    clock.now = 91
+    assert cache.prune() == 1
+    gc.collect()
+
+    assert evicted == [("a", "expired")]
+    assert len(cache) == 0
+
+
+def test_pop_and_missing_keys():
+    removed = []
+    cache = SessionCache()
+    cache.add_eviction_hook(lambda sid, obj, reason: removed.append(reason))
+    a = Obj()
+    cache["a"] = a
+
+    assert cache.pop("a") is a
+    assert cache.pop("a", None) is None
+    with pytest.raises(KeyError):
+        cache.pop("a")
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert removed == ["removed"]
+
+
+def test_failing_hook_does_not_break_cache():
+    def hook(sid, obj, reason):
+        raise RuntimeError("boom")
+
+    cache = SessionCache(max_size=1, ttl=None)
+    cache.add_eviction_hook(hook)
+    cache["a"] = Obj()
+    cache["b"] = Obj()
+
+    assert cache.stats()["evictions"] == 1
+
+
+def test_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        SessionCache(max_size=0)
+    with pytest.raises(ValueError):
+        SessionCache(ttl=0)
@@ -0,0 +1,154 @@
+"""
+Unit tests for the compact mobile UI tree.
+"""
+
+import json
+
+from agentbay import UISnapshot, UITree
+
+
+def _elements():
+    return [
+        {
+            "bounds": "[0,0][1080,2400]",
+            "className": "android.widget.FrameLayout",
+            "resourceId": "root",
+            "children": [
+                {
+                    "bounds": {"left": 0, "top": 0, "right": 1080, "bottom": 200},
+                    "className": "android.widget.TextView",
+                    "text": "Title",
+                    "resourceId": "app:id/title",
+                },
+                {
+                    "bounds": "100,500,500,700",
+                    "className": "android.widget.Button",
+                    "text": "OK",
+                    "resourceId": "app:id/ok",
+                    "children": [
+                        {
+                            "bounds": "[150,550][250,650]",
+                            "className": "android.widget.ImageView",
+                            "resourceId": "app:id/icon",
+                        }
+                    ],
+                },
+                {
+                    "bounds": "[600,500][1000,700]",
+                    "className": "android.widget.Button",
+                    "text": "Cancel",
+                    "resourceId": "app:id/cancel",
+                },
+            ],
+        }
+    ]
+
+
+class TestUITree:
+    def test_builds_nodes_in_depth_first_order(self):
+        tree = UITree.from_elements(_elements())
+
+        assert len(tree) == 5
+        assert [n.resource_id for n in tree] == [
+            "root",
+            "app:id/title",
+            "app:id/ok",
+            "app:id/icon",
+            "app:id/cancel",
+        ]
+        assert tree.roots[0].children[1].children[0].parent is tree.roots[0].children[1]
+        assert tree.nodes[3].depth == 2
+
+    def test_find_uses_indexes_and_combines_criteria(self):
+        tree = UITree.from_elements(_elements())
+
+        buttons = tree.find(class_name="android.widget.Button")
+        assert [n.text for n in buttons] == ["OK", "Cancel"]
+        assert tree.find(class_name="android.widget.Button", text="Cancel")[0].resource_id == "app:id/cancel"
+        assert tree.find(text="missing") == []
+        assert tree.find_one(resource_id="app:id/ok").center == (300, 600)
+        assert len(tree.find()) == 5
+
+    def test_element_at_returns_deepest_node(self):
+        tree = UITree.from_elements(_elements(), cell_size=64)
+
+        assert tree.element_at(200, 600).resource_id == "app:id/icon"
+        assert tree.element_at(400, 600).resource_id == "app:id/ok"
+        assert tree.element_at(700, 600).resource_id == "app:id/cancel"
+        assert tree.element_at(50, 1500).resource_id == "root"
+        assert tree.element_at(5000, 5000) is None
+        assert [n.resource_id for n in tree.elements_at(200, 600)] == [
+            "root",
+            "app:id/ok",
+            "app:id/icon",
+        ]
+
+    def test_from_json_and_round_trip_to_dicts(self):
+        tree = UITree.from_json(json.dumps(_elements()))
+        dicts = tree.to_dicts()
+
+        assert dicts[0]["resourceId"] == "root"
+        assert dicts[0]["children"][1]["bounds_rect"] == {
+            "left": 100,
+            "top": 500,
+            "right": 500,
+            "bottom": 700,
+        }
+        assert dicts[0]["children"][1]["children"][0]["className"] == "android.widget.ImageView"
+
+    def test_missing_bounds_are_skipped_by_spatial_index(self):
+        tree = UITree.from_elements([{"className": "X", "text": "no bounds"}])
+
+        assert tree.nodes[0].bounds is None
+        assert tree.nodes[0].center is None
+        assert tree.element_at(0, 0) is None
+        assert tree.find_one(text="no bounds").class_name == "X"
+
+
+class TestUISnapshot:
+    def test_identical_trees_have_no_changes(self):
+        old = UISnapshot(UITree.from_elements(_elements()))
+        new = UISnapshot(UITree.from_elements(_elements()))
+
+        diff = new.diff(old)
+
+        assert diff.has_changes is False
+        assert new.subtree_hash(new.tree.roots[0]) == old.subtree_hash(old.tree.roots[0])
+
+    def test_text_change_is_reported_as_changed(self):
+        elements = _elements()
+        old = UISnapshot(UITree.from_elements(elements))
+        elements[0]["children"][0]["text"] = "New title"
+        new = UISnapshot(UITree.from_elements(elements))
+
+        diff = new.diff(old)
+
+        assert diff.added == [] and diff.removed == []
+        assert len(diff.changed) == 1
+        before, after = diff.changed[0]
+        assert (before.text, after.text) == ("Title", "New title")
+
+    def test_added_and_removed_subtrees_report_roots_only(self):
+        elements = _elements()
+        old = UISnapshot(UITree.from_elements(elements))
+        ok_button = elements[0]["children"].pop(1)
+        elements[0]["children"].append(
+            {"bounds": "[0,2000][1080,2400]", "className": "Dialog", "resourceId": "app:id/dialog"}
+        )
+        new = UISnapshot(UITree.from_elements(elements))
+
+        diff = new.diff(old)
+
+        assert [n.resource_id for n in diff.removed] == [ok_button["resourceId"]]
+        assert [n.resource_id for n in diff.added] == ["app:id/dialog"]
+        assert diff.changed == []
+        summary = diff.to_dict()
+        assert summary["added"][0]["resourceId"] == "app:id/dialog"
+        assert summary["removed"][0]["text"] == "OK"
+
+    def test_diff_against_nothing_adds_all_roots(self):
+        snapshot = UISnapshot(UITree.from_elements(_elements()))
+
+        diff = snapshot.diff(None)
+
+        assert [n.resource_id for n in diff.added] == ["root"]
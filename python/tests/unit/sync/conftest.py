@@ -0,0 +1,94 @@
+import base64
+import functools
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from agentbay import CommandResult, McpToolResult
+
+# Remote /tmp paths, as opposed to a longer name such as /tmpfoo
+_TMP = r"/tmp(?=/|$|[\s'\"])"
+
+
+@functools.lru_cache(maxsize=None)
+def _gnu_tools() -> bool:
+    """Whether bash, tar, gzip, base64 and the GNU find/stat flags are available."""
+    if not all(shutil.which(tool) for tool in ("bash", "tar", "gzip", "base64")):
+        return False
+    probe = "find . -maxdepth 0 -printf '%y' && stat -c %s ."
+    return subprocess.run(["bash", "-c", probe], capture_output=True).returncode == 0
+
+
+class LocalSandbox:
+    """
+    Session stand-in running commands and file tools against the local machine.
+
+    Records the shell commands run (`commands`), the file tools called
+    (`tool_calls`) and the characters written through write_file (`written`).
+    Remote /tmp paths, in commands, tool arguments and written files, are
+    redirected to the private directory `tmp`, so temporary files the SDK leaves
+    behind can be checked there.
+    """
+
+    def __init__(self, root, tmp):
+        self.commands = []
+        self.tool_calls = []
+        self.written = 0
+        self.command = self
+        self.tmp = str(tmp)
+        # Paths under the test directories (themselves usually below /tmp) are
+        # kept; any other /tmp path moves to `tmp`
+        kept = "|".join(re.escape(str(path)) for path in (root, tmp))
+        self._paths = re.compile(f"({kept})|{_TMP}")
+
+    def _local(self, text):
+        return self._paths.sub(lambda m: m.group(1) or self.tmp, text)
+
+    def execute_command(self, command, timeout_ms=50000, **kwargs):
+        self.commands.append(command)
+        proc = subprocess.run(
+            ["bash", "-c", self._local(command)],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "TMPDIR": self.tmp},
+        )
+        return CommandResult(
+            request_id="cmd",
+            success=proc.returncode == 0,
+            exit_code=proc.returncode,
+            stdout=proc.stdout,
+            stderr=proc.stderr,
+            error_message=proc.stderr if proc.returncode else "",
+        )
+
+    def call_mcp_tool(self, name, args):
+        self.tool_calls.append(name)
+        path = self._local(args["path"])
+        if name == "write_file":
+            self.written += len(args["content"])
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a" if args["mode"] == "append" else "w") as f:
+                # Written files may be scripts referring to /tmp paths
+                f.write(self._local(args["content"]))
+            return McpToolResult(request_id="w", success=True, data="ok")
+        if name == "get_file_info":
+            size = os.path.getsize(path)
+            return McpToolResult(request_id="i", success=True, data=f"size: {size}\nisDirectory: false")
+        if name == "read_file":
+            with open(path, "rb") as f:
+                f.seek(args["offset"])
+                chunk = f.read(args["length"])
+            if args.get("format") == "binary":
+                return McpToolResult(request_id="r", success=True, data=base64.b64encode(chunk).decode())
+            return McpToolResult(request_id="r", success=True, data=chunk.decode())
+        raise AssertionError(f"unexpected tool {name}")
+
+
+@pytest.fixture
+def sandbox(tmp_path, tmp_path_factory):
+    if not _gnu_tools():
+        pytest.skip("requires bash, tar, gzip, base64 and GNU find/stat")
+    return LocalSandbox(tmp_path, tmp_path_factory.mktemp("remote-tmp"))
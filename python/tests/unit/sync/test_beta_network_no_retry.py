@@ -3,6 +3,8 @@ import pytest
 import unittest
 from unittest.mock import MagicMock, MagicMock, patch
 
+from alibabacloud_tea_openapi.exceptions import ThrottlingException
+
 from agentbay import AgentBay, Config
 
 
@@ -33,5 +35,53 @@ class TestAsyncBetaNetworkNoRetry(unittest.TestCase):
         self.assertEqual(mock_client.create_network.call_count, 1)
 
 
+class TestAsyncBetaNetworkDescribeRetry(unittest.TestCase):
+    """Test DescribeNetwork retries on unavailable and throttled responses."""
+
+    def _agent_bay(self, mock_mcp_client, side_effect):
+        mock_client = MagicMock()
+        mock_client.describe_network = MagicMock(side_effect=side_effect)
+        mock_mcp_client.return_value = mock_client
+        config = Config(endpoint="wuyingai.cn-shanghai.aliyuncs.com", timeout_ms=60000)
+        return AgentBay(cfg=config)
+
+    @patch.dict(os.environ, {"AGENTBAY_API_KEY": "test-api-key"})
+    @patch("agentbay._sync.agentbay.mcp_client")
+    @pytest.mark.sync
+    def test_describe_waits_as_long_as_throttling_asks(self, mock_mcp_client):
+        response = MagicMock()
+        response.body.success = True
+        response.body.data.online = True
+        agent_bay = self._agent_bay(
+            mock_mcp_client,
+            [
+                Exception("ServiceUnavailable"),
+                ThrottlingException(code="Throttling", retry_after=1500),
+                response,
+            ],
+        )
+
+        with patch("time.sleep", new=MagicMock()) as sleep_mock:
+            result = agent_bay.beta_network.describe("net-1")
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.online)
+        self.assertEqual([c.args[0] for c in sleep_mock.call_args_list], [0.2, 1.5])
+
+    @patch.dict(os.environ, {"AGENTBAY_API_KEY": "test-api-key"})
+    @patch("agentbay._sync.agentbay.mcp_client")
+    @pytest.mark.sync
+    def test_describe_gives_up_after_three_attempts(self, mock_mcp_client):
+        agent_bay = self._agent_bay(mock_mcp_client, Exception("ServiceUnavailable"))
+
+        with patch("time.sleep", new=MagicMock()) as sleep_mock:
+            result = agent_bay.beta_network.describe("net-1")
+
+        self.assertFalse(result.success)
+        self.assertIn("ServiceUnavailable", result.error_message)
+        self.assertEqual(agent_bay.client.describe_network.call_count, 3)
+        self.assertEqual([c.args[0] for c in sleep_mock.call_args_list], [0.2, 0.4])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,3 @@
-import time
 import json
 import os
 import unittest
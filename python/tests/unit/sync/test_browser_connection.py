@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import MagicMock, MagicMock
+
+from agentbay import Browser, BrowserError, BrowserOption
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def cdp_link_response(url):
+    response = MagicMock()
+    response.body.success = True
+    response.body.data.url = url
+    return response
+
+
+class TestBrowserConnection(unittest.TestCase):
+    def setUp(self):
+        self.mock_session = MagicMock()
+        mock_client = MagicMock()
+        mock_client.init_browser = MagicMock()
+        mock_client.init_browser.return_value = MagicMock()
+        mock_client.init_browser.return_value.to_map.return_value = {
+            "body": {"Data": {"Port": 9333}}
+        }
+        self.mock_session._get_client.return_value = mock_client
+        self.mock_session.call_mcp_tool = MagicMock()
+        self.get_cdp_link = MagicMock(
+            side_effect=[cdp_link_response(f"ws://cdp/{i}") for i in range(1, 10)]
+        )
+        self.mock_session.agent_bay.client.get_cdp_link = self.get_cdp_link
+
+        self.browser = Browser(self.mock_session)
+        self.browser.initialize(BrowserOption())
+        self.clock = FakeClock()
+        self.connection = self.browser.connection
+        self.connection._clock = self.clock
+
+    def test_endpoint_is_reused_until_it_expires(self):
+        first = self.browser.get_endpoint_url()
+        self.clock.now = self.connection.endpoint_ttl - 1
+        self.assertEqual(self.browser.get_endpoint_url(), first)
+        self.assertEqual(self.get_cdp_link.call_count, 1)
+
+        self.clock.now = self.connection.endpoint_ttl + 1
+        self.assertEqual(self.browser.get_endpoint_url(), "ws://cdp/2")
+        self.assertEqual(self.browser.get_endpoint_url(refresh=True), "ws://cdp/3")
+        self.assertEqual(self.connection.endpoint_fetches, 3)
+
+    def test_endpoint_requires_initialized_browser(self):
+        with self.assertRaises(BrowserError):
+            Browser(self.mock_session).get_endpoint_url()
+
+    def test_connect_reuses_connection_until_disconnected(self):
+        handlers = {}
+        remote = MagicMock()
+        remote.is_connected.return_value = True
+        remote.on.side_effect = lambda name, handler: handlers.setdefault(name, handler)
+        remote.close = MagicMock()
+        playwright = MagicMock()
+        playwright.chromium.connect_over_cdp = MagicMock(return_value=remote)
+        playwright.stop = MagicMock()
+        self.connection._playwright = playwright
+
+        self.assertIs(self.connection.connect(), remote)
+        self.assertIs(self.connection.connect(), remote)
+        playwright.chromium.connect_over_cdp.assert_called_once_with("ws://cdp/1")
+
+        handlers.pop("disconnected")(remote)
+        self.connection.connect()
+        self.assertEqual(playwright.chromium.connect_over_cdp.call_count, 2)
+        # A lost connection also drops the endpoint, which may be stale
+        playwright.chromium.connect_over_cdp.assert_called_with("ws://cdp/2")
+
+        self.browser._stop_browser()
+        remote.close.assert_called_once()
+        playwright.stop.assert_called_once()
+
+    def test_connect_retries_with_a_fresh_endpoint(self):
+        remote = MagicMock()
+        playwright = MagicMock()
+        playwright.chromium.connect_over_cdp = MagicMock(
+            side_effect=[Exception("403 expired"), remote]
+        )
+        self.connection._playwright = playwright
+
+        self.assertIs(self.connection.connect(), remote)
+        playwright.chromium.connect_over_cdp.assert_called_with("ws://cdp/2")
+
+    def test_page_target_is_looked_up_once_per_page(self):
+        handlers = {}
+        page = MagicMock()
+        page.once.side_effect = lambda name, handler: handlers.setdefault(name, handler)
+        cdp_session = MagicMock()
+        cdp_session.send = MagicMock(return_value={"targetInfo": {"targetId": "T1"}})
+        cdp_session.detach = MagicMock()
+        page.context.new_cdp_session = MagicMock(return_value=cdp_session)
+        page.context.browser.contexts = [MagicMock(), page.context]
+
+        for _ in range(3):
+            info = self.browser.agent._get_page_and_context_index(page)
+            self.assertEqual(info, ("T1", 1))
+        self.assertEqual(self.connection.target_lookups, 1)
+        cdp_session.detach.assert_called_once()
+
+        handlers["close"](page)
+        self.connection.page_info(page)
+        self.assertEqual(self.connection.target_lookups, 2)
+
+    def test_page_info_wraps_cdp_failures(self):
+        page = MagicMock()
+        page.context.new_cdp_session = MagicMock(side_effect=Exception("target closed"))
+        with self.assertRaises(BrowserError):
+            self.connection.page_info(page)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -56,6 +56,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = MagicMock()
         mock_page.set_viewport_size = MagicMock()
+        mock_page.context.new_cdp_session = MagicMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = MagicMock(return_value=b"fake_screenshot_data")
 
         # Call the screenshot method
@@ -83,6 +84,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = MagicMock()
         mock_page.set_viewport_size = MagicMock()
+        mock_page.context.new_cdp_session = MagicMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = MagicMock(return_value=b"fake_full_page_screenshot_data")
 
         # Call the screenshot method with full_page=True
@@ -117,6 +119,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = MagicMock()
         mock_page.set_viewport_size = MagicMock()
+        mock_page.context.new_cdp_session = MagicMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = MagicMock(return_value=b"fake_custom_screenshot_data")
 
         # Call the screenshot method with custom options
@@ -148,6 +151,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = MagicMock()
         mock_page.set_viewport_size = MagicMock()
+        mock_page.context.new_cdp_session = MagicMock(side_effect=Exception("no CDP"))
         mock_page.screenshot = MagicMock(side_effect=Exception("Screenshot failed"))
 
         # Call the screenshot method and expect it to raise RuntimeError
@@ -171,6 +175,7 @@ class TestBrowserScreenshot(unittest.TestCase):
         mock_page.evaluate.return_value = 1000  # Return a fake height as integer
         mock_page.wait_for_timeout = MagicMock()
         mock_page.set_viewport_size = MagicMock()
+        mock_page.context.new_cdp_session = MagicMock(side_effect=Exception("no CDP"))
 
         # Create a mock exception that raises an error when converted to string
         class UnconvertibleException(Exception):
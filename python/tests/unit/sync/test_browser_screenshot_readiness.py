@@ -0,0 +1,130 @@
+import unittest
+from unittest.mock import MagicMock, MagicMock, patch
+
+from agentbay import Browser, BrowserOption
+from agentbay._common.utils.page_readiness import READINESS_SCRIPT
+
+
+class FakePage:
+    """Serves a scripted sequence of readiness samples, repeating the last one."""
+
+    def __init__(self, samples, on_sample=None):
+        self.samples = list(samples)
+        self.on_sample = on_sample
+        self.sampled = 0
+        self.page = MagicMock()
+        self.page.evaluate = MagicMock(side_effect=self.evaluate)
+        self.page.screenshot = MagicMock(return_value=b"png")
+        self.page.context.new_cdp_session = MagicMock(side_effect=Exception("no CDP"))
+
+    def evaluate(self, script, arg=None):
+        if script != READINESS_SCRIPT:
+            return 0
+        self.sampled += 1
+        if self.on_sample:
+            self.on_sample(self.sampled)
+        return self.samples[min(self.sampled, len(self.samples)) - 1]
+
+
+def sample(height=1000, pending=0, bottom=True):
+    return {"height": height, "width": 1280, "pending": pending, "bottom": bottom}
+
+
+class TestScreenshotReadiness(unittest.TestCase):
+    def setUp(self):
+        mock_session = MagicMock()
+        mock_client = MagicMock()
+        mock_client.init_browser = MagicMock()
+        mock_client.init_browser.return_value = MagicMock()
+        mock_client.init_browser.return_value.to_map.return_value = {
+            "body": {"Data": {"Port": 9333}}
+        }
+        mock_session._get_client.return_value = mock_client
+        self.browser = Browser(mock_session)
+        self.browser.initialize(BrowserOption())
+
+    def test_static_page_is_captured_without_fixed_delays(self):
+        fake = FakePage([sample()])
+        self.browser.screenshot(fake.page)
+
+        self.assertEqual(fake.page.wait_for_timeout.call_count, 1)
+        fake.page.set_viewport_size.assert_not_called()
+        self.assertNotIn("clip", fake.page.screenshot.call_args.kwargs)
+
+    def test_waits_for_growth_images_and_scroll_to_bottom(self):
+        fake = FakePage(
+            [
+                sample(1000, bottom=False),
+                sample(3000, bottom=False),
+                sample(3000, pending=2),
+                sample(3000),
+            ]
+        )
+        self.browser.screenshot(fake.page, full_page=True)
+
+        self.assertEqual(fake.sampled, 5)
+        self.assertEqual(fake.page.wait_for_timeout.call_count, 4)
+        fake.page.evaluate.assert_any_call(READINESS_SCRIPT, True)
+
+    def test_waits_for_requests_seen_through_cdp(self):
+        handlers = {}
+        cdp = MagicMock()
+        cdp.on.side_effect = lambda name, handler: handlers.setdefault(name, handler)
+        cdp.send = MagicMock()
+        cdp.detach = MagicMock()
+
+        def network(n):
+            if n == 1:
+                handlers["Network.requestWillBeSent"]({"requestId": "r1"})
+            if n == 4:
+                handlers["Network.loadingFinished"]({"requestId": "r1"})
+
+        fake = FakePage([sample()], on_sample=network)
+        fake.page.context.new_cdp_session = MagicMock(return_value=cdp)
+        self.browser.screenshot(fake.page)
+
+        cdp.send.assert_called_once_with("Network.enable")
+        self.assertEqual(fake.sampled, 5)
+        cdp.detach.assert_called_once()
+
+    @patch("agentbay._sync.browser._logger")
+    def test_page_that_never_settles_is_captured_at_the_deadline(self, mock_logger):
+        fake = FakePage([sample(pending=1)])
+        result = self.browser.screenshot(fake.page, max_wait_ms=0)
+
+        self.assertEqual(result, b"png")
+        self.assertEqual(fake.sampled, 1)
+        mock_logger.warning.assert_called()
+
+    def test_fast_preset_samples_once_without_scrolling(self):
+        fake = FakePage([sample(pending=3, bottom=False)])
+        self.browser.screenshot(fake.page, wait="fast")
+
+        fake.page.evaluate.assert_called_once_with(READINESS_SCRIPT, False)
+        fake.page.wait_for_timeout.assert_not_called()
+
+    def test_tall_full_page_is_clipped(self):
+        fake = FakePage([sample(50000)])
+        self.browser.screenshot(fake.page, full_page=True, max_height=8000)
+
+        self.assertEqual(
+            fake.page.screenshot.call_args.kwargs["clip"],
+            {"x": 0, "y": 0, "width": 1280, "height": 8000},
+        )
+
+    def test_screenshot_tiles_cover_the_page(self):
+        fake = FakePage([sample(10000)])
+        tiles = self.browser.screenshot_tiles(fake.page, tile_height=4096)
+
+        self.assertEqual(tiles, [b"png"] * 3)
+        clips = [c.kwargs["clip"] for c in fake.page.screenshot.call_args_list]
+        self.assertEqual([(c["y"], c["height"]) for c in clips], [(0, 4096), (4096, 4096), (8192, 1808)])
+        self.assertTrue(all(c.kwargs["full_page"] for c in fake.page.screenshot.call_args_list))
+
+    def test_unknown_wait_preset_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.browser.screenshot(MagicMock(), wait="slow")
+
+
+if __name__ == "__main__":
+    unittest.main()
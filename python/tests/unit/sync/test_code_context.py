@@ -0,0 +1,153 @@
+import shutil
+import subprocess
+
+import pytest
+
+from agentbay import (
+    Code,
+    Command,
+    BinaryFileContentResult,
+    BoolResult,
+    CommandError,
+    CommandResult,
+)
+
+
+def run_locally(command, timeout_ms=50000, **kwargs):
+    proc = subprocess.run(["bash", "-c", command], capture_output=True, text=True)
+    return CommandResult(
+        request_id="cmd",
+        success=proc.returncode == 0,
+        exit_code=proc.returncode,
+        stdout=proc.stdout,
+        stderr=proc.stderr,
+        error_message=proc.stderr if proc.returncode else "",
+    )
+
+
+class LocalFiles:
+    def __init__(self):
+        self.written = []
+
+    def write_file(self, path, content, mode="overwrite"):
+        self.written.append(path)
+        with open(path, "a" if mode == "append" else "w") as f:
+            f.write(content)
+        return BoolResult(request_id="w", success=True, data=True)
+
+    def read_file(self, path, format="text"):
+        with open(path, "rb") as f:
+            return BinaryFileContentResult(request_id="r", success=True, content=f.read())
+
+
+class LocalSession:
+    """Session whose commands and background jobs run on the local machine."""
+
+    def __init__(self):
+        self.command = Command(self)
+        self.command.execute_command = run_locally
+        self.file_system = LocalFiles()
+
+
+@pytest.mark.sync
+def test_python_context_keeps_state_and_streams():
+    ctx = Code(LocalSession()).create_context("py", inline_limit=64)
+    try:
+        first = ctx.run("import math\nvalues = [1, 2, 3]\nprint('loaded', len(values))")
+        assert first.success, first.error_message
+        assert first.logs.stdout == ["loaded 3\n"]
+
+        second = ctx.run("values.append(4)\nsum(values) * math.pi")
+        assert second.success
+        assert second.execution_count == 2
+        assert second.result.startswith("31.41")
+
+        outputs = [
+            out
+            for out in ctx.stream(
+                "import time\nfor i in range(3):\n    print(i)\n    time.sleep(0.1)"
+            )
+        ]
+        assert [o.text for o in outputs if o.type == "stdout"] == ["0\n", "1\n", "2\n"]
+        assert outputs[-1].type == "done"
+    finally:
+        ctx.close()
+
+
+@pytest.mark.sync
+def test_python_context_errors_timeouts_and_artifacts():
+    ctx = Code(LocalSession()).create_context("python", inline_limit=64)
+    try:
+        failed = ctx.run("x = 1\n1 / 0")
+        assert not failed.success
+        assert failed.error.name == "ZeroDivisionError"
+        assert "kernel" not in failed.error.traceback
+        assert (ctx.run("x")).result == "1"
+
+        slow = ctx.run("import time\ntime.sleep(30)", timeout_s=0.5)
+        assert slow.error.name == "KeyboardInterrupt"
+
+        shown = ctx.run(
+            "class Img:\n"
+            "    def _repr_png_(self):\n"
+            "        return b'\\x89PNG' + bytes(200)\n"
+            "display(Img())\n"
+            "class Small:\n"
+            "    def _repr_png_(self):\n"
+            "        return b'\\x89PNG'\n"
+            "Small()"
+        )
+        large, small = shown.results
+        assert large.png is None and large.formats() == ["text", "png"]
+        assert large.artifacts[0].size == 204
+        assert small.png == "iVBORw=="
+        data = ctx.fetch_artifact(large.artifacts[0])
+        assert data.content == b"\x89PNG" + bytes(200)
+    finally:
+        ctx.close()
+    closed = ctx.run("1")
+    assert not closed.success and "closed" in closed.error_message
+
+
+@pytest.mark.sync
+def test_large_cells_are_uploaded_as_files():
+    session = LocalSession()
+    ctx = Code(session).create_context("python")
+    commands = []
+
+    def execute_command(command, **kwargs):
+        commands.append(command)
+        return run_locally(command, **kwargs)
+
+    session.command.execute_command = execute_command
+    try:
+        small = ctx.run("1 + 1")
+        large = ctx.run("rows = [%s]\nlen(rows)" % ", ".join(["1"] * 20_000))
+
+        assert small.result == "2"
+        assert large.success, large.error_message
+        assert large.result == "20000"
+        assert session.file_system.written == [f"{ctx.context_dir}/in/2.tmp"]
+        assert max(len(c) for c in commands) < 1024
+    finally:
+        ctx.close()
+
+
+@pytest.mark.sync
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_javascript_context_keeps_state():
+    ctx = Code(LocalSession()).create_context("javascript")
+    try:
+        ctx.run("let total = 40; console.log('ready')")
+        result = ctx.run("total += 2; total")
+        assert result.success and result.result == "42"
+        failed = ctx.run("undefinedFunction()")
+        assert failed.error.name == "ReferenceError"
+    finally:
+        ctx.close()
+
+
+@pytest.mark.sync
+def test_create_context_rejects_unsupported_language():
+    with pytest.raises(CommandError):
+        Code(LocalSession()).create_context("java")
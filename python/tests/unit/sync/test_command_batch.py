@@ -0,0 +1,104 @@
+"""
+Unit tests for AsyncCommand.run_batch.
+
+The generated batch script is executed with the local /bin/sh.
+"""
+
+import json
+import shutil
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import Command, CommandBatchResult, McpToolResult
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="requires sh")
+
+
+class LocalShellSession:
+    def __init__(self):
+        self.calls = 0
+
+    def call_mcp_tool(self, name, args):
+        self.calls += 1
+        proc = subprocess.run(
+            ["sh", "-c", args["command"]],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd="/tmp",
+        )
+        data = json.dumps(
+            {"stdout": proc.stdout, "stderr": proc.stderr, "exit_code": proc.returncode}
+        )
+        if proc.returncode == 0:
+            return McpToolResult(request_id="req", success=True, data=data)
+        return McpToolResult(request_id="req", success=False, error_message=data)
+
+
+class TestCommandBatch:
+    def setup_method(self):
+        self.session = LocalShellSession()
+        self.command = Command(self.session)
+
+    @pytest.mark.sync
+    def test_results_are_demultiplexed_in_one_call(self):
+        result = self.command.run_batch(
+            ["echo one", "printf 'a:b\\n---\\n' ; echo warn >&2", "echo $NAME"],
+            envs={"NAME": "batch"},
+        )
+
+        assert isinstance(result, CommandBatchResult)
+        assert self.session.calls == 1
+        assert result.success is True
+        assert [r.stdout for r in result.results] == ["one\n", "a:b\n---\n", "batch\n"]
+        assert result.results[1].stderr == "warn\n"
+        assert all(r.exit_code == 0 for r in result.results)
+
+    @pytest.mark.sync
+    def test_stop_on_error_skips_remaining(self):
+        result = self.command.run_batch(["true", "exit 4", "echo never"])
+
+        assert result.success is False
+        assert [r.exit_code for r in result.results] == [0, 4, -1]
+        assert result.results[2].stdout == ""
+        assert "Skipped" in result.results[2].error_message
+
+    @pytest.mark.sync
+    def test_continue_on_error(self):
+        result = self.command.run_batch(
+            ["exit 2", "echo still"], stop_on_error=False, cwd="/"
+        )
+
+        assert [r.exit_code for r in result.results] == [2, 0]
+        assert result.results[1].stdout == "still\n"
+
+    @pytest.mark.sync
+    def test_parallel_runs_all_commands(self):
+        result = self.command.run_batch(
+            ["sleep 0.3; echo a", "sleep 0.3; echo b", "exit 1"], parallel=True
+        )
+
+        assert [r.stdout for r in result.results] == ["a\n", "b\n", ""]
+        assert [r.exit_code for r in result.results] == [0, 0, 1]
+        assert result.results[0].duration_ms is None or result.results[0].duration_ms >= 250
+
+    @pytest.mark.sync
+    def test_empty_batch(self):
+        result = self.command.run_batch([])
+
+        assert result.success is True
+        assert result.results == []
+        assert self.session.calls == 0
+
+    @pytest.mark.sync
+    def test_tool_failure_is_reported(self):
+        self.command.execute_command = MagicMock(
+            return_value=McpToolResult(request_id="req", success=False, error_message="boom")
+        )
+
+        result = self.command.run_batch(["true"])
+
+        assert result.success is False
+        assert result.error_message == "boom"
@@ -0,0 +1,133 @@
+"""
+Unit tests for background command jobs (AsyncCommand.start).
+
+The fake session runs the generated shell scripts with the local /bin/sh, so
+these tests exercise the real launcher, offset reads and kill scripts.
+"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from agentbay import Command, CommandJob, CommandError, McpToolResult
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="requires sh")
+
+
+class LocalShellSession:
+    def __init__(self):
+        self.calls = []
+
+    def call_mcp_tool(self, name, args):
+        self.calls.append(args["command"])
+        proc = subprocess.run(
+            ["sh", "-c", args["command"]],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd="/tmp",
+        )
+        data = json.dumps(
+            {"stdout": proc.stdout, "stderr": proc.stderr, "exit_code": proc.returncode}
+        )
+        if proc.returncode == 0:
+            return McpToolResult(request_id="req", success=True, data=data)
+        return McpToolResult(request_id="req", success=False, error_message=data)
+
+
+@pytest.fixture
+def command():
+    return Command(LocalShellSession())
+
+
+class TestCommandJob:
+    @pytest.mark.sync
+    def test_start_and_wait_collects_output(self, command):
+        job = command.start(
+            "echo out; echo err >&2; echo $GREETING; exit 3",
+            envs={"GREETING": "hi there"},
+        )
+        try:
+            assert isinstance(job, CommandJob)
+            result = job.wait(timeout_ms=10000)
+
+            assert result.success is False
+            assert result.exit_code == 3
+            assert result.stdout == "out\nhi there\n"
+            assert result.stderr == "err\n"
+            assert job.finished is True
+        finally:
+            job.cleanup()
+
+    @pytest.mark.sync
+    def test_stream_reads_incrementally_by_offset(self, command):
+        job = command.start("for i in 1 2 3; do echo line$i; sleep 0.2; done")
+        try:
+            chunks = [c for c in job.stream(min_interval_ms=50, max_interval_ms=100)]
+
+            assert "".join(c.stdout for c in chunks) == "line1\nline2\nline3\n"
+            assert chunks[-1].finished is True
+            assert chunks[-1].exit_code == 0
+            assert job.stdout_offset == len("line1\nline2\nline3\n")
+            assert len(chunks) >= 2
+        finally:
+            job.cleanup()
+
+    @pytest.mark.sync
+    def test_poll_honours_max_bytes(self, command):
+        job = command.start("printf 'abcdefghij'", cwd="/tmp")
+        try:
+            chunks = []
+            while not job.finished:
+                chunk = job.poll(max_bytes=4)
+                assert chunk.success is True
+                chunks.append(chunk)
+
+            assert all(len(c.stdout) <= 4 for c in chunks)
+            assert "".join(c.stdout for c in chunks) == "abcdefghij"
+            assert chunks[-1].exit_code == 0
+            assert job.stdout_offset == 10
+        finally:
+            job.cleanup()
+
+    @pytest.mark.sync
+    def test_kill_stops_job(self, command):
+        job = command.start("sleep 30")
+        try:
+            killed = job.kill()
+            result = job.wait(timeout_ms=10000)
+
+            assert killed.success is True
+            assert result.exit_code == 143
+        finally:
+            job.cleanup()
+
+    @pytest.mark.sync
+    def test_poll_after_cleanup_reports_missing_job(self, command):
+        job = command.start("true")
+        job.wait(timeout_ms=10000)
+        job.cleanup()
+        job._finished = False
+
+        chunk = job.poll()
+
+        assert chunk.success is False
+        assert "not found" in chunk.error_message
+
+    @pytest.mark.sync
+    def test_start_rejects_invalid_envs(self, command):
+        with pytest.raises(ValueError):
+            command.start("true", envs={"A": 1})
+
+    @pytest.mark.sync
+    def test_start_failure_raises(self):
+        session = LocalShellSession()
+
+        def failing(name, args):
+            return McpToolResult(request_id="req", success=False, error_message="denied")
+
+        session.call_mcp_tool = failing
+        with pytest.raises(CommandError):
+            Command(session).start("true")
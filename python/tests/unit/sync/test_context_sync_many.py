@@ -0,0 +1,123 @@
+from unittest.mock import MagicMock, MagicMock, patch
+
+import pytest
+
+from agentbay import (
+    ContextManager,
+    ContextInfoResult,
+    ContextStatusData,
+    ContextSyncManyResult,
+)
+
+
+def _sync_response(success=True, code=None):
+    body = {"RequestId": "sync-request-id", "Success": success}
+    if code:
+        body.update({"Code": code, "Message": "sync rejected"})
+    response = MagicMock()
+    response.to_map.return_value = {"body": body}
+    return response
+
+
+def _info(*entries):
+    return ContextInfoResult(
+        request_id="info-request-id",
+        context_status_data=[
+            ContextStatusData(
+                context_id=cid,
+                path=path,
+                status=status,
+                task_type="upload",
+                error_message="disk full" if status == "Failed" else "",
+            )
+            for cid, path, status in entries
+        ],
+    )
+
+
+@pytest.fixture
+def manager():
+    session = MagicMock()
+    session._get_api_key.return_value = "test-api-key"
+    session._get_session_id.return_value = "test-session-id"
+    client = MagicMock()
+    client.sync_context = MagicMock(return_value=_sync_response())
+    session._get_client.return_value = client
+    return ContextManager(session)
+
+
+ITEMS = [("ctx-a", "/mnt/a", "upload"), ("ctx-b", "/mnt/b", "upload")]
+
+
+@pytest.mark.sync
+def test_items_resolve_as_each_finishes_from_shared_polls(manager):
+    info = MagicMock(
+        side_effect=[
+            _info(("ctx-a", "/mnt/a", "Running"), ("ctx-b", "/mnt/b", "Running")),
+            _info(("ctx-a", "/mnt/a", "Success"), ("ctx-b", "/mnt/b", "Running")),
+            _info(("ctx-a", "/mnt/a", "Success"), ("ctx-b", "/mnt/b", "Success")),
+        ]
+    )
+    completed = []
+    with patch.object(manager, "info", info), patch(
+        "time.sleep", new=MagicMock()
+    ):
+        result = manager.sync_many(
+            ITEMS,
+            on_item_complete=lambda item: completed.append((item.path, info.call_count)),
+        )
+
+    assert isinstance(result, ContextSyncManyResult)
+    assert result.success
+    assert manager.session._get_client().sync_context.call_count == 2
+    # One status query per poll covers every item
+    assert info.call_count == 3
+    info.assert_called_with()
+    # ctx-a is resolved on the poll that first reports it finished
+    assert completed == [("/mnt/a", 2), ("/mnt/b", 3)]
+    by_path = result.by_path()
+    assert by_path["/mnt/a"].status == "Success"
+    assert by_path["/mnt/a"].request_id == "sync-request-id"
+    assert by_path["/mnt/b"].status_data[0].status == "Success"
+    assert [item.context_id for item in result.items] == ["ctx-a", "ctx-b"]
+
+
+@pytest.mark.sync
+def test_failed_requests_and_failed_syncs_are_reported_per_item(manager):
+    manager.session._get_client().sync_context = MagicMock(
+        side_effect=[_sync_response(), _sync_response(False, "InvalidParameter")]
+    )
+    info = MagicMock(return_value=_info(("ctx-a", "/mnt/a", "Failed")))
+    with patch.object(manager, "info", info):
+        result = manager.sync_many(ITEMS)
+
+    assert not result.success
+    a, b = result.items
+    assert a.status == "Failed"
+    assert a.error_message == "disk full"
+    assert b.status == "RequestFailed"
+    assert "InvalidParameter" in b.error_message
+    assert len(result.failed) == 2
+    assert "/mnt/a: disk full" in result.error_message
+
+
+@pytest.mark.sync
+def test_pending_items_time_out(manager):
+    info = MagicMock(
+        return_value=_info(("ctx-a", "/mnt/a", "Success"), ("ctx-b", "/mnt/b", "Running"))
+    )
+    with patch.object(manager, "info", info), patch(
+        "time.sleep", new=MagicMock()
+    ):
+        result = manager.sync_many(ITEMS, max_retries=4, retry_interval=500)
+
+    assert not result.success
+    assert result.items[0].success
+    assert result.items[1].status == "Timeout"
+
+
+@pytest.mark.sync
+def test_empty_item_list(manager):
+    result = manager.sync_many([])
+    assert result.success
+    assert result.items == []
@@ -605,7 +605,9 @@ class TestAsyncFileSystem(unittest.TestCase):
         ]
 
         content = "a" * (150 * 1024)  # 150KB content
-        result = self.fs.write_file("/path/to/large_file.txt", content)
+        result = self.fs.write_file(
+            "/path/to/large_file.txt", content, compression="none"
+        )
         self.assertIsInstance(result, BoolResult)
         self.assertTrue(result.success)
         self.assertTrue(result.data)
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, MagicMock
+
+import pytest
+
+from agentbay import FileSystem, CommandResult, ManifestEntry, FileManifest
+
+
+def make_fs(result):
+    session = MagicMock()
+    session.command.execute_command = MagicMock(return_value=result)
+    return FileSystem(session), session
+
+
+OUTPUT = (
+    "F\t5\t1700000000.0000000000\ta.txt\n"
+    "F\t7\t1700000000.0000000000\tsub/b.txt\n"
+    "0f0f  ./a.txt\n"
+    "1e1e  ./sub/b.txt\n"
+)
+
+
+@pytest.mark.sync
+def test_manifest_runs_one_command():
+    fs, session = make_fs(CommandResult(request_id="r1", success=True, stdout=OUTPUT))
+
+    result = fs.manifest("/data", exclude=[".git"])
+
+    assert result.success
+    assert result.request_id == "r1"
+    assert result.manifest.root == "/data"
+    assert result.manifest.hash == "sha256"
+    assert result.manifest.paths == ["a.txt", "sub/b.txt"]
+    assert result.manifest["sub/b.txt"].digest == "1e1e"
+    session.command.execute_command.assert_called_once()
+    command = session.command.execute_command.call_args.args[0]
+    assert "-name .git" in command and "sha256sum" in command
+
+    local = FileManifest("/local", "sha256", [ManifestEntry("a.txt", 5, 1.0, "0f0f")])
+    assert local.diff(result.manifest).extra == ["sub/b.txt"]
+    assert local.diff(result.manifest).unchanged == ["a.txt"]
+
+
+@pytest.mark.sync
+def test_manifest_keeps_partial_output_on_nonzero_exit():
+    fs, _ = make_fs(
+        CommandResult(
+            success=False,
+            exit_code=1,
+            stdout="F\t5\t1.0\ta.txt\n",
+            stderr="sha256sum: ./a.txt: Permission denied",
+        )
+    )
+
+    result = fs.manifest("/data")
+
+    assert result.success
+    assert result.manifest["a.txt"].digest is None
+    assert "Permission denied" in result.error_message
+
+
+@pytest.mark.sync
+def test_manifest_failure():
+    fs, _ = make_fs(
+        CommandResult(success=False, exit_code=1, error_message="cd: /nope: No such file or directory")
+    )
+
+    result = fs.manifest("/nope", hash=None)
+
+    assert not result.success
+    assert "No such file" in result.error_message
+    assert len(result.manifest) == 0
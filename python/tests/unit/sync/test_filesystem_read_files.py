@@ -0,0 +1,70 @@
+import pytest
+
+from agentbay import FileSystem, FileContentResult
+
+
+class RecordingFileSystem(FileSystem):
+    def __init__(self, session):
+        super().__init__(session)
+        self.chunked = []
+
+    def read_file(self, path, *, format="text", compression="auto"):
+        self.chunked.append(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        return FileContentResult(request_id="r", success=True, content=data.decode())
+
+
+@pytest.mark.sync
+def test_read_files_batches_small_files(tmp_path, sandbox):
+    paths = []
+    for i in range(40):
+        path = tmp_path / f"note {i}: part.md"
+        path.write_text(f"# Note {i}\n\n---\nkey: value {i}\n")
+        paths.append(str(path))
+    big = tmp_path / "big.txt"
+    big.write_text("z" * 5000)
+    fs = RecordingFileSystem(sandbox)
+
+    result = fs.read_files(paths + [str(big)], batch_bytes=1024, concurrency=3)
+
+    assert result.success, result.errors
+    assert result.contents[paths[7]] == "# Note 7\n\n---\nkey: value 7\n"
+    assert result.contents[str(big)] == "z" * 5000
+    assert fs.chunked == [str(big)]
+    # One stat plus a handful of batches instead of 40 reads
+    assert len(sandbox.commands) < 10
+
+
+@pytest.mark.sync
+def test_read_files_bytes_and_errors(tmp_path, sandbox):
+    blob = tmp_path / "image.png"
+    blob.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)))
+    fs = RecordingFileSystem(sandbox)
+
+    result = fs.read_files([str(blob), str(tmp_path / "gone"), str(tmp_path)], format="bytes")
+
+    assert not result.success
+    assert result.contents == {str(blob): blob.read_bytes()}
+    assert set(result.errors) == {str(tmp_path / "gone"), str(tmp_path)}
+    assert "2 of 3" in result.error_message
+
+
+@pytest.mark.sync
+def test_stream_files_yields_each_file(tmp_path, sandbox):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(str(i))
+        paths.append(str(path))
+    fs = RecordingFileSystem(sandbox)
+
+    seen = {path: content for path, content in fs.stream_files(paths, batch_bytes=80)}
+
+    assert seen == {path: str(i) for i, path in enumerate(paths)}
+
+
+@pytest.mark.sync
+def test_read_files_rejects_unknown_format(sandbox):
+    with pytest.raises(ValueError):
+        FileSystem(sandbox).read_files(["/a"], format="json")
@@ -0,0 +1,84 @@
+import pytest
+
+from agentbay import FileSystem, FileError
+
+
+def make_tree(root, files=25):
+    for i in range(files):
+        folder = root / f"pkg{i % 3}"
+        folder.mkdir(exist_ok=True)
+        (folder / f"mod_{i:02d}.py").write_text(f"import os\n\n# TODO: item {i}\nx = {i}\n")
+    (root / ".git").mkdir()
+    (root / ".git" / "hooks.py").write_text("# TODO: hidden\n")
+
+
+@pytest.mark.sync
+def test_search_files_page_paginates(tmp_path, sandbox):
+    make_tree(tmp_path)
+    fs = FileSystem(sandbox)
+
+    first = fs.search_files_page(str(tmp_path), "*.py", [".git"], limit=10)
+    assert first.success and first.has_more
+    assert len(first.matches) == 10
+    second = fs.search_files_page(
+        str(tmp_path), "*.py", [".git"], limit=10, cursor=first.next_cursor
+    )
+    assert second.matches[0] > first.matches[-1]
+
+    streamed = [
+        p for p in fs.stream_search_files(str(tmp_path), "*.py", [".git"], page_size=7)
+    ]
+    assert len(streamed) == 25
+    assert streamed[:10] == first.matches
+    assert not any("/.git/" in p for p in streamed)
+
+
+@pytest.mark.sync
+def test_grep_returns_positions_and_cursor(tmp_path, sandbox):
+    make_tree(tmp_path)
+    fs = FileSystem(sandbox)
+
+    result = fs.grep(
+        str(tmp_path), r"TODO: item [0-9]+", ["*.py"], max_matches=5, exclude=[".git"]
+    )
+
+    assert result.success and result.has_more
+    assert len(result.matches) == 5
+    match = result.matches[0]
+    assert (match.line, match.column) == (3, 3)
+    assert match.text.startswith("# TODO: item")
+
+    everything = [
+        m
+        for m in fs.stream_grep(
+            str(tmp_path), "todo", exclude=[".git"], ignore_case=True, page_size=4
+        )
+    ]
+    assert len(everything) == 25
+    assert len({(m.path, m.line) for m in everything}) == 25
+
+    capped = [m for m in fs.stream_grep(str(tmp_path), "TODO", max_matches=6, page_size=4)]
+    assert len(capped) == 6
+
+
+@pytest.mark.sync
+def test_grep_single_file(tmp_path, sandbox):
+    make_tree(tmp_path)
+    target = tmp_path / "pkg0" / "mod_00.py"
+    fs = FileSystem(sandbox)
+
+    result = fs.grep(str(target), "TODO")
+
+    assert result.success and not result.has_more
+    assert [(m.path, m.line) for m in result.matches] == [(str(target), 3)]
+
+
+@pytest.mark.sync
+def test_grep_missing_directory(tmp_path, sandbox):
+    fs = FileSystem(sandbox)
+    result = fs.grep(str(tmp_path / "nope"), "x")
+    assert not result.success
+    assert "No such file" in result.error_message
+    with pytest.raises(FileError):
+        for _ in fs.stream_search_files(str(tmp_path / "nope"), "*"):
+            pass
@@ -0,0 +1,93 @@
+import os
+import random
+
+import pytest
+
+from agentbay import FileSystem
+
+
+def generated_source(lines, seed=1):
+    rng = random.Random(seed)
+    return "".join(f"export const v{i} = {rng.randint(0, 10 ** 9)};\n" for i in range(lines))
+
+
+@pytest.mark.sync
+def test_sync_file_sends_only_changed_blocks(tmp_path, sandbox):
+    local, remote = tmp_path / "bundle.js", tmp_path / "remote" / "bundle.js"
+    content = generated_source(20_000)
+    local.write_text(content)
+    fs = FileSystem(sandbox)
+
+    created = fs.sync_file(str(local), str(remote))
+    assert created.success, created.error_message
+    assert created.bytes_sent == created.size == len(content)
+    assert remote.read_text() == content
+
+    lines = content.splitlines(keepends=True)
+    lines.insert(5000, "export const inserted = 1;\n")
+    lines[15000] = "export const changed = 2;\n"
+    local.write_text("".join(lines))
+    sandbox.written = 0
+
+    patched = fs.sync_file(str(local), str(remote))
+
+    assert patched.success, patched.error_message
+    assert remote.read_text() == local.read_text()
+    assert patched.bytes_sent < 4 * 1024
+    assert sandbox.written < 0.05 * len(content)
+    assert not [name for name in os.listdir(remote.parent) if name != "bundle.js"]
+
+
+@pytest.mark.sync
+def test_sync_file_skips_identical_files(tmp_path, sandbox):
+    local, remote = tmp_path / "a.txt", tmp_path / "b.txt"
+    local.write_text("same")
+    remote.write_text("same")
+
+    result = FileSystem(sandbox).sync_file(str(local), str(remote))
+
+    assert result.success and result.unchanged
+    assert sandbox.written == 0
+
+
+@pytest.mark.sync
+def test_sync_file_missing_local_file(tmp_path, sandbox):
+    result = FileSystem(sandbox).sync_file(str(tmp_path / "nope"), "/tmp/x")
+    assert not result.success
+    assert "not found" in result.error_message
+
+
+@pytest.mark.sync
+def test_sync_dir_uploads_patches_and_deletes(tmp_path, sandbox):
+    local, remote = tmp_path / "local", tmp_path / "remote"
+    (local / "src").mkdir(parents=True)
+    (remote / "src").mkdir(parents=True)
+    big = generated_source(10_000)
+    (local / "src" / "big.js").write_text(big + "export const added = 1;\n")
+    (remote / "src" / "big.js").write_text(big)
+    (local / "src" / "small.js").write_text("new small")
+    (remote / "src" / "small.js").write_text("old small")
+    (local / "same.txt").write_text("same")
+    (remote / "same.txt").write_text("same")
+    (local / "new.txt").write_text("new")
+    (remote / "stale.txt").write_text("stale")
+    (remote / ".git").mkdir()
+    (remote / ".git" / "HEAD").write_text("ref")
+
+    fs = FileSystem(sandbox)
+    result = fs.sync_dir(str(local), str(remote), delete=True, exclude=[".git"])
+
+    assert result.success, result.error_message
+    assert result.uploaded == ["new.txt", "src/small.js"]
+    assert result.patched == ["src/big.js"]
+    assert result.deleted == ["stale.txt"]
+    assert result.unchanged == ["same.txt"]
+    assert result.bytes_sent < len(big) / 10
+    for rel in ("src/big.js", "src/small.js", "same.txt", "new.txt"):
+        assert (remote / rel).read_bytes() == (local / rel).read_bytes()
+    assert not (remote / "stale.txt").exists()
+    assert (remote / ".git" / "HEAD").exists()
+
+    again = fs.sync_dir(str(local), str(remote), delete=True, exclude=[".git"])
+    assert again.success
+    assert again.uploaded == again.patched == again.deleted == []
@@ -0,0 +1,133 @@
+import time
+import threading
+from unittest.mock import MagicMock, MagicMock
+
+import pytest
+
+from agentbay import FileSystem, CommandResult, McpToolResult
+
+TREE = {
+    "/data": "[DIR] a\n[DIR] b\n[FILE] top.txt",
+    "/data/a": "[DIR] deep\n[FILE] a1.txt\n[FILE] a2.txt",
+    "/data/b": "[FILE] b1.txt",
+    "/data/a/deep": "[FILE] d1.txt",
+}
+
+
+class FakeSession:
+    """Serves list_directory from TREE and records listing concurrency."""
+
+    def __init__(self, tree, fail=()):
+        self.tree = tree
+        self.fail = set(fail)
+        self.listed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.command = MagicMock()
+
+    def call_mcp_tool(self, name, args):
+        path = args["path"]
+        with self._lock:
+            self.listed.append(path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        if path in self.fail or path not in self.tree:
+            return McpToolResult(request_id="r", success=False, error_message="Permission denied")
+        return McpToolResult(request_id="r", success=True, data=self.tree[path])
+
+
+@pytest.mark.sync
+def test_walk_is_breadth_first_with_paths_and_depths():
+    fs = FileSystem(FakeSession(TREE))
+    entries = [entry for entry in fs.walk("/data")]
+
+    assert {(e.path, e.depth, e.is_directory) for e in entries} == {
+        ("/data/a", 1, True),
+        ("/data/b", 1, True),
+        ("/data/top.txt", 1, False),
+        ("/data/a/deep", 2, True),
+        ("/data/a/a1.txt", 2, False),
+        ("/data/a/a2.txt", 2, False),
+        ("/data/b/b1.txt", 2, False),
+        ("/data/a/deep/d1.txt", 3, False),
+    }
+    depths = [e.depth for e in entries]
+    assert depths == sorted(depths)
+    assert all(e.is_file != e.is_directory for e in entries)
+
+
+@pytest.mark.sync
+def test_walk_respects_max_depth():
+    session = FakeSession(TREE)
+    fs = FileSystem(session)
+    entries = [entry for entry in fs.walk("/data", max_depth=2)]
+
+    assert max(e.depth for e in entries) == 2
+    assert "/data/a/deep" not in session.listed
+
+
+@pytest.mark.sync
+def test_walk_lists_directories_concurrently_up_to_the_limit():
+    tree = {"/r": "\n".join(f"[DIR] d{i}" for i in range(10))}
+    tree.update({f"/r/d{i}": "[FILE] f" for i in range(10)})
+    session = FakeSession(tree)
+    fs = FileSystem(session)
+
+    entries = [entry for entry in fs.walk("/r", concurrency=4)]
+
+    assert len(entries) == 20
+    assert 1 < session.max_in_flight <= 4
+
+
+@pytest.mark.sync
+def test_scandir_tree_reports_unlistable_directories():
+    fs = FileSystem(FakeSession(TREE, fail={"/data/b"}))
+    result = fs.scandir_tree("/data")
+
+    assert result.success
+    assert "/data/b" in result.errors
+    assert "/data/b/b1.txt" not in [e.path for e in result.entries]
+    assert len(result.files) == 4
+    assert len(result.directories) == 3
+
+
+@pytest.mark.sync
+def test_scandir_tree_fails_when_root_cannot_be_listed():
+    fs = FileSystem(FakeSession(TREE))
+    result = fs.scandir_tree("/missing")
+
+    assert not result.success
+    assert result.error_message == "Permission denied"
+
+
+@pytest.mark.sync
+def test_walk_with_find_uses_one_command():
+    session = FakeSession({})
+    session.command.execute_command = MagicMock(
+        return_value=CommandResult(
+            success=True,
+            stdout=(
+                "d\t4096\t1\t/data/a\n"
+                "f\t12\t2\t/data/a/a1.txt\n"
+                "f\t5\t1\t/data/top.txt\n"
+            ),
+        )
+    )
+    fs = FileSystem(session)
+
+    entries = [entry for entry in fs.walk("/data", max_depth=2, use_find=True)]
+
+    command = session.command.execute_command.call_args.args[0]
+    assert command.startswith("find /data -mindepth 1 -maxdepth 2 -printf")
+    assert session.listed == []
+    assert [(e.path, e.depth) for e in entries] == [
+        ("/data/a", 1),
+        ("/data/top.txt", 1),
+        ("/data/a/a1.txt", 2),
+    ]
+    assert entries[2].size == 12
+    assert entries[0].is_directory and entries[2].is_file
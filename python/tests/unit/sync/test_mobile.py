@@ -279,6 +279,96 @@ class TestMobile:
             {"timeout_ms": 2000, "format": "xml"},
         )
 
+    @pytest.mark.sync
+    def test_get_all_ui_elements_drop_raw(self):
+        """Test that keep_raw=False does not retain the raw JSON string."""
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.request_id = "test-123"
+        mock_result.data = '[{"bounds": "[0,0][100,100]", "className": "Button", "text": "OK"}]'
+        self.session.call_mcp_tool = MagicMock(return_value=mock_result)
+
+        result = self.mobile.get_all_ui_elements(keep_raw=False)
+
+        assert result.success is True
+        assert result.raw == ""
+        assert result.elements[0]["text"] == "OK"
+
+    @pytest.mark.sync
+    def test_get_ui_tree_success(self):
+        """Test retrieving the UI hierarchy as an indexed tree."""
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.request_id = "test-123"
+        mock_result.data = '[{"bounds": "[0,0][100,100]", "className": "Frame", "resourceId": "root", "children": [{"bounds": "[10,10][90,90]", "className": "Button", "text": "OK", "resourceId": "btn"}]}]'
+        self.session.call_mcp_tool = MagicMock(return_value=mock_result)
+
+        result = self.mobile.get_ui_tree()
+
+        assert result.success is True
+        assert result.raw == ""
+        assert len(result.tree) == 2
+        assert result.tree.find_one(resource_id="btn").text == "OK"
+        assert result.tree.element_at(50, 50).resource_id == "btn"
+        self.session.call_mcp_tool.assert_called_once_with(
+            "get_all_ui_elements",
+            {"timeout_ms": 2000, "format": "json"},
+        )
+
+    @pytest.mark.sync
+    def test_get_ui_tree_invalid_json(self):
+        """Test get_ui_tree with unparsable tool output."""
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.request_id = "test-123"
+        mock_result.data = "not json"
+        self.session.call_mcp_tool = MagicMock(return_value=mock_result)
+
+        result = self.mobile.get_ui_tree(keep_raw=True)
+
+        assert result.success is False
+        assert result.raw == "not json"
+        assert "Failed to parse UI elements data" in result.error_message
+        assert len(result.tree) == 0
+
+    @pytest.mark.sync
+    def test_snapshot_ui_reports_changes_since_last_call(self):
+        """Test that snapshot_ui diffs against the previous snapshot."""
+        first = Mock(success=True, request_id="r1", data='[{"className": "Frame", "resourceId": "root", "children": [{"className": "Text", "resourceId": "msg", "text": "Loading"}]}]')
+        second = Mock(success=True, request_id="r2", data='[{"className": "Frame", "resourceId": "root", "children": [{"className": "Text", "resourceId": "msg", "text": "Done"}]}]')
+        self.session.call_mcp_tool = MagicMock(side_effect=[first, second])
+
+        initial = self.mobile.snapshot_ui()
+        result = self.mobile.snapshot_ui()
+
+        assert [n.resource_id for n in initial.diff.added] == ["root"]
+        assert result.success is True
+        assert result.diff.added == [] and result.diff.removed == []
+        assert [(old.text, new.text) for old, new in result.diff.changed] == [("Loading", "Done")]
+        self.session.call_mcp_tool.assert_called_with(
+            "get_all_ui_elements",
+            {"timeout_ms": 2000, "format": "json"},
+        )
+
+    @pytest.mark.sync
+    def test_snapshot_ui_clickable_only_and_failure_keeps_previous(self):
+        """Test clickable snapshots and that failures do not replace the stored snapshot."""
+        ok = Mock(success=True, request_id="r1", data='[{"className": "Button", "resourceId": "ok"}]')
+        failed = Mock(success=False, request_id="r2", data=None, error_message="tool error")
+        self.session.call_mcp_tool = MagicMock(side_effect=[ok, failed, ok])
+
+        self.mobile.snapshot_ui(clickable_only=True)
+        error = self.mobile.snapshot_ui(clickable_only=True)
+        again = self.mobile.snapshot_ui(clickable_only=True)
+
+        assert error.success is False
+        assert error.error_message == "tool error"
+        assert again.diff.has_changes is False
+        self.session.call_mcp_tool.assert_called_with(
+            "get_clickable_ui_elements",
+            {"timeout_ms": 2000},
+        )
+
     # Application Management Tests
     @pytest.mark.sync
 
@@ -0,0 +1,152 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentbay._sync.polling import poll_each, poll_until
+from agentbay._common.utils.polling import PollPolicy, poll_metrics
+
+FAST = PollPolicy(initial_interval=0.001, max_interval=0.005, jitter=0)
+
+
+class Probe:
+    """Returns the given values in turn, raising the exceptions among them."""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        value = self.values.pop(0) if len(self.values) > 1 else self.values[0]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+@pytest.mark.sync
+def test_first_probe_is_immediate():
+    with patch("time.sleep", new=MagicMock()) as sleep_mock:
+        outcome = poll_until(Probe(True), name="test.immediate")
+    assert outcome.done
+    assert outcome.probes == 1
+    sleep_mock.assert_not_called()
+
+
+@pytest.mark.sync
+def test_completion_predicate_and_backoff():
+    policy = PollPolicy(initial_interval=1.0, max_interval=2.0, multiplier=2.0, jitter=0)
+    with patch("time.sleep", new=MagicMock()) as sleep_mock:
+        outcome = poll_until(
+            Probe("pending", "pending", "pending", "ready"),
+            done=lambda value: value == "ready",
+            policy=policy,
+        )
+    assert outcome.done
+    assert outcome.value == "ready"
+    assert outcome.probes == 4
+    assert [c.args[0] for c in sleep_mock.call_args_list] == [1.0, 2.0, 2.0]
+
+
+@pytest.mark.sync
+def test_timeout_ends_with_a_final_probe_at_the_deadline():
+    policy = PollPolicy(initial_interval=2.0, max_interval=2.0, jitter=0)
+    with patch("time.sleep", new=MagicMock()) as sleep_mock:
+        outcome = poll_until(Probe(False), timeout=5, policy=policy)
+    assert not outcome.done
+    assert outcome.timed_out
+    # Probes at 0, 2, 4 and 5 seconds
+    assert [c.args[0] for c in sleep_mock.call_args_list] == [2.0, 2.0, 1.0]
+    assert outcome.probes == 4
+
+
+@pytest.mark.sync
+def test_server_hint_sets_next_delay():
+    policy = PollPolicy(initial_interval=1.0, max_interval=10.0, jitter=0)
+    with patch("time.sleep", new=MagicMock()) as sleep_mock:
+        poll_until(
+            Probe({"eta": 4.0}, {"eta": 0.5}, {"eta": 0, "done": True}),
+            done=lambda value: value.get("done", False),
+            hint=lambda value: value["eta"],
+            policy=policy,
+        )
+    assert [c.args[0] for c in sleep_mock.call_args_list] == [4.0, 0.5]
+
+
+@pytest.mark.sync
+def test_server_hint_restarts_backoff():
+    policy = PollPolicy(initial_interval=1.0, max_interval=10.0, multiplier=2.0, jitter=0)
+    with patch("time.sleep", new=MagicMock()) as sleep_mock:
+        poll_until(
+            Probe(1, 2, "hint", 3, 4, "done"),
+            done=lambda value: value == "done",
+            hint=lambda value: 0.5 if value == "hint" else None,
+            policy=policy,
+        )
+    assert [c.args[0] for c in sleep_mock.call_args_list] == [1.0, 2.0, 0.5, 1.0, 2.0]
+
+
+@pytest.mark.sync
+def test_poll_each_yields_every_result():
+    values = [
+        value
+        for value in poll_each(
+            Probe(1, RuntimeError("flaky"), 2, 3),
+            done=lambda value: value == 3,
+            policy=FAST,
+            name="test.each",
+        )
+    ]
+    assert values == [1, 2, 3]
+    stats = poll_metrics.get("test.each")
+    assert stats["completed"] >= 1
+    assert stats["probe_errors"] >= 1
+
+
+@pytest.mark.sync
+def test_probe_errors_are_retried_or_raised():
+    outcome = poll_until(
+        Probe(RuntimeError("flaky"), True), policy=FAST, name="test.errors"
+    )
+    assert outcome.done
+    assert outcome.probes == 2
+    assert poll_metrics.get("test.errors")["probe_errors"] >= 1
+
+    with pytest.raises(RuntimeError):
+        poll_until(Probe(RuntimeError("boom")), policy=FAST, raise_errors=True)
+
+
+@pytest.mark.sync
+def test_max_probes():
+    outcome = poll_until(Probe(False), policy=FAST, max_probes=3)
+    assert outcome.timed_out
+    assert outcome.probes == 3
+
+
+@pytest.mark.sync
+def test_cancel_event_stops_the_wait():
+    cancel = threading.Event()
+    probe = Probe(False)
+
+    def cancelling_probe():
+        value = probe()
+        if probe.calls == 2:
+            cancel.set()
+        return value
+
+    outcome = poll_until(cancelling_probe, policy=FAST, cancel=cancel)
+    assert outcome.cancelled
+    assert not outcome.done
+    assert probe.calls == 2
+
+
+@pytest.mark.sync
+def test_metrics_are_recorded_per_name():
+    poll_metrics.reset()
+    poll_until(Probe(True), name="test.metrics")
+    poll_until(Probe(False), policy=FAST, timeout=0.01, name="test.metrics")
+    stats = poll_metrics.get("test.metrics")
+    assert stats["waits"] == 2
+    assert stats["completed"] == 1
+    assert stats["timed_out"] == 1
+    assert stats["max_wait"] >= 0.01
@@ -1,4 +1,3 @@
-import time
 import unittest
 import pytest
 from unittest.mock import MagicMock, MagicMock, patch
@@ -0,0 +1,74 @@
+"""
+Allocation benchmark for AsyncSession: bulk list/get/delete flows create many
+sessions whose services are never used, so a bare session must stay small.
+"""
+
+import gc
+import tracemalloc
+from unittest.mock import MagicMock
+
+from agentbay import Session
+from agentbay._sync.command import Command
+from agentbay._sync.filesystem import FileSystem
+
+N = 2000
+
+
+def _allocated_per_session(touch_services: bool) -> float:
+    agent_bay = MagicMock()
+    sessions = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(N):
+            session = Session(agent_bay, f"session-{i:06d}")
+            if touch_services:
+                for name in (
+                    "file_system",
+                    "command",
+                    "code",
+                    "oss",
+                    "computer",
+                    "mobile",
+                    "context",
+                    "browser",
+                    "agent",
+                ):
+                    getattr(session, name)
+            sessions.append(session)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return growth / N
+
+
+class TestLazyServices:
+    def test_services_created_on_first_access_and_cached(self):
+        session = Session(MagicMock(), "session-1")
+        assert not hasattr(session, "_file_system")
+
+        fs = session.file_system
+        assert isinstance(fs, FileSystem)
+        assert fs.session is session
+        assert session.file_system is fs
+        assert session.fs is fs
+        assert isinstance(session.command, Command)
+
+    def test_service_can_be_replaced(self):
+        session = Session(MagicMock(), "session-1")
+        replacement = MagicMock()
+        session.command = replacement
+        assert session.command is replacement
+
+    def test_no_instance_dict_for_plain_session(self):
+        session = Session(MagicMock(), "session-1")
+        session.image_id = "linux_latest"
+        assert not getattr(session, "__dict__", {})
+
+    def test_bare_session_allocates_far_less_than_full_one(self):
+        bare = _allocated_per_session(touch_services=False)
+        full = _allocated_per_session(touch_services=True)
+        assert bare < 600
+        assert bare * 3 < full
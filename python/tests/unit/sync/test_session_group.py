@@ -0,0 +1,155 @@
+import time
+"""
+Unit tests for AsyncSessionGroup fan-out.
+"""
+
+import threading
+from unittest.mock import MagicMock, MagicMock
+
+import pytest
+
+from agentbay import (
+    SessionGroup,
+    CommandResult,
+    LatencyStats,
+    SessionListResult,
+    SessionResult,
+)
+
+
+def _make_session(session_id, delay=0.0, fail=False, raises=False):
+    session = MagicMock()
+    session.session_id = session_id
+
+    def execute_command(command, timeout_ms=50000, cwd=None, envs=None):
+        time.sleep(delay)
+        if raises:
+            raise RuntimeError("connection reset")
+        return CommandResult(
+            request_id=f"req-{session_id}",
+            success=not fail,
+            output=f"{session_id}:{command}",
+            error_message="boom" if fail else "",
+        )
+
+    session.command.execute_command = execute_command
+    return session
+
+
+class TestAsyncSessionGroup:
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            SessionGroup([], concurrency=0)
+        with pytest.raises(ValueError):
+            SessionGroup([], timeout=0)
+
+    @pytest.mark.sync
+    def test_run_command_results_in_group_order(self):
+        sessions = [_make_session("s0", 0.05), _make_session("s1"), _make_session("s2", 0.02)]
+        group = SessionGroup(sessions, concurrency=3)
+
+        result = group.run_command("echo hi")
+
+        assert result.success is True
+        assert [r.session_id for r in result.results] == ["s0", "s1", "s2"]
+        assert result.results[1].value.output == "s1:echo hi"
+        assert result.results[1].request_id == "req-s1"
+        assert result.stats.count == 3
+        assert result.stats.max_ms >= result.stats.p50_ms >= result.stats.min_ms
+
+    @pytest.mark.sync
+    def test_failures_and_exceptions_are_collected(self):
+        sessions = [_make_session("ok"), _make_session("bad", fail=True), _make_session("err", raises=True)]
+        group = SessionGroup(sessions)
+
+        result = group.run_command("true")
+
+        assert result.success is False
+        assert [r.session_id for r in result.failed] == ["bad", "err"]
+        assert result.failed[0].error_message == "boom"
+        assert "connection reset" in result.failed[1].error_message
+        assert "2 of 3" in result.error_message
+
+    @pytest.mark.sync
+    def test_per_session_timeout(self):
+        sessions = [_make_session("fast"), _make_session("slow", delay=1.0)]
+        group = SessionGroup(sessions, timeout=0.2)
+
+        result = group.run_command("sleep")
+
+        assert result.results[0].success is True
+        assert result.results[1].timed_out is True
+        assert result.results[1].success is False
+
+    @pytest.mark.sync
+    def test_concurrency_limit(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def op(session):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return session.session_id
+
+        group = SessionGroup([_make_session(f"s{i}") for i in range(8)], concurrency=2)
+        result = group.map(op)
+
+        assert result.success is True
+        assert [r.value for r in result.results] == [f"s{i}" for i in range(8)]
+        assert state["peak"] <= 2
+
+    @pytest.mark.sync
+    def test_as_completed_streams_in_completion_order(self):
+        sessions = [_make_session("slow", delay=0.2), _make_session("fast")]
+        group = SessionGroup(sessions, concurrency=2)
+
+        order = []
+        for item in group.as_completed(
+            lambda s: s.command.execute_command("x")
+        ):
+            order.append(item.session_id)
+
+        assert order == ["fast", "slow"]
+
+    @pytest.mark.sync
+    def test_from_list_pages_and_resolves_sessions(self):
+        agent_bay = MagicMock()
+        agent_bay.list = MagicMock(
+            side_effect=[
+                SessionListResult(
+                    success=True,
+                    session_ids=[{"sessionId": "s0"}, {"sessionId": "s1"}],
+                    next_token="t",
+                ),
+                SessionListResult(success=True, session_ids=[{"sessionId": "s2"}]),
+            ]
+        )
+        sessions = {sid: _make_session(sid) for sid in ("s0", "s2")}
+
+        def get(session_id):
+            if session_id in sessions:
+                return SessionResult(success=True, session=sessions[session_id])
+            return SessionResult(success=False, error_message="not found")
+
+        agent_bay.get = get
+
+        group = SessionGroup.from_list(agent_bay, labels={"team": "qa"})
+
+        assert group.session_ids == ["s0", "s2"]
+        assert group.unresolved == {"s1": "not found"}
+        assert agent_bay.list.call_count == 2
+        assert agent_bay.list.call_args_list[0].kwargs["next_token"] is None
+        assert agent_bay.list.call_args_list[1].kwargs["next_token"] == "t"
+
+
+def test_latency_stats_percentiles():
+    stats = LatencyStats(list(range(1, 101)))
+
+    assert stats.count == 100
+    assert (stats.min_ms, stats.p50_ms, stats.p90_ms, stats.p99_ms, stats.max_ms) == (1, 50, 90, 99, 100)
+    assert stats.mean_ms == 50.5
+    assert LatencyStats([]).to_dict()["count"] == 0
@@ -0,0 +1,248 @@
+import time
+"""
+Unit tests for AsyncSessionPool.
+"""
+
+import itertools
+from unittest.mock import MagicMock, MagicMock
+
+import pytest
+
+from agentbay import (
+    SessionPool,
+    CommandResult,
+    DeleteResult,
+    ReleaseAction,
+    ReleasePolicy,
+    SessionError,
+    SessionPauseResult,
+    SessionResult,
+    SessionResumeResult,
+)
+from agentbay._sync.session import SessionStatusResult
+
+
+def _make_agent_bay():
+    counter = itertools.count()
+    created = []
+
+    def create(params=None):
+        session = MagicMock()
+        session.session_id = f"s{next(counter)}"
+        session.delete = MagicMock(return_value=DeleteResult(success=True))
+        session.get_status = MagicMock(
+            return_value=SessionStatusResult(success=True, status="RUNNING")
+        )
+        session.command.execute_command = MagicMock(
+            return_value=CommandResult(success=True)
+        )
+        session.beta_pause = MagicMock(return_value=SessionPauseResult(success=True))
+        session.beta_resume = MagicMock(return_value=SessionResumeResult(success=True))
+        created.append(session)
+        return SessionResult(success=True, session=session)
+
+    agent_bay = MagicMock()
+    agent_bay.create = MagicMock(side_effect=create)
+    return agent_bay, created
+
+
+class TestAsyncSessionPool:
+    def test_rejects_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            SessionPool(MagicMock(), size=3, max_size=2)
+        with pytest.raises(ValueError):
+            SessionPool(MagicMock(), size=0, max_size=0)
+
+    @pytest.mark.sync
+    def test_start_prewarms_and_acquire_hits(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=2)
+        pool.start()
+        try:
+            assert len(created) == 2
+            with pool.acquire() as session:
+                assert session in created
+                assert pool.metrics().leased == 1
+
+            metrics = pool.metrics()
+            assert metrics.acquires == 1
+            assert metrics.hit_rate == 1.0
+            assert metrics.idle == 2
+            assert agent_bay.create.call_count == 2
+        finally:
+            pool.close()
+
+        for session in created:
+            session.delete.assert_called_once()
+
+    @pytest.mark.sync
+    def test_refill_creates_sessions_concurrently(self):
+        agent_bay, created = _make_agent_bay()
+        create = agent_bay.create.side_effect
+        in_flight = []
+        peak = []
+
+        def slow_create(params=None):
+            in_flight.append(params)
+            peak.append(len(in_flight))
+            time.sleep(0.05)
+            in_flight.pop()
+            return create(params)
+
+        agent_bay.create.side_effect = slow_create
+        pool = SessionPool(agent_bay, size=4)
+        pool.start()
+        try:
+            assert len(created) == 4
+            assert max(peak) > 1
+            assert pool.metrics().idle == 4
+        finally:
+            pool.close()
+
+    @pytest.mark.sync
+    def test_creates_on_miss_up_to_max_size_then_times_out(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=0, max_size=1)
+
+        session = pool.lease()
+        assert pool.metrics().misses == 1
+
+        with pytest.raises(SessionError, match="Timed out"):
+            pool.lease(timeout=0.1)
+        assert pool.metrics().timeouts == 1
+
+        pool.release(session)
+        assert pool.lease(timeout=0.1) is session
+        assert len(created) == 1
+
+    @pytest.mark.sync
+    def test_failed_creation_raises(self):
+        agent_bay = MagicMock()
+        agent_bay.create = MagicMock(
+            return_value=SessionResult(success=False, error_message="quota exceeded")
+        )
+        pool = SessionPool(agent_bay, size=0, max_size=1)
+
+        with pytest.raises(SessionError, match="quota exceeded"):
+            pool.lease()
+        assert pool.metrics().create_failures == 1
+
+    @pytest.mark.sync
+    def test_reset_policy_clears_paths(self):
+        agent_bay, created = _make_agent_bay()
+        policy = ReleasePolicy(action=ReleaseAction.RESET, reset_paths=["/tmp/work dir"])
+        pool = SessionPool(agent_bay, size=0, max_size=1, policy=policy)
+
+        with pool.acquire() as session:
+            pass
+
+        command = session.command.execute_command.call_args.args[0]
+        assert "find '/tmp/work dir' -mindepth 1 -delete" in command
+        assert pool.metrics().resets == 1
+        assert pool.metrics().idle == 1
+
+    @pytest.mark.sync
+    def test_error_in_lease_deletes_session(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=0, max_size=1)
+
+        with pytest.raises(RuntimeError):
+            with pool.acquire():
+                raise RuntimeError("broken")
+
+        created[0].delete.assert_called_once()
+        metrics = pool.metrics()
+        assert (metrics.deleted, metrics.idle, metrics.leased) == (1, 0, 0)
+
+    @pytest.mark.sync
+    def test_max_uses_recycles_session(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=0, max_size=1, policy=ReleasePolicy(max_uses=2))
+
+        for _ in range(3):
+            with pool.acquire():
+                pass
+
+        assert len(created) == 2
+        created[0].delete.assert_called_once()
+
+    @pytest.mark.sync
+    def test_health_check_drops_broken_idle_sessions(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=2)
+        pool._refill()
+        created[0].get_status.return_value = SessionStatusResult(
+            success=False, error_message="not found"
+        )
+
+        pool._check_idle()
+
+        created[0].delete.assert_called_once()
+        assert pool.metrics().health_failures == 1
+        pool._refill()
+        assert pool.metrics().idle == 2
+        assert len(created) == 3
+
+    @pytest.mark.sync
+    def test_idle_sessions_are_parked_and_resumed(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=1, pause_idle_after=0)
+        pool._refill()
+
+        pool._park_idle()
+        created[0].beta_pause.assert_called_once()
+
+        session = pool.lease()
+        assert session is created[0]
+        session.beta_resume.assert_called_once()
+        metrics = pool.metrics()
+        assert (metrics.paused, metrics.resumed, metrics.hits) == (1, 1, 1)
+
+    @pytest.mark.sync
+    def test_session_still_pausing_is_not_leased(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=1, max_size=2, pause_idle_after=0)
+        pool._refill()
+        leased = []
+
+        def pause_in_progress(*args, **kwargs):
+            # Lease while the pause has not reached PAUSED yet
+            leased.append(pool.lease())
+            return SessionPauseResult(success=True, status="PAUSED")
+
+        created[0].beta_pause.side_effect = pause_in_progress
+        pool._park_idle()
+
+        assert leased[0] is created[1]
+        created[0].beta_resume.assert_not_called()
+        created[0].delete.assert_not_called()
+        assert pool.metrics().paused == 1
+
+    @pytest.mark.sync
+    def test_release_after_close_deletes_session(self):
+        agent_bay, created = _make_agent_bay()
+        pool = SessionPool(agent_bay, size=0, max_size=1)
+        session = pool.lease()
+        pool.close()
+
+        pool.release(session)
+
+        session.delete.assert_called_once()
+        with pytest.raises(SessionError, match="closed"):
+            pool.lease()
+
+    @pytest.mark.sync
+    def test_release_unknown_session(self):
+        pool = SessionPool(MagicMock(), size=0, max_size=1)
+        with pytest.raises(ValueError):
+            pool.release(MagicMock(session_id="other"))
+
+
+def test_release_policy_decisions():
+    policy = ReleasePolicy(max_uses=3, max_age=60)
+
+    assert policy.decide(1, 1.0, failed=False) == ReleaseAction.KEEP
+    assert policy.decide(1, 1.0, failed=True) == ReleaseAction.DELETE
+    assert policy.decide(3, 1.0, failed=False) == ReleaseAction.DELETE
+    assert policy.decide(1, 61.0, failed=False) == ReleaseAction.DELETE
+    assert ReleasePolicy(delete_on_error=False).decide(1, 0.0, failed=True) == ReleaseAction.KEEP
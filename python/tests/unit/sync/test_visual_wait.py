@@ -0,0 +1,89 @@
+"""
+Unit tests for wait_for_visual_change / wait_until_stable on Computer and Mobile.
+"""
+
+import struct
+import zlib
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from agentbay import AgentBayError, Computer, Mobile, ScreenshotResult
+
+
+def _frame(color):
+    """Build a 16x16 solid-color PNG screenshot result."""
+    rows = b"".join(b"\x00" + bytes(color) * 16 for _ in range(16))
+
+    def chunk(ctype, body):
+        return (
+            struct.pack(">I", len(body))
+            + ctype
+            + body
+            + struct.pack(">I", zlib.crc32(ctype + body))
+        )
+
+    png = (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", 16, 16, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+    return ScreenshotResult(request_id="req", success=True, data=png, width=16, height=16)
+
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+@pytest.fixture(params=[Computer, Mobile])
+def service(request):
+    return request.param(Mock())
+
+
+class TestVisualWait:
+    @pytest.mark.sync
+    def test_wait_for_visual_change_returns_on_change(self, service):
+        service.beta_take_screenshot = MagicMock(
+            side_effect=[_frame(BLACK), _frame(BLACK), _frame(WHITE)]
+        )
+
+        result = service.wait_for_visual_change(timeout_ms=5000, interval_ms=0)
+
+        assert result.success is True
+        assert result.frames == 3
+        assert result.changed_ratio == 1.0
+        assert result.screenshot.data == _frame(WHITE).data
+
+    @pytest.mark.sync
+    def test_wait_for_visual_change_times_out(self, service):
+        service.beta_take_screenshot = MagicMock(return_value=_frame(BLACK))
+
+        result = service.wait_for_visual_change(timeout_ms=50, interval_ms=10)
+
+        assert result.success is False
+        assert "Timed out" in result.error_message
+        assert result.frames >= 2
+
+    @pytest.mark.sync
+    def test_wait_until_stable_resets_on_change(self, service):
+        frames = [_frame(BLACK), _frame(WHITE)] + [_frame(WHITE)] * 100
+        service.beta_take_screenshot = MagicMock(side_effect=frames)
+
+        result = service.wait_until_stable(
+            stable_ms=20, timeout_ms=5000, interval_ms=5
+        )
+
+        assert result.success is True
+        assert result.changed_ratio == 0.0
+        assert result.frames >= 3
+
+    @pytest.mark.sync
+    def test_capture_error_is_reported(self, service):
+        service.beta_take_screenshot = MagicMock(side_effect=AgentBayError("boom"))
+
+        result = service.wait_until_stable(timeout_ms=1000)
+
+        assert result.success is False
+        assert "boom" in result.error_message
+        assert result.frames == 0